@@ -8,12 +8,12 @@ import logging
 import os
 import uuid
 import asyncio
-from typing import Dict, List, Optional, Any, Literal, Union, Tuple
+from typing import Dict, List, Optional, Any, Literal, Union, Tuple, AsyncIterator
 from datetime import datetime
 from enum import Enum
 import re
 
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, SystemMessage, BaseMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.graph import StateGraph, END, MessagesState
 from langgraph.checkpoint.memory import InMemorySaver
@@ -21,6 +21,7 @@ from langgraph.prebuilt import ToolNode
 from langgraph.checkpoint.mongodb import MongoDBSaver
 from langgraph.types import interrupt, Command
 from langchain_core.messages import RemoveMessage
+from langchain_core.runnables import RunnableLambda
 
 # Import tools
 from ai_interviewer.tools.coding_tools import (
@@ -40,7 +41,11 @@ from ai_interviewer.tools.question_tools import (
 
 # Import custom modules
 from ai_interviewer.utils.session_manager import SessionManager
+from ai_interviewer.utils.async_session_manager import AsyncSessionManager
+from ai_interviewer.utils.insight_worker import InsightExtractionWorker
 from ai_interviewer.utils.memory_manager import InterviewMemoryManager
+from ai_interviewer.utils.llm_gateway import get_llm_gateway
+from ai_interviewer.utils.prompt_cache import SystemPrompt, SystemPromptCache, create_prefix_backend
 from ai_interviewer.utils.config import get_db_config, get_llm_config, log_config
 from ai_interviewer.utils.transcript import extract_messages_from_transcript, safe_extract_content
 
@@ -68,13 +73,13 @@ STAGE_KEY = "interview_stage"  # Key for storing interview stage in the state
 CANDIDATE_NAME_KEY = "candidate_name"  # Key for storing candidate name in the state
 METADATA_KEY = "metadata"  # Key for storing all metadata in the state
 
-# System prompt template
-INTERVIEW_SYSTEM_PROMPT = """
-You are {system_name}, an AI technical interviewer conducting a {job_role} interview for a {seniority_level} position.
+# Tag attached to the interviewer model call so its tokens can be told apart when streaming
+RESPONSE_STREAM_TAG = "interview_response"
 
-Interview ID: {interview_id}
-Candidate: {candidate_name}
-Current stage: {current_stage}
+# System prompt templates. The prefix only depends on the session settings and is
+# cached per session; the suffix holds the per-turn state and is formatted every turn.
+INTERVIEW_SYSTEM_PROMPT_PREFIX = """
+You are {system_name}, an AI technical interviewer conducting a {job_role} interview for a {seniority_level} position.
 
 Required skills: {required_skills}
 Job description: {job_description}
@@ -96,11 +101,6 @@ INTERVIEW APPROACH:
 4. Evaluate both technical knowledge and problem-solving approach
 5. Give constructive feedback on responses when appropriate
 
-CONTEXT MANAGEMENT:
-If a conversation summary is provided below, use it to understand previous parts of the interview that are no longer in the recent messages.
-
-{conversation_summary}
-
 HANDLING SPECIAL SITUATIONS:
 - When the candidate asks for clarification: Provide helpful context without giving away answers
 - When the candidate struggles: Show patience and offer gentle prompts or hints
@@ -119,6 +119,18 @@ ADAPTING TO INTERVIEW STAGES:
 If unsure how to respond to something unusual, stay professional and steer the conversation back to relevant technical topics.
 """
 
+INTERVIEW_SYSTEM_PROMPT_SUFFIX = """
+CURRENT INTERVIEW:
+Interview ID: {interview_id}
+Candidate: {candidate_name}
+Current stage: {current_stage}
+
+CONTEXT MANAGEMENT:
+If a conversation summary is provided below, use it to understand previous parts of the interview that are no longer in the recent messages.
+
+{conversation_summary}
+"""
+
 # Custom state that extends MessagesState to add interview-specific context
 class InterviewState(MessagesState):
     """
@@ -300,6 +312,14 @@ class AIInterviewer:
             temperature=0.1
         )
         
+        # Static system prompt prefixes, rendered once per set of session settings
+        self.prompt_cache = SystemPromptCache(
+            INTERVIEW_SYSTEM_PROMPT_PREFIX,
+            INTERVIEW_SYSTEM_PROMPT_SUFFIX,
+            backend=create_prefix_backend(self.tools)
+        )
+        self._cached_content_models: Dict[str, Any] = {}
+        
         # Set up memory management
         if use_mongodb:
             try:
@@ -362,12 +382,20 @@ class AIInterviewer:
                     collection_name=db_config["metadata_collection"],
                 )
                 
+                # Async session store used on the request path so session I/O doesn't block the event loop
+                self.async_session_manager = AsyncSessionManager(
+                    connection_uri=mongodb_uri,
+                    database_name=db_config["database"],
+                    collection_name=db_config["metadata_collection"],
+                )
+                
                 logger.info("MongoDB memory manager initialized successfully")
             except Exception as e:
                 # If there's an error with MongoDB, fall back to in-memory persistence
                 logger.warning(f"Failed to connect to MongoDB: {e}. Falling back to in-memory persistence.")
                 self.checkpointer = InMemorySaver()
                 self.session_manager = None
+                self.async_session_manager = None
                 self.memory_manager = None
                 self.store = None
                 logger.info("Using in-memory persistence as fallback")
@@ -375,10 +403,14 @@ class AIInterviewer:
             # Use in-memory persistence
             self.checkpointer = InMemorySaver()
             self.session_manager = None
+            self.async_session_manager = None
             self.memory_manager = None
             self.store = None
             logger.info("Using in-memory persistence")
         
+        # Background worker for insight extraction and memory updates
+        self.insight_worker = InsightExtractionWorker(self._aupdate_interview_memory)
+        
         # Initialize workflow
         self.workflow = self._initialize_workflow()
         
@@ -426,68 +458,44 @@ class AIInterviewer:
                 Updated state with tool results
             """
             try:
-                # Check if state is a dictionary or InterviewState object
-                if isinstance(state, dict):
-                    # Extract messages from dictionary
-                    messages = state.get("messages", [])
-                    candidate_name = state.get("candidate_name", "")
-                    
-                    # Execute tools using the ToolNode with messages
-                    tool_result = self.tool_node.invoke({"messages": messages})
-                    
-                    # Create a new dictionary with updated values
-                    updated_state = dict(state)
-                    if "messages" in tool_result:
-                        updated_state["messages"] = messages + tool_result["messages"]
-                    
-                    # Check for extracted name in new messages
-                    if not candidate_name and "messages" in tool_result:
-                        combined_messages = messages + tool_result.get("messages", [])
-                        name_match = self._extract_candidate_name(combined_messages)
-                        if name_match:
-                            updated_state["candidate_name"] = name_match
-                            logger.info(f"Extracted candidate name during tool call: {name_match}")
-                    
-                    # Update message count for context management
-                    updated_state["message_count"] = state.get("message_count", 0) + len(tool_result.get("messages", []))
-                    
-                    return updated_state
-                else:
-                    # Extract messages from InterviewState
-                    messages = state.messages
-                    candidate_name = state.candidate_name
-                    
-                    # Execute tools using the ToolNode with messages
-                    tool_result = self.tool_node.invoke({"messages": messages})
-                    
-                    # Get updated messages
-                    updated_messages = state.messages + tool_result.get("messages", [])
-                    
-                    # Check for extracted name in new messages
-                    if not candidate_name and "messages" in tool_result:
-                        name_match = self._extract_candidate_name(updated_messages)
-                        if name_match:
-                            candidate_name = name_match
-                            logger.info(f"Extracted candidate name during tool call: {name_match}")
-                    
-                    # Update message count
-                    new_message_count = state.message_count + len(tool_result.get("messages", []))
-                    
-                    # Create a new InterviewState with updated values
-                    return InterviewState(
-                        messages=updated_messages,
-                        candidate_name=candidate_name,
-                        job_role=state.job_role,
-                        seniority_level=state.seniority_level,
-                        required_skills=state.required_skills,
-                        job_description=state.job_description,
-                        interview_stage=state.interview_stage,
-                        session_id=state.session_id,
-                        user_id=state.user_id,
-                        conversation_summary=state.conversation_summary,
-                        message_count=new_message_count,
-                        max_messages_before_summary=state.max_messages_before_summary
-                    )
+                messages = state.get("messages", []) if isinstance(state, dict) else state.messages
+                
+                # Execute tools using the ToolNode with messages
+                tool_result = self.tool_node.invoke({"messages": messages})
+                
+                # Check for extracted name in new messages
+                extracted_name = ""
+                if not state.get("candidate_name", "") and "messages" in tool_result:
+                    extracted_name = self._extract_candidate_name(messages + tool_result.get("messages", []))
+                
+                return self._apply_tool_result(state, tool_result, extracted_name)
+            except Exception as e:
+                logger.error(f"Error in tools_node: {e}")
+                # Return original state on error
+                return state
+        
+        async def atools_node(state: Union[Dict, InterviewState]) -> Union[Dict, InterviewState]:
+            """
+            Async wrapper for ToolNode, used when the graph is driven with astream.
+            
+            Args:
+                state: Current state (dict or InterviewState)
+                
+            Returns:
+                Updated state with tool results
+            """
+            try:
+                messages = state.get("messages", []) if isinstance(state, dict) else state.messages
+                
+                # Execute tools using the ToolNode with messages
+                tool_result = await self.tool_node.ainvoke({"messages": messages})
+                
+                # Check for extracted name in new messages
+                extracted_name = ""
+                if not state.get("candidate_name", "") and "messages" in tool_result:
+                    extracted_name = await self._aextract_candidate_name(messages + tool_result.get("messages", []))
+                
+                return self._apply_tool_result(state, tool_result, extracted_name)
             except Exception as e:
                 logger.error(f"Error in tools_node: {e}")
                 # Return original state on error
@@ -505,156 +513,65 @@ class AIInterviewer:
                 Updated state with managed context
             """
             try:
-                # Extract values from state based on type
-                if isinstance(state, dict):
-                    messages = state.get("messages", [])
-                    message_count = state.get("message_count", 0)
-                    max_messages = state.get("max_messages_before_summary", 20)
-                    current_summary = state.get("conversation_summary", "")
-                    session_id = state.get("session_id", "")
-                else:
-                    messages = state.messages
-                    message_count = state.message_count
-                    max_messages = state.max_messages_before_summary
-                    current_summary = state.conversation_summary
-                    session_id = state.session_id
-                
-                # Check if we need to summarize
-                if len(messages) <= max_messages:
+                context = self._get_context_to_summarize(state)
+                if context is None:
                     # No need to summarize yet
-                    if isinstance(state, dict):
-                        return state
-                    else:
-                        return state
-                
-                # We need to summarize older portions of the conversation
-                messages_to_keep = max_messages // 2  # Keep half of the max messages
-                messages_to_summarize = messages[:-messages_to_keep]
+                    return state
                 
                 # First, extract structured insights from the conversation
                 # These insights will be preserved even as we reduce the conversation history
-                current_insights = None
+                # Only messages after the stored high-water mark are sent to the model
+                current_insights, marker = self._get_session_insights(context["session_id"])
+                insights, extracted = self._extract_interview_insights(context["messages"], current_insights, marker)
+                if extracted:
+                    self._save_session_insights(context["session_id"], insights, self._insights_marker(context["messages"]))
+                
+                # Now generate the conversation summary
+                summary_response = self.summarization_model.invoke(self._build_summary_prompt(context, insights))
                 
-                # Try to get current insights from session metadata if available
-                if session_id and self.session_manager:
-                    session = self.session_manager.get_session(session_id)
-                    if session and "metadata" in session:
-                        metadata = session.get("metadata", {})
-                        current_insights = metadata.get("interview_insights", None)
+                return self._apply_context_summary(state, context, summary_response)
+            except Exception as e:
+                logger.error(f"Error in manage_context: {e}")
+                # Return original state on error
+                return state
+        
+        async def amanage_context(state: Union[Dict, InterviewState]) -> Union[Dict, InterviewState]:
+            """
+            Async variant of manage_context that awaits the summarization model.
+            
+            Args:
+                state: Current state with messages
                 
-                # Extract insights from all messages, updating current insights
-                insights = self._extract_interview_insights(messages, current_insights)
+            Returns:
+                Updated state with managed context
+            """
+            try:
+                context = self._get_context_to_summarize(state)
+                if context is None:
+                    # No need to summarize yet
+                    return state
                 
-                # If we have a session manager and session ID, update the insights in metadata
-                if session_id and self.session_manager:
-                    try:
-                        session = self.session_manager.get_session(session_id)
-                        if session and "metadata" in session:
-                            metadata = session.get("metadata", {})
-                            metadata["interview_insights"] = insights
-                            self.session_manager.update_session_metadata(session_id, metadata)
-                            logger.info(f"Updated interview insights in session metadata for session {session_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to update interview insights in session metadata: {e}")
+                # First, extract structured insights from the conversation
+                # These insights will be preserved even as we reduce the conversation history
+                # Only messages after the stored high-water mark are sent to the model
+                current_insights, marker = await self._aget_session_insights(context["session_id"])
+                insights, extracted = await self._aextract_interview_insights(context["messages"], current_insights, marker)
+                if extracted:
+                    await self._asave_session_insights(context["session_id"], insights, self._insights_marker(context["messages"]))
                 
                 # Now generate the conversation summary
-                # Include insights in the prompt to assist with better summarization
-                insights_text = ""
-                if insights and "candidate_details" in insights:
-                    details = insights["candidate_details"]
-                    skills = insights.get("key_skills", [])
-                    experiences = insights.get("notable_experiences", [])
-                    
-                    insights_text = "CANDIDATE INSIGHTS EXTRACTED SO FAR:\n"
-                    
-                    if details.get("name"):
-                        insights_text += f"Name: {details['name']}\n"
-                    
-                    if details.get("current_role"):
-                        insights_text += f"Current Role: {details['current_role']}\n"
-                    
-                    if details.get("years_of_experience"):
-                        insights_text += f"Experience: {details['years_of_experience']}\n"
-                    
-                    if skills:
-                        insights_text += f"Key Skills: {', '.join(skills[:10])}\n"
-                    
-                    if experiences:
-                        insights_text += f"Notable Experiences: {'; '.join(experiences[:3])}\n"
-                    
-                    coding = insights.get("coding_ability", {})
-                    if coding.get("languages"):
-                        insights_text += f"Coding Languages: {', '.join(coding['languages'])}\n"
-                
-                # Prompt to generate summary
-                if current_summary:
-                    summary_prompt = [
-                        SystemMessage(content=f"""You are a helpful assistant that summarizes technical interview conversations while retaining all key information.
-                        
-                        Below is an existing summary, extracted candidate insights, and new conversation parts to integrate.
-                        Create a comprehensive summary that includes all important details about the candidate, their skills,
-                        experiences, and responses to interview questions.
-                        
-                        Focus on preserving technical details, specific examples, and insights about the candidate's abilities
-                        and experiences. Be concise but thorough, ensuring no important technical details are lost.
-                        """),
-                        HumanMessage(content=f"EXISTING SUMMARY:\n{current_summary}\n\n{insights_text}\n\nNEW CONVERSATION TO INTEGRATE:\n" + "\n".join([f"{m.type}: {m.content}" for m in messages_to_summarize if hasattr(m, 'content')]))
-                    ]
-                else:
-                    summary_prompt = [
-                        SystemMessage(content=f"""You are a helpful assistant that summarizes technical interview conversations while retaining all key information.
-                        
-                        Create a comprehensive summary of this interview conversation that includes all important details about
-                        the candidate, their skills, experiences, and responses to interview questions.
-                        
-                        Focus on preserving technical details, specific examples, and insights about the candidate's abilities
-                        and experiences. Be concise but thorough, ensuring no important technical details are lost.
-                        """),
-                        HumanMessage(content=f"{insights_text}\n\nCONVERSATION TO SUMMARIZE:\n" + "\n".join([f"{m.type}: {m.content}" for m in messages_to_summarize if hasattr(m, 'content')]))
-                    ]
-                
-                # Generate the summary
-                summary_response = self.summarization_model.invoke(summary_prompt)
-                new_summary = summary_response.content if hasattr(summary_response, 'content') else ""
-                
-                # Create list of messages to remove from state
-                messages_to_remove = [RemoveMessage(id=m.id) for m in messages_to_summarize]
-                
-                # Return the appropriate state type based on input
-                if isinstance(state, dict):
-                    updated_state = dict(state)
-                    updated_state["conversation_summary"] = new_summary
-                    updated_state["messages"] = messages_to_remove + messages[-messages_to_keep:]
-                    updated_state["message_count"] = message_count - len(messages_to_summarize) + 1  # +1 for the summary itself
-                    return updated_state
-                else:
-                    # Get the messages to keep
-                    kept_messages = messages[-messages_to_keep:]
-                    
-                    # Create new state with updated values
-                    return InterviewState(
-                        messages=messages_to_remove + kept_messages,
-                        candidate_name=state.candidate_name,
-                        job_role=state.job_role,
-                        seniority_level=state.seniority_level,
-                        required_skills=state.required_skills,
-                        job_description=state.job_description,
-                        interview_stage=state.interview_stage,
-                        session_id=state.session_id,
-                        user_id=state.user_id,
-                        conversation_summary=new_summary,
-                        message_count=state.message_count - len(messages_to_summarize) + 1,  # +1 for the summary
-                        max_messages_before_summary=state.max_messages_before_summary
-                    )
+                summary_response = await self.summarization_model.ainvoke(self._build_summary_prompt(context, insights))
+                
+                return self._apply_context_summary(state, context, summary_response)
             except Exception as e:
                 logger.error(f"Error in manage_context: {e}")
                 # Return original state on error
                 return state
         
-        # Define nodes
-        workflow.add_node("model", self.call_model)
-        workflow.add_node("tools", tools_node)
-        workflow.add_node("manage_context", manage_context)
+        # Define nodes; astream runs the async variants, stream the sync ones
+        workflow.add_node("model", RunnableLambda(self.call_model, afunc=self.acall_model, name="model"))
+        workflow.add_node("tools", RunnableLambda(tools_node, afunc=atools_node, name="tools"))
+        workflow.add_node("manage_context", RunnableLambda(manage_context, afunc=amanage_context, name="manage_context"))
         
         # Define edges with context management
         workflow.add_conditional_edges(
@@ -688,7 +605,297 @@ class AIInterviewer:
         compiled_workflow = workflow.compile(checkpointer=self.checkpointer)
         
         return compiled_workflow
+    
+    def _apply_tool_result(self, state: Union[Dict, InterviewState], tool_result: Dict[str, Any],
+                           extracted_name: str = "") -> Union[Dict, InterviewState]:
+        """
+        Merge ToolNode output into the interview state.
+        
+        Args:
+            state: State the tools were run with (dict or InterviewState)
+            tool_result: Output of the ToolNode
+            extracted_name: Candidate name extracted from the tool messages, if any
+            
+        Returns:
+            Updated state with tool results
+        """
+        tool_messages = tool_result.get("messages", [])
+        
+        if isinstance(state, dict):
+            # Create a new dictionary with updated values
+            updated_state = dict(state)
+            if "messages" in tool_result:
+                updated_state["messages"] = state.get("messages", []) + tool_messages
+            
+            if extracted_name:
+                updated_state["candidate_name"] = extracted_name
+                logger.info(f"Extracted candidate name during tool call: {extracted_name}")
+            
+            # Update message count for context management
+            updated_state["message_count"] = state.get("message_count", 0) + len(tool_messages)
+            
+            return updated_state
+        else:
+            candidate_name = state.candidate_name
+            if extracted_name:
+                candidate_name = extracted_name
+                logger.info(f"Extracted candidate name during tool call: {extracted_name}")
+            
+            # Create a new InterviewState with updated values
+            return InterviewState(
+                messages=state.messages + tool_messages,
+                candidate_name=candidate_name,
+                job_role=state.job_role,
+                seniority_level=state.seniority_level,
+                required_skills=state.required_skills,
+                job_description=state.job_description,
+                interview_stage=state.interview_stage,
+                session_id=state.session_id,
+                user_id=state.user_id,
+                conversation_summary=state.conversation_summary,
+                message_count=state.message_count + len(tool_messages),
+                max_messages_before_summary=state.max_messages_before_summary
+            )
+    
+    @staticmethod
+    def _get_context_to_summarize(state: Union[Dict, InterviewState]) -> Optional[Dict[str, Any]]:
+        """
+        Decide whether the conversation needs summarizing and collect what to summarize.
+        
+        Args:
+            state: Current state with messages
+            
+        Returns:
+            Dictionary describing the summarization, or None if no summary is needed yet
+        """
+        # Extract values from state based on type
+        if isinstance(state, dict):
+            messages = state.get("messages", [])
+            message_count = state.get("message_count", 0)
+            max_messages = state.get("max_messages_before_summary", 20)
+            current_summary = state.get("conversation_summary", "")
+            session_id = state.get("session_id", "")
+        else:
+            messages = state.messages
+            message_count = state.message_count
+            max_messages = state.max_messages_before_summary
+            current_summary = state.conversation_summary
+            session_id = state.session_id
+        
+        # Check if we need to summarize
+        if len(messages) <= max_messages:
+            return None
+        
+        # We need to summarize older portions of the conversation
+        messages_to_keep = max_messages // 2  # Keep half of the max messages
+        
+        return {
+            "messages": messages,
+            "messages_to_keep": messages_to_keep,
+            "messages_to_summarize": messages[:-messages_to_keep],
+            "message_count": message_count,
+            "current_summary": current_summary,
+            "session_id": session_id
+        }
+    
+    def _get_session_insights(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Get the interview insights and their high-water mark from session metadata.
         
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Tuple of (insights, marker); either may be None if not available
+        """
+        if session_id and self.session_manager:
+            session = self.session_manager.get_session(session_id)
+            if session and "metadata" in session:
+                metadata = session.get("metadata", {})
+                return metadata.get("interview_insights", None), metadata.get("interview_insights_hwm", None)
+        return None, None
+    
+    def _save_session_insights(self, session_id: str, insights: Dict[str, Any],
+                               marker: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store interview insights and their high-water mark in session metadata.
+        
+        Args:
+            session_id: Session identifier
+            insights: Insights dictionary to store
+            marker: Marker for the last message the insights cover
+        """
+        if not (session_id and self.session_manager):
+            return
+        
+        try:
+            session = self.session_manager.get_session(session_id)
+            if session and "metadata" in session:
+                metadata = session.get("metadata", {})
+                metadata["interview_insights"] = insights
+                if marker is not None:
+                    metadata["interview_insights_hwm"] = marker
+                self.session_manager.update_session_metadata(session_id, metadata)
+                logger.info(f"Updated interview insights in session metadata for session {session_id}")
+        except Exception as e:
+            logger.error(f"Failed to update interview insights in session metadata: {e}")
+    
+    async def _aget_session_insights(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Async variant of _get_session_insights.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Tuple of (insights, marker); either may be None if not available
+        """
+        if session_id and self.async_session_manager:
+            metadata = await self.async_session_manager.get_session_metadata(session_id)
+            return metadata.get("interview_insights", None), metadata.get("interview_insights_hwm", None)
+        return None, None
+    
+    async def _asave_session_insights(self, session_id: str, insights: Dict[str, Any],
+                                      marker: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Async variant of _save_session_insights using a single partial update.
+        
+        Args:
+            session_id: Session identifier
+            insights: Insights dictionary to store
+            marker: Marker for the last message the insights cover
+        """
+        if not (session_id and self.async_session_manager):
+            return
+        
+        try:
+            fields = {"interview_insights": insights}
+            if marker is not None:
+                fields["interview_insights_hwm"] = marker
+            if await self.async_session_manager.update_session_metadata(session_id, fields):
+                logger.info(f"Updated interview insights in session metadata for session {session_id}")
+        except Exception as e:
+            logger.error(f"Failed to update interview insights in session metadata: {e}")
+    
+    @staticmethod
+    def _build_summary_prompt(context: Dict[str, Any], insights: Optional[Dict[str, Any]]) -> List[BaseMessage]:
+        """
+        Build the prompt used to summarize older parts of the conversation.
+        
+        Args:
+            context: Summarization context from _get_context_to_summarize
+            insights: Structured insights extracted so far
+            
+        Returns:
+            Prompt messages
+        """
+        current_summary = context["current_summary"]
+        messages_to_summarize = context["messages_to_summarize"]
+        
+        # Include insights in the prompt to assist with better summarization
+        insights_text = ""
+        if insights and "candidate_details" in insights:
+            details = insights["candidate_details"]
+            skills = insights.get("key_skills", [])
+            experiences = insights.get("notable_experiences", [])
+            
+            insights_text = "CANDIDATE INSIGHTS EXTRACTED SO FAR:\n"
+            
+            if details.get("name"):
+                insights_text += f"Name: {details['name']}\n"
+            
+            if details.get("current_role"):
+                insights_text += f"Current Role: {details['current_role']}\n"
+            
+            if details.get("years_of_experience"):
+                insights_text += f"Experience: {details['years_of_experience']}\n"
+            
+            if skills:
+                insights_text += f"Key Skills: {', '.join(skills[:10])}\n"
+            
+            if experiences:
+                insights_text += f"Notable Experiences: {'; '.join(experiences[:3])}\n"
+            
+            coding = insights.get("coding_ability", {})
+            if coding.get("languages"):
+                insights_text += f"Coding Languages: {', '.join(coding['languages'])}\n"
+        
+        # Prompt to generate summary
+        if current_summary:
+            return [
+                SystemMessage(content=f"""You are a helpful assistant that summarizes technical interview conversations while retaining all key information.
+                
+                Below is an existing summary, extracted candidate insights, and new conversation parts to integrate.
+                Create a comprehensive summary that includes all important details about the candidate, their skills,
+                experiences, and responses to interview questions.
+                
+                Focus on preserving technical details, specific examples, and insights about the candidate's abilities
+                and experiences. Be concise but thorough, ensuring no important technical details are lost.
+                """),
+                HumanMessage(content=f"EXISTING SUMMARY:\n{current_summary}\n\n{insights_text}\n\nNEW CONVERSATION TO INTEGRATE:\n" + "\n".join([f"{m.type}: {m.content}" for m in messages_to_summarize if hasattr(m, 'content')]))
+            ]
+        
+        return [
+            SystemMessage(content=f"""You are a helpful assistant that summarizes technical interview conversations while retaining all key information.
+            
+            Create a comprehensive summary of this interview conversation that includes all important details about
+            the candidate, their skills, experiences, and responses to interview questions.
+            
+            Focus on preserving technical details, specific examples, and insights about the candidate's abilities
+            and experiences. Be concise but thorough, ensuring no important technical details are lost.
+            """),
+            HumanMessage(content=f"{insights_text}\n\nCONVERSATION TO SUMMARIZE:\n" + "\n".join([f"{m.type}: {m.content}" for m in messages_to_summarize if hasattr(m, 'content')]))
+        ]
+    
+    @staticmethod
+    def _apply_context_summary(state: Union[Dict, InterviewState], context: Dict[str, Any],
+                               summary_response: Any) -> Union[Dict, InterviewState]:
+        """
+        Replace summarized messages with the new conversation summary.
+        
+        Args:
+            state: Current state with messages
+            context: Summarization context from _get_context_to_summarize
+            summary_response: Response of the summarization model
+            
+        Returns:
+            Updated state with managed context
+        """
+        new_summary = summary_response.content if hasattr(summary_response, 'content') else ""
+        messages = context["messages"]
+        messages_to_keep = context["messages_to_keep"]
+        messages_to_summarize = context["messages_to_summarize"]
+        
+        # Create list of messages to remove from state
+        messages_to_remove = [RemoveMessage(id=m.id) for m in messages_to_summarize]
+        
+        # Return the appropriate state type based on input
+        if isinstance(state, dict):
+            updated_state = dict(state)
+            updated_state["conversation_summary"] = new_summary
+            updated_state["messages"] = messages_to_remove + messages[-messages_to_keep:]
+            updated_state["message_count"] = context["message_count"] - len(messages_to_summarize) + 1  # +1 for the summary itself
+            return updated_state
+        else:
+            # Get the messages to keep
+            kept_messages = messages[-messages_to_keep:]
+            
+            # Create new state with updated values
+            return InterviewState(
+                messages=messages_to_remove + kept_messages,
+                candidate_name=state.candidate_name,
+                job_role=state.job_role,
+                seniority_level=state.seniority_level,
+                required_skills=state.required_skills,
+                job_description=state.job_description,
+                interview_stage=state.interview_stage,
+                session_id=state.session_id,
+                user_id=state.user_id,
+                conversation_summary=new_summary,
+                message_count=state.message_count - len(messages_to_summarize) + 1,  # +1 for the summary
+                max_messages_before_summary=state.max_messages_before_summary
+            )
+    
     @staticmethod
     def should_continue(state: Union[Dict, InterviewState]) -> Literal["tools", "manage_context", "end"]:
         """
@@ -745,203 +952,402 @@ class AIInterviewer:
             Updated state with new AI message
         """
         try:
-            # Check if state is a dictionary or InterviewState object
-            if isinstance(state, dict):
-                # Extract data from dictionary
-                messages = state.get("messages", [])
-                candidate_name = state.get("candidate_name", "")
-                job_role = state.get("job_role", self.job_role)
-                seniority_level = state.get("seniority_level", self.seniority_level)
-                required_skills = state.get("required_skills", self.required_skills)
-                job_description = state.get("job_description", self.job_description)
-                interview_stage = state.get("interview_stage", InterviewStage.INTRODUCTION.value)
-                session_id = state.get("session_id", "")
-                user_id = state.get("user_id", "")
-                conversation_summary = state.get("conversation_summary", "")
-                message_count = state.get("message_count", len(messages))
-                max_messages_before_summary = state.get("max_messages_before_summary", 20)
-                # Default to True for requires_coding if not specified
-                requires_coding = state.get("requires_coding", True)
-            else:
-                # Extract data from InterviewState object
-                messages = state.messages
-                candidate_name = state.candidate_name
-                job_role = state.job_role
-                seniority_level = state.seniority_level
-                required_skills = state.required_skills
-                job_description = state.job_description
-                interview_stage = state.interview_stage
-                session_id = state.session_id
-                user_id = state.user_id
-                conversation_summary = state.conversation_summary
-                message_count = state.message_count
-                max_messages_before_summary = state.max_messages_before_summary
-                # Default to True for requires_coding if not specified
-                requires_coding = getattr(state, "requires_coding", True)
-            
-            # Create or update system message with context
-            system_prompt = INTERVIEW_SYSTEM_PROMPT.format(
-                system_name=get_llm_config()["system_name"],
-                candidate_name=candidate_name or "[Not provided yet]",
-                interview_id=session_id,
-                current_stage=interview_stage,
-                job_role=job_role,
-                seniority_level=seniority_level,
-                required_skills=", ".join(required_skills) if isinstance(required_skills, list) else str(required_skills),
-                job_description=job_description,
-                requires_coding=requires_coding,
-                conversation_summary=conversation_summary if conversation_summary else "No summary available yet."
-            )
+            model_call = self._prepare_model_call(state)
             
-            # Add cross-thread memory if available
-            if self.memory_manager and candidate_name and user_id:
-                try:
-                    # Get candidate profile from memory store
-                    candidate_profile = self.memory_manager.get_candidate_profile(user_id)
-                    
-                    if candidate_profile:
-                        # Add profile information to the system prompt
-                        profile_info = "\n\nCANDIDATE HISTORY FROM PREVIOUS SESSIONS:\n"
-                        
-                        if "key_skills" in candidate_profile and candidate_profile["key_skills"]:
-                            skills = candidate_profile["key_skills"]
-                            profile_info += f"- Previously demonstrated skills: {', '.join(skills[:5])}\n"
-                        
-                        if "notable_experiences" in candidate_profile and candidate_profile["notable_experiences"]:
-                            experiences = candidate_profile["notable_experiences"]
-                            profile_info += f"- Notable past experiences: {'; '.join(experiences[:3])}\n"
-                        
-                        if "strengths" in candidate_profile and candidate_profile["strengths"]:
-                            strengths = candidate_profile["strengths"]
-                            profile_info += f"- Previously identified strengths: {', '.join(strengths[:3])}\n"
-                        
-                        if "areas_for_improvement" in candidate_profile and candidate_profile["areas_for_improvement"]:
-                            improvements = candidate_profile["areas_for_improvement"]
-                            profile_info += f"- Areas for improvement: {', '.join(improvements[:3])}\n"
-                        
-                        if "coding_ability" in candidate_profile and candidate_profile["coding_ability"]:
-                            coding = candidate_profile["coding_ability"]
-                            if "languages" in coding and coding["languages"]:
-                                profile_info += f"- Coding languages: {', '.join(coding['languages'])}\n"
-                        
-                        # Add the profile info to the system prompt
-                        system_prompt += profile_info
-                except Exception as e:
-                    logger.error(f"Error retrieving candidate profile: {e}")
-            
-            # Update system message if present, otherwise add it
-            if messages and isinstance(messages[0], SystemMessage):
-                messages[0] = SystemMessage(content=system_prompt)
-            else:
-                messages = [SystemMessage(content=system_prompt)] + messages
+            # Call the model
+            logger.debug(f"Calling model with {len(model_call['messages'])} messages")
+            ai_message = model_call["model"].invoke(model_call["model_input"], config=model_call["model_config"])
             
-            # Include metadata for model tracing/context
-            model_config = {
-                "metadata": {
-                    "interview_id": session_id,
-                    "candidate_name": candidate_name,
-                    "interview_stage": interview_stage
-                }
-            }
+            # Extract name from conversation if not already known
+            candidate_name = model_call["candidate_name"]
+            if not candidate_name:
+                candidate_name = self._extract_candidate_name(model_call["messages"] + [ai_message])
+                if candidate_name:
+                    logger.info(f"Extracted candidate name during model call: {candidate_name}")
+                    self._persist_candidate_name(model_call["session_id"], candidate_name)
+            
+            return self._finalize_model_call(state, model_call, ai_message, candidate_name)
+        except Exception as e:
+            logger.error(f"Error calling model: {e}")
+            return self._model_error_state(state)
+    
+    async def acall_model(self, state: Union[Dict, InterviewState]) -> Union[Dict, InterviewState]:
+        """
+        Async variant of call_model that awaits the model instead of blocking the event loop.
+        
+        Args:
+            state: Current state with messages and interview context (dict or InterviewState)
+            
+        Returns:
+            Updated state with new AI message
+        """
+        try:
+            # Reading the candidate profile and registering a prompt prefix may block on I/O
+            model_call = await asyncio.to_thread(self._prepare_model_call, state)
             
             # Call the model
-            logger.debug(f"Calling model with {len(messages)} messages")
-            ai_message = self.model.invoke(messages, config=model_config)
+            logger.debug(f"Calling model asynchronously with {len(model_call['messages'])} messages")
+            ai_message = await model_call["model"].ainvoke(model_call["model_input"], config=model_call["model_config"])
             
             # Extract name from conversation if not already known
+            candidate_name = model_call["candidate_name"]
             if not candidate_name:
-                name_match = self._extract_candidate_name(messages + [ai_message])
-                if name_match:
-                    candidate_name = name_match
+                candidate_name = await self._aextract_candidate_name(model_call["messages"] + [ai_message])
+                if candidate_name:
                     logger.info(f"Extracted candidate name during model call: {candidate_name}")
-                    
-                    # Immediately update session metadata with the new candidate name
-                    if session_id and self.session_manager:
-                        session = self.session_manager.get_session(session_id)
-                        if session and "metadata" in session:
-                            metadata = session.get("metadata", {})
-                            metadata[CANDIDATE_NAME_KEY] = candidate_name
-                            self.session_manager.update_session_metadata(session_id, metadata)
-                            logger.info(f"Updated session metadata with candidate name: {candidate_name}")
-            
-            # Determine if we need to update the interview stage
-            new_stage = self._determine_interview_stage(messages, ai_message, interview_stage)
-            
-            # Increment message count for new message
-            new_message_count = message_count + 1
-            
-            # Return the appropriate state type based on input
-            if isinstance(state, dict):
-                # Return a dictionary with updated values
-                updated_state = dict(state)
-                updated_state["messages"] = messages + [ai_message]
-                updated_state["candidate_name"] = candidate_name
-                updated_state["interview_stage"] = new_stage if new_stage != interview_stage else interview_stage
-                updated_state["message_count"] = new_message_count
-                return updated_state
-            else:
-                # Return a new InterviewState object
-                return InterviewState(
-                    messages=messages + [ai_message],
-                    candidate_name=candidate_name,
-                    job_role=job_role,
-                    seniority_level=seniority_level,
-                    required_skills=required_skills,
-                    job_description=job_description,
-                    interview_stage=new_stage if new_stage != interview_stage else interview_stage,
-                    session_id=session_id,
-                    user_id=user_id,
-                    conversation_summary=conversation_summary,
-                    message_count=new_message_count,
-                    max_messages_before_summary=max_messages_before_summary
-                )
+                    await self._apersist_candidate_name(model_call["session_id"], candidate_name)
             
+            return self._finalize_model_call(state, model_call, ai_message, candidate_name)
         except Exception as e:
             logger.error(f"Error calling model: {e}")
-            # Create error message
-            error_message = AIMessage(content="I apologize, but I encountered an issue. Please try again.")
-            
-            # Return appropriate state type
-            if isinstance(state, dict):
-                updated_state = dict(state)
-                if "messages" in updated_state:
-                    updated_state["messages"] = updated_state["messages"] + [error_message]
-                else:
-                    updated_state["messages"] = [error_message]
-                return updated_state
-            else:
-                return InterviewState(
-                    messages=state.messages + [error_message] if hasattr(state, "messages") else [error_message],
-                    candidate_name=state.candidate_name if hasattr(state, "candidate_name") else "",
-                    job_role=state.job_role if hasattr(state, "job_role") else self.job_role,
-                    seniority_level=state.seniority_level if hasattr(state, "seniority_level") else self.seniority_level,
-                    required_skills=state.required_skills if hasattr(state, "required_skills") else self.required_skills,
-                    job_description=state.job_description if hasattr(state, "job_description") else self.job_description,
-                    interview_stage=state.interview_stage if hasattr(state, "interview_stage") else InterviewStage.INTRODUCTION.value,
-                    session_id=state.session_id if hasattr(state, "session_id") else "",
-                    user_id=state.user_id if hasattr(state, "user_id") else "",
-                    conversation_summary=state.conversation_summary if hasattr(state, "conversation_summary") else "",
-                    message_count=state.message_count if hasattr(state, "message_count") else 0,
-                    max_messages_before_summary=state.max_messages_before_summary if hasattr(state, "max_messages_before_summary") else 20
-                )
+            return self._model_error_state(state)
     
-    def _determine_interview_stage(self, messages: List[BaseMessage], ai_message: AIMessage, current_stage: str) -> str:
+    def _prepare_model_call(self, state: Union[Dict, InterviewState]) -> Dict[str, Any]:
         """
-        Determine the next interview stage based on the conversation context.
+        Extract the interview context from the state and build the model input.
         
         Args:
-            messages: List of all messages in the conversation
-            ai_message: The latest AI message
-            current_stage: Current interview stage
+            state: Current state with messages and interview context (dict or InterviewState)
             
         Returns:
-            New interview stage or current stage if no change
+            Dictionary with the interview context, the messages to send and the model config
         """
-        # Get human messages for better analysis
-        human_messages = [m for m in messages if isinstance(m, HumanMessage)]
-        human_message_count = len(human_messages)
+        # Check if state is a dictionary or InterviewState object
+        if isinstance(state, dict):
+            # Extract data from dictionary
+            messages = state.get("messages", [])
+            candidate_name = state.get("candidate_name", "")
+            job_role = state.get("job_role", self.job_role)
+            seniority_level = state.get("seniority_level", self.seniority_level)
+            required_skills = state.get("required_skills", self.required_skills)
+            job_description = state.get("job_description", self.job_description)
+            interview_stage = state.get("interview_stage", InterviewStage.INTRODUCTION.value)
+            session_id = state.get("session_id", "")
+            user_id = state.get("user_id", "")
+            conversation_summary = state.get("conversation_summary", "")
+            message_count = state.get("message_count", len(messages))
+            max_messages_before_summary = state.get("max_messages_before_summary", 20)
+            # Default to True for requires_coding if not specified
+            requires_coding = state.get("requires_coding", True)
+        else:
+            # Extract data from InterviewState object
+            messages = state.messages
+            candidate_name = state.candidate_name
+            job_role = state.job_role
+            seniority_level = state.seniority_level
+            required_skills = state.required_skills
+            job_description = state.job_description
+            interview_stage = state.interview_stage
+            session_id = state.session_id
+            user_id = state.user_id
+            conversation_summary = state.conversation_summary
+            message_count = state.message_count
+            max_messages_before_summary = state.max_messages_before_summary
+            # Default to True for requires_coding if not specified
+            requires_coding = getattr(state, "requires_coding", True)
+        
+        # Add cross-thread memory if available
+        candidate_history = ""
+        if self.memory_manager and candidate_name and user_id:
+            try:
+                # Get candidate profile from memory store
+                candidate_profile = self.memory_manager.get_candidate_profile(user_id)
+                if candidate_profile:
+                    candidate_history = self._format_candidate_history(candidate_profile)
+            except Exception as e:
+                logger.error(f"Error retrieving candidate profile: {e}")
         
-        # Get the latest human message (if any)
+        # Cached prefix for the session settings plus this turn's state
+        system_prompt = self._render_system_prompt(
+            session_id=session_id,
+            candidate_name=candidate_name,
+            interview_stage=interview_stage,
+            conversation_summary=conversation_summary,
+            job_role=job_role,
+            seniority_level=seniority_level,
+            required_skills=required_skills,
+            job_description=job_description,
+            requires_coding=requires_coding,
+            candidate_history=candidate_history
+        )
+        
+        # Update system message if present, otherwise add it
+        if messages and isinstance(messages[0], SystemMessage):
+            messages[0] = SystemMessage(content=system_prompt.content)
+        else:
+            messages = [SystemMessage(content=system_prompt.content)] + messages
+        
+        model, model_input = self._get_model_input(messages, system_prompt)
+        
+        # Include metadata for model tracing/context
+        model_config = {
+            "metadata": {
+                "interview_id": session_id,
+                "candidate_name": candidate_name,
+                "interview_stage": interview_stage
+            },
+            "tags": [RESPONSE_STREAM_TAG]
+        }
+        
+        return {
+            "messages": messages,
+            "model": model,
+            "model_input": model_input,
+            "model_config": model_config,
+            "candidate_name": candidate_name,
+            "job_role": job_role,
+            "seniority_level": seniority_level,
+            "required_skills": required_skills,
+            "job_description": job_description,
+            "interview_stage": interview_stage,
+            "session_id": session_id,
+            "user_id": user_id,
+            "conversation_summary": conversation_summary,
+            "message_count": message_count,
+            "max_messages_before_summary": max_messages_before_summary
+        }
+    
+    def _render_system_prompt(self, session_id: str, candidate_name: str, interview_stage: str,
+                              conversation_summary: str, job_role: str, seniority_level: str,
+                              required_skills: Union[List[str], str], job_description: str,
+                              requires_coding: bool, candidate_history: str = "") -> SystemPrompt:
+        """
+        Render the system prompt from the session's cached prefix and this turn's state.
+        
+        Args:
+            session_id: Session ID
+            candidate_name: Candidate name, if known
+            interview_stage: Current interview stage
+            conversation_summary: Summary of earlier parts of the interview
+            job_role: Job role
+            seniority_level: Seniority level
+            required_skills: Required skills
+            job_description: Job description
+            requires_coding: Whether the role requires coding challenges
+            candidate_history: Formatted history from previous sessions
+            
+        Returns:
+            SystemPrompt with the prefix, the suffix and the remote cache handle, if any
+        """
+        static = {
+            "system_name": get_llm_config()["system_name"],
+            "job_role": job_role,
+            "seniority_level": seniority_level,
+            "required_skills": ", ".join(required_skills) if isinstance(required_skills, list) else str(required_skills),
+            "job_description": job_description,
+            "requires_coding": requires_coding
+        }
+        volatile = {
+            "interview_id": session_id,
+            "candidate_name": candidate_name or "[Not provided yet]",
+            "current_stage": interview_stage,
+            "conversation_summary": conversation_summary if conversation_summary else "No summary available yet."
+        }
+        return self.prompt_cache.render(session_id, static, volatile, extra=candidate_history)
+    
+    @staticmethod
+    def _format_candidate_history(candidate_profile: Dict[str, Any]) -> str:
+        """
+        Format a candidate profile as the history section of the system prompt.
+        
+        Args:
+            candidate_profile: Profile from the memory store
+            
+        Returns:
+            History section text
+        """
+        profile_info = "\n\nCANDIDATE HISTORY FROM PREVIOUS SESSIONS:\n"
+        
+        if "key_skills" in candidate_profile and candidate_profile["key_skills"]:
+            skills = candidate_profile["key_skills"]
+            profile_info += f"- Previously demonstrated skills: {', '.join(skills[:5])}\n"
+        
+        if "notable_experiences" in candidate_profile and candidate_profile["notable_experiences"]:
+            experiences = candidate_profile["notable_experiences"]
+            profile_info += f"- Notable past experiences: {'; '.join(experiences[:3])}\n"
+        
+        if "strengths" in candidate_profile and candidate_profile["strengths"]:
+            strengths = candidate_profile["strengths"]
+            profile_info += f"- Previously identified strengths: {', '.join(strengths[:3])}\n"
+        
+        if "areas_for_improvement" in candidate_profile and candidate_profile["areas_for_improvement"]:
+            improvements = candidate_profile["areas_for_improvement"]
+            profile_info += f"- Areas for improvement: {', '.join(improvements[:3])}\n"
+        
+        if "coding_ability" in candidate_profile and candidate_profile["coding_ability"]:
+            coding = candidate_profile["coding_ability"]
+            if "languages" in coding and coding["languages"]:
+                profile_info += f"- Coding languages: {', '.join(coding['languages'])}\n"
+        
+        return profile_info
+    
+    def _get_model_input(self, messages: List[BaseMessage], system_prompt: SystemPrompt) -> Tuple[Any, List[BaseMessage]]:
+        """
+        Choose the model and input messages for a system prompt.
+        
+        When the prefix is registered with Gemini context caching, the prefix and
+        tools live in the cached content. The request may then not carry a system
+        instruction, so the per-turn suffix is sent as the first user message.
+        
+        Args:
+            messages: Messages starting with the full system message
+            system_prompt: Rendered system prompt
+            
+        Returns:
+            Tuple of (model, messages to send)
+        """
+        if not system_prompt.cache_handle:
+            return self.model, messages
+        
+        model = self._cached_content_models.get(system_prompt.cache_handle)
+        if model is None:
+            # Forget models bound to caches that have since been released
+            active = set(self.prompt_cache.active_handles())
+            for handle in [h for h in self._cached_content_models if h not in active]:
+                del self._cached_content_models[handle]
+            
+            llm_config = get_llm_config()
+            model = ChatGoogleGenerativeAI(
+                model=llm_config["context_cache_model"],
+                temperature=llm_config["temperature"],
+                cached_content=system_prompt.cache_handle
+            )
+            self._cached_content_models[system_prompt.cache_handle] = model
+        
+        return model, [HumanMessage(content=system_prompt.suffix)] + messages[1:]
+    
+    def _finalize_model_call(self, state: Union[Dict, InterviewState], model_call: Dict[str, Any],
+                             ai_message: AIMessage, candidate_name: str) -> Union[Dict, InterviewState]:
+        """
+        Build the updated state after the model has produced a response.
+        
+        Args:
+            state: State the model was called with (dict or InterviewState)
+            model_call: Context returned by _prepare_model_call
+            ai_message: The model's response
+            candidate_name: Candidate name, possibly extracted during this call
+            
+        Returns:
+            Updated state with new AI message
+        """
+        messages = model_call["messages"]
+        session_id = model_call["session_id"]
+        interview_stage = model_call["interview_stage"]
+        
+        # Determine if we need to update the interview stage
+        new_stage = self._determine_interview_stage(messages, ai_message, interview_stage)
+        
+        # Increment message count for new message
+        new_message_count = model_call["message_count"] + 1
+        
+        # Return the appropriate state type based on input
+        if isinstance(state, dict):
+            # Return a dictionary with updated values
+            updated_state = dict(state)
+            updated_state["messages"] = messages + [ai_message]
+            updated_state["candidate_name"] = candidate_name
+            updated_state["interview_stage"] = new_stage if new_stage != interview_stage else interview_stage
+            updated_state["message_count"] = new_message_count
+            return updated_state
+        else:
+            # Return a new InterviewState object
+            return InterviewState(
+                messages=messages + [ai_message],
+                candidate_name=candidate_name,
+                job_role=model_call["job_role"],
+                seniority_level=model_call["seniority_level"],
+                required_skills=model_call["required_skills"],
+                job_description=model_call["job_description"],
+                interview_stage=new_stage if new_stage != interview_stage else interview_stage,
+                session_id=session_id,
+                user_id=model_call["user_id"],
+                conversation_summary=model_call["conversation_summary"],
+                message_count=new_message_count,
+                max_messages_before_summary=model_call["max_messages_before_summary"]
+            )
+    
+    def _persist_candidate_name(self, session_id: str, candidate_name: str) -> None:
+        """
+        Immediately update session metadata with a newly extracted candidate name.
+        
+        Args:
+            session_id: Session identifier
+            candidate_name: Extracted candidate name
+        """
+        if session_id and self.session_manager:
+            session = self.session_manager.get_session(session_id)
+            if session and "metadata" in session:
+                metadata = session.get("metadata", {})
+                metadata[CANDIDATE_NAME_KEY] = candidate_name
+                self.session_manager.update_session_metadata(session_id, metadata)
+                logger.info(f"Updated session metadata with candidate name: {candidate_name}")
+    
+    async def _apersist_candidate_name(self, session_id: str, candidate_name: str) -> None:
+        """
+        Async variant of _persist_candidate_name using a single partial update.
+        
+        Args:
+            session_id: Session identifier
+            candidate_name: Extracted candidate name
+        """
+        if session_id and self.async_session_manager:
+            if await self.async_session_manager.update_session_metadata(session_id, {CANDIDATE_NAME_KEY: candidate_name}):
+                logger.info(f"Updated session metadata with candidate name: {candidate_name}")
+    
+    def _model_error_state(self, state: Union[Dict, InterviewState]) -> Union[Dict, InterviewState]:
+        """
+        Build the state returned when the model call fails.
+        
+        Args:
+            state: State the model was called with (dict or InterviewState)
+            
+        Returns:
+            State with an apology message appended
+        """
+        # Create error message
+        error_message = AIMessage(content="I apologize, but I encountered an issue. Please try again.")
+        
+        # Return appropriate state type
+        if isinstance(state, dict):
+            updated_state = dict(state)
+            if "messages" in updated_state:
+                updated_state["messages"] = updated_state["messages"] + [error_message]
+            else:
+                updated_state["messages"] = [error_message]
+            return updated_state
+        else:
+            return InterviewState(
+                messages=state.messages + [error_message] if hasattr(state, "messages") else [error_message],
+                candidate_name=state.candidate_name if hasattr(state, "candidate_name") else "",
+                job_role=state.job_role if hasattr(state, "job_role") else self.job_role,
+                seniority_level=state.seniority_level if hasattr(state, "seniority_level") else self.seniority_level,
+                required_skills=state.required_skills if hasattr(state, "required_skills") else self.required_skills,
+                job_description=state.job_description if hasattr(state, "job_description") else self.job_description,
+                interview_stage=state.interview_stage if hasattr(state, "interview_stage") else InterviewStage.INTRODUCTION.value,
+                session_id=state.session_id if hasattr(state, "session_id") else "",
+                user_id=state.user_id if hasattr(state, "user_id") else "",
+                conversation_summary=state.conversation_summary if hasattr(state, "conversation_summary") else "",
+                message_count=state.message_count if hasattr(state, "message_count") else 0,
+                max_messages_before_summary=state.max_messages_before_summary if hasattr(state, "max_messages_before_summary") else 20
+            )
+    
+    def _determine_interview_stage(self, messages: List[BaseMessage], ai_message: AIMessage, current_stage: str) -> str:
+        """
+        Determine the next interview stage based on the conversation context.
+        
+        Args:
+            messages: List of all messages in the conversation
+            ai_message: The latest AI message
+            current_stage: Current interview stage
+            
+        Returns:
+            New interview stage or current stage if no change
+        """
+        # Get human messages for better analysis
+        human_messages = [m for m in messages if isinstance(m, HumanMessage)]
+        human_message_count = len(human_messages)
+        
+        # Get the latest human message (if any)
         latest_human_message = human_messages[-1].content.lower() if human_messages else ""
         
         # Extract AI message content
@@ -1223,9 +1629,356 @@ class AIInterviewer:
         Returns:
             Tuple of (AI response, session ID)
         """
+        session_id, config = await self._prepare_interview_turn(
+            user_id,
+            user_message,
+            session_id,
+            job_role=job_role,
+            seniority_level=seniority_level,
+            required_skills=required_skills,
+            job_description=job_description,
+            requires_coding=requires_coding,
+            handle_digression=handle_digression
+        )
+        
+        # Store a message for the graph to process
+        human_message = HumanMessage(content=user_message)
+        
+        # Run the graph with appropriate method based on checkpointer type
+        final_chunk = None
+        try:
+            # Check if we're using an async checkpointer
+            is_async_checkpointer = hasattr(self.checkpointer, 'aget_tuple')
+            
+            # Use the appropriate streaming method based on the checkpointer type
+            if is_async_checkpointer:
+                # For async checkpointer
+                logger.info(f"Using async streaming with thread_id: {session_id}")
+                async for chunk in self.workflow.astream(
+                    {"messages": [human_message]},
+                    config=config,
+                    stream_mode="values",
+                ):
+                    final_chunk = chunk
+            else:
+                # For sync checkpointer
+                logger.info(f"Using synchronous streaming with thread_id: {session_id}")
+                async for chunk in self._astream_in_thread({"messages": [human_message]}, config, "values"):
+                    final_chunk = chunk
+        except NotImplementedError as e:
+            # Handle the specific error when using wrong checkpointer type
+            logger.error(f"NotImplementedError - likely mismatched checkpointer type: {str(e)}")
+            error_message = str(e)
+            
+            # Give specific guidance based on the error
+            if "astream" in error_message and not is_async_checkpointer:
+                # Trying to use astream with a sync checkpointer
+                logger.error("Async operation called with synchronous checkpointer. Use AsyncMongoDBSaver instead of MongoDBSaver")
+                # Try fallback to sync method
+                try:
+                    logger.info("Attempting fallback to synchronous stream method")
+                    async for chunk in self._astream_in_thread({"messages": [human_message]}, config, "values"):
+                        final_chunk = chunk
+                except Exception as fallback_error:
+                    logger.error(f"Fallback to sync method failed: {fallback_error}")
+                    return f"I apologize, but there was an error processing your request. The system is using an incompatible checkpoint configuration. Please contact support.", session_id
+            elif "stream" in error_message and is_async_checkpointer:
+                # Trying to use stream with an async checkpointer
+                logger.error("Synchronous operation called with async checkpointer. Use MongoDBSaver instead of AsyncMongoDBSaver")
+                # Try fallback to async method if we're in an event loop
+                try:
+                    logger.info("Attempting fallback to asynchronous stream method")
+                    async for chunk in self.workflow.astream(
+                        {"messages": [human_message]},
+                        config=config,
+                        stream_mode="values",
+                    ):
+                        final_chunk = chunk
+                except Exception as fallback_error:
+                    logger.error(f"Fallback to async method failed: {fallback_error}")
+                    return f"I apologize, but there was an error processing your request. The system is using an incompatible checkpoint configuration. Please contact support.", session_id
+            else:
+                return f"I apologize, but there was an error processing your request. The system is using an incompatible checkpoint configuration. Please contact support. Error: {error_message}", session_id
+        except Exception as e:
+            import traceback
+            error_tb = traceback.format_exc()
+            logger.error(f"Error running interview graph: {str(e)}")
+            logger.error(f"Traceback: {error_tb}")
+            return f"I apologize, but there was an error processing your request. Please try again. Error: {str(e)}", session_id
+        
+        # Extract the AI response from the final chunk
+        if final_chunk and "messages" in final_chunk and len(final_chunk["messages"]) > 0:
+            for msg in reversed(final_chunk["messages"]):
+                if isinstance(msg, AIMessage):
+                    ai_response = msg.content
+                    logger.info(f"AI response generated for session {session_id}")
+                    
+                    # Update cross-thread memory in the background
+                    self._schedule_interview_memory_update(
+                        user_id, session_id, final_chunk["messages"], final_chunk.get(STAGE_KEY)
+                    )
+                    
+                    return ai_response, session_id
+        
+        # Fallback response if no AI message found
+        return "I'm sorry, I couldn't generate a proper response. Please try again.", session_id
+
+    async def stream_interview(self, user_id: str, user_message: str, session_id: Optional[str] = None,
+                               job_role: Optional[str] = None, seniority_level: Optional[str] = None,
+                               required_skills: Optional[List[str]] = None, job_description: Optional[str] = None,
+                               requires_coding: Optional[bool] = None,
+                               handle_digression: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run an interview turn and yield the AI response token by token.
+        
+        Uses the same session handling as run_interview, but drives the graph with
+        stream_mode="messages" so that tokens from the interviewer model are forwarded
+        as soon as they are produced. Once the graph finishes, the session state is
+        read back from the checkpointer and cross-thread memory is updated.
+        
+        Args:
+            user_id: User identifier
+            user_message: User's message text
+            session_id: Optional session ID for continuing a session
+            job_role: Optional job role for the interview
+            seniority_level: Optional seniority level
+            required_skills: Optional list of required skills
+            job_description: Optional job description
+            requires_coding: Whether this role requires coding challenges
+            handle_digression: Whether to handle topic digressions
+            
+        Yields:
+            Event dictionaries: {"type": "token", "content": ...} for each token, followed by
+            a single {"type": "done", ...} or {"type": "error", ...} event
+        """
+        session_id, config = await self._prepare_interview_turn(
+            user_id,
+            user_message,
+            session_id,
+            job_role=job_role,
+            seniority_level=seniority_level,
+            required_skills=required_skills,
+            job_description=job_description,
+            requires_coding=requires_coding,
+            handle_digression=handle_digression
+        )
+        
+        human_message = HumanMessage(content=user_message)
+        is_async_checkpointer = hasattr(self.checkpointer, 'aget_tuple')
+        
+        try:
+            if is_async_checkpointer:
+                logger.info(f"Using async token streaming with thread_id: {session_id}")
+                async for message_chunk, chunk_metadata in self.workflow.astream(
+                    {"messages": [human_message]},
+                    config=config,
+                    stream_mode="messages",
+                ):
+                    token = self._extract_response_token(message_chunk, chunk_metadata)
+                    if token:
+                        yield {"type": "token", "content": token}
+                
+                snapshot = await self.workflow.aget_state(config)
+            else:
+                logger.info(f"Using synchronous token streaming with thread_id: {session_id}")
+                async for message_chunk, chunk_metadata in self._astream_in_thread(
+                    {"messages": [human_message]}, config, "messages"
+                ):
+                    token = self._extract_response_token(message_chunk, chunk_metadata)
+                    if token:
+                        yield {"type": "token", "content": token}
+                
+                snapshot = await asyncio.to_thread(self.workflow.get_state, config)
+        except Exception as e:
+            logger.error(f"Error streaming interview graph: {str(e)}")
+            yield {
+                "type": "error",
+                "message": f"I apologize, but there was an error processing your request. Please try again. Error: {str(e)}",
+                "session_id": session_id
+            }
+            return
+        
+        # Read the persisted state back to get the complete response
+        final_values = snapshot.values if snapshot else {}
+        final_messages = final_values.get("messages", []) if isinstance(final_values, dict) else []
+        ai_response = "I'm sorry, I couldn't generate a proper response. Please try again."
+        for msg in reversed(final_messages):
+            if isinstance(msg, AIMessage):
+                ai_response = msg.content
+                logger.info(f"AI response streamed for session {session_id}")
+                self._schedule_interview_memory_update(
+                    user_id, session_id, final_messages,
+                    final_values.get(STAGE_KEY) if isinstance(final_values, dict) else None
+                )
+                break
+        
+        yield {
+            "type": "done",
+            "response": ai_response,
+            "session_id": session_id,
+            "interview_stage": final_values.get(STAGE_KEY) if isinstance(final_values, dict) else None
+        }
+    
+    async def _astream_in_thread(self, graph_input: Dict[str, Any], config: Dict[str, Any],
+                                 stream_mode: str) -> AsyncIterator[Any]:
+        """
+        Run workflow.stream on a worker thread and yield its chunks on the event loop.
+        
+        The sync checkpointer cannot be used with astream, and iterating stream
+        directly would block the event loop for every graph step.
+        
+        Args:
+            graph_input: Input for the graph
+            config: Graph config with the thread_id
+            stream_mode: LangGraph stream mode
+            
+        Yields:
+            Chunks produced by the graph
+        """
+        loop = asyncio.get_running_loop()
+        chunks: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue()
+        
+        def produce() -> None:
+            try:
+                for chunk in self.workflow.stream(graph_input, config=config, stream_mode=stream_mode):
+                    loop.call_soon_threadsafe(chunks.put_nowait, (False, chunk))
+            except Exception as e:
+                loop.call_soon_threadsafe(chunks.put_nowait, (True, e))
+            else:
+                loop.call_soon_threadsafe(chunks.put_nowait, (True, None))
+        
+        producer = loop.run_in_executor(None, produce)
+        while True:
+            finished, item = await chunks.get()
+            if finished:
+                break
+            yield item
+        await producer
+        if item is not None:
+            raise item
+    
+    @staticmethod
+    def _extract_response_token(message_chunk: BaseMessage, chunk_metadata: Dict[str, Any]) -> str:
+        """
+        Extract streamable text from a ("messages" mode) graph chunk.
+        
+        Only chunks produced by the interviewer model call are forwarded; tokens from
+        helper LLM calls (name extraction, summarization) and tool messages are skipped.
+        
+        Args:
+            message_chunk: Message chunk emitted by the graph
+            chunk_metadata: Metadata emitted alongside the chunk
+            
+        Returns:
+            Token text, or an empty string if the chunk should not be forwarded
+        """
+        if not isinstance(message_chunk, AIMessageChunk):
+            return ""
+        if RESPONSE_STREAM_TAG not in (chunk_metadata or {}).get("tags", []):
+            return ""
+        
+        content = message_chunk.content
+        if isinstance(content, list):
+            # Gemini may return content parts instead of a plain string
+            content = "".join(
+                part.get("text", "") if isinstance(part, dict) else str(part)
+                for part in content
+            )
+        return content or ""
+    
+    def _schedule_interview_memory_update(self, user_id: str, session_id: str, messages: List[BaseMessage],
+                                          interview_stage: Optional[str] = None) -> bool:
+        """
+        Queue a cross-thread memory update for this session on the background insight worker.
+        
+        The update is debounced per session (see InsightExtractionWorker) so the extra
+        LLM call does not run on every turn or delay the response.
+        
+        Args:
+            user_id: User identifier
+            session_id: Session identifier
+            messages: Full list of conversation messages
+            interview_stage: Current interview stage
+            
+        Returns:
+            True if an update was queued
+        """
+        if not self.memory_manager:
+            return False
+        
+        try:
+            return self.insight_worker.submit(
+                {"user_id": user_id, "session_id": session_id, "messages": list(messages)},
+                interview_stage=interview_stage
+            )
+        except Exception as e:
+            logger.error(f"Error scheduling memory update: {e}")
+            return False
+    
+    async def _aupdate_interview_memory(self, job: Dict[str, Any]) -> None:
+        """
+        Update cross-thread memory with insights extracted from the conversation.
+        
+        Runs on the background insight worker.
+        
+        Args:
+            job: Dictionary with "user_id", "session_id" and "messages"
+        """
+        if not self.memory_manager:
+            return
+        
+        user_id = job["user_id"]
+        session_id = job["session_id"]
+        
+        try:
+            # Extract candidate insights from the messages added since the last extraction
+            messages = job["messages"]
+            current_insights, marker = await self._aget_session_insights(session_id)
+            insights, extracted = await self._aextract_interview_insights(messages, current_insights, marker)
+            if extracted:
+                # Messages are only skipped next time once their insights are stored
+                await self._asave_session_insights(session_id, insights, self._insights_marker(messages))
+            
+            # Update candidate profile in long-term memory
+            if insights and "candidate_details" in insights:
+                await asyncio.to_thread(self.memory_manager.save_candidate_profile, user_id, insights)
+            
+            # Save interview memory for this session
+            await asyncio.to_thread(
+                self.memory_manager.save_interview_memory,
+                session_id=session_id,
+                memory_type="insights",
+                memory_data={"insights": insights},
+                user_id=user_id
+            )
+        except Exception as e:
+            logger.error(f"Error updating memory: {e}")
+    
+    async def _prepare_interview_turn(self, user_id: str, user_message: str, session_id: Optional[str] = None,
+                                      job_role: Optional[str] = None, seniority_level: Optional[str] = None,
+                                      required_skills: Optional[List[str]] = None, job_description: Optional[str] = None,
+                                      requires_coding: Optional[bool] = None,
+                                      handle_digression: bool = True) -> Tuple[str, Dict[str, Any]]:
+        """
+        Load or create the session for an interview turn and build the graph config.
+        
+        Args:
+            user_id: User identifier
+            user_message: User's message text
+            session_id: Optional session ID for continuing a session
+            job_role: Optional job role for the interview
+            seniority_level: Optional seniority level
+            required_skills: Optional list of required skills
+            job_description: Optional job description
+            requires_coding: Whether this role requires coding challenges
+            handle_digression: Whether to handle topic digressions
+            
+        Returns:
+            Tuple of (session ID, graph config)
+        """
         # Create a new session if one doesn't exist
         if not session_id:
-            session_id = self._get_or_create_session(user_id)
+            session_id = await self._aget_or_create_session(user_id)
             logger.info(f"Created new session {session_id} for user {user_id}")
         
         # Initialize state with default values
@@ -1244,27 +1997,27 @@ class AIInterviewer:
         # Try to load existing session if available
         try:
             # Check if the session exists
-            if self.session_manager:
-                session = self.session_manager.get_session(session_id)
+            if self.async_session_manager:
+                session = await self.async_session_manager.get_session(session_id)
             else:
                 # Use in-memory storage
                 session = self.active_sessions.get(session_id)
                 
-            if not session and self.session_manager:
+            if not session and self.async_session_manager:
                 # Create a new session if it doesn't exist but session_id was provided
                 logger.warning(f"Session {session_id} not found, creating new")
-                self.session_manager.create_session(user_id, session_id=session_id)
-                session = self.session_manager.get_session(session_id)
+                await self.async_session_manager.create_session(user_id, session_id=session_id)
+                session = await self.async_session_manager.get_session(session_id)
                 
                 # Add default interview stage
-                if session and self.session_manager:
+                if session and self.async_session_manager:
                     metadata = session.get("metadata", {})
                     metadata[STAGE_KEY] = InterviewStage.INTRODUCTION.value
-                    self.session_manager.update_session_metadata(session_id, metadata)
+                    await self.async_session_manager.update_session_metadata(session_id, metadata)
                 
             # Extract messages and metadata
             if session:
-                if self.session_manager:
+                if self.async_session_manager:
                     # MongoDB session structure
                     messages = session.get("messages", [])
                     metadata = session.get("metadata", {})
@@ -1331,8 +2084,8 @@ class AIInterviewer:
                     "max_messages_before_summary": 20
                 }
                 
-                if self.session_manager:
-                    self.session_manager.update_session_metadata(session_id, metadata)
+                if self.async_session_manager:
+                    await self.async_session_manager.update_session_metadata(session_id, metadata)
                 else:
                     # Store in memory
                     self.active_sessions[session_id] = metadata
@@ -1371,188 +2124,86 @@ class AIInterviewer:
                 
                 # No need to update the interview stage for digressions
                 metadata["handling_digression"] = True
-            else:
-                # If previously handling a digression, clear the flag
-                if metadata.get("handling_digression"):
-                    metadata.pop("handling_digression")
-                
-        # Add the user message
-        human_msg = HumanMessage(content=user_message)
-        messages.append(human_msg)
-        
-        # Increment message count for context management
-        message_count += 1
-        
-        # Check for candidate name in the user message if not already known
-        if not candidate_name:
-            # First try with simple name patterns
-            name_match = self._extract_candidate_name([human_msg])
-            if name_match:
-                candidate_name = name_match
-                logger.info(f"Extracted candidate name from new message: {candidate_name}")
-                
-                # Update metadata with the new name
-                metadata[CANDIDATE_NAME_KEY] = candidate_name
-                
-                # Immediately update session metadata with the new name
-                if self.session_manager:
-                    self.session_manager.update_session_metadata(session_id, metadata)
-                    logger.info(f"Updated session metadata with candidate name: {candidate_name}")
-        
-        # Add to transcript for later retrieval
-        if "transcript" not in metadata:
-            metadata["transcript"] = []
-        
-        # Create or update system message with context including conversation summary
-        system_prompt = INTERVIEW_SYSTEM_PROMPT.format(
-            system_name=get_llm_config()["system_name"],
-            candidate_name=candidate_name or "[Not provided yet]",
-            interview_id=session_id,
-            current_stage=interview_stage,
-            job_role=job_role_value,
-            seniority_level=seniority_level_value,
-            required_skills=", ".join(required_skills_value) if isinstance(required_skills_value, list) else str(required_skills_value),
-            job_description=job_description_value,
-            requires_coding=requires_coding_value,
-            conversation_summary=conversation_summary if conversation_summary else "No summary available yet."
-        )
-        
-        # Prepend system message if not already present
-        if not messages or not isinstance(messages[0], SystemMessage):
-            messages = [SystemMessage(content=system_prompt)] + messages
-        else:
-            # Update existing system message to reflect current stage and summary
-            messages[0] = SystemMessage(content=system_prompt)
-        
-        # Properly initialize our InterviewState class
-        state = InterviewState(
-            messages=messages,
-            candidate_name=candidate_name,
-            job_role=job_role_value,
-            seniority_level=seniority_level_value,
-            required_skills=required_skills_value,
-            job_description=job_description_value,
-            requires_coding=requires_coding_value,
-            interview_stage=interview_stage,
-            session_id=session_id,
-            user_id=user_id,
-            conversation_summary=conversation_summary,
-            message_count=message_count,
-            max_messages_before_summary=max_messages_before_summary
-        )
-        
-        # Add the StateGraph config
-        config = {
-            "configurable": {
-                "thread_id": session_id,
-                "session_id": session_id,
-                "user_id": user_id,
-            }
-        }
-        
-        # Store a message for the graph to process
-        human_message = HumanMessage(content=user_message)
-        
-        # Run the graph with appropriate method based on checkpointer type
-        final_chunk = None
-        try:
-            # Check if we're using an async checkpointer
-            is_async_checkpointer = hasattr(self.checkpointer, 'aget_tuple')
-            
-            # Use the appropriate streaming method based on the checkpointer type
-            if is_async_checkpointer:
-                # For async checkpointer
-                logger.info(f"Using async streaming with thread_id: {session_id}")
-                async for chunk in self.workflow.astream(
-                    {"messages": [human_message]},
-                    config=config,
-                    stream_mode="values",
-                ):
-                    final_chunk = chunk
-            else:
-                # For sync checkpointer
-                logger.info(f"Using synchronous streaming with thread_id: {session_id}")
-                for chunk in self.workflow.stream(
-                    {"messages": [human_message]},
-                    config=config,
-                    stream_mode="values",
-                ):
-                    final_chunk = chunk
-        except NotImplementedError as e:
-            # Handle the specific error when using wrong checkpointer type
-            logger.error(f"NotImplementedError - likely mismatched checkpointer type: {str(e)}")
-            error_message = str(e)
-            
-            # Give specific guidance based on the error
-            if "astream" in error_message and not is_async_checkpointer:
-                # Trying to use astream with a sync checkpointer
-                logger.error("Async operation called with synchronous checkpointer. Use AsyncMongoDBSaver instead of MongoDBSaver")
-                # Try fallback to sync method
-                try:
-                    logger.info("Attempting fallback to synchronous stream method")
-                    for chunk in self.workflow.stream(
-                        {"messages": [human_message]},
-                        config=config,
-                        stream_mode="values",
-                    ):
-                        final_chunk = chunk
-                except Exception as fallback_error:
-                    logger.error(f"Fallback to sync method failed: {fallback_error}")
-                    return f"I apologize, but there was an error processing your request. The system is using an incompatible checkpoint configuration. Please contact support.", session_id
-            elif "stream" in error_message and is_async_checkpointer:
-                # Trying to use stream with an async checkpointer
-                logger.error("Synchronous operation called with async checkpointer. Use MongoDBSaver instead of AsyncMongoDBSaver")
-                # Try fallback to async method if we're in an event loop
-                try:
-                    logger.info("Attempting fallback to asynchronous stream method")
-                    async for chunk in self.workflow.astream(
-                        {"messages": [human_message]},
-                        config=config,
-                        stream_mode="values",
-                    ):
-                        final_chunk = chunk
-                except Exception as fallback_error:
-                    logger.error(f"Fallback to async method failed: {fallback_error}")
-                    return f"I apologize, but there was an error processing your request. The system is using an incompatible checkpoint configuration. Please contact support.", session_id
-            else:
-                return f"I apologize, but there was an error processing your request. The system is using an incompatible checkpoint configuration. Please contact support. Error: {error_message}", session_id
-        except Exception as e:
-            import traceback
-            error_tb = traceback.format_exc()
-            logger.error(f"Error running interview graph: {str(e)}")
-            logger.error(f"Traceback: {error_tb}")
-            return f"I apologize, but there was an error processing your request. Please try again. Error: {str(e)}", session_id
+            else:
+                # If previously handling a digression, clear the flag
+                if metadata.get("handling_digression"):
+                    metadata.pop("handling_digression")
+                
+        # Add the user message
+        human_msg = HumanMessage(content=user_message)
+        messages.append(human_msg)
         
-        # Extract the AI response from the final chunk
-        if final_chunk and "messages" in final_chunk and len(final_chunk["messages"]) > 0:
-            for msg in reversed(final_chunk["messages"]):
-                if isinstance(msg, AIMessage):
-                    ai_response = msg.content
-                    logger.info(f"AI response generated for session {session_id}")
-                    
-                    # Update cross-thread memory if needed
-                    if self.memory_manager:
-                        try:
-                            # Extract candidate insights from the conversation
-                            insights = self._extract_interview_insights(final_chunk["messages"])
-                            
-                            # Update candidate profile in long-term memory
-                            if insights and "candidate_details" in insights:
-                                self.memory_manager.save_candidate_profile(user_id, insights)
-                            
-                            # Save interview memory for this session
-                            self.memory_manager.save_interview_memory(
-                                session_id=session_id,
-                                memory_type="insights",
-                                memory_data={"insights": insights}
-                            )
-                        except Exception as e:
-                            logger.error(f"Error updating memory: {e}")
-                    
-                    return ai_response, session_id
+        # Increment message count for context management
+        message_count += 1
         
-        # Fallback response if no AI message found
-        return "I'm sorry, I couldn't generate a proper response. Please try again.", session_id
+        # Check for candidate name in the user message if not already known
+        if not candidate_name:
+            # First try with simple name patterns
+            name_match = self._extract_candidate_name([human_msg])
+            if name_match:
+                candidate_name = name_match
+                logger.info(f"Extracted candidate name from new message: {candidate_name}")
+                
+                # Update metadata with the new name
+                metadata[CANDIDATE_NAME_KEY] = candidate_name
+                
+                # Immediately update session metadata with the new name
+                if self.async_session_manager:
+                    await self.async_session_manager.update_session_metadata(session_id, metadata)
+                    logger.info(f"Updated session metadata with candidate name: {candidate_name}")
+        
+        # Add to transcript for later retrieval
+        if "transcript" not in metadata:
+            metadata["transcript"] = []
+        
+        # Create or update system message with context including conversation summary;
+        # the prefix for these session settings is reused from earlier turns
+        system_prompt = self._render_system_prompt(
+            session_id=session_id,
+            candidate_name=candidate_name,
+            interview_stage=interview_stage,
+            conversation_summary=conversation_summary,
+            job_role=job_role_value,
+            seniority_level=seniority_level_value,
+            required_skills=required_skills_value,
+            job_description=job_description_value,
+            requires_coding=requires_coding_value
+        )
+        
+        # Prepend system message if not already present
+        if not messages or not isinstance(messages[0], SystemMessage):
+            messages = [SystemMessage(content=system_prompt.content)] + messages
+        else:
+            # Update existing system message to reflect current stage and summary
+            messages[0] = SystemMessage(content=system_prompt.content)
+        
+        # Properly initialize our InterviewState class
+        state = InterviewState(
+            messages=messages,
+            candidate_name=candidate_name,
+            job_role=job_role_value,
+            seniority_level=seniority_level_value,
+            required_skills=required_skills_value,
+            job_description=job_description_value,
+            requires_coding=requires_coding_value,
+            interview_stage=interview_stage,
+            session_id=session_id,
+            user_id=user_id,
+            conversation_summary=conversation_summary,
+            message_count=message_count,
+            max_messages_before_summary=max_messages_before_summary
+        )
+        
+        # Add the StateGraph config
+        config = {
+            "configurable": {
+                "thread_id": session_id,
+                "session_id": session_id,
+                "user_id": user_id,
+            }
+        }
+        
+        return session_id, config
     
     def _detect_digression(self, user_message: str, messages: List[BaseMessage], current_stage: str) -> bool:
         """
@@ -1696,6 +2347,35 @@ class AIInterviewer:
             logger.info(f"Created fallback session {session_id} for user {user_id}")
             return session_id
     
+    async def _aget_or_create_session(self, user_id: str) -> str:
+        """
+        Async variant of _get_or_create_session.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            Session ID
+        """
+        if not self.async_session_manager:
+            # In-memory session management doesn't do any I/O
+            return self._get_or_create_session(user_id)
+        
+        try:
+            # Try to get most recent active session for user
+            session = await self.async_session_manager.get_most_recent_session(user_id)
+            if session:
+                return session["session_id"]
+            
+            # Create new session with initial interview stage
+            return await self.async_session_manager.create_session(
+                user_id,
+                metadata={STAGE_KEY: InterviewStage.INTRODUCTION.value}
+            )
+        except Exception as e:
+            logger.error(f"Error in get_or_create_session: {e}")
+            return self._get_or_create_session(user_id)
+    
     def list_active_sessions(self) -> Dict[str, Dict[str, Any]]:
         """
         List all active interview sessions.
@@ -1775,6 +2455,10 @@ class AIInterviewer:
 
     def cleanup(self):
         """Clean up resources."""
+        # Release prompt prefixes registered with remote context caching
+        if hasattr(self, 'prompt_cache'):
+            self.prompt_cache.clear()
+        
         if hasattr(self, 'memory_manager') and self.memory_manager:
             try:
                 # Check if we're using an async memory manager
@@ -1852,6 +2536,13 @@ class AIInterviewer:
                 logger.info("Session manager resources cleaned up")
             except Exception as e:
                 logger.error(f"Error closing session manager: {e}")
+        
+        if hasattr(self, 'async_session_manager') and self.async_session_manager:
+            try:
+                self.async_session_manager.close()
+                logger.info("Async session manager resources cleaned up")
+            except Exception as e:
+                logger.error(f"Error closing async session manager: {e}")
     
     def _extract_candidate_name(self, messages: List[BaseMessage]) -> str:
         """
@@ -1867,35 +2558,75 @@ class AIInterviewer:
         if len(messages) < 3:
             return ""
         
-        # Create a prompt for the model to extract the name
-        extract_prompt = [
-            SystemMessage(content="You are a helpful assistant. Your task is to extract the candidate's name from the conversation, if mentioned. Respond with just the name, or 'Unknown' if no name is found."),
-            HumanMessage(content=f"Extract the candidate's name from this conversation: {', '.join([m.content for m in messages if hasattr(m, 'content')])}"),
-        ]
-        
         try:
-            # Use the same model but with no tools
-            raw_model = ChatGoogleGenerativeAI(
-                model=get_llm_config()["model"],
-                temperature=0.0
+            response = get_llm_gateway().invoke(
+                self._build_name_extraction_prompt(messages), model=get_llm_config()["model"], temperature=0.0
             )
+            return self._parse_extracted_name(response.content)
+        except Exception as e:
+            logger.error(f"Error extracting candidate name: {e}")
+            return ""
+    
+    async def _aextract_candidate_name(self, messages: List[BaseMessage]) -> str:
+        """
+        Async variant of _extract_candidate_name.
+        
+        Args:
+            messages: List of conversation messages
             
-            response = raw_model.invoke(extract_prompt)
-            
-            # Process response
-            name = response.content.strip()
-            if name.lower() in ["unknown", "not mentioned", "no name found", "none"]:
-                return ""
-                
-            # Basic cleaning
-            name = name.replace("Name:", "").replace("Candidate name:", "").strip()
-            
-            logger.info(f"Extracted candidate name: {name}")
-            return name
+        Returns:
+            Candidate name or empty string if not found
+        """
+        # Skip if we have fewer than 3 messages
+        if len(messages) < 3:
+            return ""
+        
+        try:
+            response = await get_llm_gateway().ainvoke(
+                self._build_name_extraction_prompt(messages), model=get_llm_config()["model"], temperature=0.0
+            )
+            return self._parse_extracted_name(response.content)
         except Exception as e:
             logger.error(f"Error extracting candidate name: {e}")
             return ""
     
+    @staticmethod
+    def _build_name_extraction_prompt(messages: List[BaseMessage]) -> List[BaseMessage]:
+        """
+        Build the prompt asking the model for the candidate's name.
+        
+        Args:
+            messages: List of conversation messages
+            
+        Returns:
+            Prompt messages
+        """
+        return [
+            SystemMessage(content="You are a helpful assistant. Your task is to extract the candidate's name from the conversation, if mentioned. Respond with just the name, or 'Unknown' if no name is found."),
+            HumanMessage(content=f"Extract the candidate's name from this conversation: {', '.join([m.content for m in messages if hasattr(m, 'content')])}"),
+        ]
+    
+    @staticmethod
+    def _parse_extracted_name(content: str) -> str:
+        """
+        Clean up the model's answer to the name extraction prompt.
+        
+        Args:
+            content: Raw model response text
+            
+        Returns:
+            Candidate name or empty string if none was found
+        """
+        name = content.strip()
+        if name.lower() in ["unknown", "not mentioned", "no name found", "none"]:
+            return ""
+            
+        # Basic cleaning
+        name = name.replace("Name:", "").replace("Candidate name:", "").strip()
+        
+        logger.info(f"Extracted candidate name: {name}")
+        return name
+    
     async def continue_after_challenge(self, user_id: str, session_id: str, message: str, challenge_completed: bool = True) -> Tuple[str, Dict[str, Any]]:
         """
         Continue an interview after a coding challenge has been completed.
@@ -1911,8 +2642,8 @@ class AIInterviewer:
         """
         try:
             # Get session data
-            if self.session_manager:
-                session = self.session_manager.get_session(session_id)
+            if self.async_session_manager:
+                session = await self.async_session_manager.get_session(session_id)
                 if not session:
                     return f"Session {session_id} not found.", {}
                 
@@ -1944,9 +2675,13 @@ class AIInterviewer:
                 
             metadata[STAGE_KEY] = next_stage
             
-            # Save metadata updates
-            if self.session_manager:
-                self.session_manager.update_session_metadata(session_id, metadata)
+            # Save only the changed metadata keys
+            if self.async_session_manager:
+                await self.async_session_manager.update_session_metadata(session_id, {
+                    "resuming_from_challenge": True,
+                    "challenge_completed": challenge_completed,
+                    STAGE_KEY: next_stage
+                })
             
             # Prepare context message for continuing the interview
             feedback_context = ""
@@ -2003,7 +2738,8 @@ class AIInterviewer:
         """Context manager exit."""
         self.cleanup()
 
-    def _extract_interview_insights(self, messages: List[BaseMessage], current_insights: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _extract_interview_insights(self, messages: List[BaseMessage], current_insights: Dict[str, Any] = None,
+                                    marker: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], bool]:
         """
         Extract key interview insights from messages to retain critical information
         even when messages are summarized.
@@ -2011,12 +2747,76 @@ class AIInterviewer:
         Args:
             messages: List of messages to extract insights from
             current_insights: Current insights dictionary to update
+            marker: High-water mark from a previous extraction; only messages after
+                it are sent to the model
             
         Returns:
-            Dictionary of structured insights about the candidate
+            Tuple of (insights, extracted); extracted is True only if the model's
+            response was parsed, i.e. when the high-water mark may move past the messages
+        """
+        # Initialize insights with existing data or create new dict
+        insights = current_insights or self._empty_insights()
+        
+        try:
+            # If we have fewer than 5 messages, there's not much to extract yet
+            if len(messages) < 5:
+                return insights, False
+            
+            new_messages = self._messages_after_marker(messages, marker)
+            if not new_messages:
+                return insights, False
+            
+            # Call the model to extract insights
+            extraction_response = self.summarization_model.invoke(self._build_insights_extraction_prompt(new_messages, current_insights))
+            extraction_text = extraction_response.content if hasattr(extraction_response, 'content') else ""
+            
+            return insights, self._apply_extracted_insights(insights, extraction_text)
+        except Exception as e:
+            logger.error(f"Error extracting interview insights: {e}")
+        
+        return insights, False
+    
+    async def _aextract_interview_insights(self, messages: List[BaseMessage], current_insights: Dict[str, Any] = None,
+                                           marker: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Async variant of _extract_interview_insights.
+        
+        Args:
+            messages: List of messages to extract insights from
+            current_insights: Current insights dictionary to update
+            marker: High-water mark from a previous extraction; only messages after
+                it are sent to the model
+            
+        Returns:
+            Tuple of (insights, extracted); extracted is True only if the model's
+            response was parsed, i.e. when the high-water mark may move past the messages
         """
         # Initialize insights with existing data or create new dict
-        insights = current_insights or {
+        insights = current_insights or self._empty_insights()
+        
+        try:
+            # If we have fewer than 5 messages, there's not much to extract yet
+            if len(messages) < 5:
+                return insights, False
+            
+            new_messages = self._messages_after_marker(messages, marker)
+            if not new_messages:
+                return insights, False
+            
+            # Call the model to extract insights
+            extraction_response = await self.summarization_model.ainvoke(self._build_insights_extraction_prompt(new_messages, current_insights))
+            extraction_text = extraction_response.content if hasattr(extraction_response, 'content') else ""
+            
+            return insights, self._apply_extracted_insights(insights, extraction_text)
+        except Exception as e:
+            logger.error(f"Error extracting interview insights: {e}")
+        
+        return insights, False
+    
+    @staticmethod
+    def _empty_insights() -> Dict[str, Any]:
+        """Create an empty insights dictionary."""
+        return {
             "candidate_details": {
                 "name": "",
                 "years_of_experience": None,
@@ -2042,125 +2842,194 @@ class AIInterviewer:
             },
             "extracted_at": datetime.now().isoformat()
         }
+    
+    @staticmethod
+    def _insights_marker(messages: List[Any]) -> Dict[str, Any]:
+        """
+        Build a high-water mark for the last message covered by an insight extraction.
         
-        try:
-            # If we have fewer than 5 messages, there's not much to extract yet
-            if len(messages) < 5:
-                return insights
-                
-            # Use the summarization model to extract structured insights
-            # Build a prompt that asks for specific structured information
-            extraction_prompt = [
-                SystemMessage(content="""You are an expert at analyzing technical interviews and extracting structured information.
-                Extract key information from this interview conversation into the following structured format.
-                Only include information that was explicitly mentioned; don't infer or make up details.
-                
-                Format your response as a valid JSON object with these fields:
-                {
-                    "candidate_details": {
-                        "name": "Candidate's name if mentioned",
-                        "years_of_experience": "Years of experience in relevant fields (number or range)",
-                        "current_role": "Current job title if mentioned",
-                        "education": "Educational background if mentioned",
-                        "location": "Location if mentioned"
-                    },
-                    "key_skills": ["List of skills the candidate mentioned having"],
-                    "notable_experiences": ["Brief descriptions of notable projects or achievements mentioned"],
-                    "strengths": ["Areas where the candidate demonstrated strength"],
-                    "areas_for_improvement": ["Areas where the candidate could improve"],
-                    "coding_ability": {
-                        "assessed": true/false,
-                        "languages": ["Programming languages mentioned"],
-                        "frameworks": ["Frameworks mentioned"],
-                        "level": "Assessment of coding ability if determined"
-                    },
-                    "communication_ability": "Assessment of communication skills if demonstrated"
-                }
-                """),
-                HumanMessage(content="Here is the interview conversation to analyze:\n\n" + "\n".join([f"{m.type}: {m.content}" for m in messages if hasattr(m, 'content')]))
-            ]
+        Args:
+            messages: Messages the extraction covered
             
-            # Call the model to extract insights
-            extraction_response = self.summarization_model.invoke(extraction_prompt)
-            extraction_text = extraction_response.content if hasattr(extraction_response, 'content') else ""
+        Returns:
+            Marker with the last message id (if any) and the message count
+        """
+        last_id = getattr(messages[-1], "id", None) if messages else None
+        return {"message_id": last_id, "message_count": len(messages)}
+    
+    @staticmethod
+    def _messages_after_marker(messages: List[Any], marker: Optional[Dict[str, Any]]) -> List[Any]:
+        """
+        Get the messages added after a high-water mark.
+        
+        Messages are located by id so the mark stays valid when context management
+        removes older messages; the message count is used when messages have no ids.
+        
+        Args:
+            messages: Current list of messages
+            marker: Marker from _insights_marker, or None
+            
+        Returns:
+            Messages not yet covered by the marker
+        """
+        if not marker:
+            return list(messages)
+        
+        message_id = marker.get("message_id")
+        if message_id:
+            for index in range(len(messages) - 1, -1, -1):
+                if getattr(messages[index], "id", None) == message_id:
+                    return list(messages[index + 1:])
+            # The marked message was trimmed, so everything left is newer
+            return list(messages)
+        
+        count = marker.get("message_count") or 0
+        return list(messages[count:]) if count <= len(messages) else list(messages)
+    
+    @staticmethod
+    def _build_insights_extraction_prompt(messages: List[BaseMessage],
+                                          current_insights: Optional[Dict[str, Any]] = None) -> List[BaseMessage]:
+        """
+        Build the prompt asking the model for structured interview insights.
+        
+        Args:
+            messages: List of messages to extract insights from
+            current_insights: Insights extracted so far, sent instead of the earlier messages
             
-            # Parse the JSON response - handle potential JSON formatting issues
-            import json
-            import re
+        Returns:
+            Prompt messages
+        """
+        import json
+        
+        conversation = "\n".join([f"{m.type}: {m.content}" for m in messages if hasattr(m, 'content')])
+        if current_insights:
+            known = {k: v for k, v in current_insights.items() if k != "extracted_at"}
+            human_content = (
+                "Here are the insights extracted from the earlier part of the interview:\n\n"
+                + json.dumps(known, default=str)
+                + "\n\nHere are the new interview messages since then. Only report information from these messages:\n\n"
+                + conversation
+            )
+        else:
+            human_content = "Here is the interview conversation to analyze:\n\n" + conversation
+        
+        # Build a prompt that asks for specific structured information
+        return [
+            SystemMessage(content="""You are an expert at analyzing technical interviews and extracting structured information.
+            Extract key information from this interview conversation into the following structured format.
+            Only include information that was explicitly mentioned; don't infer or make up details.
+            
+            Format your response as a valid JSON object with these fields:
+            {
+                "candidate_details": {
+                    "name": "Candidate's name if mentioned",
+                    "years_of_experience": "Years of experience in relevant fields (number or range)",
+                    "current_role": "Current job title if mentioned",
+                    "education": "Educational background if mentioned",
+                    "location": "Location if mentioned"
+                },
+                "key_skills": ["List of skills the candidate mentioned having"],
+                "notable_experiences": ["Brief descriptions of notable projects or achievements mentioned"],
+                "strengths": ["Areas where the candidate demonstrated strength"],
+                "areas_for_improvement": ["Areas where the candidate could improve"],
+                "coding_ability": {
+                    "assessed": true/false,
+                    "languages": ["Programming languages mentioned"],
+                    "frameworks": ["Frameworks mentioned"],
+                    "level": "Assessment of coding ability if determined"
+                },
+                "communication_ability": "Assessment of communication skills if demonstrated"
+            }
+            """),
+            HumanMessage(content=human_content)
+        ]
+    
+    @staticmethod
+    def _apply_extracted_insights(insights: Dict[str, Any], extraction_text: str) -> bool:
+        """
+        Merge the model's JSON insight extraction into an insights dictionary in place.
+        
+        Args:
+            insights: Insights dictionary to update
+            extraction_text: Raw model response text
             
-            # Look for JSON object in the response
-            json_match = re.search(r'```json\s*(.*?)\s*```', extraction_text, re.DOTALL)
+        Returns:
+            True if the response was parsed and merged, False otherwise
+        """
+        # Parse the JSON response - handle potential JSON formatting issues
+        import json
+        import re
+        
+        # Look for JSON object in the response
+        json_match = re.search(r'```json\s*(.*?)\s*```', extraction_text, re.DOTALL)
+        if json_match:
+            extraction_text = json_match.group(1)
+        else:
+            # Try to find JSON with curly braces
+            json_match = re.search(r'({.*})', extraction_text, re.DOTALL)
             if json_match:
                 extraction_text = json_match.group(1)
-            else:
-                # Try to find JSON with curly braces
-                json_match = re.search(r'({.*})', extraction_text, re.DOTALL)
-                if json_match:
-                    extraction_text = json_match.group(1)
-            
-            # Parse the JSON
-            try:
-                extracted_data = json.loads(extraction_text)
-                
-                # Update insights with extracted data, preserving existing data where appropriate
-                if "candidate_details" in extracted_data:
-                    for key, value in extracted_data["candidate_details"].items():
-                        if value and (not insights["candidate_details"].get(key) or key == "name"):
-                            insights["candidate_details"][key] = value
-                
-                # Update lists by adding new unique items
-                for list_key in ["key_skills", "notable_experiences", "strengths", "areas_for_improvement"]:
-                    if list_key in extracted_data and isinstance(extracted_data[list_key], list):
-                        current_set = set(insights.get(list_key, []))
-                        for item in extracted_data[list_key]:
-                            if item and item not in current_set:
-                                insights.setdefault(list_key, []).append(item)
-                                current_set.add(item)
-                
-                # Update coding ability
-                if "coding_ability" in extracted_data:
-                    coding = extracted_data["coding_ability"]
-                    insights_coding = insights["coding_ability"]
-                    
-                    # Only set assessed to True if it was previously False
-                    if coding.get("assessed", False):
-                        insights_coding["assessed"] = True
-                    
-                    # Add new programming languages
-                    if "languages" in coding and isinstance(coding["languages"], list):
-                        current_languages = set(insights_coding.get("languages", []))
-                        for lang in coding["languages"]:
-                            if lang and lang not in current_languages:
-                                insights_coding.setdefault("languages", []).append(lang)
-                                current_languages.add(lang)
-                    
-                    # Add new frameworks
-                    if "frameworks" in coding and isinstance(coding["frameworks"], list):
-                        current_frameworks = set(insights_coding.get("frameworks", []))
-                        for framework in coding["frameworks"]:
-                            if framework and framework not in current_frameworks:
-                                insights_coding.setdefault("frameworks", []).append(framework)
-                                current_frameworks.add(framework)
-                    
-                    # Update level if provided
-                    if coding.get("level") and (not insights_coding.get("level") or len(coding["level"]) > len(insights_coding["level"])):
-                        insights_coding["level"] = coding["level"]
-                
-                # Update communication ability if provided
-                if extracted_data.get("communication_ability"):
-                    insights["communication_ability"] = extracted_data["communication_ability"]
-                
-                # Update timestamp
-                insights["extracted_at"] = datetime.now().isoformat()
-                
-                logger.info(f"Successfully extracted interview insights with {len(insights.get('key_skills', []))} skills and {len(insights.get('notable_experiences', []))} experiences")
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON from extraction response: {e}")
-                logger.debug(f"Raw extraction text: {extraction_text}")
-        except Exception as e:
-            logger.error(f"Error extracting interview insights: {e}")
         
-        return insights
+        # Parse the JSON
+        try:
+            extracted_data = json.loads(extraction_text)
+            
+            # Update insights with extracted data, preserving existing data where appropriate
+            if "candidate_details" in extracted_data:
+                for key, value in extracted_data["candidate_details"].items():
+                    if value and (not insights["candidate_details"].get(key) or key == "name"):
+                        insights["candidate_details"][key] = value
+            
+            # Update lists by adding new unique items
+            list_updates = {
+                list_key: extracted_data[list_key]
+                for list_key in ["key_skills", "notable_experiences", "strengths", "areas_for_improvement"]
+                if isinstance(extracted_data.get(list_key), list)
+            }
+            insights.update(InterviewMemoryManager._merge_profile_data(insights, list_updates))
+            
+            # Update coding ability
+            if "coding_ability" in extracted_data:
+                coding = extracted_data["coding_ability"]
+                insights_coding = insights["coding_ability"]
+                
+                # Only set assessed to True if it was previously False
+                if coding.get("assessed", False):
+                    insights_coding["assessed"] = True
+                
+                # Add new programming languages
+                if "languages" in coding and isinstance(coding["languages"], list):
+                    current_languages = set(insights_coding.get("languages", []))
+                    for lang in coding["languages"]:
+                        if lang and lang not in current_languages:
+                            insights_coding.setdefault("languages", []).append(lang)
+                            current_languages.add(lang)
+                
+                # Add new frameworks
+                if "frameworks" in coding and isinstance(coding["frameworks"], list):
+                    current_frameworks = set(insights_coding.get("frameworks", []))
+                    for framework in coding["frameworks"]:
+                        if framework and framework not in current_frameworks:
+                            insights_coding.setdefault("frameworks", []).append(framework)
+                            current_frameworks.add(framework)
+                
+                # Update level if provided
+                if coding.get("level") and (not insights_coding.get("level") or len(coding["level"]) > len(insights_coding["level"])):
+                    insights_coding["level"] = coding["level"]
+            
+            # Update communication ability if provided
+            if extracted_data.get("communication_ability"):
+                insights["communication_ability"] = extracted_data["communication_ability"]
+            
+            # Update timestamp
+            insights["extracted_at"] = datetime.now().isoformat()
+            
+            logger.info(f"Successfully extracted interview insights with {len(insights.get('key_skills', []))} skills and {len(insights.get('notable_experiences', []))} experiences")
+            return True
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON from extraction response: {e}")
+            logger.debug(f"Raw extraction text: {extraction_text}")
+            return False
 
     async def extract_and_update_insights(self, session_id: str) -> Dict[str, Any]:
         """
@@ -2177,11 +3046,11 @@ class AIInterviewer:
         """
         try:
             # Get session data
-            if not self.session_manager:
+            if not self.async_session_manager:
                 logger.error("Cannot extract insights: Session manager not available")
                 return {}
                 
-            session = self.session_manager.get_session(session_id)
+            session = await self.async_session_manager.get_session(session_id)
             if not session:
                 logger.error(f"Cannot extract insights: Session {session_id} not found")
                 return {}
@@ -2190,16 +3059,16 @@ class AIInterviewer:
             messages = session.get("messages", [])
             metadata = session.get("metadata", {})
             current_insights = metadata.get("interview_insights", None)
+            marker = metadata.get("interview_insights_hwm", None)
             
-            # Extract insights from messages
+            # Extract insights from messages added since the last extraction
             logger.info(f"Manually extracting insights from session {session_id} with {len(messages)} messages")
-            insights = self._extract_interview_insights(messages, current_insights)
-            
-            # Update metadata with new insights
-            metadata["interview_insights"] = insights
-            self.session_manager.update_session_metadata(session_id, metadata)
+            insights, extracted = await self._aextract_interview_insights(messages, current_insights, marker)
             
-            logger.info(f"Successfully extracted and updated insights for session {session_id}")
+            # Update only the insight keys of the metadata
+            if extracted:
+                await self._asave_session_insights(session_id, insights, self._insights_marker(messages))
+                logger.info(f"Successfully extracted and updated insights for session {session_id}")
             return insights
         except Exception as e:
             logger.error(f"Error in extract_and_update_insights: {e}")
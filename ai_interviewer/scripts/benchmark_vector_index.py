@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Benchmark script for the memory vector index.
+
+This script compares exhaustive (brute-force) and clustered (approximate)
+search on synthetic interview memories of increasing size. It reports the
+query latency of both and the recall of approximate search against the exact
+top k, to choose MEMORY_VECTOR_ANN_THRESHOLD and MEMORY_VECTOR_NPROBE.
+
+Usage:
+    python ai_interviewer/scripts/benchmark_vector_index.py --sizes 1000 10000 100000
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from ai_interviewer.utils.vector_index import HashedNgramEmbedder, MemoryVectorIndex
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+SKILLS = [
+    "python", "java", "golang", "rust", "typescript", "react", "kubernetes", "docker", "terraform",
+    "postgresql", "mongodb", "redis", "kafka", "spark", "airflow", "graphql", "microservices",
+    "pytorch", "tensorflow", "aws", "gcp", "azure", "linux", "networking", "security", "ci/cd"
+]
+QUALITIES = [
+    "strong", "solid", "limited", "deep", "practical", "theoretical", "hands-on", "growing", "senior-level"
+]
+TOPICS = [
+    "system design", "algorithms", "data modelling", "testing", "debugging", "performance tuning",
+    "distributed systems", "API design", "concurrency", "observability", "code review", "mentoring"
+]
+
+
+def synthetic_memory(rng):
+    """Build a random insight-like memory text"""
+    skills = rng.sample(SKILLS, 3)
+    return (
+        f"Candidate showed {rng.choice(QUALITIES)} experience with {skills[0]} and {skills[1]}. "
+        f"Discussed {rng.choice(TOPICS)} using {skills[2]}; {rng.choice(QUALITIES)} grasp of {rng.choice(TOPICS)}."
+    )
+
+
+def time_queries(index, queries, k, exact):
+    """Return the mean query latency in milliseconds and the result IDs"""
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        results.append([item_id for item_id, _, _ in index.search(query, k=k, exact=exact)])
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / len(queries), results
+
+
+def benchmark(size, num_queries, k, nprobe, dim, seed):
+    """Benchmark one index size and return a result row"""
+    rng = random.Random(seed)
+    index = MemoryVectorIndex(embedder=HashedNgramEmbedder(dim), ann_threshold=0, nprobe=nprobe)
+
+    start = time.perf_counter()
+    for i in range(size):
+        index.add(f"memory-{i}", synthetic_memory(rng), {"user_id": f"user-{i % 1000}"})
+    build_s = time.perf_counter() - start
+
+    queries = [
+        f"{rng.choice(QUALITIES)} {rng.choice(SKILLS)} {rng.choice(TOPICS)}" for _ in range(num_queries)
+    ]
+    exact_ms, exact_results = time_queries(index, queries, k, exact=True)
+
+    start = time.perf_counter()
+    index.train()
+    train_s = time.perf_counter() - start
+    approximate_ms, approximate_results = time_queries(index, queries, k, exact=False)
+
+    hits = sum(len(set(a) & set(e)) for a, e in zip(approximate_results, exact_results))
+    expected = sum(len(e) for e in exact_results) or 1
+    return {
+        "size": size,
+        "build_s": build_s,
+        "train_s": train_s,
+        "exact_ms": exact_ms,
+        "approximate_ms": approximate_ms,
+        "recall": hits / expected,
+        "clusters": index.get_stats()["clusters"],
+    }
+
+
+def main():
+    """Run the benchmark for each size and print a table"""
+    parser = argparse.ArgumentParser(description="Benchmark brute-force against clustered vector search")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000, 50000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("--dim", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'clusters':>8} {'build s':>8} {'train s':>8} {'exact ms':>9} {'approx ms':>9} {'recall@' + str(args.k):>9}")
+    for size in args.sizes:
+        row = benchmark(size, args.queries, args.k, args.nprobe, args.dim, args.seed)
+        print(
+            f"{row['size']:>8} {row['clusters']:>8} {row['build_s']:>8.2f} {row['train_s']:>8.2f} "
+            f"{row['exact_ms']:>9.3f} {row['approximate_ms']:>9.3f} {row['recall']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,14 @@ import uuid
 import asyncio
 import logging
 import base64
+import json
 import re
 from typing import Dict, Any, Optional, List, Literal, Union
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, UploadFile, File, Request
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, UploadFile, File, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse, FileResponse
+from fastapi.responses import JSONResponse, StreamingResponse, FileResponse, Response
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.staticfiles import StaticFiles
@@ -26,9 +27,14 @@ from starlette.status import HTTP_429_TOO_MANY_REQUESTS
 
 from ai_interviewer.core.ai_interviewer import AIInterviewer
 from ai_interviewer.utils.speech_utils import VoiceHandler
-from ai_interviewer.utils.config import get_llm_config, get_db_config
+from ai_interviewer.utils.voice_pipeline import VoiceConversation
+from ai_interviewer.tools.execution_service import CodeExecutionService
+from ai_interviewer.tools.code_execution import prepare_sandbox, get_sandbox_status
+from ai_interviewer.utils.config import get_llm_config, get_db_config, get_sandbox_config
 from ai_interviewer.utils.transcript import extract_messages_from_transcript, safe_extract_content
 from ai_interviewer.utils.memory_manager import InterviewMemoryManager
+from ai_interviewer.utils.llm_gateway import get_llm_gateway
+from ai_interviewer.utils.response_cache import get_response_cache
 from langgraph.types import interrupt, Command
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -153,6 +159,9 @@ except Exception as e:
     voice_handler = None
     voice_enabled = False
 
+# Code submissions are evaluated off the event loop with a global concurrency cap
+execution_service = CodeExecutionService()
+
 # Custom OpenAPI documentation
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
@@ -306,6 +315,14 @@ async def general_exception_handler(request: Request, exc: Exception):
         content={"detail": "An internal server error occurred. Please try again later."}
     )
 
+# Get the code sandbox ready before the first submission
+@app.on_event("startup")
+async def startup_event():
+    """Pull sandbox images, fill the warm pools and run a canary in the background."""
+    if get_sandbox_config()["prepare_on_startup"]:
+        # Image pulls can take minutes; /api/health reports progress meanwhile
+        app.state.sandbox_prepare_task = asyncio.create_task(asyncio.to_thread(prepare_sandbox))
+
 # Background task to clean up resources when the server is shutting down
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -314,6 +331,11 @@ async def shutdown_event():
     
     # Clean up AI Interviewer resources
     if 'interviewer' in globals():
+        try:
+            await interviewer.insight_worker.stop()
+        except Exception as e:
+            logger.error(f"Error stopping insight worker: {e}")
+        
         try:
             interviewer.cleanup()
             logger.info("AI Interviewer resources cleaned up")
@@ -335,12 +357,16 @@ async def shutdown_event():
     # Clean up voice handler resources
     if 'voice_handler' in globals() and voice_handler:
         try:
-            if hasattr(voice_handler, 'close'):
-                voice_handler.close()
-                logger.info("Voice handler resources cleaned up")
+            # Close the pooled Deepgram HTTP connections
+            await voice_handler.aclose()
+            logger.info("Voice handler resources cleaned up")
         except Exception as e:
             logger.error(f"Error cleaning up voice handler: {e}")
     
+    # Stop the code execution thread pool
+    if 'execution_service' in globals():
+        execution_service.shutdown()
+    
     logger.info("Server shutdown complete")
 
 # Dependency for monitoring request timing
@@ -350,6 +376,20 @@ async def log_request_time(request: Request):
     process_time = (datetime.now() - request.state.start_time).total_seconds() * 1000
     logger.info(f"Request to {request.url.path} took {process_time:.2f}ms")
 
+async def get_session_metadata(session_id: str) -> Dict[str, Any]:
+    """
+    Get session metadata without blocking the event loop.
+    
+    Args:
+        session_id: Session ID
+        
+    Returns:
+        Session metadata, or an empty dict if unavailable
+    """
+    if interviewer.async_session_manager:
+        return await interviewer.async_session_manager.get_session_metadata(session_id)
+    return {}
+
 # Define some default job roles
 DEFAULT_JOB_ROLES = [
     JobRole(
@@ -479,11 +519,7 @@ async def start_interview(request: Request, request_data: MessageRequest):
         )
         
         # Get session metadata if available
-        metadata = {}
-        if interviewer.session_manager:
-            session = interviewer.session_manager.get_session(session_id)
-            if session and "metadata" in session:
-                metadata = session["metadata"]
+        metadata = await get_session_metadata(session_id)
         
         return MessageResponse(
             response=ai_response,
@@ -541,11 +577,7 @@ async def continue_interview(request: Request, session_id: str, request_data: Me
         )
         
         # Get session metadata if available
-        metadata = {}
-        if interviewer.session_manager:
-            session = interviewer.session_manager.get_session(new_session_id)
-            if session and "metadata" in session:
-                metadata = session["metadata"]
+        metadata = await get_session_metadata(new_session_id)
         
         return MessageResponse(
             response=ai_response,
@@ -563,6 +595,89 @@ async def continue_interview(request: Request, session_id: str, request_data: Me
         logger.error(f"Error continuing interview: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def format_sse_event(event: str, data: Dict[str, Any]) -> str:
+    """
+    Format a Server-Sent Events message.
+
+    Args:
+        event: Event name
+        data: JSON-serializable event payload
+
+    Returns:
+        SSE-formatted string
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.post(
+    "/api/interview/{session_id}/stream",
+    responses={
+        200: {"description": "Stream of interview response tokens (text/event-stream)"},
+        400: {"description": "Bad request - missing user ID", "model": ErrorResponse},
+        429: {"description": "Rate limit exceeded", "model": ErrorResponse},
+        500: {"description": "Internal server error", "model": ErrorResponse}
+    },
+    dependencies=[Depends(log_request_time)]
+)
+@limiter.limit("15/minute")
+async def stream_interview(request: Request, session_id: str, request_data: MessageRequest):
+    """
+    Continue an existing interview session, streaming the response as Server-Sent Events.
+
+    Emits a "token" event for each chunk of the AI response as soon as it is generated,
+    followed by a single "done" event carrying the full response and session metadata
+    (or an "error" event). The session is persisted before the "done" event is sent.
+
+    Args:
+        session_id: Session ID to continue
+        request_data: MessageRequest containing the user's message and user ID
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+    # Ensure user ID is provided
+    if not request_data.user_id:
+        raise HTTPException(status_code=400, detail="User ID is required")
+
+    async def event_generator():
+        try:
+            async for event in interviewer.stream_interview(
+                request_data.user_id,
+                request_data.message,
+                session_id,
+                job_role=request_data.job_role,
+                seniority_level=request_data.seniority_level,
+                required_skills=request_data.required_skills,
+                job_description=request_data.job_description,
+                requires_coding=request_data.requires_coding
+            ):
+                if event["type"] == "done":
+                    # Get session metadata if available
+                    metadata = await get_session_metadata(event["session_id"])
+
+                    yield format_sse_event("done", {
+                        "response": event["response"],
+                        "session_id": event["session_id"],
+                        "interview_stage": event.get("interview_stage") or metadata.get("interview_stage"),
+                        "job_role": metadata.get("job_role"),
+                        "requires_coding": metadata.get("requires_coding")
+                    })
+                elif event["type"] == "token":
+                    yield format_sse_event("token", {"content": event["content"]})
+                else:
+                    yield format_sse_event("error", {
+                        "detail": event.get("message", "Unknown error"),
+                        "session_id": event.get("session_id", session_id)
+                    })
+        except Exception as e:
+            logger.error(f"Error streaming interview: {e}")
+            yield format_sse_event("error", {"detail": str(e), "session_id": session_id})
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get(
     "/api/sessions/{user_id}", 
     response_model=List[SessionResponse],
@@ -664,10 +779,9 @@ async def transcribe_and_respond(request: Request, request_data: AudioTranscript
         # Check if we have an existing session with candidate information
         session_data = {}
         candidate_name_before = None
-        if request_data.session_id and interviewer.session_manager:
-            existing_session = interviewer.session_manager.get_session(request_data.session_id)
-            if existing_session and "metadata" in existing_session:
-                session_data = existing_session["metadata"]
+        if request_data.session_id and interviewer.async_session_manager:
+            session_data = await interviewer.async_session_manager.get_session_metadata(request_data.session_id)
+            if session_data:
                 candidate_name_before = session_data.get('candidate_name')
                 logger.info(f"Restored session data with candidate: {candidate_name_before or 'Unknown'}")
         
@@ -705,11 +819,12 @@ async def transcribe_and_respond(request: Request, request_data: AudioTranscript
                 
                 logger.info(f"Audio format detection - WAV: {is_wav}, WebM: {is_webm}, MP3: {is_mp3}")
             
-            # Save a sample for debugging
-            debug_sample_path = "/tmp/audio_debug_sample.raw"
-            with open(debug_sample_path, "wb") as f:
-                f.write(audio_bytes[:min(8000, len(audio_bytes))])
-            logger.info(f"Debug audio sample saved to {debug_sample_path}")
+            # Save a sample for debugging (opt-in via SPEECH_DEBUG_AUDIO_DUMP)
+            if speech_config.get("debug_audio_dump"):
+                debug_sample_path = speech_config["debug_audio_path"]
+                with open(debug_sample_path, "wb") as f:
+                    f.write(memoryview(audio_bytes)[:8000])
+                logger.info(f"Debug audio sample saved to {debug_sample_path}")
             
         except Exception as e:
             logger.error(f"Error decoding base64 audio data: {e}")
@@ -780,24 +895,25 @@ async def transcribe_and_respond(request: Request, request_data: AudioTranscript
         
         # Get session metadata if available
         metadata = {}
-        if interviewer.session_manager:
+        if interviewer.async_session_manager:
             # Verify session exists
-            session = interviewer.session_manager.get_session(session_id)
+            session = await interviewer.async_session_manager.get_session(session_id)
             if not session:
                 logger.error(f"Session {session_id} not found after run_interview. Creating backup session.")
                 # Create emergency backup session
                 try:
-                    interviewer.session_manager.create_session(
+                    await interviewer.async_session_manager.create_session(
                         user_id, 
                         {
                             "interview_stage": "introduction",
                             "created_at": datetime.now().isoformat(),
                             "last_active": datetime.now().isoformat(),
                             "backup_created": True
-                        }
+                        },
+                        session_id=session_id
                     )
                     # Try to get session again
-                    session = interviewer.session_manager.get_session(session_id)
+                    session = await interviewer.async_session_manager.get_session(session_id)
                 except Exception as e:
                     logger.error(f"Error creating backup session: {e}")
             
@@ -816,30 +932,12 @@ async def transcribe_and_respond(request: Request, request_data: AudioTranscript
         audio_response_url = None
         try:
             if voice_handler:
-                # Create a unique filename for the audio response
-                audio_filename = f"{session_id}_{int(datetime.now().timestamp())}.wav"
-                
-                # Use a path relative to the application directory
-                app_dir = os.path.dirname(os.path.abspath(__file__))
-                audio_responses_dir = os.path.join(app_dir, "audio_responses")
-                
-                # Ensure directory exists
-                os.makedirs(audio_responses_dir, exist_ok=True)
-                
-                audio_path = os.path.join(audio_responses_dir, audio_filename)
-                
-                # Generate audio
-                success = await voice_handler.speak(
-                    text=ai_response,
-                    voice=speech_config.get("tts_voice", "nova"),
-                    output_file=audio_path,
-                    play_audio=False
+                audio_response_url = await generate_audio_response(
+                    ai_response,
+                    "audio_responses",
+                    f"{session_id}_{int(datetime.now().timestamp())}.wav"
                 )
-                
-                if success:
-                    logger.info(f"Generated audio response at {audio_path}")
-                    audio_response_url = f"/api/audio/response/{audio_filename}"
-                else:
+                if not audio_response_url:
                     logger.warning(f"Failed to generate audio response")
         except Exception as e:
             logger.warning(f"Error generating audio response: {e}")
@@ -924,34 +1022,10 @@ async def upload_audio_file(
         )
         
         # Get session metadata if available
-        metadata = {}
-        if interviewer.session_manager:
-            session = interviewer.session_manager.get_session(new_session_id)
-            if session and "metadata" in session:
-                metadata = session["metadata"]
-        
-        # Generate speech response
-        audio_filename = f"response_{uuid.uuid4()}.wav"
-        
-        # Use a path relative to the application directory
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        temp_audio_dir = os.path.join(app_dir, "temp_audio")
-        
-        # Create temp directory if it doesn't exist
-        os.makedirs(temp_audio_dir, exist_ok=True)
-        
-        audio_path = os.path.join(temp_audio_dir, audio_filename)
+        metadata = await get_session_metadata(new_session_id)
         
-        # Generate speech
-        await voice_handler.speak(
-            text=ai_response,
-            voice=speech_config.get("tts_voice", "nova"),
-            output_file=audio_path,
-            play_audio=False
-        )
-        
-        # For simplicity, we're returning a URL that can be used to fetch the audio
-        audio_url = f"/api/audio/response/{audio_filename}"
+        # Generate speech response; the URL can be used to fetch the audio
+        audio_url = await generate_audio_response(ai_response, "temp_audio", f"response_{uuid.uuid4()}.wav")
         
         return AudioTranscriptionResponse(
             transcription=transcription,
@@ -966,17 +1040,142 @@ async def upload_audio_file(
         logger.error(f"Error processing audio file: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.websocket("/api/voice/ws")
+async def voice_websocket(
+    websocket: WebSocket,
+    user_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+    encoding: Optional[str] = None,
+    sample_rate: Optional[int] = None,
+    channels: Optional[int] = None
+):
+    """
+    Real-time voice interview over a WebSocket.
+    
+    The client sends audio as binary frames; speech is transcribed while it streams in,
+    and each utterance is answered with response tokens plus raw audio chunks for every
+    sentence as soon as it is complete. See ai_interviewer.utils.voice_pipeline for the
+    message protocol.
+    
+    Args:
+        websocket: WebSocket connection
+        user_id: User ID (generated if not provided)
+        session_id: Session ID (if continuing a session)
+        encoding: Encoding of raw audio frames (e.g. "linear16"); omit for containerized audio such as WebM
+        sample_rate: Sample rate of raw audio frames
+        channels: Number of channels of raw audio frames
+    """
+    await websocket.accept()
+    
+    if not voice_enabled or not voice_handler:
+        await websocket.send_json({"type": "error", "detail": "Voice processing not available"})
+        await websocket.close(code=1011)
+        return
+    
+    user_id = user_id or f"api-user-{uuid.uuid4()}"
+    
+    # Raw PCM input needs its format declared; containerized audio is detected by Deepgram
+    stt_params = {}
+    if encoding:
+        stt_params["encoding"] = encoding
+        stt_params["sample_rate"] = sample_rate or speech_config.get("sample_rate", 16000)
+        stt_params["channels"] = channels or 1
+    
+    conversation = VoiceConversation(
+        websocket,
+        voice_handler,
+        interviewer,
+        user_id,
+        session_id=session_id,
+        voice=speech_config.get("tts_voice", "nova"),
+        stt_params=stt_params,
+        tts_params={
+            "encoding": "linear16",
+            "container": "none",
+            "sample_rate": speech_config.get("stream_sample_rate", 24000)
+        }
+    )
+    
+    try:
+        logger.info(f"Voice WebSocket opened for user {user_id}, session {session_id or 'new'}")
+        await conversation.run()
+    except Exception as e:
+        logger.error(f"Error in voice WebSocket: {e}")
+    finally:
+        try:
+            await websocket.close()
+        except Exception as e:
+            logger.debug(f"Voice WebSocket already closed: {e}")
+        logger.info(f"Voice WebSocket closed for user {user_id}")
+
+async def generate_audio_response(text: str, fallback_dir: str, fallback_filename: str) -> Optional[str]:
+    """
+    Synthesize speech for an AI response and return the URL it can be fetched from.
+    
+    Audio goes into the TTS cache when it is enabled, so repeated phrases are served
+    without another TTS request; otherwise a new file is written to fallback_dir.
+    
+    Args:
+        text: Text to convert to speech
+        fallback_dir: Directory (relative to the application directory) used without a cache
+        fallback_filename: Filename used without a cache
+        
+    Returns:
+        URL of the audio response, or None if synthesis failed
+    """
+    voice = speech_config.get("tts_voice", "nova")
+    
+    if voice_handler.tts_cache:
+        cache_key = await voice_handler.synthesize_to_cache(text, voice=voice)
+        return f"/api/audio/response/{cache_key}.wav" if cache_key else None
+    
+    # Use a path relative to the application directory
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    audio_dir = os.path.join(app_dir, fallback_dir)
+    
+    # Ensure directory exists
+    os.makedirs(audio_dir, exist_ok=True)
+    
+    audio_path = os.path.join(audio_dir, fallback_filename)
+    
+    # Generate audio
+    success = await voice_handler.speak(
+        text=text,
+        voice=voice,
+        output_file=audio_path,
+        play_audio=False
+    )
+    
+    if not success:
+        return None
+    
+    logger.info(f"Generated audio response at {audio_path}")
+    return f"/api/audio/response/{fallback_filename}"
+
 @app.get("/api/audio/response/{filename}")
 async def get_audio_response(filename: str):
     """
     Get audio response file.
     
+    Cached audio is served directly from the TTS cache.
+    
     Args:
         filename: Audio filename
         
     Returns:
         Audio file as streaming response
     """
+    # Serve content-addressed audio from the TTS cache
+    cache_key = os.path.splitext(filename)[0]
+    if voice_handler and voice_handler.tts_cache and voice_handler.tts_cache.is_valid_key(cache_key):
+        audio_data = await asyncio.to_thread(voice_handler.tts_cache.get, cache_key)
+        if audio_data is not None:
+            return Response(
+                content=audio_data,
+                media_type="audio/wav",
+                headers={"Cache-Control": "public, max-age=31536000, immutable"}
+            )
+    
     # Use a path relative to the application directory
     app_dir = os.path.dirname(os.path.abspath(__file__))
     audio_responses_dir = os.path.join(app_dir, "audio_responses")
@@ -1014,7 +1213,9 @@ async def health_check():
     Health check endpoint.
     
     This endpoint checks if the service is running properly and if the
-    database connection is available.
+    database connection is available. It also reports whether the code
+    sandbox is ready (images pulled, canary passed) and its capacity, and
+    how often tool LLM calls are answered from the response cache.
     
     Returns:
         Status of the service and its components
@@ -1026,11 +1227,32 @@ async def health_check():
         # Check voice handler if enabled
         voice_status = "available" if voice_enabled and voice_handler else "unavailable"
         
+        # Sandbox readiness and capacity
+        sandbox_status = get_sandbox_status()
+        sandbox_status["execution"] = execution_service.get_stats()
+        
+        # Tool LLM call volume and response cache hit rates
+        response_cache = get_response_cache()
+        llm_status = {
+            "gateway": get_llm_gateway().get_stats(),
+            "response_cache": response_cache.get_stats() if response_cache else None
+        }
+        
+        # Candidate profile cache effectiveness
+        memory_manager = interviewer.memory_manager
+        memory_status = {
+            "profile_cache": memory_manager.profile_cache.get_stats() if memory_manager and memory_manager.profile_cache else None,
+            "vector_index": memory_manager.vector_index.get_stats() if memory_manager and memory_manager.vector_index else None
+        }
+        
         return {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "active_sessions": session_count,
             "voice_processing": voice_status,
+            "sandbox": sandbox_status,
+            "llm": llm_status,
+            "memory": memory_status,
             "version": app.version
         }
     except Exception as e:
@@ -1086,6 +1308,14 @@ class CodingSubmissionResponse(BaseModel):
     feedback: dict
     evaluation: dict
 
+class CodingJobResponse(BaseModel):
+    job_id: str
+    status: str = Field(..., description="queued, running, completed, failed or cancelled")
+    challenge_id: Optional[str] = None
+    queue_position: Optional[int] = Field(None, description="Position among the user's queued submissions")
+    result: Optional[Dict[str, Any]] = Field(None, description="Evaluation results, same shape as /api/coding/submit, once completed")
+    error: Optional[str] = None
+
 class CodingHintResponse(BaseModel):
     status: str
     challenge_id: str
@@ -1119,6 +1349,7 @@ class ChallengeCompleteRequest(BaseModel):
     responses={
         200: {"description": "Successfully submitted code solution"},
         400: {"description": "Bad request - missing required fields", "model": ErrorResponse},
+        404: {"description": "Session not found", "model": ErrorResponse},
         429: {"description": "Rate limit exceeded", "model": ErrorResponse},
         500: {"description": "Internal server error", "model": ErrorResponse}
     },
@@ -1155,56 +1386,185 @@ async def submit_code_solution(request: Request, submission: CodingSubmissionReq
         # Generate timestamp if not provided
         timestamp = submission.timestamp or datetime.now().isoformat()
         
-        # Call the submit_code_for_challenge tool
-        from ai_interviewer.tools.coding_tools import submit_code_for_challenge
-        
-        result = submit_code_for_challenge(
-            challenge_id=submission.challenge_id,
-            candidate_code=submission.code
+        job_id = execution_service.submit(
+            await get_submitter_key(request, submission.session_id),
+            evaluate_code_submission,
+            submission,
+            timestamp
         )
+        if job_id is None:
+            raise HTTPException(status_code=HTTP_429_TOO_MANY_REQUESTS, detail="Too many submissions are already being evaluated. Please wait for them to finish.")
         
-        # If session ID is provided, update session state with the completed challenge
-        if submission.session_id and submission.user_id and interviewer.session_manager:
-            session = interviewer.session_manager.get_session(submission.session_id)
-            if session:
-                metadata = session.get("metadata", {})
-                
-                # Update completed challenges list
-                challenges = metadata.get("completed_challenges", [])
-                challenges.append({
-                    "challenge_id": submission.challenge_id,
-                    "timestamp": timestamp,
-                    "passed": result.get("evaluation", {}).get("passed", False)
-                })
-                metadata["completed_challenges"] = challenges
-                
-                # Store code snapshot for tracking code evolution
-                code_snapshots = metadata.get("code_snapshots", [])
-                code_snapshots.append({
-                    "challenge_id": submission.challenge_id,
-                    "code": submission.code,
-                    "timestamp": timestamp,
-                    "event_type": "submission",
-                    "execution_results": {
-                        "passed": result.get("evaluation", {}).get("passed", False),
-                        "pass_rate": result.get("evaluation", {}).get("pass_rate", 0),
-                        "execution_time": result.get("execution_results", {}).get("execution_time", 0)
-                    }
-                })
-                metadata["code_snapshots"] = code_snapshots
-                
-                # Update session
-                session["metadata"] = metadata
-                interviewer.session_manager.update_session(submission.session_id, session)
-                
-                # Log the code snapshot event
-                logger.info(f"Stored code snapshot for session {submission.session_id}, challenge {submission.challenge_id}")
+        job = await execution_service.wait(job_id)
+        if job["status"] != "completed":
+            raise HTTPException(status_code=500, detail=job.get("error") or "Code evaluation did not complete")
         
-        return result
+        return job["result"]
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error submitting code solution: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post(
+    "/api/coding/submit/async",
+    response_model=CodingJobResponse,
+    status_code=202,
+    responses={
+        202: {"description": "Submission queued for evaluation"},
+        404: {"description": "Session not found", "model": ErrorResponse},
+        429: {"description": "Rate limit exceeded or too many queued submissions", "model": ErrorResponse},
+        500: {"description": "Internal server error", "model": ErrorResponse}
+    },
+    dependencies=[Depends(log_request_time)]
+)
+@limiter.limit("10/minute")
+async def submit_code_solution_async(request: Request, submission: CodingSubmissionRequest):
+    """
+    Queue a candidate's code solution for evaluation and return immediately.
+    
+    Use this instead of /api/coding/submit for long test suites. Poll
+    `/api/coding/jobs/{job_id}` (optionally with `wait` for long-polling) until
+    the status is `completed`; the `result` field then holds the same payload
+    /api/coding/submit would have returned.
+    
+    Args:
+        submission: CodingSubmissionRequest containing the code solution and challenge ID
+        
+    Returns:
+        CodingJobResponse with the job ID and queue status
+    """
+    try:
+        timestamp = submission.timestamp or datetime.now().isoformat()
+        
+        job_id = execution_service.submit(
+            await get_submitter_key(request, submission.session_id),
+            evaluate_code_submission,
+            submission,
+            timestamp
+        )
+        if job_id is None:
+            raise HTTPException(status_code=HTTP_429_TOO_MANY_REQUESTS, detail="Too many submissions are already being evaluated. Please wait for them to finish.")
+        
+        return {**execution_service.get_job(job_id), "challenge_id": submission.challenge_id}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error queueing code solution: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get(
+    "/api/coding/jobs/{job_id}",
+    response_model=CodingJobResponse,
+    responses={
+        200: {"description": "Current job status"},
+        404: {"description": "Job not found or expired", "model": ErrorResponse}
+    }
+)
+async def get_coding_job(request: Request, job_id: str, wait: float = 0, session_id: Optional[str] = None):
+    """
+    Get the status of a queued code evaluation.
+    
+    Only the submitter can read a job: pass the session ID the submission was
+    made with, or for submissions without a session, poll from the same client address.
+    
+    Args:
+        job_id: Job ID returned by /api/coding/submit/async
+        wait: Seconds to wait for the job to finish before answering (long-poll, max 30)
+        session_id: Session ID the submission was made with, if any
+        
+    Returns:
+        CodingJobResponse with the job status and, once completed, the results
+    """
+    job = execution_service.get_job(job_id)
+    # Jobs are owned by the same key they were submitted under
+    if job is None or job["user_id"] != await get_submitter_key(request, session_id):
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    
+    if wait > 0 and job["status"] in ("queued", "running"):
+        job = await execution_service.wait(job_id, timeout=min(wait, 30.0))
+    
+    result = job.get("result") or {}
+    return {**job, "challenge_id": result.get("challenge_id")}
+
+async def get_submitter_key(request: Request, session_id: Optional[str]) -> str:
+    """
+    Get the key code execution jobs are owned and rate-limited by.
+    
+    The key comes from the user stored with the session, never from a user ID
+    in the request, so clients cannot switch keys to skip the per-user limit or
+    read someone else's jobs. Requests without a session are keyed by client address.
+    
+    Args:
+        request: Incoming request
+        session_id: Session the request belongs to, if any
+        
+    Returns:
+        Submitter key
+        
+    Raises:
+        HTTPException: If the session does not exist
+    """
+    if not session_id:
+        return f"address:{get_remote_address(request)}"
+    
+    if interviewer.async_session_manager:
+        session = await interviewer.async_session_manager.get_session(session_id)
+    else:
+        session = interviewer.active_sessions.get(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return f"user:{session['user_id']}"
+
+def evaluate_code_submission(submission: CodingSubmissionRequest, timestamp: str) -> Dict[str, Any]:
+    """
+    Evaluate a code submission and record it in the session. Blocking; runs on the execution service.
+    
+    Args:
+        submission: CodingSubmissionRequest containing the code solution and challenge ID
+        timestamp: Submission timestamp
+        
+    Returns:
+        Evaluation results from submit_code_for_challenge
+    """
+    # Call the submit_code_for_challenge tool
+    from ai_interviewer.tools.coding_tools import submit_code_for_challenge
+    
+    result = submit_code_for_challenge.invoke({
+        "challenge_id": submission.challenge_id,
+        "candidate_code": submission.code
+    })
+    
+    # If session ID is provided, update session state with the completed challenge
+    if submission.session_id and submission.user_id and interviewer.session_manager:
+        # Append with $push so concurrent submissions to the session keep each other's entries
+        stored = interviewer.session_manager.push_session_metadata(submission.session_id, {
+            # Completed challenges list
+            "completed_challenges": {
+                "challenge_id": submission.challenge_id,
+                "timestamp": timestamp,
+                "passed": result.get("evaluation", {}).get("passed", False)
+            },
+            # Code snapshot for tracking code evolution
+            "code_snapshots": {
+                "challenge_id": submission.challenge_id,
+                "code": submission.code,
+                "timestamp": timestamp,
+                "event_type": "submission",
+                "execution_results": {
+                    "passed": result.get("evaluation", {}).get("passed", False),
+                    "pass_rate": result.get("evaluation", {}).get("pass_rate", 0),
+                    "execution_time": result.get("execution_results", {}).get("execution_time", 0)
+                }
+            }
+        })
+        
+        # Log the code snapshot event
+        if stored:
+            logger.info(f"Stored code snapshot for session {submission.session_id}, challenge {submission.challenge_id}")
+    
+    return result
+
 @app.post(
     "/api/coding/hint",
     response_model=CodingHintResponse,
@@ -1243,28 +1603,21 @@ async def get_coding_hint(request: Request, hint_request: CodingHintRequest):
         )
         
         # If session ID is provided, store code snapshot for tracking hint requests
-        if hint_request.session_id and hint_request.user_id and interviewer.session_manager:
-            session = interviewer.session_manager.get_session(hint_request.session_id)
-            if session:
-                metadata = session.get("metadata", {})
-                
-                # Store code snapshot for hint request
-                code_snapshots = metadata.get("code_snapshots", [])
-                code_snapshots.append({
+        if hint_request.session_id and hint_request.user_id and interviewer.async_session_manager:
+            # Append with $push so snapshots stored by concurrent requests are kept
+            stored = await interviewer.async_session_manager.push_session_metadata(hint_request.session_id, {
+                "code_snapshots": {
                     "challenge_id": hint_request.challenge_id,
                     "code": hint_request.code,
                     "timestamp": timestamp,
                     "event_type": "hint_request",
                     "error_message": hint_request.error_message,
                     "hints_provided": result.get("hints", [])
-                })
-                metadata["code_snapshots"] = code_snapshots
-                
-                # Update session
-                session["metadata"] = metadata
-                interviewer.session_manager.update_session(hint_request.session_id, session)
-                
-                # Log the hint request event
+                }
+            })
+            
+            # Log the hint request event
+            if stored:
                 logger.info(f"Stored hint request snapshot for session {hint_request.session_id}, challenge {hint_request.challenge_id}")
         
         return result
@@ -1311,26 +1664,23 @@ async def continue_after_challenge(request: Request, session_id: str, request_da
         if not request_data.user_id:
             raise HTTPException(status_code=400, detail="User ID is required")
         
-        # Get the session
-        if not interviewer.session_manager:
+        if not interviewer.async_session_manager:
             raise HTTPException(status_code=500, detail="Session manager not available")
             
-        session = interviewer.session_manager.get_session(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
-            
-        # Update metadata to indicate we're resuming from a challenge
-        metadata = session.get("metadata", {})
-        metadata["resuming_from_challenge"] = True
-        metadata["challenge_completed"] = request_data.challenge_completed
+        # Update metadata to indicate we're resuming from a challenge; only these keys are written
+        updates = {
+            "resuming_from_challenge": True,
+            "challenge_completed": request_data.challenge_completed
+        }
         
         # Store evaluation summary if provided
         if request_data.evaluation_summary:
-            metadata["coding_evaluation"] = request_data.evaluation_summary
-            logger.info(f"Stored coding evaluation in session metadata: {request_data.evaluation_summary}")
+            updates["coding_evaluation"] = request_data.evaluation_summary
         
-        session["metadata"] = metadata
-        interviewer.session_manager.update_session(session_id, session)
+        if not await interviewer.async_session_manager.update_session_metadata(session_id, updates):
+            raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
+        if request_data.evaluation_summary:
+            logger.info(f"Stored coding evaluation in session metadata: {request_data.evaluation_summary}")
         
         # Prepare a more detailed message if evaluation summary is provided
         message = request_data.message
@@ -1357,11 +1707,7 @@ async def continue_after_challenge(request: Request, session_id: str, request_da
         )
         
         # Get updated session metadata
-        metadata = {}
-        if interviewer.session_manager:
-            session = interviewer.session_manager.get_session(new_session_id)
-            if session and "metadata" in session:
-                metadata = session["metadata"]
+        metadata = await get_session_metadata(new_session_id)
         
         return MessageResponse(
             response=ai_response,
@@ -1544,10 +1890,10 @@ async def get_code_snapshots(
     """
     try:
         # Verify session exists
-        if not interviewer.session_manager:
+        if not interviewer.async_session_manager:
             raise HTTPException(status_code=500, detail="Session manager not available")
             
-        session = interviewer.session_manager.get_session(session_id)
+        session = await interviewer.async_session_manager.get_session(session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
             
@@ -1556,7 +1902,7 @@ async def get_code_snapshots(
             raise HTTPException(status_code=403, detail="User ID does not match session")
             
         # Get code snapshots from AIInterviewer
-        snapshots = interviewer.get_code_snapshots(session_id, challenge_id)
+        snapshots = await asyncio.to_thread(interviewer.get_code_snapshots, session_id, challenge_id)
         
         # Return snapshots
         return snapshots
@@ -1631,12 +1977,12 @@ async def update_context_settings(request: Request, settings: ContextSettingsReq
     """
     try:
         # Verify the session exists
-        session = interviewer.session_manager.get_session(settings.session_id)
+        session = await interviewer.async_session_manager.get_session(settings.session_id)
         if not session:
             raise HTTPException(status_code=404, detail=f"Session {settings.session_id} not found")
         
         # Configure context management settings
-        success = interviewer.session_manager.configure_context_management(
+        success = await interviewer.async_session_manager.configure_context_management(
             settings.session_id, 
             max_messages=settings.max_messages
         )
@@ -1677,12 +2023,12 @@ async def get_conversation_summary(request: Request, session_id: str):
     """
     try:
         # Verify the session exists
-        session = interviewer.session_manager.get_session(session_id)
+        session = await interviewer.async_session_manager.get_session(session_id)
         if not session:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
         
         # Get the current summary
-        summary = interviewer.session_manager.get_conversation_summary(session_id)
+        summary = session.get("metadata", {}).get("conversation_summary")
         
         return {
             "session_id": session_id,
@@ -1745,7 +2091,7 @@ async def force_summarize_conversation(request: Request, req_data: ForceSummariz
     """
     try:
         # Verify the session exists and belongs to the user
-        session = interviewer.session_manager.get_session(req_data.session_id)
+        session = await interviewer.async_session_manager.get_session(req_data.session_id)
         if not session:
             raise HTTPException(status_code=404, detail=f"Session {req_data.session_id} not found")
         
@@ -1767,7 +2113,7 @@ async def force_summarize_conversation(request: Request, req_data: ForceSummariz
         messages_to_summarize = message_objects[:-messages_to_keep] if len(message_objects) > messages_to_keep else message_objects
         
         # Create the prompt
-        current_summary = interviewer.session_manager.get_conversation_summary(req_data.session_id) or ""
+        current_summary = session.get("metadata", {}).get("conversation_summary") or ""
         
         if current_summary:
             summary_prompt = [
@@ -1781,20 +2127,15 @@ async def force_summarize_conversation(request: Request, req_data: ForceSummariz
             ]
         
         # Generate summary
-        summary_response = interviewer.summarization_model.invoke(summary_prompt)
+        summary_response = await interviewer.summarization_model.ainvoke(summary_prompt)
         new_summary = summary_response.content if hasattr(summary_response, 'content') else ""
         
         # Update the session with the new summary and reduced message list
-        interviewer.session_manager.update_conversation_summary(req_data.session_id, new_summary)
+        await interviewer.async_session_manager.update_conversation_summary(req_data.session_id, new_summary)
         
-        # Create a list of messages to keep - the most recent ones
+        # Keep the most recent messages; this also sets the message count in the metadata
         kept_messages = message_objects[-messages_to_keep:] if len(message_objects) > messages_to_keep else []
-        interviewer.session_manager.reduce_message_history(req_data.session_id, kept_messages)
-        
-        # Update message count in metadata
-        metadata = session.get("metadata", {})
-        metadata["message_count"] = len(kept_messages)
-        interviewer.session_manager.update_session_metadata(req_data.session_id, metadata)
+        await interviewer.async_session_manager.reduce_message_history(req_data.session_id, kept_messages)
         
         return {
             "success": True,
@@ -1868,10 +2209,10 @@ async def get_interview_insights(request: Request, session_id: str, user_id: Opt
     """
     try:
         # Verify session exists
-        if not interviewer.session_manager:
+        if not interviewer.async_session_manager:
             raise HTTPException(status_code=500, detail="Session manager not available")
             
-        session = interviewer.session_manager.get_session(session_id)
+        session = await interviewer.async_session_manager.get_session(session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
             
@@ -1961,7 +2302,7 @@ async def extract_interview_insights(request: Request, req_data: ExtractInsights
     """
     try:
         # Verify the session exists and belongs to the user
-        session = interviewer.session_manager.get_session(req_data.session_id)
+        session = await interviewer.async_session_manager.get_session(req_data.session_id)
         if not session:
             raise HTTPException(status_code=404, detail=f"Session {req_data.session_id} not found")
         
@@ -2031,13 +2372,17 @@ class EnhancedMemoryQuery(BaseModel):
     user_id: str = Field(..., description="User ID to search memories for")
     query: str = Field(..., description="Search query for memories")
     max_results: int = Field(5, description="Maximum number of results to return")
+    offset: int = Field(0, description="Number of results to skip, for pagination")
+    mode: str = Field("text", description="'text' for keyword search or 'semantic' for similarity search")
     
     class Config:
         schema_extra = {
             "example": {
                 "user_id": "user-123",
                 "query": "python",
-                "max_results": 5
+                "max_results": 5,
+                "offset": 0,
+                "mode": "text"
             }
         }
 
@@ -2056,7 +2401,8 @@ class EnhancedMemoryResponse(BaseModel):
                         "value": {
                             "key_skills": ["Python", "JavaScript"],
                             "notable_experiences": ["Built a distributed system at Company X"]
-                        }
+                        },
+                        "score": 1.1
                     }
                 ],
                 "query": "python",
@@ -2086,11 +2432,20 @@ async def search_memories(request: Request, query_data: EnhancedMemoryQuery):
                 status_code=500,
                 detail="Memory management is not available on this server instance"
             )
+        if query_data.mode not in ("text", "semantic"):
+            raise HTTPException(
+                status_code=400,
+                detail="Search mode must be 'text' or 'semantic'"
+            )
         
-        memories = interviewer.memory_manager.search_memories(
+        # The store is queried with blocking pymongo calls, so search in a worker thread
+        memories = await asyncio.to_thread(
+            interviewer.memory_manager.search_memories,
             query=query_data.query,
             user_id=query_data.user_id,
-            max_results=query_data.max_results
+            max_results=query_data.max_results,
+            offset=query_data.offset,
+            mode=query_data.mode
         )
         
         return {
@@ -2098,6 +2453,8 @@ async def search_memories(request: Request, query_data: EnhancedMemoryQuery):
             "query": query_data.query,
             "user_id": query_data.user_id
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error searching memories: {e}")
         raise HTTPException(
@@ -0,0 +1,53 @@
+"""
+Tests for the async session manager.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from ai_interviewer.utils.async_session_manager import AsyncSessionManager
+
+
+def _make_manager():
+    """Create a manager whose collection is replaced by a mock."""
+    manager = AsyncSessionManager("mongodb://localhost:27017")
+    manager._indexes_created = True
+    manager.collection = MagicMock()
+    manager.collection.update_one = AsyncMock(return_value=MagicMock(modified_count=1, matched_count=1))
+    return manager
+
+
+def test_update_session_metadata_sets_individual_fields():
+    """Test that metadata updates are partial $set operations, not document rewrites."""
+    manager = _make_manager()
+
+    result = asyncio.run(manager.update_session_metadata("sess-1", {"candidate_name": "Ada", "interview_stage": "feedback"}))
+
+    assert result is True
+    query, update = manager.collection.update_one.call_args.args
+    assert query == {"session_id": "sess-1"}
+    assert update["$set"]["metadata.candidate_name"] == "Ada"
+    assert update["$set"]["metadata.interview_stage"] == "feedback"
+    assert "metadata" not in update["$set"]
+
+
+def test_append_session_messages_uses_push():
+    """Test that appending messages pushes them and bumps the message count atomically."""
+    manager = _make_manager()
+
+    asyncio.run(manager.append_session_messages("sess-1", [{"type": "human", "content": "hi"}]))
+
+    _, update = manager.collection.update_one.call_args.args
+    assert update["$push"] == {"messages": {"$each": [{"type": "human", "content": "hi"}]}}
+    assert update["$inc"] == {"metadata.message_count": 1}
+
+
+def test_push_session_metadata_appends_to_metadata_lists():
+    """Test that metadata list entries are appended with $push instead of rewriting the list."""
+    manager = _make_manager()
+
+    snapshot = {"challenge_id": "c1", "event_type": "hint_request"}
+    assert asyncio.run(manager.push_session_metadata("sess-1", {"code_snapshots": snapshot}))
+
+    _, update = manager.collection.update_one.call_args.args
+    assert update["$push"] == {"metadata.code_snapshots": snapshot}
+    assert set(update["$set"]) == {"last_active"}
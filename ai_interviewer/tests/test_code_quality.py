@@ -0,0 +1,67 @@
+"""
+Tests for code quality analysis.
+"""
+from radon.complexity import cc_visit
+from radon.metrics import mi_visit
+
+from ai_interviewer.tools import code_quality
+from ai_interviewer.tools.code_quality import CodeQualityMetrics, PylintWorker
+
+CODE = (
+    "import os\n"
+    "def twoSum(nums, target, seen={}):\n"
+    "    unused = 0\n"
+    "    for i in range(len(nums)):\n"
+    "        if nums[i] == None: continue\n"
+    "        if target - nums[i] in seen:\n"
+    "            return [seen[target - nums[i]], i]\n"
+    "            print('found')\n"
+    "        seen[nums[i]] = i\n"
+    "    return []\n"
+)
+
+
+def test_fast_analysis_reports_style_issues_from_a_single_parse():
+    """Test the built-in checks and that radon metrics come from the candidate's code."""
+    metrics = CodeQualityMetrics.analyze_python_code(CODE, deep=False)
+
+    symbols = {issue["symbol"] for issue in metrics["style"]["issues"]}
+    assert symbols == {
+        "unused-import", "invalid-name", "dangerous-default-value", "unused-variable",
+        "consider-using-enumerate", "multiple-statements", "singleton-comparison", "unreachable"
+    }
+    assert metrics["style"]["engine"] == "ast"
+    assert metrics["style"]["pylint_score"] == 4.0
+    assert not metrics["pep8"]["is_compliant"]
+    assert metrics["complexity"]["cyclomatic_complexity"] == cc_visit(CODE)[0].complexity
+    assert metrics["maintainability"]["maintainability_index"] == mi_visit(CODE, multi=True)
+    assert metrics["halstead"]["volume"] > 0
+
+    clean = CodeQualityMetrics.analyze_python_code('def add(a, b):\n    """Add two numbers."""\n    return a + b\n', deep=False)
+    assert clean["style"]["pylint_score"] == 10.0
+    assert clean["documentation"]["doc_ratio"] == 0.5
+
+    broken = CodeQualityMetrics.analyze_python_code("def add(a, b:\n", deep=False)
+    assert broken["style"]["pylint_score"] == 0.0
+    assert broken["style"]["issues"][0]["symbol"] == "syntax-error"
+
+
+def test_deep_analysis_uses_pylint_worker_and_falls_back(monkeypatch):
+    """Test the long-lived pylint worker and the fallback when it fails."""
+    worker = PylintWorker(timeout=60)
+    monkeypatch.setattr(code_quality, "get_pylint_worker", lambda: worker)
+    try:
+        first = CodeQualityMetrics.analyze_python_code(CODE, deep=True)
+        process = worker._process
+        second = CodeQualityMetrics.analyze_python_code("def add(a, b):\n    return a + b\n", deep=True)
+
+        assert first["style"]["engine"] == "pylint"
+        assert "dangerous-default-value" in {issue["symbol"] for issue in first["style"]["issues"]}
+        assert second["style"]["engine"] == "pylint"
+        assert worker._process is process
+    finally:
+        worker.shutdown()
+
+    broken = PylintWorker(timeout=5, python_executable="/bin/false")
+    monkeypatch.setattr(code_quality, "get_pylint_worker", lambda: broken)
+    assert CodeQualityMetrics.analyze_python_code(CODE, deep=True)["style"]["engine"] == "ast"
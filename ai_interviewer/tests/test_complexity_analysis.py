@@ -0,0 +1,142 @@
+"""
+Tests for static and empirical time complexity estimation.
+"""
+from ai_interviewer.tools.complexity_analysis import (
+    analyze_python_complexity,
+    combine_estimates,
+    estimate_empirical_complexity,
+    fit_growth_curve,
+    scale_input
+)
+
+
+def big_o(code):
+    return analyze_python_complexity(code)["big_o"]
+
+
+def test_static_analysis_reads_loops_and_known_cost_calls():
+    """Test loop nesting, membership tests, sorting and calls between functions."""
+    nested = (
+        "def two_sum(nums, target):\n"
+        "    # for each pair: for, for\n"
+        "    for i in range(len(nums)):\n"
+        "        for j in range(i + 1, len(nums)):\n"
+        "            if nums[i] + nums[j] == target:\n"
+        "                return [i, j]\n"
+    )
+    result = analyze_python_complexity(nested)
+    assert result["time_complexity"] == "O(n²) - Quadratic"
+    assert result["loop_depth"] == 2
+
+    assert big_o("def f(s):\n    text = 'for for for'\n    return s[0]\n") == "O(1)"
+    assert big_o("def f(nums, t):\n    seen = set()\n    for x in nums:\n        if t - x in seen:\n            return True\n        seen.add(x)\n") == "O(n)"
+    assert big_o("def f(nums, t):\n    for x in nums:\n        if t - x in nums:\n            return True\n") == "O(n²)"
+    assert big_o("def f(nums):\n    return sorted(nums)[len(nums) // 2]\n") == "O(n log n)"
+    assert big_o("def f(nums):\n    return [a * b for a in nums for b in nums]\n") == "O(n²)"
+    assert big_o("def f(nums):\n    for _ in range(10):\n        nums.append(0)\n") == "O(1)"
+    assert big_o("def biggest(nums):\n    return max(nums)\n\ndef f(nums):\n    return [biggest(nums) for _ in nums]\n") == "O(n²)"
+    assert big_o(
+        "def search(nums, target):\n"
+        "    lo, hi = 0, len(nums) - 1\n"
+        "    while lo <= hi:\n"
+        "        mid = (lo + hi) // 2\n"
+        "        if nums[mid] < target:\n"
+        "            lo = mid + 1\n"
+        "        else:\n"
+        "            hi = mid - 1\n"
+        "    return lo\n"
+    ) == "O(log n)"
+
+    broken = analyze_python_complexity("def f(:\n")
+    assert broken["time_complexity"] == "Unknown"
+    assert "error" in broken
+
+
+def test_static_analysis_classifies_recursion():
+    """Test exponential, memoized, divide-and-conquer and structural recursion."""
+    fib = "def fib(n):\n    if n < 2:\n        return n\n    return fib(n - 1) + fib(n - 2)\n"
+    result = analyze_python_complexity(fib)
+    assert result["big_o"] == "O(2^n)"
+    assert result["functions"]["fib"]["recursion"] == "exponential"
+
+    assert big_o("from functools import lru_cache\n\n@lru_cache(None)\n" + fib) == "O(n)"
+    assert big_o("def fact(n):\n    return 1 if n <= 1 else n * fact(n - 1)\n") == "O(n)"
+    assert big_o(
+        "def merge_sort(a):\n"
+        "    if len(a) <= 1:\n"
+        "        return a\n"
+        "    mid = len(a) // 2\n"
+        "    return merge(merge_sort(a[:mid]), merge_sort(a[mid:]))\n"
+        "\n"
+        "def merge(left, right):\n"
+        "    out = []\n"
+        "    while left and right:\n"
+        "        out.append(left.pop() if left[-1] > right[-1] else right.pop())\n"
+        "    return out + left + right\n"
+    ) == "O(n log n)"
+    assert big_o(
+        "def find(a, t, lo, hi):\n"
+        "    if lo > hi:\n"
+        "        return -1\n"
+        "    mid = (lo + hi) // 2\n"
+        "    if a[mid] == t:\n"
+        "        return mid\n"
+        "    if a[mid] < t:\n"
+        "        return find(a, t, mid + 1, hi)\n"
+        "    return find(a, t, lo, mid - 1)\n"
+    ) == "O(log n)"
+    assert big_o(
+        "class Solution:\n"
+        "    def inorder(self, node):\n"
+        "        if not node:\n"
+        "            return []\n"
+        "        return self.inorder(node.left) + [node.val] + self.inorder(node.right)\n"
+    ) == "O(n)"
+
+
+def test_fit_growth_curve_prefers_the_simplest_curve_that_fits():
+    """Test curve fitting on synthetic timings with a fixed overhead."""
+    sizes = [8 * 2 ** i for i in range(8)]
+
+    assert fit_growth_curve(sizes, [1e-3 + 1e-8 * n * n for n in sizes])["big_o"] == "O(n²)"
+    assert fit_growth_curve(sizes, [1e-4 + 1e-7 * n for n in sizes])["big_o"] == "O(n)"
+    assert fit_growth_curve(sizes, [2e-5 for _ in sizes])["big_o"] == "O(1)"
+    assert fit_growth_curve(sizes[:2], [0.1, 0.2])["big_o"] is None
+
+
+def test_scale_input_keeps_the_shape_of_the_sample():
+    """Test that lists and strings grow while other arguments keep their value."""
+    nums, target = scale_input([[1, 3, 5], 9], 50)
+    assert len(nums) == 50 and nums == sorted(nums) and len(set(nums)) == 50
+    assert target == 9
+
+    assert scale_input(10, 64) == 64
+    assert scale_input({"s": "ab", "k": 2}, 5) == {"s": "ababa", "k": 2}
+
+
+def test_empirical_estimate_stops_at_the_time_budget_and_combines():
+    """Test the sandbox timing loop and that a confident fit wins over static analysis."""
+    calls = []
+
+    class FakeSandbox:
+        def execute_code(self, language, code, test_cases, **kwargs):
+            n = len(test_cases[0]["input"][0])
+            calls.append(n)
+            return {"status": "success", "test_results": [
+                {"passed": False, "execution_time": 1e-4 + 1e-8 * n * n, "timed_out": False, "error": None}
+                for _ in test_cases
+            ]}
+
+    code = "def f(nums):\n    return sorted(nums)\n"
+    empirical = estimate_empirical_complexity(
+        code, sample_input=[[3, 1, 2]], sizes=[2 ** k for k in range(4, 16)], time_budget=0.5, sandbox=FakeSandbox()
+    )
+
+    assert empirical["big_o"] == "O(n²)"
+    assert empirical["stopped"] == "time_budget"
+    assert calls[-1] == 8192 and len(calls) == 10
+
+    combined = combine_estimates(analyze_python_complexity(code), empirical)
+    assert combined["method"] == "empirical"
+    assert combined["big_o"] == "O(n²)"
+    assert "O(n log n)" in combined["notes"][-1]
@@ -0,0 +1,85 @@
+"""
+Tests for the submission evaluation cache.
+"""
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from ai_interviewer.tools import coding_tools
+from ai_interviewer.tools.execution_cache import ExecutionResultCache
+
+TEST_CASES = [{"input": [2, 3], "expected_output": 5, "explanation": "", "is_hidden": False}]
+
+
+def test_cache_key_normalizes_code_and_covers_evaluation_inputs():
+    """Test that formatting noise shares a key but anything affecting the result does not."""
+    key = ExecutionResultCache.make_key("def add(a, b):\n    return a + b\n", "c1", TEST_CASES, "Python", "intermediate")
+
+    assert key == ExecutionResultCache.make_key("def add(a, b):  \r\n    return a + b\r\n\r\n", "c1", TEST_CASES, "python", "intermediate")
+    assert key != ExecutionResultCache.make_key("def add(a, b):\n    return b + a\n", "c1", TEST_CASES, "python", "intermediate")
+    assert key != ExecutionResultCache.make_key("def add(a, b):\n    return a + b\n", "c2", TEST_CASES, "python", "intermediate")
+    assert key != ExecutionResultCache.make_key("def add(a, b):\n    return a + b\n", "c1", TEST_CASES[:0], "python", "intermediate")
+    assert key != ExecutionResultCache.make_key("def add(a, b):\n    return a + b\n", "c1", TEST_CASES, "python", "advanced")
+
+
+def test_cache_evicts_by_lru_and_ttl_and_reads_through_mongodb():
+    """Test LRU eviction, expiry and the shared MongoDB tier."""
+    cache = ExecutionResultCache(max_entries=2, ttl=60)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}  # "b" is now least recently used
+    cache.put("c", {"v": 3})
+    assert cache.get("b") is None
+
+    cached = cache.get("a")
+    cached["v"] = 99
+    assert cache.get("a") == {"v": 1}  # Callers get copies
+
+    short_lived = ExecutionResultCache(max_entries=2, ttl=0.05)
+    short_lived.put("a", {"v": 1})
+    time.sleep(0.1)
+    assert short_lived.get("a") is None
+    assert short_lived.get_stats()["expired"] == 1
+
+    collection = MagicMock()
+    collection.find_one.return_value = {
+        "_id": "k", "value": '{"v": 4}', "expires_at": datetime.utcnow() + timedelta(seconds=30)
+    }
+    shared = ExecutionResultCache(max_entries=2, ttl=60, collection=collection)
+    assert shared.get("k") == {"v": 4}
+    assert shared.get("k") == {"v": 4}
+    collection.find_one.assert_called_once()
+    assert shared.get_stats()["mongodb_hits"] == 1
+
+
+def test_resubmission_skips_execution_and_feedback(monkeypatch):
+    """Test that an unchanged submission is served from the cache."""
+    executor = MagicMock()
+    executor.invoke.return_value = {
+        "status": "success", "pass_count": 1, "total_tests": 1, "outputs": [5], "errors": "",
+        "detailed_results": {"status": "success", "passed": 1, "failed": 0, "test_results": [{"passed": True}]}
+    }
+    feedback = MagicMock(return_value={
+        "correctness": {"pass_rate": 1.0}, "code_quality": {"overall_score": 8},
+        "summary": "Good", "suggestions": [], "strengths": [], "areas_for_improvement": []
+    })
+    cache = ExecutionResultCache(max_entries=8, ttl=60)
+    monkeypatch.setattr(coding_tools, "execute_candidate_code", executor)
+    monkeypatch.setattr(coding_tools.CodeFeedbackGenerator, "generate_feedback", feedback)
+    monkeypatch.setattr(coding_tools, "get_execution_cache", lambda: cache)
+
+    code = "def add(a, b):\n    return a + b\n"
+    first = coding_tools.submit_code_for_challenge.invoke({"challenge_id": "py_001", "candidate_code": code})
+    second = coding_tools.submit_code_for_challenge.invoke({"challenge_id": "py_001", "candidate_code": code + "\n"})
+
+    assert first["evaluation"]["passed"]
+    assert second["cached"]
+    assert second["evaluation"] == first["evaluation"]
+    assert executor.invoke.call_count == 1
+    assert feedback.call_count == 1
+
+    # Timed out runs depend on load, so they are never cached
+    executor.invoke.return_value["detailed_results"]["test_results"] = [{"passed": False, "timed_out": True}]
+    coding_tools.submit_code_for_challenge.invoke({"challenge_id": "py_001", "candidate_code": "x = 1\n" + code})
+    coding_tools.submit_code_for_challenge.invoke({"challenge_id": "py_001", "candidate_code": "x = 1\n" + code})
+    assert executor.invoke.call_count == 3
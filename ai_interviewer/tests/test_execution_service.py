@@ -0,0 +1,80 @@
+"""
+Tests for the concurrency-limited code execution service.
+"""
+import asyncio
+import threading
+import time
+
+from ai_interviewer.tools.execution_service import CodeExecutionService
+
+
+def test_execution_service_caps_concurrency_and_rotates_users():
+    """Test the global cap, fair ordering between users and the queue limit."""
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+    order = []
+
+    def evaluate(label):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            order.append(label)
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return label
+
+    async def main():
+        service = CodeExecutionService(max_concurrency=1, max_concurrent_per_user=1, max_queued_per_user=3)
+        try:
+            # A heavy user fills the queue before a second user shows up
+            heavy = [service.submit("heavy", evaluate, f"heavy-{i}") for i in range(4)]
+            assert service.submit("heavy", evaluate, "heavy-rejected") is None
+            light = service.submit("light", evaluate, "light-0")
+
+            assert await service.run("light", evaluate, "light-1") == "light-1"
+            for job_id in heavy + [light]:
+                job = await service.wait(job_id)
+                assert job["status"] == "completed"
+            return service.get_stats()
+        finally:
+            service.shutdown()
+
+    stats = asyncio.run(main())
+
+    assert state["peak"] == 1
+    # The light user goes next instead of waiting behind the heavy user's queue
+    assert order[:3] == ["heavy-0", "light-0", "heavy-1"]
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 6
+
+
+def test_execution_service_poll_reports_progress_and_errors():
+    """Test polling a job with a timeout and surfacing a failed evaluation."""
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return {"status": "submitted"}
+
+    def broken():
+        raise ValueError("sandbox unavailable")
+
+    async def main():
+        service = CodeExecutionService(max_concurrency=2)
+        try:
+            job_id = service.submit("user-1", slow)
+            job = await service.wait(job_id, timeout=0.05)
+            assert job["status"] == "running"
+            release.set()
+            job = await service.wait(job_id, timeout=5)
+            assert job["status"] == "completed"
+            assert job["result"] == {"status": "submitted"}
+
+            failed = await service.wait(service.submit("user-2", broken))
+            assert failed["status"] == "failed"
+            assert "sandbox unavailable" in failed["error"]
+        finally:
+            service.shutdown()
+
+    asyncio.run(main())
@@ -0,0 +1,41 @@
+"""
+Tests for the background insight extraction worker.
+"""
+import asyncio
+
+from ai_interviewer.utils.insight_worker import InsightExtractionWorker
+
+
+def test_debounce_every_n_turns_and_stage_change():
+    """Test that extraction runs every N turns or when the stage changes."""
+    worker = InsightExtractionWorker(handler=None, every_n_turns=3)
+
+    results = [worker.should_run("sess-1", "introduction") for _ in range(3)]
+    assert results == [False, False, True]
+
+    # A stage change triggers extraction immediately
+    assert worker.should_run("sess-1", "technical_questions") is True
+    assert worker.should_run("sess-1", "technical_questions") is False
+
+
+def test_newer_job_supersedes_older_one():
+    """Test that only the latest job for a session is processed."""
+    processed = []
+
+    async def handler(job):
+        await asyncio.sleep(0.01)
+        processed.append(job["turn"])
+
+    async def run():
+        worker = InsightExtractionWorker(handler, num_workers=1, every_n_turns=1)
+        worker.submit({"session_id": "sess-1", "turn": 1})
+        worker.submit({"session_id": "sess-1", "turn": 2})
+        worker.submit({"session_id": "sess-2", "turn": 3})
+        await worker.drain()
+        await worker.stop()
+        return worker
+
+    worker = asyncio.run(run())
+
+    assert sorted(processed) == [2, 3]
+    assert worker.stats["superseded"] == 1
@@ -0,0 +1,111 @@
+"""
+Tests for the shared LLM gateway.
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from ai_interviewer.utils.llm_gateway import LLMGateway, RateBudget
+
+
+class FakeModel:
+    """Chat model that counts calls and can be held until released."""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def invoke(self, prompt):
+        self.calls += 1
+        self.release.wait(5)
+        return SimpleNamespace(content=f"answer to {prompt}", usage_metadata={"total_tokens": 10})
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(content=f"answer to {prompt}", usage_metadata={"total_tokens": 10})
+
+
+def test_gateway_reuses_clients_and_coalesces_identical_requests():
+    """Test that concurrent identical prompts share one call and one client."""
+    gateway = LLMGateway(requests_per_minute=0, tokens_per_minute=0, expected_output_tokens=0, model_factory=FakeModel)
+    model = gateway.get_model("m", temperature=0.1)
+    assert gateway.get_model("m", temperature=0.1) is model
+    assert gateway.get_model("m", temperature=0.4) is not model
+
+    model.release.clear()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(gateway.invoke("q", model="m", temperature=0.1)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    model.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert model.calls == 1
+    assert len(results) == 5 and all(r is results[0] for r in results)
+    assert gateway.get_stats()["coalesced"] == 4
+
+    # Once finished, the same prompt is sent again
+    gateway.invoke("q", model="m", temperature=0.1)
+    assert model.calls == 2
+
+    async def ask_concurrently():
+        return await asyncio.gather(*(gateway.ainvoke("async q", model="m", temperature=0.1) for _ in range(3)))
+
+    answers = asyncio.run(ask_concurrently())
+    assert model.calls == 3
+    assert {answer.content for answer in answers} == {"answer to async q"}
+
+
+def test_gateway_shares_errors_with_coalesced_callers():
+    """Test that a failed request fails every caller waiting on it, then clears."""
+    class FailingModel(FakeModel):
+        def invoke(self, prompt):
+            self.calls += 1
+            time.sleep(0.1)
+            raise RuntimeError("quota exceeded")
+
+    gateway = LLMGateway(requests_per_minute=0, tokens_per_minute=0, model_factory=FailingModel)
+    errors = []
+
+    def call():
+        try:
+            gateway.invoke("q", model="m")
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ["quota exceeded"] * 3
+    assert gateway.get_model("m").calls == 1
+    assert gateway.get_stats()["in_flight"] == 0
+
+
+def test_rate_budget_queues_instead_of_failing():
+    """Test that calls over the per-minute budget wait for it to refill."""
+    budget = RateBudget(requests_per_minute=600, tokens_per_minute=0)  # One request per 0.1s after the burst
+    for _ in range(600):
+        assert budget.reserve(0) == 0
+    assert 0 < budget.reserve(0) <= 0.1
+
+    started = time.monotonic()
+    budget.acquire(0)
+    assert time.monotonic() - started < 1
+
+    tokens = RateBudget(requests_per_minute=0, tokens_per_minute=60)
+    assert tokens.reserve(60) == 0
+    assert tokens.reserve(30) > 0
+    tokens.adjust(-30)  # The request used half of what was reserved
+    assert tokens.reserve(30) == 0
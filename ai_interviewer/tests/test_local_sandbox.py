@@ -0,0 +1,97 @@
+"""
+Tests for the local process sandbox.
+"""
+import os
+import time
+
+import pytest
+
+from ai_interviewer.tools import code_execution, local_sandbox
+from ai_interviewer.tools.local_sandbox import LocalSandbox
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="the local sandbox requires POSIX")
+
+TEST_CASES = [{"input": [2, 3], "expected_output": 5}]
+
+
+def test_local_sandbox_runs_code_out_of_process_with_limits():
+    """Test results, the memory limit and network isolation (where the kernel allows it)."""
+    sandbox = LocalSandbox(pool_size=1)
+    try:
+        results = sandbox.execute_code("python", "import os\ndef add(a, b):\n    return a + b + (os.getpid() == %d)\n" % os.getpid(), TEST_CASES)
+        assert results["status"] == "success"
+        assert results["passed"] == 1
+
+        results = sandbox.execute_code("python", "def add(a, b):\n    data = bytearray(512 * 1024 * 1024)\n    return a + b\n", TEST_CASES)
+        assert results["test_results"][0]["error"] == "MemoryError"
+
+        code = "import socket\ndef add(a, b):\n    socket.create_connection(('192.0.2.1', 80), timeout=1)\n    return a + b\n"
+        results = sandbox.execute_code("python", code, TEST_CASES)
+        if results["sandbox"]["network"] == "isolated":
+            assert not results["test_results"][0]["passed"]
+    finally:
+        sandbox.shutdown()
+
+
+def test_local_sandbox_kills_runaway_code_at_the_wall_clock_limit():
+    """Test that a hung run, including processes it spawned, is killed on time."""
+    sandbox = LocalSandbox(pool_size=0)
+    code = (
+        "import os, time\n"
+        "def add(a, b):\n"
+        "    if os.fork() == 0:\n"
+        "        time.sleep(60)\n"
+        "    while True:\n"
+        "        pass\n"
+    )
+    started = time.monotonic()
+    results = sandbox.execute_code("python", code, TEST_CASES, timeout=1, per_test_timeout=None)
+
+    assert results["status"] == "error"
+    assert results["message"] == "Execution timed out"
+    assert time.monotonic() - started < 5
+
+
+def test_get_sandbox_selects_local_backend(monkeypatch):
+    """Test the backend factory honours SANDBOX_BACKEND."""
+    monkeypatch.setattr(code_execution, "get_sandbox_config", lambda: {"backend": "local"})
+    monkeypatch.setattr(code_execution, "get_docker_sandbox", lambda: pytest.fail("Docker should not be tried"))
+    monkeypatch.setattr(code_execution, "_local_sandbox", None)
+
+    sandbox = code_execution.get_sandbox()
+    try:
+        assert isinstance(sandbox, LocalSandbox)
+    finally:
+        sandbox.shutdown()
+
+
+def test_prepare_sandbox_runs_canary_and_reports_capacity(monkeypatch):
+    """Test the startup readiness check on the local backend."""
+    sandbox = LocalSandbox(pool_size=1)
+    monkeypatch.setattr(code_execution, "get_sandbox", lambda: sandbox)
+    monkeypatch.setattr(code_execution, "_local_sandbox", sandbox)
+    monkeypatch.setattr(code_execution, "_docker_sandbox", None)
+    try:
+        readiness = code_execution.prepare_sandbox()
+
+        assert readiness["canary"]["python"]["passed"]
+        assert readiness["status"] in ("ready", "degraded")
+        status = code_execution.get_sandbox_status()
+        assert status["status"] == readiness["status"]
+        assert status["capacity"]["pools"]["local"]["size"] == 1
+    finally:
+        sandbox.shutdown()
+
+
+def test_local_sandbox_refuses_to_run_code_without_network_isolation(monkeypatch):
+    """Test that code is not run when the worker cannot leave the host's network namespace."""
+    bootstrap = local_sandbox.WORKER_BOOTSTRAP.replace('        network = "isolated"', '        raise OSError("unshare failed")')
+    monkeypatch.setattr(local_sandbox, "WORKER_BOOTSTRAP", bootstrap)
+    sandbox = LocalSandbox(pool_size=0)
+    sandbox.allow_unisolated = False
+
+    results = sandbox.execute_code("python", "def add(a, b):\n    return a + b\n", TEST_CASES)
+
+    assert results["status"] == "error"
+    assert results["sandbox"] == {"backend": "local", "network": "unavailable", "refused": True}
+    assert "passed" not in results
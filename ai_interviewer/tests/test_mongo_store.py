@@ -0,0 +1,221 @@
+"""
+Tests for the MongoDB-backed LangGraph store.
+"""
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import mongomock
+from langgraph.store.base import GetOp, PutOp
+
+from ai_interviewer.utils import mongo_store
+from ai_interviewer.utils.mongo_store import AsyncMongoStore
+
+
+class FakeAsyncCursor:
+    """Async iterator over a mongomock cursor."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def sort(self, *args):
+        self.cursor = self.cursor.sort(*args)
+        return self
+
+    def skip(self, count):
+        self.cursor = self.cursor.skip(count)
+        return self
+
+    def limit(self, count):
+        self.cursor = self.cursor.limit(count)
+        return self
+
+    def __aiter__(self):
+        self._documents = iter(list(self.cursor))
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeAsyncCollection:
+    """Motor-like wrapper around a mongomock collection that counts round trips."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.calls = []
+
+    def find(self, query, projection=None):
+        self.calls.append("find")
+        return FakeAsyncCursor(self.collection.find(query, projection))
+
+    async def bulk_write(self, requests, ordered=True):
+        self.calls.append("bulk_write")
+        return self.collection.bulk_write(requests, ordered=ordered)
+
+    async def distinct(self, field):
+        self.calls.append("distinct")
+        return self.collection.distinct(field)
+
+    async def create_index(self, keys, **kwargs):
+        return self.collection.create_index(keys, **kwargs)
+
+
+def make_store():
+    collection = mongomock.MongoClient()["test"]["store"]
+    return AsyncMongoStore(FakeAsyncCollection(collection), sync_collection=collection), collection
+
+
+def test_sync_operations_persist_and_search_by_user():
+    """Test puts, gets, filtered prefix searches and deletes with the sync collection."""
+    store, collection = make_store()
+    store.setup_sync()
+
+    store.put(("candidate_profiles",), "u1", {"user_id": "u1", "key_skills": ["python"]})
+    store.put(("interview_memories", "s1"), "insight", {"user_id": "u1", "session_id": "s1", "text": "a"})
+    store.put(("interview_memories", "s2"), "insight", {"user_id": "u2", "session_id": "s2", "text": "b"})
+    store.put(("candidate_profiles",), "u1", {"user_id": "u1", "key_skills": ["python", "go"]})
+
+    # A second store on the same collection sees the data, as after a restart
+    restarted = AsyncMongoStore(None, sync_collection=collection)
+    item = restarted.get(("candidate_profiles",), "u1")
+    assert item.value["key_skills"] == ["python", "go"]
+    assert item.created_at <= item.updated_at
+
+    results = restarted.search(("interview_memories",), filter={"user_id": "u1"})
+    assert [(r.namespace, r.value["text"]) for r in results] == [(("interview_memories", "s1"), "a")]
+    assert restarted.list_namespaces(prefix=("interview_memories",)) == [
+        ("interview_memories", "s1"), ("interview_memories", "s2")
+    ]
+
+    restarted.delete(("candidate_profiles",), "u1")
+    assert store.get(("candidate_profiles",), "u1") is None
+    assert collection.find_one({"_id": "interview_memories.s2/insight"})["session_id"] == "s2"
+
+
+def test_concurrent_async_calls_share_one_batch():
+    """Test that gets and puts issued together are sent as one find and one bulk write."""
+    store, _ = make_store()
+
+    async def run():
+        await store.setup()
+        store.async_collection.calls.clear()
+        await asyncio.gather(*[
+            store.aput(("candidate_profiles",), f"u{i}", {"user_id": f"u{i}", "n": i}) for i in range(5)
+        ])
+        writes = list(store.async_collection.calls)
+        store.async_collection.calls.clear()
+        items = await asyncio.gather(*[store.aget(("candidate_profiles",), f"u{i}") for i in range(6)])
+        return writes, items
+
+    writes, items = asyncio.run(run())
+
+    assert [item.value["n"] for item in items[:5]] == [0, 1, 2, 3, 4]
+    assert items[5] is None
+    assert writes == ["bulk_write"]
+    assert store.async_collection.calls == ["find"]
+    stats = store.get_stats()
+    assert stats["batches"] == 2
+    assert stats["coalesced_calls"] == 9
+
+
+def test_reads_in_a_batch_see_the_state_before_its_writes():
+    """Test batch ordering and that a failed batch fails every waiting caller."""
+    store, _ = make_store()
+    store.put(("profiles",), "u1", {"version": 1})
+
+    async def run():
+        return await store.abatch([
+            GetOp(("profiles",), "u1"),
+            PutOp(("profiles",), "u1", {"version": 2}),
+        ])
+
+    before, _ = asyncio.run(run())
+    assert before.value == {"version": 1}
+    assert store.get(("profiles",), "u1").value == {"version": 2}
+
+    async def failing():
+        async def boom(*args, **kwargs):
+            raise ConnectionError("down")
+        store.async_collection.bulk_write = boom
+        return await asyncio.gather(
+            store.aput(("profiles",), "u1", {"version": 3}),
+            store.aput(("profiles",), "u2", {"version": 1}),
+            return_exceptions=True
+        )
+
+    errors = asyncio.run(failing())
+    assert all(isinstance(error, ConnectionError) for error in errors)
+
+def test_setup_adds_existing_items_to_the_text_index_in_bulk(monkeypatch):
+    """Test that items without search text are backfilled with chunked bulk writes."""
+    monkeypatch.setattr(mongo_store, "BACKFILL_BATCH_SIZE", 2)
+    store, collection = make_store()
+    collection.insert_many([
+        {"_id": f"profiles/u{i}", "namespace": "profiles", "key": f"u{i}", "value": {"user_id": f"u{i}"}} for i in range(5)
+    ])
+
+    asyncio.run(store.setup())
+
+    assert store.async_collection.calls == ["find", "bulk_write", "bulk_write", "bulk_write"]
+    assert collection.count_documents({"search_text": {"$exists": False}}) == 0
+    assert collection.find_one({"_id": "profiles/u3"})["search_text"] == "u3"
+
+
+def test_text_search_is_ranked_paginated_and_scoped_in_the_database():
+    """Test that values are indexed as text and searches send the query, scope and page to MongoDB."""
+    store, collection = make_store()
+    store.put(("interview_memories", "insights"), "m1", {
+        "user_id": "u1", "insights": {"key_skills": ["Python", "Kafka"], "notes": "Strong on streaming"}
+    })
+    assert collection.find_one({"_id": "interview_memories.insights/m1"})["search_text"] == "u1 Python Kafka Strong on streaming"
+
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.limit.return_value = [{
+        "namespace_labels": ["candidate_profiles"], "key": "u1", "value": {"user_id": "u1"},
+        "created_at": datetime(2024, 1, 1), "updated_at": datetime(2024, 1, 1), "score": 1.5
+    }]
+    mock_collection = MagicMock()
+    mock_collection.find.return_value = cursor
+    searcher = AsyncMongoStore(None, sync_collection=mock_collection)
+
+    results = searcher.search_text([("candidate_profiles",), ("interview_memories",)], "python kafka",
+                                   filter={"user_id": "u1"}, limit=5, offset=10)
+
+    query, projection = mock_collection.find.call_args[0]
+    assert query["$text"] == {"$search": "python kafka"}
+    assert query["user_id"] == "u1"
+    assert len(query["$or"]) == 2
+    assert projection == {"score": {"$meta": "textScore"}}
+    cursor.sort.assert_called_once_with([("score", {"$meta": "textScore"})])
+    cursor.skip.assert_called_once_with(10)
+    cursor.limit.assert_called_once_with(5)
+    assert [(r.key, r.score) for r in results] == [("u1", 1.5)]
+
+
+def test_search_updated_since_reads_new_items_oldest_first():
+    """Test that items written by another store on the collection are found by update time."""
+    store, collection = make_store()
+    store.put(("candidate_profiles",), "u1", {"user_id": "u1"})
+
+    # Another worker's store on the same collection
+    other = AsyncMongoStore(None, sync_collection=collection)
+    other.put(("candidate_profiles",), "u2", {"user_id": "u2"})
+    other.put(("interview_memories", "insights"), "m1", {"user_id": "u2", "text": "kafka"})
+    other.put(("interview_memories", "s1"), "turn", {"user_id": "u2"})
+    for minute, _id in enumerate(["candidate_profiles/u1", "interview_memories.insights/m1",
+                                  "candidate_profiles/u2", "interview_memories.s1/turn"]):
+        collection.update_one({"_id": _id}, {"$set": {"updated_at": datetime(2024, 1, 1, 12, minute)}})
+
+    items = store.search_updated_since([("candidate_profiles",), ("interview_memories", "insights")],
+                                       datetime(2024, 1, 1, 12, 1))
+    assert [item.key for item in items] == ["m1", "u2"]
+
+    page = store.search_updated_since([("candidate_profiles",), ("interview_memories", "insights")],
+                                      datetime(2024, 1, 1), limit=2)
+    assert [item.key for item in page] == ["u1", "m1"]
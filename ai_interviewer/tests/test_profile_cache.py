@@ -0,0 +1,91 @@
+"""
+Tests for the candidate profile cache.
+"""
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from ai_interviewer.utils.profile_cache import LocalInvalidationBus, MongoInvalidationBus, ProfileCache
+
+
+def test_reads_go_through_the_cache_and_saves_write_through():
+    """Test read-through loading, cached absence, write-through and TTL expiry."""
+    store = {"u1": {"key_skills": ["python"]}}
+    loads = []
+
+    def loader(user_id):
+        loads.append(user_id)
+        return store.get(user_id)
+
+    cache = ProfileCache(ttl=60, max_entries=10)
+    assert cache.get_or_load("u1", loader) == {"key_skills": ["python"]}
+    profile = cache.get_or_load("u1", loader)
+    profile["key_skills"].append("mutated")
+    assert cache.get_or_load("u1", loader) == {"key_skills": ["python"]}
+
+    # Users without a profile are cached too
+    assert cache.get_or_load("u2", loader) is None
+    assert cache.get_or_load("u2", loader) is None
+    assert loads == ["u1", "u2"]
+
+    cache.put("u2", {"key_skills": ["go"]})
+    assert cache.get_or_load("u2", loader) == {"key_skills": ["go"]}
+    assert loads == ["u1", "u2"]
+
+    cache.invalidate("u1")
+    cache.get_or_load("u1", loader)
+    assert loads == ["u1", "u2", "u1"]
+
+    expiring = ProfileCache(ttl=0, max_entries=10)
+    expiring.get_or_load("u1", loader)
+    expiring.get_or_load("u1", loader)
+    assert loads[-2:] == ["u1", "u1"]
+    assert cache.get_stats()["hits"] == 4
+
+
+def test_load_racing_with_a_save_does_not_cache_stale_data():
+    """Test that a profile saved while a load is in flight is not overwritten by the load."""
+    cache = ProfileCache(ttl=60, max_entries=10)
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_loader(user_id):
+        loading.set()
+        release.wait(5)
+        return {"version": 1}
+
+    reader = threading.Thread(target=cache.get_or_load, args=("u1", slow_loader))
+    reader.start()
+    loading.wait(5)
+    cache.put("u1", {"version": 2})
+    release.set()
+    reader.join(5)
+
+    assert cache.get_or_load("u1", lambda user_id: {"version": 3}) == {"version": 2}
+
+
+def test_invalidations_reach_caches_in_other_workers():
+    """Test a shared local bus and delivery of MongoDB invalidation events from other workers."""
+    bus = LocalInvalidationBus()
+    worker_a = ProfileCache(ttl=60, max_entries=10, bus=bus)
+    worker_b = ProfileCache(ttl=60, max_entries=10, bus=bus)
+    worker_b.get_or_load("u1", lambda user_id: {"version": 1})
+
+    worker_a.put("u1", {"version": 2})
+    assert worker_b.get_or_load("u1", lambda user_id: {"version": 2}) == {"version": 2}
+
+    collection = MagicMock()
+    collection.find.return_value = [{"user_id": "u1", "origin": "other", "at": datetime.utcnow()}]
+    mongo_bus = MongoInvalidationBus(collection, poll_interval=60)
+    try:
+        cache = ProfileCache(ttl=60, max_entries=10, bus=mongo_bus)
+        cache.get_or_load("u1", lambda user_id: {"version": 1})
+
+        assert mongo_bus.poll() == 1
+        assert cache.get_or_load("u1", lambda user_id: {"version": 2}) == {"version": 2}
+        assert collection.find.call_args[0][0]["origin"] == {"$ne": mongo_bus.origin}
+
+        cache.put("u1", {"version": 3})
+        assert collection.insert_one.call_args[0][0]["user_id"] == "u1"
+    finally:
+        mongo_bus.close()
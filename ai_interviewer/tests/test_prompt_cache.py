@@ -0,0 +1,81 @@
+"""
+Tests for system prompt prefix caching.
+"""
+from ai_interviewer.utils.prompt_cache import GeminiContextCacheBackend, SystemPromptCache
+
+PREFIX = "You interview for {job_role} ({seniority_level}).\n"
+SUFFIX = "Stage: {current_stage}\nSummary: {conversation_summary}\n"
+
+
+class FakeBackend:
+    """Backend that hands out numbered handles and records releases."""
+
+    def __init__(self):
+        self.registered = []
+        self.released = []
+
+    def register(self, key, prefix, ttl):
+        self.registered.append(prefix)
+        return f"cachedContents/{len(self.registered)}"
+
+    def release(self, handle):
+        self.released.append(handle)
+
+
+class CountingTemplate(str):
+    """Prefix template that counts how often it is formatted."""
+    formats = 0
+
+    def format(self, *args, **kwargs):
+        CountingTemplate.formats += 1
+        return str.format(self, *args, **kwargs)
+
+
+def test_prefix_is_rendered_once_per_session_settings():
+    """Test that turns only re-format the suffix while the settings are unchanged."""
+    CountingTemplate.formats = 0
+    cache = SystemPromptCache(CountingTemplate(PREFIX), SUFFIX, ttl=60, max_prefixes=8)
+    static = {"job_role": "Backend Engineer", "seniority_level": "Senior"}
+
+    first = cache.render("s1", static, {"current_stage": "introduction", "conversation_summary": ""})
+    second = cache.render("s1", dict(static), {"current_stage": "technical_questions", "conversation_summary": "Talked about APIs"},
+                          extra="\nCANDIDATE HISTORY")
+    other_session = cache.render("s2", static, {"current_stage": "introduction", "conversation_summary": ""})
+
+    assert CountingTemplate.formats == 1
+    assert first.prefix is second.prefix is other_session.prefix
+    assert second.content == (
+        "You interview for Backend Engineer (Senior).\n"
+        "Stage: technical_questions\nSummary: Talked about APIs\n\nCANDIDATE HISTORY"
+    )
+    assert first.cache_handle is None
+    assert cache.get_stats()["hits"] == 2
+
+
+def test_changed_session_settings_rebind_and_release_remote_prefixes():
+    """Test that a settings change moves the session to a new prefix and frees the unused remote cache."""
+    backend = FakeBackend()
+    cache = SystemPromptCache(PREFIX, SUFFIX, backend=backend, ttl=60, max_prefixes=8)
+    volatile = {"current_stage": "introduction", "conversation_summary": ""}
+
+    first = cache.render("s1", {"job_role": "Backend Engineer", "seniority_level": "Senior"}, volatile)
+    cache.render("s2", {"job_role": "Backend Engineer", "seniority_level": "Senior"}, volatile)
+    assert first.cache_handle == "cachedContents/1"
+
+    # s2 still uses the first prefix, so it is kept
+    changed = cache.render("s1", {"job_role": "Data Engineer", "seniority_level": "Senior"}, volatile)
+    assert changed.cache_handle == "cachedContents/2"
+    assert backend.released == []
+
+    cache.render("s2", {"job_role": "Data Engineer", "seniority_level": "Senior"}, volatile)
+    assert backend.released == ["cachedContents/1"]
+    assert cache.active_handles() == ["cachedContents/2"]
+
+    cache.clear()
+    assert backend.released == ["cachedContents/1", "cachedContents/2"]
+
+
+def test_gemini_backend_sends_short_prefixes_inline():
+    """Test that prefixes below the Gemini minimum are not registered remotely."""
+    backend = GeminiContextCacheBackend("models/gemini-1.5-pro-002", min_tokens=32768)
+    assert backend.register("key", "short prompt", ttl=60) is None
@@ -0,0 +1,91 @@
+"""
+Tests for the tool LLM response cache.
+"""
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from ai_interviewer.tools import pair_programming, question_tools
+from ai_interviewer.utils.response_cache import DiskResponseStore, ResponseCache, normalize_code, normalize_text
+
+
+def test_cache_applies_per_tool_ttls_and_counts_hits():
+    """Test per-tool TTLs, LRU eviction, copies and per-tool hit metrics."""
+    cache = ResponseCache(max_entries=2, ttls={"hints": 60, "question": 0.05, "code_review": 0})
+    key = cache.make_key("hints", challenge="c1", code=normalize_code("x = 1  \r\n"), error=normalize_text("  Name  Error"))
+    assert key == cache.make_key("hints", challenge="c1", code="x = 1", error="name error")
+    assert key.startswith("hints:")
+
+    assert cache.get("hints", key) is None
+    cache.put("hints", key, ["Check the loop bounds."])
+    cached = cache.get("hints", key)
+    cached.append("mutated")
+    assert cache.get("hints", key) == ["Check the loop bounds."]
+
+    # A TTL of 0 disables caching for that tool
+    review_key = cache.make_key("code_review", code="x = 1")
+    cache.put("code_review", review_key, ["Use a better name."])
+    assert cache.get("code_review", review_key) is None
+
+    question_key = cache.make_key("question", job_role="backend engineer")
+    cache.put("question", question_key, {"question": "Q"})
+    time.sleep(0.1)
+    assert cache.get("question", question_key) is None
+
+    stats = cache.get_stats()["tools"]
+    assert stats["hints"]["memory_hits"] == 2 and stats["hints"]["misses"] == 1
+    assert stats["hints"]["hit_rate"] == round(2 / 3, 3)
+    assert stats["question"]["expired"] == 1
+    assert "code_review" not in stats
+
+
+def test_disk_store_is_shared_between_cache_instances(tmp_path):
+    """Test that a second worker reads entries written by the first through the disk tier."""
+    first = ResponseCache(max_entries=10, ttls={"hints": 60}, store=DiskResponseStore(str(tmp_path)))
+    key = first.make_key("hints", challenge="c1", code="pass", error="")
+    first.put("hints", key, ["Return a value."])
+
+    second = ResponseCache(max_entries=10, ttls={"hints": 60}, store=DiskResponseStore(str(tmp_path)))
+    assert second.get("hints", key) == ["Return a value."]
+    assert second.get("hints", key) == ["Return a value."]
+    assert second.get_stats()["tools"]["hints"]["store_hits"] == 1
+
+    expired = DiskResponseStore(str(tmp_path))
+    expired.put("hints:old", ["stale"], ttl=-1)
+    assert expired.get("hints:old") is None
+    assert not (tmp_path / "hints_old.json").exists()
+
+
+def test_tools_skip_the_llm_for_repeated_inputs(monkeypatch):
+    """Test that repeated hint and opening question requests only reach the LLM once."""
+    cache = ResponseCache(max_entries=10, ttls={"hints": 60, "code_review": 60, "question": 60})
+    monkeypatch.setattr(pair_programming, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(question_tools, "get_response_cache", lambda: cache)
+
+    gateway = MagicMock()
+    gateway.invoke.side_effect = [
+        SimpleNamespace(content="- Consider a hash map.\n- Handle empty input."),
+        SimpleNamespace(content='{"question": "How would you design a rate limiter?", "expected_topics": ["token bucket"]}'),
+    ]
+    monkeypatch.setattr(pair_programming, "get_llm_gateway", lambda: gateway)
+    monkeypatch.setattr(question_tools, "get_llm_gateway", lambda: gateway)
+
+    challenge_info = {"id": "two_sum", "description": "Find two numbers that add up to a target."}
+    first = pair_programming.HintGenerator._generate_llm_based_hints("def f(nums):\n    pass\n", challenge_info)
+    second = pair_programming.HintGenerator._generate_llm_based_hints("def f(nums):\n    pass", challenge_info)
+    assert first == second == ["Consider a hash map.", "Handle empty input."]
+
+    question = question_tools.generate_interview_question.invoke({"job_role": "Backend Engineer", "skill_areas": ["Python", "APIs"]})
+    again = question_tools.generate_interview_question.invoke({"job_role": "backend engineer", "skill_areas": ["APIs", "python"]})
+    assert again["question"] == question["question"]
+    assert again["job_role"] == "backend engineer"
+    assert gateway.invoke.call_count == 2
+
+    # Follow-up questions depend on the conversation and are never cached
+    gateway.invoke.side_effect = None
+    gateway.invoke.return_value = SimpleNamespace(content='{"question": "Why?"}')
+    question_tools.generate_interview_question.invoke({
+        "job_role": "Backend Engineer", "skill_areas": ["Python", "APIs"],
+        "previous_questions": ["Q"], "previous_responses": ["A"]
+    })
+    assert gateway.invoke.call_count == 3
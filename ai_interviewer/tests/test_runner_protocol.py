@@ -0,0 +1,108 @@
+"""
+Tests for the structured test runner protocol.
+"""
+import json
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from ai_interviewer.tools.runner_protocol import (
+    JAVASCRIPT_TEST_RUNNER,
+    PYTHON_TEST_RUNNER,
+    RUNNER_CONFIG_FILE,
+    RunnerEventParser,
+    build_runner_config,
+    summarize_runner_events
+)
+
+TEST_CASES = [
+    {"input": [2, 3], "expected_output": 5},
+    {"input": [-1, 0], "expected_output": -1, "is_hidden": True},
+    {"input": [1, 1], "expected_output": 2, "is_hidden": True},
+]
+
+
+def _run_runner(tmp_path, command, runner_name, runner, code_name, code, **options):
+    """Run a test runner locally the way the sandbox does and parse its events."""
+    files = {
+        runner_name: runner,
+        code_name: code,
+        "test_cases.json": json.dumps(TEST_CASES),
+        RUNNER_CONFIG_FILE: build_runner_config(**options)
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(content)
+
+    process = subprocess.run(command + [runner_name], cwd=tmp_path, capture_output=True, timeout=30)
+    parser = RunnerEventParser()
+    # Feed in small chunks to exercise line reassembly
+    for i in range(0, len(process.stdout), 7):
+        parser.feed(process.stdout[i:i + 7])
+    parser.close()
+    assert not parser.invalid_lines
+    return parser.events, summarize_runner_events(parser.events, process.stderr.decode())
+
+
+def test_python_runner_reports_per_test_metrics_and_timeouts(tmp_path):
+    """Test per-test timeouts, metrics and that candidate prints stay off the event channel."""
+    code = (
+        "print('loading')\n"
+        "def add(a, b):\n"
+        "    print('adding', a, b)\n"
+        "    while a < 0:\n"
+        "        pass\n"
+        "    return a + b\n"
+    )
+    events, results = _run_runner(tmp_path, [sys.executable], "runner.py", PYTHON_TEST_RUNNER, "code.py", code,
+                                  per_test_timeout=0.3)
+
+    assert [e["event"] for e in events] == ["start", "test", "test", "test", "end"]
+    assert results["status"] == "success"
+    assert results["passed"] == 2 and results["failed"] == 1
+    first, looping = results["test_results"][0], results["test_results"][1]
+    assert first["stdout"] == "adding 2 3\n"
+    assert first["cpu_time"] >= 0 and first["peak_memory_kb"] > 0
+    assert looping["timed_out"] and 0.25 < looping["execution_time"] < 5
+    assert "loading" in results["logs"]
+
+
+def test_python_runner_stops_at_first_failing_hidden_test(tmp_path):
+    """Test the optional short-circuit on a failing hidden test."""
+    code = "def add(a, b):\n    return a + b + (a < 0)\n"
+    _, results = _run_runner(tmp_path, [sys.executable], "runner.py", PYTHON_TEST_RUNNER, "code.py", code,
+                             stop_on_hidden_failure=True)
+
+    assert results["stopped_early"]
+    assert len(results["test_results"]) == 2
+    assert results["skipped"] == 1
+    assert not results["all_passed"]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_javascript_runner_reports_per_test_results(tmp_path):
+    """Test the JavaScript runner, including a per-test timeout."""
+    code = (
+        "console.log('loading');\n"
+        "const add = (a, b) => { while (a < 0) {} return a + b; };\n"
+    )
+    events, results = _run_runner(tmp_path, ["node"], "runner.js", JAVASCRIPT_TEST_RUNNER, "code.js", code,
+                                  per_test_timeout=0.3)
+
+    assert [e["event"] for e in events] == ["start", "test", "test", "test", "end"]
+    assert results["passed"] == 2
+    assert results["test_results"][1]["timed_out"]
+    assert results["detailed_metrics"]["timed_out_tests"] == 1
+
+
+def test_summary_keeps_finished_tests_when_run_is_cut_short():
+    """Test that an overall timeout still reports the tests that completed."""
+    events = [
+        {"event": "start", "runner_version": 2, "total": 3},
+        {"event": "test", "test_case_id": 1, "passed": True, "execution_time": 0.1},
+    ]
+    results = summarize_runner_events(events, timed_out=True)
+
+    assert results["status"] == "error" and results["message"] == "Execution timed out"
+    assert results["passed"] == 1 and results["skipped"] == 2
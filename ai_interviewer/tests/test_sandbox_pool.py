@@ -0,0 +1,131 @@
+"""
+Tests for the warm sandbox container pool.
+"""
+import socket
+import struct
+import threading
+import time
+from unittest.mock import MagicMock
+
+from ai_interviewer.tools.sandbox_pool import ContainerPool
+
+
+def _fake_client():
+    """Docker client whose containers start instantly and reset cleanly."""
+    client = MagicMock()
+
+    def run_container(image, **kwargs):
+        container = MagicMock()
+        container.name = kwargs["name"]
+        container.exec_run.return_value = (0, b"")
+        return container
+
+    client.containers.run.side_effect = run_container
+    return client
+
+
+def test_pool_recycles_workers_after_max_runs_and_faults():
+    """Test that workers are reused, then replaced after max_runs or a fault."""
+    pool = ContainerPool(_fake_client(), "python", "python:3.10-slim", size=1, max_runs=2, acquire_timeout=5)
+    assert pool.start() == 1
+
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+
+    # Second run reaches max_runs, so the worker is replaced
+    pool.release(first)
+    second = pool.acquire()
+    assert second is not first
+    first["container"].remove.assert_called_once_with(force=True)
+
+    # A faulted run recycles immediately
+    pool.release(second, faulted=True)
+    third = pool.acquire()
+    assert third is not second
+    second["container"].remove.assert_called_once_with(force=True)
+
+    stats = pool.get_stats()
+    assert stats["recycled"] == 2
+    assert stats["faults"] == 1
+    assert stats["workers"] == 1
+
+
+def test_pool_output_reader_demuxes_and_enforces_deadline():
+    """Test exec output framing and the wall-clock kill."""
+    pool = ContainerPool(MagicMock(), "python", "python:3.10-slim")
+    ours, theirs = socket.socketpair()
+    try:
+        frame = lambda stream, data: struct.pack(">BxxxL", stream, len(data)) + data
+        theirs.sendall(frame(1, b'{"event": "start"}\n') + frame(2, b"warning") + frame(1, b'{"event": "end"}\n'))
+        theirs.shutdown(socket.SHUT_WR)
+        chunks = []
+        output = pool._read_output(ours, time.monotonic() + 5, on_stdout=chunks.append)
+        assert output["stdout"] == '{"event": "start"}\n{"event": "end"}\n'
+        assert len(chunks) == 2
+        assert output["stderr"] == "warning"
+        assert not output["timed_out"]
+    finally:
+        ours.close()
+        theirs.close()
+
+    ours, theirs = socket.socketpair()
+    try:
+        started = time.monotonic()
+        output = pool._read_output(ours, time.monotonic() + 0.2)
+        assert output["timed_out"]
+        assert time.monotonic() - started < 2
+    finally:
+        ours.close()
+        theirs.close()
+
+
+def test_docker_sandbox_pulls_missing_images_once():
+    """Test that prewarming pulls missing runtime images before starting workers."""
+    from docker.errors import ImageNotFound
+
+    from ai_interviewer.tools.docker_sandbox import DockerSandbox
+
+    def get_image(image):
+        if image.startswith("node"):
+            raise ImageNotFound(image)
+        return MagicMock()
+
+    client = _fake_client()
+    client.images.get.side_effect = get_image
+
+    sandbox = DockerSandbox.__new__(DockerSandbox)
+    sandbox.client = client
+    sandbox.image_status = {}
+    sandbox._images_lock = threading.Lock()
+    sandbox.pools = {"python": ContainerPool(client, "python", "python:3.10-slim", size=1)}
+
+    assert sandbox.prewarm() == {"python": 1}
+    assert sandbox.image_status == {"python": "present", "javascript": "pulled"}
+    client.images.pull.assert_called_once_with("node", tag="16-slim")
+
+    sandbox.ensure_images()
+    client.images.pull.assert_called_once()
+
+
+def test_docker_sandbox_fallback_does_not_report_streamed_tests_again():
+    """Test that a pooled run failing after streaming results falls back without the per-test callback."""
+    from ai_interviewer.tools import docker_sandbox
+    from ai_interviewer.tools.docker_sandbox import DockerSandbox
+
+    def failing_run(files, timeout, on_stdout=None):
+        on_stdout(b'{"event": "test", "test_case_id": 1, "passed": true}\n')
+        return None
+
+    pool = MagicMock()
+    pool.run.side_effect = failing_run
+    sandbox = DockerSandbox.__new__(DockerSandbox)
+    sandbox.pools = {"python": pool}
+    sandbox._run_cold_container = MagicMock(return_value={"status": "success"})
+    reported = []
+
+    sandbox._run_files("python", {}, docker_sandbox.DEFAULT_MEMORY_LIMIT, docker_sandbox.DEFAULT_CPU_LIMIT, 5,
+                       docker_sandbox.DEFAULT_NETWORK_DISABLED, on_test_result=reported.append)
+
+    assert reported == [{"test_case_id": 1, "passed": True}]
+    assert sandbox._run_cold_container.call_args[0][-1] is None
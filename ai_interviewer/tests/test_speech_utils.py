@@ -0,0 +1,126 @@
+"""
+Tests for the Deepgram speech clients, using a local HTTP stand-in for the API.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("pyaudio")
+from aiohttp import web
+
+from ai_interviewer.utils.speech_utils import DeepgramHTTPClient, VoiceHandler
+from ai_interviewer.utils.tts_cache import TTSCache
+
+
+async def _start_stand_in():
+    """Start a local server that mimics the Deepgram listen/speak endpoints."""
+    peers = set()
+
+    async def listen(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        await request.read()
+        return web.json_response({"results": {"channels": [{"alternatives": [{"transcript": "hello there"}]}]}})
+
+    async def speak(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        await request.json()
+        return web.Response(body=b"RIFF-audio", content_type="audio/wav")
+
+    app = web.Application()
+    app.router.add_post("/v1/listen", listen)
+    app.router.add_post("/v1/speak", speak)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1", peers
+
+
+def test_voice_handler_reuses_pooled_connection(tmp_path):
+    """Test that STT and TTS requests share one keep-alive connection."""
+    async def run():
+        runner, base_url, peers = await _start_stand_in()
+        handler = VoiceHandler(api_key="test-key", http_client=DeepgramHTTPClient(base_url=base_url),
+                               tts_cache=TTSCache(cache_dir=str(tmp_path)))
+        try:
+            for _ in range(3):
+                transcript = await handler.transcribe_audio_bytes(b"\x00\x01" * 100)
+                assert transcript == "hello there"
+                result = await handler.tts.synthesize_speech("Hi")
+                assert result["audio_data"] == b"RIFF-audio"
+        finally:
+            await handler.aclose()
+            await runner.cleanup()
+        return peers
+
+    peers = asyncio.run(run())
+    assert len(peers) == 1
+
+
+def test_transcribe_audio_bytes_stays_in_memory(tmp_path, monkeypatch):
+    """Test that in-memory audio is posted without touching the filesystem."""
+    import tempfile
+
+    def no_temp_files(*args, **kwargs):
+        raise AssertionError("transcription should not create temporary files")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_files)
+
+    async def run():
+        runner, base_url, _ = await _start_stand_in()
+        handler = VoiceHandler(api_key="test-key", http_client=DeepgramHTTPClient(base_url=base_url),
+                               tts_cache=TTSCache(cache_dir=str(tmp_path)))
+        try:
+            return await handler.transcribe_audio_bytes(memoryview(b"\x00\x01" * 100))
+        finally:
+            await handler.aclose()
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == "hello there"
+
+
+def test_chunked_speak_stitches_sentences_in_order(tmp_path):
+    """Test that chunked synthesis requests sentences concurrently and stitches them in order."""
+    import io
+    import wave
+
+    def make_wav(frames: bytes) -> bytes:
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(24000)
+            wf.writeframes(frames)
+        return buffer.getvalue()
+
+    handler = VoiceHandler(api_key="test-key", tts_cache=TTSCache(cache_dir=str(tmp_path / "cache")))
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_synthesize(text, params=None, **kwargs):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        # Later sentences finish first to check ordering
+        await asyncio.sleep(0.01 * (3 - int(text[-2])))
+        in_flight["now"] -= 1
+        return {"success": True, "audio_data": make_wav(text[-2].encode() * 4)}
+
+    handler.tts.synthesize_speech = fake_synthesize
+    text = ("This is the first sentence of the response 1. This is the second sentence of the response 2. "
+            "This is the third sentence of the response 3.")
+    output_file = tmp_path / "response.wav"
+
+    async def run():
+        try:
+            return await handler.speak(text, play_audio=False, output_file=str(output_file), chunked=True)
+        finally:
+            await handler.aclose()
+
+    assert asyncio.run(run()) is True
+    assert in_flight["max"] > 1
+    with wave.open(str(output_file), "rb") as wf:
+        assert wf.readframes(wf.getnframes()) == b"1111" + b"2222" + b"3333"
+
+    # The same text again is served from the TTS cache without new requests
+    handler.tts.synthesize_speech = None
+    assert asyncio.run(handler.synthesize_to_cache(text)) == handler.tts_cache_key(text, "nova")
@@ -0,0 +1,33 @@
+"""
+Tests for the content-addressed TTS cache.
+"""
+import os
+
+from ai_interviewer.utils.tts_cache import TTSCache
+
+
+def test_cache_key_normalizes_text_and_includes_settings():
+    """Test that keys ignore whitespace differences but not synthesis settings."""
+    key = TTSCache.make_key("Thank you for your time today.", "nova", "aura-asteria-en", "linear16")
+
+    assert TTSCache.is_valid_key(key)
+    assert key == TTSCache.make_key("  Thank you for your\ntime today. ", "nova", "aura-asteria-en", "linear16")
+    assert key != TTSCache.make_key("Thank you for your time today.", "luna", "aura-asteria-en", "linear16")
+
+
+def test_cache_evicts_least_recently_used_and_reloads_from_disk(tmp_path):
+    """Test size-bounded LRU eviction on disk and the disk tier surviving a restart."""
+    cache = TTSCache(cache_dir=str(tmp_path), max_disk_bytes=25, max_memory_bytes=10)
+    keys = [TTSCache.make_key(f"phrase {i}", "nova", "m", "e") for i in range(3)]
+
+    cache.put(keys[0], b"a" * 10)
+    cache.put(keys[1], b"b" * 10)
+    assert cache.get(keys[0]) == b"a" * 10  # keys[1] is now least recently used
+    cache.put(keys[2], b"c" * 10)
+
+    assert not cache.contains(keys[1])
+    assert not os.path.exists(cache.path_for(keys[1]))
+
+    restarted = TTSCache(cache_dir=str(tmp_path), max_disk_bytes=25, max_memory_bytes=10)
+    assert restarted.get(keys[0]) == b"a" * 10
+    assert restarted.get_stats()["disk_hits"] == 1
@@ -0,0 +1,61 @@
+"""
+Tests for the memory vector index.
+"""
+import random
+
+import numpy as np
+
+from ai_interviewer.utils.vector_index import HashedNgramEmbedder, MemoryVectorIndex
+
+
+def test_hashed_ngrams_place_related_texts_close_together():
+    """Test that texts sharing words and word pieces are more similar than unrelated ones."""
+    embedder = HashedNgramEmbedder(dim=512)
+    query = embedder.embed("PostgreSQL microservices")
+
+    related = embedder.embed("Built micro-services on Postgres")
+    unrelated = embedder.embed("Prefers pair programming in the morning")
+
+    assert np.isclose(np.linalg.norm(query), 1.0)
+    assert float(query @ related) > float(query @ unrelated)
+    assert not embedder.embed("  ...  ").any()
+
+
+def test_items_are_updated_in_place_and_searches_are_scoped_and_paginated():
+    """Test incremental upserts, per-user scoping and offsets."""
+    index = MemoryVectorIndex(embedder=HashedNgramEmbedder(dim=256), ann_threshold=0, nprobe=4)
+    index.add("m1", "Strong Kafka streaming experience", {"user_id": "u1"})
+    index.add("m2", "Kafka consumer groups and offsets", {"user_id": "u2"})
+    index.add("m3", "Designed a React component library", {"user_id": "u1"})
+
+    assert {item_id for item_id, _, _ in index.search("kafka", k=2)} == {"m1", "m2"}
+    assert [item_id for item_id, _, _ in index.search("kafka", k=5, user_id="u1")] == ["m1"]
+
+    # Replacing an item moves it to the new text and user
+    index.add("m1", "Frontend work in React and TypeScript", {"user_id": "u2"})
+    assert len(index) == 3
+    assert index.search("kafka", k=5, user_id="u1") == []
+    assert [item_id for item_id, _, _ in index.search("kafka", k=5, user_id="u2")][0] == "m2"
+
+    first_page = index.search("react", k=1)
+    second_page = index.search("react", k=1, offset=1)
+    assert first_page[0][0] != second_page[0][0]
+    assert {first_page[0][0], second_page[0][0]} == {"m1", "m3"}
+
+
+def test_large_indexes_switch_to_clustered_search():
+    """Test that reaching the threshold trains clusters and approximate search finds the exact best match."""
+    rng = random.Random(0)
+    words = ["python", "kafka", "react", "docker", "postgres", "graphql", "spark", "rust", "terraform", "redis"]
+    index = MemoryVectorIndex(embedder=HashedNgramEmbedder(dim=128), ann_threshold=200, nprobe=4)
+    for i in range(400):
+        index.add(f"m{i}", " ".join(rng.sample(words, 3)), {"user_id": f"u{i % 7}"})
+
+    stats = index.get_stats()
+    assert stats["trainings"] == 2
+    assert stats["clusters"] == 20
+
+    exact = index.search("kafka spark redis", k=1, exact=True)
+    approximate = index.search("kafka spark redis", k=1)
+    assert approximate[0][1] == exact[0][1]
+    assert index.get_stats()["approximate_searches"] == 1
@@ -0,0 +1,72 @@
+"""
+Tests for the real-time voice pipeline.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pyaudio")
+
+from ai_interviewer.utils.speech_utils import split_complete_sentences
+from ai_interviewer.utils.voice_pipeline import VoiceConversation
+
+
+class FakeWebSocket:
+    """Stand-in for a FastAPI WebSocket that replays client messages."""
+
+    def __init__(self, incoming):
+        self.incoming = list(incoming)
+        self.sent = []
+
+    async def receive(self):
+        await asyncio.sleep(0)
+        if self.incoming:
+            return self.incoming.pop(0)
+        return {"type": "websocket.receive", "text": json.dumps({"type": "stop"})}
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+
+def test_split_complete_sentences_keeps_remainder():
+    """Test that only complete sentences are split off a growing buffer."""
+    sentences, rest = split_complete_sentences("Thanks for joining today. Let's start with your backgro", min_length=10)
+    assert sentences == ["Thanks for joining today."]
+    assert rest == "Let's start with your backgro"
+
+
+def test_voice_conversation_speaks_first_sentence_before_response_finishes():
+    """Test that TTS for the first sentence starts while the LLM is still streaming."""
+    async def stream_transcription(audio_queue, params=None):
+        while await audio_queue.get() is not None:
+            pass
+        yield {"type": "transcript", "transcript": "Hi, I'm Ada", "is_final": True, "speech_final": True}
+
+    async def stream_speech(text, params=None):
+        yield f"audio:{text}".encode()
+
+    async def stream_interview(user_id, message, session_id=None):
+        for token in ["Nice to meet you, Ada. ", "Tell me about ", "your last project."]:
+            yield {"type": "token", "content": token}
+        yield {"type": "done", "response": "", "session_id": "sess-1", "interview_stage": "introduction"}
+
+    voice_handler = SimpleNamespace(
+        stt=SimpleNamespace(stream_transcription=stream_transcription),
+        tts=SimpleNamespace(stream_speech=stream_speech)
+    )
+    interviewer = SimpleNamespace(stream_interview=stream_interview)
+    websocket = FakeWebSocket([{"type": "websocket.receive", "bytes": b"\x00\x01"}])
+
+    conversation = VoiceConversation(websocket, voice_handler, interviewer, "user-1")
+    asyncio.run(conversation.run())
+
+    kinds = [m if isinstance(m, bytes) else m["type"] for m in websocket.sent]
+    assert b"audio:Nice to meet you, Ada." in kinds
+    assert kinds.index(b"audio:Nice to meet you, Ada.") < kinds.index("done")
+    assert b"audio:Tell me about your last project." in kinds
+    assert conversation.session_id == "sess-1"
@@ -70,4 +70,81 @@ def test_interviewer_initialization():
     assert interviewer.workflow is not None
     
     # Verify tools were initialized
-    assert len(interviewer.tools) > 0 
\ No newline at end of file
+    assert len(interviewer.tools) > 0 
+
+def test_extract_response_token_filters_by_tag():
+    """Test that only tokens from the tagged interviewer model call are streamed."""
+    from langchain_core.messages import AIMessageChunk, ToolMessage
+    from ai_interviewer.core.ai_interviewer import RESPONSE_STREAM_TAG
+    
+    chunk = AIMessageChunk(content="Hello")
+    
+    assert AIInterviewer._extract_response_token(chunk, {"tags": [RESPONSE_STREAM_TAG]}) == "Hello"
+    assert AIInterviewer._extract_response_token(chunk, {"tags": []}) == ""
+    assert AIInterviewer._extract_response_token(
+        ToolMessage(content="result", tool_call_id="1"), {"tags": [RESPONSE_STREAM_TAG]}
+    ) == ""
+
+
+def test_insight_extraction_only_sends_new_messages():
+    """Test that insight extraction resumes from the stored high-water mark."""
+    messages = [HumanMessage(content=f"message {i}", id=f"m{i}") for i in range(8)]
+    marker = AIInterviewer._insights_marker(messages[:5])
+    
+    assert marker == {"message_id": "m4", "message_count": 5}
+    assert [m.id for m in AIInterviewer._messages_after_marker(messages, marker)] == ["m5", "m6", "m7"]
+    # After context management trims the marked message, all remaining messages are new
+    assert [m.id for m in AIInterviewer._messages_after_marker(messages[6:], marker)] == ["m6", "m7"]
+    
+    insights = {"key_skills": ["Python"], "strengths": []}
+    assert AIInterviewer._apply_extracted_insights(insights, '{"key_skills": ["python", "Go"], "strengths": ["Testing"]}')
+    assert insights["key_skills"] == ["Python", "Go"]
+    assert insights["strengths"] == ["Testing"]
+    assert not AIInterviewer._apply_extracted_insights(insights, "Sorry, I can't help with that.")
+
+
+def test_failed_insight_extraction_does_not_report_success():
+    """Test that the high-water mark is only advanced after a parsed extraction."""
+    interviewer = AIInterviewer.__new__(AIInterviewer)
+    interviewer.summarization_model = MagicMock()
+    messages = [HumanMessage(content=f"message {i}", id=f"m{i}") for i in range(6)]
+    
+    _, extracted = interviewer._extract_interview_insights(messages[:3])
+    assert not extracted
+    
+    interviewer.summarization_model.invoke.side_effect = RuntimeError("quota exceeded")
+    _, extracted = interviewer._extract_interview_insights(messages)
+    assert not extracted
+    
+    interviewer.summarization_model.invoke.side_effect = None
+    interviewer.summarization_model.invoke.return_value = AIMessage(content='{"key_skills": ["Rust"]}')
+    insights, extracted = interviewer._extract_interview_insights(messages)
+    assert extracted
+    assert insights["key_skills"] == ["Rust"]
+
+
+def test_sync_graph_streams_from_a_worker_thread():
+    """Test that the sync-checkpointer stream runs off the event loop and re-raises graph errors."""
+    import asyncio
+    import threading
+    
+    graph_threads = []
+    
+    def stream(graph_input, config, stream_mode):
+        graph_threads.append(threading.get_ident())
+        yield "first"
+        yield "second"
+        if graph_input.get("fail"):
+            raise ValueError("graph failed")
+    
+    interviewer = AIInterviewer.__new__(AIInterviewer)
+    interviewer.workflow = MagicMock()
+    interviewer.workflow.stream.side_effect = stream
+    
+    async def collect(graph_input):
+        return [chunk async for chunk in interviewer._astream_in_thread(graph_input, {}, "values")]
+    
+    assert asyncio.run(collect({})) == ["first", "second"]
+    assert graph_threads[0] != threading.get_ident()
+    with pytest.raises(ValueError, match="graph failed"):
+        asyncio.run(collect({"fail": True}))
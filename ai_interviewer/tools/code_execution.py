@@ -10,13 +10,16 @@ import logging
 import traceback
 import ast
 import time
-from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple, Union
 from contextlib import redirect_stdout, redirect_stderr
 
 from langchain_core.tools import tool
 
-# Import docker sandbox
+# Import sandboxes
 from ai_interviewer.tools.docker_sandbox import DockerSandbox
+from ai_interviewer.tools.local_sandbox import LocalSandbox
+from ai_interviewer.utils.config import get_sandbox_config
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -49,6 +52,143 @@ def get_docker_sandbox() -> Optional[DockerSandbox]:
     
     return _docker_sandbox
 
+# Initialize local process sandbox (will be lazily loaded)
+_local_sandbox = None
+
+def get_local_sandbox() -> Optional[LocalSandbox]:
+    """
+    Get or initialize the local process sandbox instance.
+    
+    Returns:
+        LocalSandbox instance or None if it is not supported on this host
+    """
+    global _local_sandbox
+    
+    if _local_sandbox is None:
+        try:
+            _local_sandbox = LocalSandbox()
+        except Exception as e:
+            logger.error(f"Failed to initialize local sandbox: {e}")
+            _local_sandbox = None
+    
+    return _local_sandbox
+
+def get_sandbox() -> Optional[Union[DockerSandbox, LocalSandbox]]:
+    """
+    Get the code execution sandbox selected by SANDBOX_BACKEND.
+    
+    "auto" prefers Docker and falls back to the local process sandbox;
+    "docker" and "local" use only that backend.
+    
+    Returns:
+        Sandbox instance or None if the selected backend is not available
+    """
+    backend = get_sandbox_config()["backend"]
+    
+    if backend in ("auto", "docker"):
+        sandbox = get_docker_sandbox()
+        if sandbox is not None or backend == "docker":
+            return sandbox
+    
+    return get_local_sandbox()
+
+# Canary submission run by prepare_sandbox, per language
+CANARY_SUBMISSIONS = {
+    "python": "def add(a, b):\n    return a + b\n",
+    "javascript": "function add(a, b) {\n    return a + b;\n}\n"
+}
+CANARY_TEST_CASES = [{"input": [2, 3], "expected_output": 5}]
+
+# Outcome of the last prepare_sandbox run
+_sandbox_readiness: Dict[str, Any] = {"status": "not_started"}
+
+def prepare_sandbox() -> Dict[str, Any]:
+    """
+    Get the code execution sandbox ready before the first submission.
+    
+    Pulls missing Docker images, fills the warm pools and runs a canary
+    submission per language, so the first candidate after a deploy does not
+    wait for image pulls and container starts. Blocks until done; the server
+    runs it in a background thread at startup.
+    
+    Returns:
+        Readiness report: "status" is "ready", "degraded" (Python works but
+        another language does not) or "unavailable"
+    """
+    global _sandbox_readiness
+    _sandbox_readiness = {"status": "starting", "started_at": datetime.now().isoformat()}
+    started = time.perf_counter()
+    readiness: Dict[str, Any] = {"canary": {}}
+    
+    try:
+        sandbox = get_sandbox()
+        if sandbox is None:
+            readiness.update({
+                "status": "unavailable",
+                "message": "No sandbox backend is available; submissions use the legacy in-process executor"
+            })
+            return readiness
+        
+        readiness["backend"] = type(sandbox).__name__
+        languages = list(CANARY_SUBMISSIONS)
+        if isinstance(sandbox, DockerSandbox):
+            readiness["images"] = sandbox.ensure_images()
+            readiness["workers_started"] = sandbox.prewarm()
+        elif not sandbox.check_docker_requirements().get("node_available"):
+            languages.remove("javascript")
+            readiness["canary"]["javascript"] = {"passed": False, "message": "Node.js is not installed"}
+        
+        for language in languages:
+            canary_started = time.perf_counter()
+            results = sandbox.execute_code(
+                language=language,
+                code=CANARY_SUBMISSIONS[language],
+                test_cases=CANARY_TEST_CASES
+            )
+            canary = {
+                "passed": bool(results.get("all_passed")),
+                "duration": round(time.perf_counter() - canary_started, 3)
+            }
+            if not canary["passed"]:
+                canary["message"] = results.get("message") or results.get("error_message") or "Canary test failed"
+                logger.error(f"Sandbox canary failed for {language}: {canary['message']}")
+            readiness["canary"][language] = canary
+        
+        if not readiness["canary"]["python"]["passed"]:
+            readiness["status"] = "unavailable"
+        elif all(canary["passed"] for canary in readiness["canary"].values()):
+            readiness["status"] = "ready"
+        else:
+            readiness["status"] = "degraded"
+        return readiness
+    except Exception as e:
+        logger.error(f"Sandbox preparation failed: {e}")
+        readiness.update({"status": "unavailable", "message": str(e)})
+        return readiness
+    finally:
+        readiness["duration"] = round(time.perf_counter() - started, 3)
+        readiness["finished_at"] = datetime.now().isoformat()
+        _sandbox_readiness = readiness
+        logger.info(f"Sandbox readiness: {readiness['status']} ({readiness['duration']}s)")
+
+def get_sandbox_status() -> Dict[str, Any]:
+    """
+    Report sandbox readiness and warm capacity without creating a sandbox.
+    
+    Returns:
+        The last prepare_sandbox report plus current pool statistics
+    """
+    status = dict(_sandbox_readiness)
+    sandbox = _docker_sandbox or _local_sandbox
+    if sandbox is not None:
+        pools = sandbox.get_pool_stats()
+        status["capacity"] = {
+            "workers": sum(pool.get("workers", pool.get("size", 0)) for pool in pools.values()),
+            "idle": sum(pool.get("idle", 0) for pool in pools.values()),
+            "pools": pools
+        }
+    return status
+
 @tool
 def execute_candidate_code(language: str, code: str, test_cases: List[Dict]) -> Dict:
     """
@@ -65,13 +205,13 @@ def execute_candidate_code(language: str, code: str, test_cases: List[Dict]) ->
     try:
         logger.info(f"Executing {language} code in secure sandbox")
         
-        # Get Docker sandbox instance
-        sandbox = get_docker_sandbox()
+        # Get sandbox instance
+        sandbox = get_sandbox()
         
-        # Check if Docker is available
+        # Check if a sandbox is available
         if sandbox is not None:
-            # Execute code in Docker sandbox
-            logger.info("Using Docker sandbox for secure execution")
+            # Execute code in the sandbox
+            logger.info(f"Using {type(sandbox).__name__} for secure execution")
             results = sandbox.execute_code(
                 language=language,
                 code=code,
@@ -89,7 +229,7 @@ def execute_candidate_code(language: str, code: str, test_cases: List[Dict]) ->
             }
         else:
             # Fall back to legacy execution method for compatibility
-            logger.warning("Docker not available, falling back to legacy CodeExecutor")
+            logger.warning("No sandbox available, falling back to legacy CodeExecutor")
             
             if language.lower() == "python":
                 results = CodeExecutor.execute_python_code(code, test_cases)
@@ -148,10 +288,10 @@ class CodeExecutor:
         Returns:
             Dictionary with execution results
         """
-        # First, try using the Docker sandbox if available
-        sandbox = get_docker_sandbox()
+        # First, try using a sandbox if available
+        sandbox = get_sandbox()
         if sandbox:
-            logger.info("Using Docker sandbox for Python code execution")
+            logger.info(f"Using {type(sandbox).__name__} for Python code execution")
             return sandbox.execute_code(
                 language="python",
                 code=code,
@@ -160,8 +300,8 @@ class CodeExecutor:
                 timeout=timeout
             )
         
-        # Fall back to legacy in-process execution if Docker is not available
-        logger.warning("Docker sandbox not available, using legacy in-process execution (less secure)")
+        # Fall back to legacy in-process execution if no sandbox is available
+        logger.warning("No sandbox available, using legacy in-process execution (less secure)")
         
         results = {
             "status": "success",
@@ -311,10 +451,10 @@ class CodeExecutor:
         Returns:
             Dictionary with execution results
         """
-        # First, try using the Docker sandbox if available
-        sandbox = get_docker_sandbox()
+        # First, try using a sandbox if available
+        sandbox = get_sandbox()
         if sandbox:
-            logger.info("Using Docker sandbox for JavaScript code execution")
+            logger.info(f"Using {type(sandbox).__name__} for JavaScript code execution")
             return sandbox.execute_code(
                 language="javascript",
                 code=code,
@@ -323,7 +463,7 @@ class CodeExecutor:
             )
             
         # Fall back to placeholder if Docker is not available
-        logger.warning("Docker sandbox not available, JavaScript execution not supported in legacy mode")
+        logger.warning("No sandbox available, JavaScript execution not supported in legacy mode")
         
         # Placeholder implementation - would use subprocess to call Node.js in real implementation
         return {
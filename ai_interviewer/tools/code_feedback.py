@@ -9,6 +9,12 @@ from typing import Dict, List, Optional, Any
 import re
 
 from ai_interviewer.tools.code_quality import CodeQualityMetrics
+from ai_interviewer.tools.complexity_analysis import (
+    analyze_python_complexity,
+    combine_estimates,
+    estimate_empirical_complexity
+)
+from ai_interviewer.utils.config import get_code_quality_config
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -31,7 +37,9 @@ class CodeFeedbackGenerator:
         code: str, 
         execution_results: Dict[str, Any],
         language: str = "python",
-        skill_level: str = "intermediate"
+        skill_level: str = "intermediate",
+        sample_input: Optional[Any] = None,
+        empirical: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Generate comprehensive feedback for a code submission.
@@ -41,6 +49,8 @@ class CodeFeedbackGenerator:
             execution_results: Results from code execution
             language: Programming language of submission
             skill_level: Skill level of the candidate (beginner, intermediate, advanced)
+            sample_input: Input of a test case, scaled up to time the code on growing inputs
+            empirical: Whether to time the code in the sandbox (config default if None)
             
         Returns:
             Dictionary containing structured feedback
@@ -64,7 +74,9 @@ class CodeFeedbackGenerator:
         if language.lower() == "python":
             quality_metrics = CodeQualityMetrics.analyze_python_code(code)
             feedback["code_quality"] = CodeFeedbackGenerator._analyze_code_quality(quality_metrics)
-            feedback["efficiency"] = CodeFeedbackGenerator._analyze_python_efficiency(code, execution_results)
+            feedback["efficiency"] = CodeFeedbackGenerator._analyze_python_efficiency(
+                code, execution_results, sample_input, empirical
+            )
         elif language.lower() == "javascript":
             feedback["code_quality"] = {"message": "JavaScript code quality analysis not fully implemented"}
             feedback["efficiency"] = {"message": "JavaScript efficiency analysis not fully implemented"}
@@ -229,13 +241,24 @@ class CodeFeedbackGenerator:
         return quality
     
     @staticmethod
-    def _analyze_python_efficiency(code: str, execution_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_python_efficiency(
+        code: str,
+        execution_results: Dict[str, Any],
+        sample_input: Optional[Any] = None,
+        empirical: Optional[bool] = None
+    ) -> Dict[str, Any]:
         """
         Analyze the efficiency of Python code.
         
+        Time complexity is estimated statically from the AST. In empirical mode
+        the code is also timed in the sandbox on growing inputs, and a confident
+        fit of those timings takes precedence.
+        
         Args:
             code: Python code to analyze
             execution_results: Results from code execution
+            sample_input: Input of a test case, scaled up for empirical timing
+            empirical: Whether to time the code in the sandbox (config default if None)
             
         Returns:
             Dictionary with efficiency analysis
@@ -255,39 +278,35 @@ class CodeFeedbackGenerator:
                 "max_execution_time": metrics.get("max_execution_time", 0)
             }
         
-        # Heuristic time complexity estimation based on code patterns
-        # This is a simplified analysis - in a production system, this would be more sophisticated
-        # and would analyze the AST for loops, nested loops, recursion, etc.
-        if "for" in code and "for" in code.split("for")[1]:
-            # Nested loops detected
-            efficiency["time_complexity"] = "O(n²) - Quadratic"
-            efficiency["analysis"].append(
-                "The code contains nested loops, suggesting quadratic time complexity."
-            )
-        elif "for" in code:
-            # Single loop
-            efficiency["time_complexity"] = "O(n) - Linear"
+        # Static estimate from loop nesting, recursion and known-cost calls
+        static = analyze_python_complexity(code)
+        efficiency["static_analysis"] = static
+        
+        empirical_results = None
+        if empirical is None:
+            empirical = get_code_quality_config()["empirical_complexity"]
+        if empirical and sample_input is not None and static.get("big_o") \
+                and execution_results.get("status") != "error":
+            try:
+                empirical_results = estimate_empirical_complexity(code, sample_input=sample_input)
+                efficiency["empirical_analysis"] = empirical_results
+            except Exception as e:
+                logger.warning(f"Empirical complexity estimation failed: {e}")
+        
+        estimate = combine_estimates(static, empirical_results)
+        efficiency["time_complexity"] = estimate["time_complexity"]
+        efficiency["complexity_method"] = estimate["method"]
+        
+        if estimate["method"] == "empirical":
             efficiency["analysis"].append(
-                "The code contains a loop, suggesting linear time complexity."
+                f"Running times measured on growing inputs suggest {estimate['big_o']} time complexity."
             )
-        elif "while" in code:
-            # While loop
-            efficiency["time_complexity"] = "O(n) - Linear"
-            efficiency["analysis"].append(
-                "The code contains a while loop, suggesting linear or potentially higher time complexity."
-            )
-        elif "recursion" in execution_results.get("patterns", []):
-            # Recursive function
-            efficiency["time_complexity"] = "O(?) - Recursive"
-            efficiency["analysis"].append(
-                "The code uses recursion, making complexity dependent on recursion depth."
-            )
-        else:
-            # Default to constant time
-            efficiency["time_complexity"] = "O(1) - Constant"
+        elif static.get("big_o"):
             efficiency["analysis"].append(
-                "The code appears to have constant time complexity."
+                f"Static analysis suggests {static['big_o']} time complexity "
+                f"(loop nesting depth {static['loop_depth']})."
             )
+        efficiency["analysis"].extend(estimate["notes"])
         
         # Execution time analysis
         avg_time = efficiency["execution_metrics"].get("avg_execution_time", 0)
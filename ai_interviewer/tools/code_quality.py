@@ -3,21 +3,419 @@ Code quality analysis tools for the AI Interviewer platform.
 
 This module provides tools for analyzing code quality, including metrics
 for complexity, style, and best practices.
+
+Submissions are parsed once with ``ast`` and every metric is derived from
+that tree: radon's complexity, maintainability and Halstead visitors, the
+documentation ratio and a built-in set of pylint-style checks. Running pylint
+itself is an optional deep mode served by a long-lived worker process, so its
+start-up and plugin loading are paid once rather than per submission.
 """
 import ast
+import atexit
+import builtins
+import json
 import logging
-import io
+import os
+import re
+import selectors
+import subprocess
 import sys
-from typing import Dict, List, Optional, Any
-from radon.complexity import cc_visit
-from radon.metrics import h_visit, mi_visit
+import threading
+import time
+from typing import Dict, List, Optional, Any, Union
+from radon.complexity import cc_visit_ast
+from radon.metrics import h_visit_ast, mi_compute
 from radon.raw import analyze
-import pylint.lint
-from pylint.reporters import JSONReporter
+from radon.visitors import ComplexityVisitor
+
+from ai_interviewer.utils.config import get_code_quality_config
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Score deductions per message category, as used for the pylint score
+CATEGORY_PENALTIES = {"fatal": 2.0, "error": 2.0, "warning": 1.0, "convention": 0.5}
+
+MAX_LINE_LENGTH = 100
+SNAKE_CASE = re.compile(r"^_{0,2}[a-z][a-z0-9_]*_{0,2}$|^_$")
+UPPER_CASE = re.compile(r"^_{0,2}[A-Z][A-Z0-9_]*$")
+PASCAL_CASE = re.compile(r"^_{0,2}[A-Z][a-zA-Z0-9]*$")
+BUILTIN_NAMES = frozenset(name for name in dir(builtins) if not name.startswith("_"))
+
+# Arguments for the deep analysis pylint worker
+PYLINT_ARGS = [
+    "--disable=import-error,no-name-in-module,missing-module-docstring",
+    "--persistent=n",
+    "--score=n"
+]
+
+# Long-lived pylint process: reads one JSON job per line on stdin and writes
+# one JSON result per line on stdout. pylint and astroid are imported once.
+PYLINT_WORKER_SCRIPT = """
+import io, json, os, sys, tempfile
+from astroid import MANAGER
+from pylint.lint import Run
+from pylint.reporters import JSONReporter
+
+args = json.loads(sys.argv[1])
+channel = sys.stdout
+sys.stdout = sys.stderr
+
+for line in sys.stdin:
+    job = json.loads(line)
+    fd, path = tempfile.mkstemp(suffix=".py", prefix="submission_")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(job["code"])
+        reporter = JSONReporter(io.StringIO())
+        Run([*args, path], reporter=reporter, exit=False)
+        result = {"messages": [
+            {"category": m.category, "symbol": m.symbol, "line": m.line, "message": m.msg}
+            for m in reporter.messages
+        ]}
+    except Exception as e:
+        result = {"error": str(e) or type(e).__name__}
+    finally:
+        os.unlink(path)
+        MANAGER.astroid_cache.pop(os.path.splitext(os.path.basename(path))[0], None)
+    channel.write(json.dumps(result) + "\\n")
+    channel.flush()
+"""
+
+
+class PythonStyleChecker(ast.NodeVisitor):
+    """
+    Fast pylint-style checks over a parsed module.
+
+    Messages use pylint's categories and symbols so they can be scored the
+    same way. Documentation is scored separately, so missing docstrings are
+    not reported here.
+    """
+
+    def __init__(self, tree: ast.Module, code: str):
+        """
+        Initialize the checker.
+
+        Args:
+            tree: Parsed module
+            code: Source code the tree was parsed from
+        """
+        self.tree = tree
+        self.lines = code.splitlines()
+        self.messages: List[Dict[str, Any]] = []
+
+    def check(self) -> List[Dict[str, Any]]:
+        """
+        Run all checks.
+
+        Returns:
+            List of messages with category, symbol, line and message
+        """
+        self.messages = []
+        self._check_lines()
+        self._check_unused_imports()
+        self.visit(self.tree)
+        return sorted(self.messages, key=lambda m: m["line"])
+
+    def _add(self, category: str, symbol: str, line: int, message: str) -> None:
+        """Record a message."""
+        self.messages.append({"category": category, "symbol": symbol, "line": line, "message": message})
+
+    def _check_lines(self) -> None:
+        """Check line length and trailing whitespace."""
+        for number, line in enumerate(self.lines, 1):
+            if len(line) > MAX_LINE_LENGTH:
+                self._add("convention", "line-too-long", number,
+                          f"Line too long ({len(line)}/{MAX_LINE_LENGTH})")
+            if line != line.rstrip():
+                self._add("convention", "trailing-whitespace", number, "Trailing whitespace")
+
+    def _check_unused_imports(self) -> None:
+        """Check for module imports that are never used."""
+        used = {node.id for node in ast.walk(self.tree) if isinstance(node, ast.Name)}
+        for node in self.tree.body:
+            if not isinstance(node, (ast.Import, ast.ImportFrom)):
+                continue
+            for alias in node.names:
+                name = (alias.asname or alias.name).split(".")[0]
+                if name != "*" and name not in used:
+                    self._add("warning", "unused-import", node.lineno, f"Unused import {alias.name}")
+
+    def _check_body(self, body: List[ast.stmt]) -> None:
+        """Check a statement list for unreachable code, indentation and multiple statements per line."""
+        previous = None
+        for stmt in body:
+            if previous is not None:
+                if isinstance(previous, (ast.Return, ast.Raise, ast.Continue, ast.Break)):
+                    self._add("warning", "unreachable", stmt.lineno, "Unreachable code")
+                    previous = None
+                if previous is not None and previous.end_lineno == stmt.lineno:
+                    self._add("convention", "multiple-statements", stmt.lineno,
+                              "More than one statement on a single line")
+            line = self.lines[stmt.lineno - 1] if stmt.lineno <= len(self.lines) else ""
+            starts_line = len(line) - len(line.lstrip()) == stmt.col_offset
+            if starts_line and stmt.col_offset % 4:
+                self._add("warning", "bad-indentation", stmt.lineno,
+                          "Bad indentation, indent with a multiple of four spaces")
+            previous = stmt
+
+    def _check_name(self, name: str, line: int, kind: str, pattern: "re.Pattern") -> None:
+        """Check a name against a naming convention and for shadowed builtins."""
+        if name in BUILTIN_NAMES and kind != "class":
+            self._add("warning", "redefined-builtin", line, f"Redefining built-in '{name}'")
+        elif not pattern.match(name):
+            self._add("convention", "invalid-name", line, f"{kind.capitalize()} name \"{name}\" doesn't conform to naming style")
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Check statement lists, then visit children."""
+        for field in ("body", "orelse", "finalbody"):
+            body = getattr(node, field, None)
+            if isinstance(body, list) and body and isinstance(body[0], ast.stmt):
+                if isinstance(node, ast.stmt) and field == "body" and body[0].lineno == node.lineno:
+                    self._add("convention", "multiple-statements", node.lineno,
+                              "More than one statement on a single line")
+                self._check_body(body)
+        super().generic_visit(node)
+
+    def visit_FunctionDef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        """Check function names, arguments, defaults and unused locals."""
+        self._check_name(node.name, node.lineno, "function", SNAKE_CASE)
+
+        arguments = node.args.posonlyargs + node.args.args + node.args.kwonlyargs
+        arguments += [arg for arg in (node.args.vararg, node.args.kwarg) if arg]
+        for arg in arguments:
+            if arg.arg not in ("self", "cls"):
+                self._check_name(arg.arg, arg.lineno, "argument", SNAKE_CASE)
+
+        for default in node.args.defaults + [d for d in node.args.kw_defaults if d is not None]:
+            mutable_call = (isinstance(default, ast.Call) and isinstance(default.func, ast.Name)
+                            and default.func.id in ("list", "dict", "set"))
+            if isinstance(default, (ast.List, ast.Dict, ast.Set)) or mutable_call:
+                self._add("warning", "dangerous-default-value", default.lineno,
+                          "Dangerous default value as argument")
+
+        self._check_unused_variables(node)
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def _check_unused_variables(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        """Check for local variables that are assigned but never read."""
+        declared = set()
+        assigned: Dict[str, int] = {}
+        loaded = set()
+        for child in ast.walk(node):
+            if isinstance(child, (ast.Global, ast.Nonlocal)):
+                declared.update(child.names)
+            elif isinstance(child, ast.Name):
+                if isinstance(child.ctx, ast.Load):
+                    loaded.add(child.id)
+            elif isinstance(child, (ast.Assign, ast.AnnAssign)):
+                targets = child.targets if isinstance(child, ast.Assign) else [child.target]
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        assigned.setdefault(target.id, target.lineno)
+
+        for name, line in assigned.items():
+            if name not in loaded and name not in declared and not name.startswith("_"):
+                self._add("warning", "unused-variable", line, f"Unused variable '{name}'")
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Check class names."""
+        self._check_name(node.name, node.lineno, "class", PASCAL_CASE)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        """Check assigned names: builtins anywhere, naming style at module level."""
+        at_module_level = node in self.tree.body
+        for target in node.targets:
+            if not isinstance(target, ast.Name):
+                continue
+            if at_module_level and not UPPER_CASE.match(target.id):
+                self._check_name(target.id, target.lineno, "variable", SNAKE_CASE)
+            elif target.id in BUILTIN_NAMES:
+                self._add("warning", "redefined-builtin", target.lineno, f"Redefining built-in '{target.id}'")
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        """Check for bare except clauses."""
+        if node.type is None:
+            self._add("warning", "bare-except", node.lineno, "No exception type(s) specified")
+        self.generic_visit(node)
+
+    def visit_Global(self, node: ast.Global) -> None:
+        """Check for global statements."""
+        self._add("warning", "global-statement", node.lineno, "Using the global statement")
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Check for eval and exec."""
+        if isinstance(node.func, ast.Name) and node.func.id in ("eval", "exec"):
+            self._add("warning", f"{node.func.id}-used", node.lineno, f"Use of {node.func.id}")
+        self.generic_visit(node)
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        """Check for comparisons to singletons with == or !=."""
+        for op, right in zip(node.ops, node.comparators):
+            if not isinstance(op, (ast.Eq, ast.NotEq)) or not isinstance(right, ast.Constant):
+                continue
+            if right.value is None or isinstance(right.value, bool):
+                self._add("convention", "singleton-comparison", node.lineno,
+                          f"Comparison to {right.value} should use 'is' or an implicit boolean")
+        self.generic_visit(node)
+
+    def visit_If(self, node: ast.If) -> None:
+        """Check for len() used as a condition."""
+        self._check_len_condition(node.test)
+        self.generic_visit(node)
+
+    def visit_While(self, node: ast.While) -> None:
+        """Check for len() used as a condition."""
+        self._check_len_condition(node.test)
+        self.generic_visit(node)
+
+    def _check_len_condition(self, test: ast.expr) -> None:
+        """Report `if len(seq):` style conditions."""
+        if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not):
+            test = test.operand
+        if isinstance(test, ast.Call) and isinstance(test.func, ast.Name) and test.func.id == "len":
+            self._add("convention", "use-implicit-booleaness-not-len", test.lineno,
+                      "Do not use `len(SEQUENCE)` to determine if a sequence is empty")
+
+    def visit_For(self, node: ast.For) -> None:
+        """Check for range(len(seq)) loops that only index seq."""
+        iterable = node.iter
+        if (isinstance(node.target, ast.Name) and isinstance(iterable, ast.Call)
+                and isinstance(iterable.func, ast.Name) and iterable.func.id == "range"
+                and len(iterable.args) == 1 and isinstance(iterable.args[0], ast.Call)
+                and isinstance(iterable.args[0].func, ast.Name) and iterable.args[0].func.id == "len"
+                and iterable.args[0].args and isinstance(iterable.args[0].args[0], ast.Name)):
+            sequence = iterable.args[0].args[0].id
+            for child in ast.walk(ast.Module(body=node.body, type_ignores=[])):
+                if (isinstance(child, ast.Subscript) and isinstance(child.value, ast.Name)
+                        and child.value.id == sequence and isinstance(child.slice, ast.Name)
+                        and child.slice.id == node.target.id):
+                    self._add("convention", "consider-using-enumerate", node.lineno,
+                              "Consider using enumerate instead of iterating with range and len")
+                    break
+        self.generic_visit(node)
+
+
+class PylintWorker:
+    """
+    Long-lived pylint process used for deep analysis.
+
+    The process is started on first use and restarted after a timeout or crash.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, python_executable: Optional[str] = None):
+        """
+        Initialize the worker.
+
+        Args:
+            timeout: Seconds to wait for a result; defaults to get_code_quality_config()
+            python_executable: Interpreter used to run pylint
+        """
+        self.timeout = timeout if timeout is not None else get_code_quality_config()["pylint_timeout"]
+        self.python_executable = python_executable or sys.executable
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def lint(self, code: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lint source code with pylint.
+
+        Args:
+            code: Python source code
+
+        Returns:
+            List of pylint messages, or None if the worker failed
+        """
+        with self._lock:
+            try:
+                if self._process is None or self._process.poll() is not None:
+                    self._start()
+                self._process.stdin.write(json.dumps({"code": code}) + "\n")
+                self._process.stdin.flush()
+                line = self._read_line(time.monotonic() + self.timeout)
+            except (OSError, ValueError) as e:
+                logger.warning(f"pylint worker failed: {e}")
+                line = None
+
+            if line is None:
+                self._stop()
+                return None
+
+        result = json.loads(line)
+        if "error" in result:
+            logger.warning(f"pylint worker could not lint submission: {result['error']}")
+            return None
+        return result["messages"]
+
+    def _start(self) -> None:
+        """Start the pylint process."""
+        self._process = subprocess.Popen(
+            [self.python_executable, "-c", PYLINT_WORKER_SCRIPT, json.dumps(PYLINT_ARGS)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            cwd="/tmp" if os.path.isdir("/tmp") else None
+        )
+        logger.info(f"Started pylint worker (pid {self._process.pid})")
+
+    def _read_line(self, deadline: float) -> Optional[str]:
+        """
+        Read one result line from the worker.
+
+        Args:
+            deadline: Monotonic time to give up at
+
+        Returns:
+            The line, or None on timeout or exit
+        """
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._process.stdout, selectors.EVENT_READ)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not selector.select(remaining):
+                logger.warning("pylint worker timed out")
+                return None
+        line = self._process.stdout.readline()
+        return line or None
+
+    def _stop(self) -> None:
+        """Kill the pylint process."""
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def shutdown(self) -> None:
+        """Stop the worker."""
+        with self._lock:
+            self._stop()
+
+
+# Lazily started deep analysis worker
+_pylint_worker: Optional[PylintWorker] = None
+_pylint_worker_lock = threading.Lock()
+
+
+def get_pylint_worker() -> PylintWorker:
+    """
+    Get the process-wide pylint worker.
+
+    Returns:
+        PylintWorker instance
+    """
+    global _pylint_worker
+
+    with _pylint_worker_lock:
+        if _pylint_worker is None:
+            _pylint_worker = PylintWorker()
+            atexit.register(_pylint_worker.shutdown)
+        return _pylint_worker
+
+
 class CodeQualityMetrics:
     """
     Analyzes code quality using various metrics and tools.
@@ -31,90 +429,84 @@ class CodeQualityMetrics:
     """
     
     @staticmethod
-    def analyze_python_code(code: str) -> Dict[str, Any]:
+    def analyze_python_code(code: str, deep: Optional[bool] = None) -> Dict[str, Any]:
         """
         Analyze Python code quality using multiple metrics.
         
         Args:
             code: The Python code to analyze
+            deep: Lint with the pylint worker; defaults to CODE_QUALITY_DEEP_ANALYSIS
             
         Returns:
             Dict containing various code quality metrics
         """
         try:
-            # Run pylint with custom reporter
-            pylint_score = 10.0  # Default score
-            try:
-                # Create a temporary file for pylint
-                file_path = io.StringIO()
-                file_path.write(code)
-                file_path.seek(0)
-                
-                # Set up a custom JSON reporter to capture output
-                json_reporter = JSONReporter()
-                
-                # Run pylint with the JSON reporter
-                # Newer versions of pylint use Run constructor differently
-                args = ['--output-format=json', '--disable=import-error', '--disable=no-name-in-module']
-                pylint.lint.Run([*args, ''], reporter=json_reporter, exit=False)
-                
-                # Process messages
-                messages = json_reporter.messages
-                
-                # Calculate score based on message types
-                if messages:
-                    error_count = sum(1 for msg in messages if msg.category in ('error', 'fatal'))
-                    warning_count = sum(1 for msg in messages if msg.category == 'warning')
-                    convention_count = sum(1 for msg in messages if msg.category == 'convention')
-                    
-                    # Deduct points based on message severity
-                    pylint_score -= error_count * 2.0
-                    pylint_score -= warning_count * 1.0
-                    pylint_score -= convention_count * 0.5
-                    
-                    # Ensure score is between 0 and 10
-                    pylint_score = max(0.0, min(10.0, pylint_score))
-            except Exception as e:
-                logger.error(f"Error running pylint: {e}")
-                pylint_score = 5.0  # Default score on error
+            if deep is None:
+                deep = get_code_quality_config()["deep_analysis"]
             
-            # Calculate cyclomatic complexity
+            # Parse once; every metric below works from this tree
             try:
-                complexity_results = cc_visit(code)
-                avg_complexity = sum(item.complexity for item in complexity_results) / len(complexity_results) if complexity_results else 0
-            except Exception as e:
-                logger.error(f"Error calculating cyclomatic complexity: {e}")
-                avg_complexity = 5.0  # Default value on error
+                tree = ast.parse(code)
+            except SyntaxError as e:
+                logger.info(f"Submission has a syntax error: {e}")
+                tree = None
+                syntax_error = {"category": "error", "symbol": "syntax-error", "line": e.lineno or 0, "message": str(e)}
             
-            # Calculate maintainability index
-            try:
-                mi_result = mi_visit(code, multi=True)
-                maintainability_index = sum(mi_result.values()) / len(mi_result) if mi_result else 100
-            except Exception as e:
-                logger.error(f"Error calculating maintainability index: {e}")
-                maintainability_index = 70.0  # Default value on error
-            
-            # Calculate Halstead metrics
-            try:
-                h_result = h_visit(code)
-            except Exception as e:
-                logger.error(f"Error calculating Halstead metrics: {e}")
-                h_result = None
+            # Lint the code
+            engine = "ast"
+            if tree is None:
+                messages = [syntax_error]
+            else:
+                messages = get_pylint_worker().lint(code) if deep else None
+                if messages is None:
+                    messages = PythonStyleChecker(tree, code).check()
+                else:
+                    engine = "pylint"
+            pylint_score = CodeQualityMetrics._score_messages(messages) if tree is not None else 0.0
             
-            # Calculate raw metrics
-            try:
-                raw_metrics = analyze(code)
-            except Exception as e:
-                logger.error(f"Error calculating raw metrics: {e}")
-                raw_metrics = None
+            avg_complexity = 5.0  # Default values when the code cannot be parsed
+            maintainability_index = 70.0
+            h_result = None
+            raw_metrics = None
+            if tree is not None:
+                # Calculate cyclomatic complexity
+                try:
+                    complexity_results = cc_visit_ast(tree)
+                    avg_complexity = sum(item.complexity for item in complexity_results) / len(complexity_results) if complexity_results else 0
+                except Exception as e:
+                    logger.error(f"Error calculating cyclomatic complexity: {e}")
+                
+                # Calculate Halstead metrics
+                try:
+                    h_result = h_visit_ast(tree).total
+                except Exception as e:
+                    logger.error(f"Error calculating Halstead metrics: {e}")
+                
+                # Calculate raw metrics
+                try:
+                    raw_metrics = analyze(code)
+                except Exception as e:
+                    logger.error(f"Error calculating raw metrics: {e}")
+                
+                # Calculate maintainability index (as radon's mi_visit with multi=True)
+                try:
+                    comment_lines = raw_metrics.comments + raw_metrics.multi
+                    comments = comment_lines / float(raw_metrics.sloc) * 100 if raw_metrics.sloc else 0
+                    maintainability_index = mi_compute(
+                        h_result.volume, ComplexityVisitor.from_ast(tree).total_complexity, raw_metrics.lloc, comments
+                    )
+                except Exception as e:
+                    logger.error(f"Error calculating maintainability index: {e}")
             
             # Analyze documentation
             try:
-                doc_ratio = CodeQualityMetrics._analyze_documentation(code)
+                doc_ratio = CodeQualityMetrics._analyze_documentation(tree) if tree is not None else 0.0
             except Exception as e:
                 logger.error(f"Error analyzing documentation: {e}")
                 doc_ratio = 0.5  # Default value on error
             
+            pep8_messages = [m for m in messages if m["category"] == "convention"]
+            
             # Compile metrics
             metrics = {
                 "complexity": {
@@ -127,7 +519,14 @@ class CodeQualityMetrics:
                 },
                 "style": {
                     "pylint_score": pylint_score,
-                    "interpretation": "Good" if pylint_score >= 8 else "Medium" if pylint_score >= 6 else "Poor"
+                    "interpretation": "Good" if pylint_score >= 8 else "Medium" if pylint_score >= 6 else "Poor",
+                    "engine": engine,
+                    "issues": messages[:10]
+                },
+                "pep8": {
+                    "total_violations": len(pep8_messages),
+                    "is_compliant": tree is not None and not pep8_messages,
+                    "details": [f"line {m['line']}: {m['message']} ({m['symbol']})" for m in pep8_messages[:5]]
                 },
                 "documentation": {
                     "doc_ratio": doc_ratio,
@@ -174,18 +573,32 @@ class CodeQualityMetrics:
             }
     
     @staticmethod
-    def _analyze_documentation(code: str) -> float:
+    def _score_messages(messages: List[Dict[str, Any]]) -> float:
+        """
+        Score lint messages on pylint's 0-10 scale.
+        
+        Args:
+            messages: Lint messages with a category
+            
+        Returns:
+            float: Style score (0.0 to 10.0)
+        """
+        score = 10.0 - sum(CATEGORY_PENALTIES.get(m["category"], 0.0) for m in messages)
+        return max(0.0, min(10.0, score))
+    
+    @staticmethod
+    def _analyze_documentation(code: Union[str, ast.AST]) -> float:
         """
         Analyze documentation coverage and quality.
         
         Args:
-            code: The Python code to analyze
+            code: The Python code to analyze, or its parsed tree
             
         Returns:
             float: Documentation ratio (0.0 to 1.0)
         """
         try:
-            tree = ast.parse(code)
+            tree = ast.parse(code) if isinstance(code, str) else code
             total_nodes = 0
             documented_nodes = 0
             
@@ -230,29 +643,19 @@ class CodeQualityMetrics:
             Dict containing PEP 8 compliance metrics
         """
         try:
-            # Use pycodestyle for PEP 8 checking
-            import pycodestyle
-            style_guide = pycodestyle.StyleGuide(quiet=True)
-            
-            # Create a temporary file-like object
-            file_like = io.StringIO(code)
-            
-            # Check the code
-            checker = pycodestyle.Checker(lines=code.splitlines(), options=style_guide.options)
-            
-            # Get all violations
-            violations = list(checker.check_all())
-            
-            return {
-                "total_violations": len(violations),
-                "is_compliant": len(violations) == 0,
-                "details": [str(v) for v in violations[:5]]  # First 5 violations
-            }
-        except Exception as e:
+            tree = ast.parse(code)
+        except SyntaxError as e:
             return {
                 "error": str(e),
                 "is_compliant": False
             }
+        
+        violations = [m for m in PythonStyleChecker(tree, code).check() if m["category"] == "convention"]
+        return {
+            "total_violations": len(violations),
+            "is_compliant": len(violations) == 0,
+            "details": [f"line {m['line']}: {m['message']} ({m['symbol']})" for m in violations[:5]]  # First 5 violations
+        }
     
     @staticmethod
     def _interpret_metrics(metrics: Dict[str, Any]) -> List[str]:
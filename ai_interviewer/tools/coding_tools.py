@@ -12,6 +12,7 @@ from ai_interviewer.models.coding_challenge import get_coding_challenge, CodingC
 from ai_interviewer.tools.code_quality import CodeQualityMetrics
 from ai_interviewer.tools.code_execution import CodeExecutor, SafetyChecker, execute_candidate_code
 from ai_interviewer.tools.code_feedback import CodeFeedbackGenerator
+from ai_interviewer.tools.execution_cache import get_execution_cache, is_cacheable
 from ai_interviewer.tools.pair_programming import HintGenerator
 
 # Configure logging
@@ -122,23 +123,34 @@ def submit_code_for_challenge(challenge_id: str, candidate_code: str, skill_leve
             for tc in challenge.test_cases
         ]
         
+        # Identical submissions reuse the previous evaluation
+        cache = get_execution_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.make_key(candidate_code, challenge_id, test_cases, challenge.language, skill_level)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing cached evaluation for challenge: {challenge_id}")
+                cached["cached"] = True
+                return cached
+        
         # Execute the code using our secure Docker executor
-        execution_results = execute_candidate_code(
-            language=challenge.language.lower(),
-            code=candidate_code,
-            test_cases=test_cases
-        )
+        execution_results = execute_candidate_code.invoke({
+            "language": challenge.language.lower(),
+            "code": candidate_code,
+            "test_cases": test_cases
+        })
         
         # Generate detailed feedback
         feedback = CodeFeedbackGenerator.generate_feedback(
             code=candidate_code,
             execution_results=execution_results.get("detailed_results", execution_results),
             language=challenge.language,
-            skill_level=skill_level
+            skill_level=skill_level,
+            sample_input=test_cases[0]["input"] if test_cases else None
         )
         
-        # Return detailed evaluation
-        return {
+        result = {
             "status": "submitted",
             "challenge_id": challenge_id,
             "execution_results": execution_results,
@@ -154,6 +166,12 @@ def submit_code_for_challenge(challenge_id: str, candidate_code: str, skill_leve
             }
         }
         
+        if cache_key is not None and is_cacheable(execution_results):
+            cache.put(cache_key, result)
+        
+        # Return detailed evaluation
+        return result
+        
     except Exception as e:
         logger.error(f"Error processing code submission: {e}")
         import traceback
@@ -0,0 +1,919 @@
+"""
+Time complexity estimation for code submissions.
+
+Static analysis parses a submission once with ``ast`` and works out, for every
+function, how deeply its loops nest, whether and how it recurses, and which
+calls carry a known cost (sorting, membership tests on lists, slicing, list
+methods that shift elements, heap and bisect operations). Calls between the
+candidate's own functions are followed, so a helper called inside a loop
+counts towards the caller.
+
+The empirical mode runs the candidate's function in the code sandbox on
+geometrically growing inputs and fits the timings against the common growth
+curves. It costs several sandbox runs, so it is opt-in.
+"""
+import ast
+import logging
+import math
+import random
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from ai_interviewer.utils.config import get_code_quality_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class Complexity(NamedTuple):
+    """Growth order: 2^n when exponential, otherwise n^degree * log^log_power n."""
+    exponential: bool = False
+    degree: int = 0
+    log_power: int = 0
+
+    def times(self, other: "Complexity") -> "Complexity":
+        """Cost of doing ``other`` once per step of ``self``."""
+        if self.exponential or other.exponential:
+            return EXPONENTIAL
+        return Complexity(False, self.degree + other.degree, self.log_power + other.log_power)
+
+    @property
+    def big_o(self) -> str:
+        """Big-O notation, e.g. "O(n log n)"."""
+        if self.exponential:
+            return "O(2^n)"
+        terms = []
+        if self.degree == 1:
+            terms.append("n")
+        elif self.degree > 1:
+            terms.append("n" + SUPERSCRIPTS.get(self.degree, f"^{self.degree}"))
+        if self.log_power == 1:
+            terms.append("log n")
+        elif self.log_power > 1:
+            terms.append(f"log{SUPERSCRIPTS.get(self.log_power, '^' + str(self.log_power))} n")
+        return f"O({' '.join(terms) or '1'})"
+
+    @property
+    def label(self) -> str:
+        """Name of the complexity class, e.g. "Quadratic"."""
+        if self.exponential:
+            return "Exponential"
+        if self.degree == 0:
+            return "Constant" if self.log_power == 0 else "Logarithmic"
+        if self.degree == 1:
+            return "Linear" if self.log_power == 0 else "Linearithmic"
+        return {2: "Quadratic", 3: "Cubic"}.get(self.degree, "Polynomial")
+
+    def describe(self) -> str:
+        """Big-O notation with the class name, e.g. "O(n²) - Quadratic"."""
+        return f"{self.big_o} - {self.label}"
+
+
+SUPERSCRIPTS = {2: "²", 3: "³"}
+
+CONSTANT = Complexity()
+LOGARITHMIC = Complexity(False, 0, 1)
+LINEAR = Complexity(False, 1, 0)
+LINEARITHMIC = Complexity(False, 1, 1)
+QUADRATIC = Complexity(False, 2, 0)
+CUBIC = Complexity(False, 3, 0)
+EXPONENTIAL = Complexity(True, 0, 0)
+
+# Builtins that walk their (single) iterable argument
+LINEAR_BUILTINS = frozenset({
+    "sum", "min", "max", "any", "all", "list", "tuple", "set", "frozenset", "dict",
+    "Counter", "deque", "heapify", "reversed"
+})
+SORTING_CALLS = frozenset({"sorted", "sort", "nlargest", "nsmallest"})
+LOGARITHMIC_CALLS = frozenset({
+    "heappush", "heappop", "heappushpop", "heapreplace", "bisect", "bisect_left", "bisect_right"
+})
+# Sequence methods that scan or shift the elements
+LINEAR_METHODS = frozenset({"index", "count", "remove", "copy", "reverse", "join", "insort", "insort_left", "insort_right"})
+MEMOIZING_DECORATORS = frozenset({"cache", "lru_cache"})
+
+# Names bound to these are hashed containers with O(1) membership tests
+HASHED_CONSTRUCTORS = frozenset({"set", "frozenset", "dict", "Counter", "defaultdict", "OrderedDict"})
+SEQUENCE_CONSTRUCTORS = frozenset({"list", "tuple", "sorted", "deque"})
+HASHED_ANNOTATIONS = frozenset({"set", "frozenset", "dict", "Set", "FrozenSet", "Dict", "Mapping", "Counter"})
+
+HALVING_OPERATORS = (ast.FloorDiv, ast.RShift, ast.Div)
+LOOP_NODES = (ast.For, ast.AsyncFor, ast.While)
+COMPREHENSION_NODES = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+SCOPE_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+
+# Self-calls on one path through a function that recurses inside a loop
+LOOP_RECURSION = 1000
+
+
+def _walk_scope(node: ast.AST):
+    """Like ast.walk, but skips nested functions, lambdas and classes."""
+    if isinstance(node, SCOPE_NODES):
+        return
+    todo = [node]
+    while todo:
+        current = todo.pop()
+        yield current
+        todo.extend(child for child in ast.iter_child_nodes(current) if not isinstance(child, SCOPE_NODES))
+
+
+def _call_name(call: ast.Call) -> Optional[str]:
+    """Name of the called function or method, ignoring any module or object prefix."""
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    return None
+
+
+def _is_constant_size(node: ast.expr) -> bool:
+    """Whether iterating ``node`` takes a number of steps that does not depend on the input."""
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return all(not isinstance(element, ast.Starred) for element in node.elts)
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "range":
+        return all(isinstance(arg, ast.Constant) for arg in node.args)
+    return False
+
+
+def _halves(node: ast.AST) -> bool:
+    """Whether ``node`` divides something by a constant (n // 2, n >> 1, n /= 2)."""
+    for child in _walk_scope(node):
+        if isinstance(child, ast.BinOp) and isinstance(child.op, HALVING_OPERATORS) \
+                and isinstance(child.right, ast.Constant):
+            return True
+        if isinstance(child, ast.AugAssign) and isinstance(child.op, HALVING_OPERATORS):
+            return True
+    return False
+
+
+class FunctionInfo:
+    """What the static analyser knows about one function definition."""
+
+    def __init__(self, name: str, node: ast.AST, class_name: Optional[str] = None):
+        self.name = name
+        self.node = node
+        self.class_name = class_name
+        self.kinds: Dict[str, str] = {}
+        self.halving_names: Set[str] = set()
+        self.loop_targets: Set[str] = set()
+        self.memoized = False
+        self.cost: Optional[Complexity] = None
+        self.loop_depth = 0
+        self.depth = 0
+        self.recursion: Optional[str] = None
+
+
+class StaticComplexityAnalyzer:
+    """
+    Estimates time complexity from the AST of Python code.
+
+    Costs are worked out bottom-up: a statement costs the most expensive of its
+    parts, a loop multiplies its body by the number of iterations (constant for
+    literal ranges and containers, logarithmic when the loop halves its state,
+    linear otherwise), and a call costs whatever is known about the callee.
+    """
+
+    def __init__(self, tree: ast.Module):
+        self.tree = tree
+        self.functions: Dict[str, List[FunctionInfo]] = {}
+        self.notes: List[str] = []
+        self._stack: List[FunctionInfo] = []
+        self._collect(tree.body, None)
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        Analyze every function and the module-level code.
+
+        Returns:
+            Dictionary with the overall estimate and a breakdown per function
+        """
+        overall = CONSTANT
+        functions = {}
+        for infos in self.functions.values():
+            for info in infos:
+                cost = self._function_cost(info)
+                overall = max(overall, cost)
+                key = f"{info.class_name}.{info.name}" if info.class_name else info.name
+                functions[key] = {
+                    "big_o": cost.big_o,
+                    "loop_depth": info.loop_depth,
+                    "recursion": info.recursion
+                }
+
+        module = FunctionInfo("<module>", self.tree)
+        module_body = [stmt for stmt in self.tree.body if not isinstance(stmt, (*FUNCTION_NODES, ast.ClassDef))]
+        self._prescan(module, module_body)
+        self._stack.append(module)
+        try:
+            overall = max(overall, self._block_cost(module_body))
+        finally:
+            self._stack.pop()
+
+        loop_depth = max([module.loop_depth] + [f["loop_depth"] for f in functions.values()])
+        return {
+            "time_complexity": overall.describe(),
+            "big_o": overall.big_o,
+            "complexity_class": overall.label,
+            "loop_depth": loop_depth,
+            "recursive": any(f["recursion"] for f in functions.values()),
+            "functions": functions,
+            "notes": self.notes,
+            "method": "static"
+        }
+
+    def _note(self, message: str) -> None:
+        if message not in self.notes:
+            self.notes.append(message)
+
+    def _collect(self, body: List[ast.stmt], class_name: Optional[str]) -> None:
+        """Register functions and methods, including nested ones, by name."""
+        for node in body:
+            if isinstance(node, FUNCTION_NODES):
+                info = FunctionInfo(node.name, node, class_name)
+                self.functions.setdefault(node.name, []).append(info)
+                self._collect(node.body, class_name)
+            elif isinstance(node, ast.ClassDef):
+                self._collect(node.body, node.name)
+            elif isinstance(node, (ast.If, ast.Try, ast.With)):
+                self._collect(getattr(node, "body", []) + getattr(node, "orelse", []), class_name)
+
+    def _prescan(self, info: FunctionInfo, body: List[ast.stmt]) -> None:
+        """Record container kinds, halved variables, loop targets and memoization."""
+        node = info.node
+        if isinstance(node, FUNCTION_NODES):
+            for decorator in node.decorator_list:
+                target = decorator.func if isinstance(decorator, ast.Call) else decorator
+                name = target.id if isinstance(target, ast.Name) else getattr(target, "attr", None)
+                if name in MEMOIZING_DECORATORS:
+                    info.memoized = True
+            positional = node.args.posonlyargs + node.args.args
+            defaults = [None] * (len(positional) - len(node.args.defaults)) + node.args.defaults
+            for arg, default in zip(positional + node.args.kwonlyargs, defaults + node.args.kw_defaults):
+                if arg.arg in ("self", "cls"):
+                    continue
+                annotation = ast.unparse(arg.annotation) if arg.annotation is not None else ""
+                hashed = any(name in annotation for name in HASHED_ANNOTATIONS) \
+                    or (default is not None and self._container_kind(default) == "hashed")
+                # Untyped parameters are usually the input sequence
+                info.kinds[arg.arg] = "hashed" if hashed else "sequence"
+
+        checked: Set[str] = set()
+        stored: Set[str] = set()
+        for stmt in body:
+            for child in _walk_scope(stmt):
+                if isinstance(child, ast.Assign):
+                    kind = self._container_kind(child.value)
+                    for target in child.targets:
+                        if isinstance(target, ast.Name):
+                            self._bind(info, target.id, kind, child.value)
+                        elif isinstance(target, ast.Tuple):
+                            for element in target.elts:
+                                if isinstance(element, ast.Name):
+                                    self._bind(info, element.id, None, child.value)
+                        elif isinstance(target, ast.Subscript) and isinstance(target.value, ast.Name):
+                            stored.add(target.value.id)
+                elif isinstance(child, ast.AnnAssign) and isinstance(child.target, ast.Name) and child.value:
+                    self._bind(info, child.target.id, self._container_kind(child.value), child.value)
+                elif isinstance(child, ast.AugAssign) and isinstance(child.target, ast.Name) \
+                        and isinstance(child.op, HALVING_OPERATORS):
+                    info.halving_names.add(child.target.id)
+                elif isinstance(child, (ast.For, ast.AsyncFor, ast.comprehension)):
+                    for target in ast.walk(child.target):
+                        if isinstance(target, ast.Name):
+                            info.loop_targets.add(target.id)
+                elif isinstance(child, ast.Compare) and isinstance(child.ops[0], (ast.In, ast.NotIn)) \
+                        and isinstance(child.comparators[0], ast.Name):
+                    checked.add(child.comparators[0].id)
+                elif isinstance(child, ast.Call) and isinstance(child.func, ast.Attribute) \
+                        and child.func.attr in ("add", "update") and isinstance(child.func.value, ast.Name):
+                    stored.add(child.func.value.id)
+        # A cache or visited set that is both checked and filled makes each state run once
+        if checked & stored:
+            info.memoized = True
+
+    def _bind(self, info: FunctionInfo, name: str, kind: Optional[str], value: ast.expr) -> None:
+        if kind is None or info.kinds.get(name, kind) != kind:
+            info.kinds.pop(name, None)
+        else:
+            info.kinds[name] = kind
+        if _halves(value):
+            info.halving_names.add(name)
+
+    @staticmethod
+    def _container_kind(value: ast.expr) -> Optional[str]:
+        """Classify an assigned value as a hashed container, a sequence or unknown."""
+        if isinstance(value, (ast.Set, ast.SetComp, ast.Dict, ast.DictComp)):
+            return "hashed"
+        if isinstance(value, (ast.List, ast.ListComp, ast.Tuple)):
+            return "sequence"
+        if isinstance(value, ast.BinOp) and isinstance(value.op, ast.Mult) and isinstance(value.left, ast.List):
+            return "sequence"
+        if isinstance(value, ast.Call):
+            name = _call_name(value)
+            if name in HASHED_CONSTRUCTORS:
+                return "hashed"
+            if name in SEQUENCE_CONSTRUCTORS or name == "split":
+                return "sequence"
+        return None
+
+    def _resolve(self, call: ast.Call) -> Optional[FunctionInfo]:
+        """Find the candidate's function a call refers to."""
+        current = self._stack[-1] if self._stack else None
+        if isinstance(call.func, ast.Name):
+            candidates = self.functions.get(call.func.id, [])
+        elif isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name) \
+                and call.func.value.id in ("self", "cls"):
+            candidates = [
+                info for info in self.functions.get(call.func.attr, [])
+                if current is None or info.class_name == current.class_name
+            ]
+        else:
+            return None
+        return candidates[0] if candidates else None
+
+    def _function_cost(self, info: FunctionInfo) -> Complexity:
+        if info.cost is not None:
+            return info.cost
+        if info in self._stack:
+            # Mutual recursion; the outer call accounts for it
+            return CONSTANT
+
+        self._prescan(info, info.node.body)
+        self._stack.append(info)
+        try:
+            body_cost = self._block_cost(info.node.body)
+            info.cost = self._apply_recursion(info, body_cost)
+        finally:
+            self._stack.pop()
+        return info.cost
+
+    def _is_self_call(self, info: FunctionInfo, node: ast.AST) -> bool:
+        if not isinstance(node, ast.Call):
+            return False
+        if isinstance(node.func, ast.Name):
+            return node.func.id == info.name
+        return isinstance(node.func, ast.Attribute) and node.func.attr == info.name \
+            and isinstance(node.func.value, ast.Name) and node.func.value.id in ("self", "cls")
+
+    def _self_calls(self, info: FunctionInfo, node: ast.AST) -> List[ast.Call]:
+        if isinstance(node, FUNCTION_NODES) and node is info.node:
+            return [call for stmt in node.body for call in self._self_calls(info, stmt)]
+        return [child for child in _walk_scope(node) if self._is_self_call(info, child)]
+
+    def _calls_per_path(self, info: FunctionInfo, body: List[ast.stmt]) -> int:
+        """Most self-calls made by one execution of the function body."""
+        total = 0
+        for index, stmt in enumerate(body):
+            if isinstance(stmt, ast.If):
+                rest = self._calls_per_path(info, body[index + 1:])
+                branches = []
+                for branch in (stmt.body, stmt.orelse):
+                    calls = self._calls_per_path(info, branch)
+                    branches.append(calls if self._terminates(branch) else calls + rest)
+                return total + len(self._self_calls(info, stmt.test)) + max(branches)
+            calls = self._self_calls(info, stmt)
+            if calls and any(isinstance(parent, (*LOOP_NODES, *COMPREHENSION_NODES)) and self._self_calls(info, parent)
+                             for parent in _walk_scope(stmt)):
+                return LOOP_RECURSION
+            total += len(calls)
+            if isinstance(stmt, (ast.Return, ast.Raise)):
+                return total
+        return total
+
+    @staticmethod
+    def _terminates(body: List[ast.stmt]) -> bool:
+        return bool(body) and isinstance(body[-1], (ast.Return, ast.Raise, ast.Continue, ast.Break))
+
+    def _apply_recursion(self, info: FunctionInfo, body_cost: Complexity) -> Complexity:
+        """Combine the cost of one invocation with the shape of the function's recursion."""
+        calls = self._self_calls(info, info.node)
+        if not calls:
+            return body_cost
+
+        per_path = self._calls_per_path(info, info.node.body)
+        divides = all(self._divides(info, call) for call in calls)
+        structural = all(self._is_structural(info, call) for call in calls)
+        name = f"`{info.name}`"
+
+        if info.memoized:
+            info.recursion = "memoized"
+            self._note(f"{name} is recursive with memoization, so each distinct state is computed once.")
+            return LINEAR.times(body_cost)
+        if structural:
+            info.recursion = "structural"
+            self._note(f"{name} recurses over the parts of its input, visiting each element once.")
+            return LINEAR.times(body_cost)
+        if divides:
+            info.recursion = "divide-and-conquer"
+            # Master theorem with b = 2: T(n) = a T(n/2) + O(body)
+            branching = math.log2(min(per_path, LOOP_RECURSION)) if per_path > 1 else 0.0
+            if body_cost.degree > branching:
+                cost = body_cost
+            elif body_cost.degree == branching:
+                cost = Complexity(False, body_cost.degree, body_cost.log_power + 1)
+            else:
+                cost = Complexity(False, math.ceil(branching), 0)
+            self._note(f"{name} splits its input in half on each recursive call.")
+            return cost
+        if per_path > 1:
+            info.recursion = "exponential"
+            if per_path >= LOOP_RECURSION:
+                self._note(f"{name} recurses inside a loop without memoization, exploring every combination.")
+            else:
+                self._note(f"{name} makes {per_path} recursive calls per invocation without memoization.")
+            return EXPONENTIAL
+        info.recursion = "linear"
+        self._note(f"{name} recurses once per step, reducing its input by a constant amount.")
+        return LINEAR.times(body_cost)
+
+    def _divides(self, info: FunctionInfo, call: ast.Call) -> bool:
+        for arg in [*call.args, *(keyword.value for keyword in call.keywords)]:
+            if _halves(arg):
+                return True
+            for child in ast.walk(arg):
+                if isinstance(child, ast.Slice):
+                    return True
+                if isinstance(child, ast.Name) and child.id in info.halving_names:
+                    return True
+        return False
+
+    def _is_structural(self, info: FunctionInfo, call: ast.Call) -> bool:
+        """Whether a call recurses into a child (node.left, graph[node], a loop element)."""
+        args = [*call.args, *(keyword.value for keyword in call.keywords)]
+        if any(isinstance(child, (ast.BinOp, ast.Slice)) for arg in args for child in ast.walk(arg)):
+            return False
+        for arg in args:
+            if isinstance(arg, (ast.Attribute, ast.Subscript)):
+                return True
+            if isinstance(arg, ast.Name) and arg.id in info.loop_targets:
+                return True
+        return False
+
+    def _block_cost(self, body: List[ast.stmt]) -> Complexity:
+        return max((self._stmt_cost(stmt) for stmt in body), default=CONSTANT)
+
+    def _stmt_cost(self, stmt: ast.stmt) -> Complexity:
+        if isinstance(stmt, (*FUNCTION_NODES, ast.ClassDef)):
+            return CONSTANT
+        if isinstance(stmt, (ast.For, ast.AsyncFor)):
+            with _LoopDepth(self._stack):
+                body = max(self._block_cost(stmt.body), self._block_cost(stmt.orelse))
+            factor = CONSTANT if _is_constant_size(stmt.iter) else LINEAR
+            return max(self._expr_cost(stmt.iter), factor.times(body))
+        if isinstance(stmt, ast.While):
+            with _LoopDepth(self._stack):
+                body = max(self._block_cost(stmt.body), self._expr_cost(stmt.test))
+            if self._loop_halves(stmt):
+                factor = LOGARITHMIC
+                self._note("A loop halves its search space on each iteration, taking logarithmic steps.")
+            else:
+                factor = LINEAR
+            return max(self._block_cost(stmt.orelse), factor.times(body))
+
+        cost = CONSTANT
+        for field, value in ast.iter_fields(stmt):
+            if isinstance(value, list):
+                if value and isinstance(value[0], ast.stmt):
+                    cost = max(cost, self._block_cost(value))
+                else:
+                    for item in value:
+                        if isinstance(item, ast.expr):
+                            cost = max(cost, self._expr_cost(item))
+                        elif isinstance(item, (ast.ExceptHandler, ast.withitem, ast.match_case)):
+                            cost = max(cost, self._node_cost(item))
+            elif isinstance(value, ast.expr):
+                cost = max(cost, self._expr_cost(value))
+        return cost
+
+    def _node_cost(self, node: ast.AST) -> Complexity:
+        cost = CONSTANT
+        for value in ast.iter_child_nodes(node):
+            if isinstance(value, ast.stmt):
+                cost = max(cost, self._stmt_cost(value))
+            elif isinstance(value, ast.expr):
+                cost = max(cost, self._expr_cost(value))
+        return cost
+
+    def _loop_halves(self, loop: ast.While) -> bool:
+        """Whether a while loop halves a variable its condition depends on."""
+        info = self._stack[-1]
+        tested = {child.id for child in ast.walk(loop.test) if isinstance(child, ast.Name)}
+        for stmt in loop.body:
+            for child in _walk_scope(stmt):
+                if isinstance(child, LOOP_NODES) and child is not loop:
+                    continue
+                if isinstance(child, ast.AugAssign) and isinstance(child.op, HALVING_OPERATORS) \
+                        and isinstance(child.target, ast.Name) and child.target.id in tested:
+                    return True
+                if isinstance(child, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id in tested for target in child.targets
+                ) and (_halves(child.value) or any(
+                    isinstance(name, ast.Name) and name.id in info.halving_names for name in ast.walk(child.value)
+                )):
+                    return True
+        return False
+
+    def _expr_cost(self, node: ast.expr) -> Complexity:
+        if isinstance(node, ast.Lambda):
+            return CONSTANT
+        if isinstance(node, COMPREHENSION_NODES):
+            return self._comprehension_cost(node)
+
+        cost = CONSTANT
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                cost = max(cost, self._expr_cost(child))
+            elif isinstance(child, ast.keyword):
+                cost = max(cost, self._expr_cost(child.value))
+
+        if isinstance(node, ast.Call):
+            cost = max(cost, self._call_cost(node))
+        elif isinstance(node, ast.Compare):
+            for op, comparator in zip(node.ops, node.comparators):
+                if isinstance(op, (ast.In, ast.NotIn)) and self._is_sequence(comparator):
+                    self._note(f"`{ast.unparse(node)}` scans a sequence, which is linear per check; a set or dict gives constant-time lookups.")
+                    cost = max(cost, LINEAR)
+        elif isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Slice) \
+                and isinstance(node.ctx, ast.Load):
+            cost = max(cost, LINEAR)
+        return cost
+
+    def _comprehension_cost(self, node: ast.expr) -> Complexity:
+        with _LoopDepth(self._stack, len(node.generators)):
+            if isinstance(node, ast.DictComp):
+                cost = max(self._expr_cost(node.key), self._expr_cost(node.value))
+            else:
+                cost = self._expr_cost(node.elt)
+            for generator in reversed(node.generators):
+                for condition in generator.ifs:
+                    cost = max(cost, self._expr_cost(condition))
+                factor = CONSTANT if _is_constant_size(generator.iter) else LINEAR
+                cost = max(self._expr_cost(generator.iter), factor.times(cost))
+        return cost
+
+    def _call_cost(self, call: ast.Call) -> Complexity:
+        info = self._stack[-1] if self._stack else None
+        if info is not None and self._is_self_call(info, call):
+            # Accounted for by _apply_recursion
+            return CONSTANT
+
+        callee = self._resolve(call)
+        if callee is not None:
+            return self._function_cost(callee)
+
+        name = _call_name(call)
+        if name in SORTING_CALLS:
+            self._note(f"`{name}()` sorts its input in O(n log n).")
+            return LINEARITHMIC
+        if name in LOGARITHMIC_CALLS:
+            return LOGARITHMIC
+        if name in LINEAR_BUILTINS:
+            return LINEAR if len(call.args) == 1 and not _is_constant_size(call.args[0]) else CONSTANT
+        if name in LINEAR_METHODS:
+            return LINEAR
+        if isinstance(call.func, ast.Attribute) and (
+            (name == "pop" and call.args and isinstance(call.args[0], ast.Constant) and call.args[0].value == 0)
+            or name == "insert"
+        ):
+            self._note(f"`{ast.unparse(call)}` shifts every later element of a list; collections.deque avoids this.")
+            return LINEAR
+        return CONSTANT
+
+    def _is_sequence(self, node: ast.expr) -> bool:
+        """Whether a membership test against ``node`` scans its elements."""
+        if _is_constant_size(node):
+            return False
+        if isinstance(node, (ast.List, ast.ListComp, ast.Tuple)):
+            return True
+        if isinstance(node, ast.Call):
+            name = _call_name(node)
+            if name in ("values", "items") or name in SEQUENCE_CONSTRUCTORS:
+                return True
+            return False
+        if isinstance(node, ast.Name):
+            info = self._stack[-1] if self._stack else None
+            return info is not None and info.kinds.get(node.id) == "sequence"
+        return False
+
+
+class _LoopDepth:
+    """Tracks loop nesting depth on the function being analyzed."""
+
+    def __init__(self, stack: List[FunctionInfo], levels: int = 1):
+        self.info = stack[-1] if stack else None
+        self.levels = levels
+
+    def __enter__(self) -> None:
+        if self.info is not None:
+            self.info.depth += self.levels
+            self.info.loop_depth = max(self.info.loop_depth, self.info.depth)
+
+    def __exit__(self, *exc_info) -> None:
+        if self.info is not None:
+            self.info.depth -= self.levels
+
+
+def analyze_python_complexity(code: str) -> Dict[str, Any]:
+    """
+    Estimate the time complexity of Python code statically.
+
+    Args:
+        code: Python code to analyze
+
+    Returns:
+        Dictionary with the estimate ("time_complexity", "big_o"), the deepest
+        loop nesting, a breakdown per function and notes explaining the estimate
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return {
+            "time_complexity": "Unknown",
+            "big_o": None,
+            "loop_depth": 0,
+            "recursive": False,
+            "functions": {},
+            "notes": [],
+            "method": "static",
+            "error": f"Syntax error: {e.msg} (line {e.lineno})"
+        }
+    return StaticComplexityAnalyzer(tree).analyze()
+
+
+# Growth curves fitted to empirical timings, from slowest to fastest growing
+GROWTH_MODELS: List[Tuple[Complexity, Callable[[int], float]]] = [
+    (CONSTANT, lambda n: 1.0),
+    (LOGARITHMIC, lambda n: math.log2(n)),
+    (LINEAR, lambda n: float(n)),
+    (LINEARITHMIC, lambda n: n * math.log2(n)),
+    (QUADRATIC, lambda n: float(n) ** 2),
+    (CUBIC, lambda n: float(n) ** 3),
+    (EXPONENTIAL, lambda n: 2.0 ** n),
+]
+
+MIN_EMPIRICAL_SIZE = 8
+MIN_FIT_POINTS = 4
+# Timings below this are dominated by timer resolution and call overhead
+MIN_MEASURABLE_TIME = 1e-4
+# A faster-growing curve must cut the squared error by this much to be preferred
+MODEL_IMPROVEMENT_FACTOR = 0.5
+# Empirical fits below this R² defer to the static estimate
+MIN_EMPIRICAL_R_SQUARED = 0.9
+
+
+def fit_growth_curve(sizes: List[int], times: List[float]) -> Dict[str, Any]:
+    """
+    Fit timings against the common growth curves.
+
+    Each curve is fitted as t = a + c * f(n) by least squares. Faster-growing
+    curves fit noise more easily, so one is only chosen over a slower-growing
+    curve when it clearly reduces the error.
+
+    Args:
+        sizes: Input sizes
+        times: Seconds taken at each size
+
+    Returns:
+        Dictionary with the best-fitting complexity, its R² and the log-log slope
+    """
+    if len(sizes) < MIN_FIT_POINTS:
+        return {"time_complexity": "Unknown", "big_o": None, "r_squared": 0.0, "exponent": None,
+                "message": f"At least {MIN_FIT_POINTS} timed input sizes are needed"}
+
+    mean_time = sum(times) / len(times)
+    total = sum((t - mean_time) ** 2 for t in times)
+
+    if max(times) < MIN_MEASURABLE_TIME or total == 0:
+        best, best_error = CONSTANT, 0.0
+    else:
+        best, best_error = None, math.inf
+        for complexity, curve in GROWTH_MODELS:
+            try:
+                xs = [curve(n) for n in sizes]
+            except OverflowError:
+                continue
+            error = _least_squares_error(xs, times)
+            if error is None:
+                continue
+            if best is None or error < best_error * MODEL_IMPROVEMENT_FACTOR:
+                best, best_error = complexity, error
+
+    r_squared = 1.0 - best_error / total if total else 1.0
+    return {
+        "time_complexity": best.describe(),
+        "big_o": best.big_o,
+        "complexity_class": best.label,
+        "r_squared": round(max(0.0, r_squared), 4),
+        "exponent": _log_log_slope(sizes, times)
+    }
+
+
+def _least_squares_error(xs: List[float], ys: List[float]) -> Optional[float]:
+    """Squared error of the best fit y = a + c * x with c >= 0, or None if x does not vary."""
+    count = len(xs)
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x == 0:
+        slope = 0.0
+    elif math.isinf(var_x):
+        return None
+    else:
+        slope = max(0.0, sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x)
+    intercept = mean_y - slope * mean_x
+    return sum((y - intercept - slope * x) ** 2 for x, y in zip(xs, ys))
+
+
+def _log_log_slope(sizes: List[int], times: List[float]) -> Optional[float]:
+    """Exponent k of t ~ n^k over the larger half of the sizes."""
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    points = points[len(points) // 2:]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x, 2)
+
+
+def scale_input(sample: Any, size: int) -> Any:
+    """
+    Build a test input of the given size shaped like a sample input.
+
+    Lists and strings are resized to ``size``; lists of integers get distinct
+    values and keep the sample's ordering (sorted inputs stay sorted). Integer
+    arguments are only scaled when there is no list or string to scale, as in
+    fib(n). Inputs follow the runner's conventions: a list is the positional
+    arguments and a dict the keyword arguments.
+
+    Args:
+        sample: Input of an existing test case
+        size: Target size
+
+    Returns:
+        Scaled input
+    """
+    if isinstance(sample, dict):
+        scale_ints = not any(isinstance(value, (list, str)) for value in sample.values())
+        return {key: _scale_argument(value, size, scale_ints) for key, value in sample.items()}
+    if isinstance(sample, (list, tuple)):
+        scale_ints = not any(isinstance(value, (list, str)) for value in sample)
+        return [_scale_argument(value, size, scale_ints) for value in sample]
+    return _scale_argument(sample, size, True)
+
+
+def _scale_argument(value: Any, size: int, scale_ints: bool) -> Any:
+    rng = random.Random(size)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return size if scale_ints else value
+    if isinstance(value, str):
+        if not value:
+            return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(size))
+        return (value * (size // len(value) + 1))[:size]
+    if isinstance(value, list):
+        if value and all(isinstance(item, int) and not isinstance(item, bool) for item in value):
+            scaled = rng.sample(range(-4 * size, 4 * size), size)
+            if value == sorted(value):
+                scaled.sort()
+            elif value == sorted(value, reverse=True):
+                scaled.sort(reverse=True)
+            return scaled
+        if not value:
+            return list(range(size))
+        return (value * (size // len(value) + 1))[:size]
+    return value
+
+
+def estimate_empirical_complexity(
+    code: str,
+    sample_input: Any = None,
+    input_generator: Optional[Callable[[int], Any]] = None,
+    language: str = "python",
+    function_name: Optional[str] = None,
+    sizes: Optional[List[int]] = None,
+    repeats: int = 3,
+    time_budget: Optional[float] = None,
+    sandbox: Any = None
+) -> Dict[str, Any]:
+    """
+    Estimate time complexity by timing the candidate's function in the sandbox.
+
+    Input sizes grow geometrically and each size is one sandbox run that calls
+    the function ``repeats`` times; the fastest call is kept. Growth stops at
+    the first size that exceeds the time budget, times out or raises.
+
+    Args:
+        code: Candidate's code
+        sample_input: Input of an existing test case, scaled with scale_input
+        input_generator: Builds the input for a size (takes precedence over sample_input)
+        language: Programming language
+        function_name: Function to call (extracted from the code if None)
+        sizes: Input sizes to try (doubling up to the configured maximum if None)
+        repeats: Calls per size
+        time_budget: Seconds one call may take before growth stops (config if None)
+        sandbox: Sandbox to run in (the configured sandbox if None)
+
+    Returns:
+        Dictionary with the fitted complexity and the measurements
+    """
+    config = get_code_quality_config()
+    if time_budget is None:
+        time_budget = config["empirical_time_budget"]
+    if sizes is None:
+        sizes = []
+        size = MIN_EMPIRICAL_SIZE
+        while size <= config["empirical_max_size"]:
+            sizes.append(size)
+            size *= 2
+    if input_generator is None:
+        if sample_input is None:
+            return {"time_complexity": "Unknown", "big_o": None, "method": "empirical",
+                    "error": "No sample input to scale"}
+        input_generator = lambda n: scale_input(sample_input, n)
+    if sandbox is None:
+        from ai_interviewer.tools.code_execution import get_sandbox
+        sandbox = get_sandbox()
+        if sandbox is None:
+            return {"time_complexity": "Unknown", "big_o": None, "method": "empirical",
+                    "error": "No sandbox available"}
+
+    per_test_timeout = time_budget * 4
+    measured_sizes: List[int] = []
+    timings: List[float] = []
+    stopped = "max_size"
+
+    for size in sizes:
+        test_input = input_generator(size)
+        results = sandbox.execute_code(
+            language=language,
+            code=code,
+            test_cases=[{"input": test_input, "expected_output": None}] * repeats,
+            function_name=function_name,
+            per_test_timeout=per_test_timeout,
+            timeout=math.ceil(per_test_timeout * repeats) + 5
+        )
+        test_results = results.get("test_results", [])
+        if len(test_results) < repeats or any(t.get("timed_out") for t in test_results):
+            stopped = "timeout" if any(t.get("timed_out") for t in test_results) else "error"
+            break
+        if any(t.get("error") for t in test_results):
+            stopped = "error"
+            logger.info(f"Empirical complexity run stopped at n={size}: {test_results[0].get('error')}")
+            break
+        elapsed = min(t.get("execution_time", 0.0) for t in test_results)
+        measured_sizes.append(size)
+        timings.append(elapsed)
+        if elapsed > time_budget:
+            stopped = "time_budget"
+            break
+
+    result = fit_growth_curve(measured_sizes, timings)
+    result.update({
+        "method": "empirical",
+        "sizes": measured_sizes,
+        "timings": timings,
+        "stopped": stopped
+    })
+    return result
+
+
+def combine_estimates(static: Dict[str, Any], empirical: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge the static and empirical estimates.
+
+    A confident empirical fit wins, since it reflects what the code actually
+    does; the static estimate is used otherwise.
+
+    Args:
+        static: Result of analyze_python_complexity
+        empirical: Result of estimate_empirical_complexity, if it was run
+
+    Returns:
+        Dictionary with the chosen "time_complexity", its "method" and notes
+    """
+    combined = {
+        "time_complexity": static.get("time_complexity", "Unknown"),
+        "big_o": static.get("big_o"),
+        "method": "static",
+        "notes": list(static.get("notes", []))
+    }
+    if not empirical or not empirical.get("big_o"):
+        return combined
+
+    if empirical.get("r_squared", 0) >= MIN_EMPIRICAL_R_SQUARED:
+        if static.get("big_o") and static["big_o"] != empirical["big_o"]:
+            combined["notes"].append(
+                f"Static analysis suggests {static['big_o']}, but measured running times grow like {empirical['big_o']}."
+            )
+        combined.update({
+            "time_complexity": empirical["time_complexity"],
+            "big_o": empirical["big_o"],
+            "method": "empirical"
+        })
+    return combined
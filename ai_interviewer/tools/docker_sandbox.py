@@ -5,25 +5,55 @@ This module implements a secure sandbox for executing candidate code using Docke
 with appropriate resource limits and security constraints.
 """
 import os
+import atexit
 import logging
 import tempfile
+import threading
 import json
 import uuid
 import subprocess
 import shutil
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import docker
 from docker.errors import DockerException, ImageNotFound, ContainerError
 
+from ai_interviewer.tools.runner_protocol import (
+    JAVASCRIPT_TEST_RUNNER,
+    PYTHON_TEST_RUNNER,
+    RUNNER_CONFIG_FILE,
+    RunnerEventParser,
+    build_runner_config,
+    summarize_runner_events
+)
+from ai_interviewer.tools.sandbox_pool import ContainerPool
+from ai_interviewer.utils.config import get_sandbox_config
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Default resource limits for containers
 DEFAULT_MEMORY_LIMIT = "128m"  # 128 MB memory limit
 DEFAULT_CPU_LIMIT = 0.5  # 0.5 CPU cores
-DEFAULT_TIMEOUT = 10  # 10 seconds timeout
+DEFAULT_TIMEOUT = 10  # 10 seconds timeout for the whole run
+DEFAULT_TEST_TIMEOUT = 3  # 3 seconds per test case
 DEFAULT_NETWORK_DISABLED = True  # No network access
 
+# Images and entry points per language
+LANGUAGE_RUNTIMES = {
+    "python": {
+        "image": "python:3.10-slim",  # Use slim Python image
+        "command": ["python", "runner.py"],
+        "container_prefix": "ai-interviewer-python",
+        "display_name": "Python"
+    },
+    "javascript": {
+        "image": "node:16-slim",  # Use slim Node.js image
+        "command": ["node", "runner.js"],
+        "container_prefix": "ai-interviewer-node",
+        "display_name": "Node.js"
+    }
+}
+
 class DockerSandbox:
     """
     Docker-based secure sandbox for code execution.
@@ -42,6 +72,88 @@ class DockerSandbox:
         except DockerException as e:
             logger.error(f"Failed to initialize Docker client: {e}")
             raise RuntimeError(f"Docker not available: {e}")
+        
+        # Availability of each runtime image, filled in by ensure_images
+        self.image_status: Dict[str, str] = {}
+        self._images_lock = threading.Lock()
+        
+        # Warm worker pools, keyed by language
+        self.pools: Dict[str, ContainerPool] = {}
+        config = get_sandbox_config()
+        if config["pool_enabled"]:
+            for language, runtime in LANGUAGE_RUNTIMES.items():
+                self.pools[language] = ContainerPool(
+                    self.client,
+                    language,
+                    runtime["image"],
+                    size=config["pool_size"],
+                    max_runs=config["pool_max_runs"],
+                    memory_limit=DEFAULT_MEMORY_LIMIT,
+                    cpu_limit=DEFAULT_CPU_LIMIT,
+                    network_disabled=DEFAULT_NETWORK_DISABLED,
+                    acquire_timeout=config["pool_acquire_timeout"],
+                    max_output_bytes=config["max_output_bytes"]
+                )
+            # Fill the pools in the background so the first submission is warm
+            threading.Thread(target=self.prewarm, daemon=True).start()
+            atexit.register(self.shutdown)
+    
+    def ensure_images(self) -> Dict[str, str]:
+        """
+        Make sure every runtime image is available locally, pulling missing ones.
+        
+        Images are checked once per sandbox; concurrent callers wait for the
+        first check (and any pulls) to finish.
+        
+        Returns:
+            Image status per language: "present", "pulled" or an error message
+        """
+        with self._images_lock:
+            for language, runtime in LANGUAGE_RUNTIMES.items():
+                if self.image_status.get(language) in ("present", "pulled"):
+                    continue
+                image = runtime["image"]
+                try:
+                    self.client.images.get(image)
+                    self.image_status[language] = "present"
+                except ImageNotFound:
+                    logger.info(f"Pulling sandbox image {image}")
+                    repository, _, tag = image.partition(":")
+                    try:
+                        self.client.images.pull(repository, tag=tag or "latest")
+                        self.image_status[language] = "pulled"
+                        logger.info(f"Pulled sandbox image {image}")
+                    except DockerException as e:
+                        logger.error(f"Failed to pull sandbox image {image}: {e}")
+                        self.image_status[language] = f"error: {e}"
+                except DockerException as e:
+                    logger.error(f"Failed to inspect sandbox image {image}: {e}")
+                    self.image_status[language] = f"error: {e}"
+            return dict(self.image_status)
+    
+    def prewarm(self) -> Dict[str, int]:
+        """
+        Pull missing images and start pooled workers for every language.
+        
+        Returns:
+            Number of workers started per language
+        """
+        self.ensure_images()
+        return {language: pool.start() for language, pool in self.pools.items()}
+    
+    def shutdown(self) -> None:
+        """Remove all pooled workers."""
+        for pool in self.pools.values():
+            pool.shutdown()
+    
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get warm pool statistics.
+        
+        Returns:
+            Pool statistics per language
+        """
+        return {language: pool.get_stats() for language, pool in self.pools.items()}
     
     def execute_code(
         self,
@@ -52,7 +164,10 @@ class DockerSandbox:
         memory_limit: str = DEFAULT_MEMORY_LIMIT,
         cpu_limit: float = DEFAULT_CPU_LIMIT,
         timeout: int = DEFAULT_TIMEOUT,
-        network_disabled: bool = DEFAULT_NETWORK_DISABLED
+        network_disabled: bool = DEFAULT_NETWORK_DISABLED,
+        per_test_timeout: Optional[float] = DEFAULT_TEST_TIMEOUT,
+        stop_on_hidden_failure: bool = False,
+        on_test_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Execute code in a secure Docker container with resource limits.
@@ -64,20 +179,24 @@ class DockerSandbox:
             function_name: Name of the function to test (optional, will be extracted if not provided)
             memory_limit: Container memory limit (e.g., "128m")
             cpu_limit: Container CPU limit (e.g., 0.5 for half a core)
-            timeout: Execution timeout in seconds
+            timeout: Execution timeout in seconds for the whole run
             network_disabled: Whether to disable network access
+            per_test_timeout: Time limit per test case in seconds (None for no limit)
+            stop_on_hidden_failure: Skip the remaining tests after the first failing hidden test
+            on_test_result: Called with each test result as soon as that test finishes
             
         Returns:
             Dictionary with execution results
         """
         # Normalize language
         language = language.lower()
+        runner_config = build_runner_config(function_name, per_test_timeout, stop_on_hidden_failure)
         
         # Choose execution handler based on language
         if language == "python":
-            return self._execute_python(code, test_cases, function_name, memory_limit, cpu_limit, timeout, network_disabled)
+            return self._execute_python(code, test_cases, runner_config, memory_limit, cpu_limit, timeout, network_disabled, on_test_result)
         elif language in ["javascript", "js"]:
-            return self._execute_javascript(code, test_cases, function_name, memory_limit, cpu_limit, timeout, network_disabled)
+            return self._execute_javascript(code, test_cases, runner_config, memory_limit, cpu_limit, timeout, network_disabled, on_test_result)
         else:
             return {
                 "status": "error",
@@ -89,11 +208,12 @@ class DockerSandbox:
         self,
         code: str,
         test_cases: List[Dict[str, Any]],
-        function_name: Optional[str] = None,
+        runner_config: str,
         memory_limit: str = DEFAULT_MEMORY_LIMIT,
         cpu_limit: float = DEFAULT_CPU_LIMIT,
         timeout: int = DEFAULT_TIMEOUT,
-        network_disabled: bool = DEFAULT_NETWORK_DISABLED
+        network_disabled: bool = DEFAULT_NETWORK_DISABLED,
+        on_test_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Execute Python code in a Docker container.
@@ -101,148 +221,34 @@ class DockerSandbox:
         Args:
             code: Python source code
             test_cases: List of test cases
-            function_name: Name of the function to test
+            runner_config: Runner options from build_runner_config
             memory_limit: Container memory limit
             cpu_limit: Container CPU limit
             timeout: Execution timeout in seconds
             network_disabled: Whether to disable network access
+            on_test_result: Called with each test result as it finishes
             
         Returns:
             Dictionary with execution results
         """
-        # Create a temporary directory for the execution files
-        temp_dir = tempfile.mkdtemp(prefix="ai_interviewer_")
-        
-        try:
-            # Create the runner script
-            with open(os.path.join(temp_dir, "code.py"), "w") as f:
-                f.write(code)
-                
-            # Create the test runner script
-            runner_code = self._generate_python_test_runner(test_cases, function_name)
-            with open(os.path.join(temp_dir, "runner.py"), "w") as f:
-                f.write(runner_code)
-                
-            # Create test cases file
-            with open(os.path.join(temp_dir, "test_cases.json"), "w") as f:
-                json.dump(test_cases, f)
-                
-            # Run the container
-            container_name = f"ai-interviewer-python-{uuid.uuid4().hex[:8]}"
-            
-            try:
-                # Prepare container settings
-                container_settings = {
-                    "volumes": {temp_dir: {"bind": "/app", "mode": "ro"}},
-                    "working_dir": "/app",
-                    "command": ["python", "runner.py"],
-                    "mem_limit": memory_limit,
-                    "cpu_quota": int(cpu_limit * 100000),  # Docker CPU quota in microseconds
-                    "network_disabled": network_disabled,
-                    "name": container_name,
-                    "detach": True,
-                    "read_only": True,  # Make container filesystem read-only for extra security
-                    "auto_remove": True,  # Automatically remove container when it exits
-                }
-                
-                # Run the container
-                container = self.client.containers.run(
-                    "python:3.10-slim",  # Use slim Python image
-                    **container_settings
-                )
-                
-                # Wait for container to complete with timeout
-                try:
-                    container.wait(timeout=timeout)
-                except:
-                    # If timeout or error, force stop
-                    try:
-                        container.stop(timeout=1)
-                    except:
-                        pass
-                    
-                    return {
-                        "status": "error",
-                        "message": "Execution timed out",
-                        "execution_time": timeout,
-                        "error": True
-                    }
-                
-                # Get container logs
-                try:
-                    logs = container.logs().decode("utf-8")
-                    
-                    # Parse the JSON output from the runner
-                    try:
-                        # Find JSON output in logs
-                        json_start = logs.find("__RESULTS_JSON_START__")
-                        json_end = logs.find("__RESULTS_JSON_END__")
-                        
-                        if json_start >= 0 and json_end > json_start:
-                            json_data = logs[json_start + len("__RESULTS_JSON_START__"):json_end].strip()
-                            results = json.loads(json_data)
-                            results["logs"] = logs
-                            return results
-                        else:
-                            # No JSON results found, return error
-                            return {
-                                "status": "error",
-                                "message": "Failed to parse execution results",
-                                "logs": logs,
-                                "error": True
-                            }
-                    except json.JSONDecodeError:
-                        return {
-                            "status": "error",
-                            "message": "Failed to parse execution results JSON",
-                            "logs": logs,
-                            "error": True
-                        }
-                except:
-                    # If failed to get logs, return error
-                    return {
-                        "status": "error",
-                        "message": "Failed to retrieve execution logs",
-                        "error": True
-                    }
-                
-            except ContainerError as e:
-                # Container run failed
-                return {
-                    "status": "error",
-                    "message": f"Container execution failed: {str(e)}",
-                    "stderr": e.stderr.decode("utf-8") if hasattr(e, "stderr") else "",
-                    "error": True
-                }
-            except ImageNotFound:
-                # Python image not found
-                return {
-                    "status": "error",
-                    "message": "Python Docker image not found",
-                    "error": True
-                }
-            except Exception as e:
-                # Other exceptions
-                logger.error(f"Docker execution error: {str(e)}")
-                return {
-                    "status": "error",
-                    "message": f"Execution error: {str(e)}",
-                    "error": True
-                }
-                
-        finally:
-            # Clean up temporary directory
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        files = {
+            "code.py": code,
+            "runner.py": self._generate_python_test_runner(),
+            "test_cases.json": json.dumps(test_cases),
+            RUNNER_CONFIG_FILE: runner_config
+        }
+        return self._run_files("python", files, memory_limit, cpu_limit, timeout, network_disabled, on_test_result)
     
     def _execute_javascript(
         self,
         code: str,
         test_cases: List[Dict[str, Any]],
-        function_name: Optional[str] = None,
+        runner_config: str,
         memory_limit: str = DEFAULT_MEMORY_LIMIT,
         cpu_limit: float = DEFAULT_CPU_LIMIT,
         timeout: int = DEFAULT_TIMEOUT,
-        network_disabled: bool = DEFAULT_NETWORK_DISABLED
+        network_disabled: bool = DEFAULT_NETWORK_DISABLED,
+        on_test_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Execute JavaScript code in a Docker container.
@@ -250,41 +256,125 @@ class DockerSandbox:
         Args:
             code: JavaScript source code
             test_cases: List of test cases
-            function_name: Name of the function to test
+            runner_config: Runner options from build_runner_config
             memory_limit: Container memory limit
             cpu_limit: Container CPU limit
             timeout: Execution timeout in seconds
             network_disabled: Whether to disable network access
+            on_test_result: Called with each test result as it finishes
             
         Returns:
             Dictionary with execution results
         """
+        files = {
+            "code.js": code,
+            "runner.js": self._generate_javascript_test_runner(),
+            "test_cases.json": json.dumps(test_cases),
+            RUNNER_CONFIG_FILE: runner_config
+        }
+        return self._run_files("javascript", files, memory_limit, cpu_limit, timeout, network_disabled, on_test_result)
+    
+    def _run_files(
+        self,
+        language: str,
+        files: Dict[str, str],
+        memory_limit: str,
+        cpu_limit: float,
+        timeout: int,
+        network_disabled: bool,
+        on_test_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a test runner, on a warm pooled worker when possible.
+        
+        Pooled workers are started with the default limits, so requests with
+        custom limits (or with the pool disabled or exhausted) get a one-off
+        container instead. If a pooled worker fails after reporting some test
+        results, the one-off rerun reports none.
+        
+        Args:
+            language: Language key in LANGUAGE_RUNTIMES
+            files: File name to content mapping
+            memory_limit: Container memory limit
+            cpu_limit: Container CPU limit
+            timeout: Execution timeout in seconds
+            network_disabled: Whether to disable network access
+            on_test_result: Called with each test result as it finishes
+            
+        Returns:
+            Dictionary with execution results
+        """
+        pool = self.pools.get(language)
+        uses_default_limits = (
+            memory_limit == DEFAULT_MEMORY_LIMIT
+            and cpu_limit == DEFAULT_CPU_LIMIT
+            and network_disabled == DEFAULT_NETWORK_DISABLED
+        )
+        
+        if pool is not None and uses_default_limits:
+            # Test results are parsed (and reported) as the worker streams them
+            parser = RunnerEventParser(self._test_result_callback(on_test_result))
+            output = pool.run(files, timeout, on_stdout=parser.feed)
+            if output is not None:
+                if output["truncated"]:
+                    return {
+                        "status": "error",
+                        "message": "Execution produced too much output",
+                        "logs": output["stderr"][:10000],
+                        "error": True
+                    }
+                parser.close()
+                return summarize_runner_events(parser.events, output["stderr"], timed_out=output["timed_out"])
+            if any(event["event"] == "test" for event in parser.events):
+                # The worker failed mid-run; the rerun must not report those tests a second time
+                on_test_result = None
+        
+        return self._run_cold_container(language, files, memory_limit, cpu_limit, timeout, network_disabled, on_test_result)
+    
+    def _run_cold_container(
+        self,
+        language: str,
+        files: Dict[str, str],
+        memory_limit: str,
+        cpu_limit: float,
+        timeout: int,
+        network_disabled: bool,
+        on_test_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a test runner in a new single-use container.
+        
+        Args:
+            language: Language key in LANGUAGE_RUNTIMES
+            files: File name to content mapping
+            memory_limit: Container memory limit
+            cpu_limit: Container CPU limit
+            timeout: Execution timeout in seconds
+            network_disabled: Whether to disable network access
+            on_test_result: Called with each test result once the run ends
+            
+        Returns:
+            Dictionary with execution results
+        """
+        runtime = LANGUAGE_RUNTIMES[language]
+        
         # Create a temporary directory for the execution files
         temp_dir = tempfile.mkdtemp(prefix="ai_interviewer_")
         
         try:
-            # Create the solution file
-            with open(os.path.join(temp_dir, "code.js"), "w") as f:
-                f.write(code)
-                
-            # Create the test runner script
-            runner_code = self._generate_javascript_test_runner(test_cases, function_name)
-            with open(os.path.join(temp_dir, "runner.js"), "w") as f:
-                f.write(runner_code)
-                
-            # Create test cases file
-            with open(os.path.join(temp_dir, "test_cases.json"), "w") as f:
-                json.dump(test_cases, f)
+            for name, content in files.items():
+                with open(os.path.join(temp_dir, name), "w") as f:
+                    f.write(content)
                 
             # Run the container
-            container_name = f"ai-interviewer-node-{uuid.uuid4().hex[:8]}"
+            container_name = f"{runtime['container_prefix']}-{uuid.uuid4().hex[:8]}"
             
             try:
                 # Prepare container settings
                 container_settings = {
                     "volumes": {temp_dir: {"bind": "/app", "mode": "ro"}},
                     "working_dir": "/app",
-                    "command": ["node", "runner.js"],
+                    "command": runtime["command"],
                     "mem_limit": memory_limit,
                     "cpu_quota": int(cpu_limit * 100000),  # Docker CPU quota in microseconds
                     "network_disabled": network_disabled,
@@ -296,58 +386,39 @@ class DockerSandbox:
                 
                 # Run the container
                 container = self.client.containers.run(
-                    "node:16-slim",  # Use slim Node.js image
+                    runtime["image"],
                     **container_settings
                 )
                 
                 # Wait for container to complete with timeout
+                timed_out = False
                 try:
                     container.wait(timeout=timeout)
                 except:
-                    # If timeout or error, force stop
-                    try:
-                        container.stop(timeout=1)
-                    except:
-                        pass
-                    
-                    return {
-                        "status": "error",
-                        "message": "Execution timed out",
-                        "execution_time": timeout,
-                        "error": True
-                    }
+                    timed_out = True
                 
-                # Get container logs
+                # Get container logs; on timeout this keeps the tests that did finish
                 try:
-                    logs = container.logs().decode("utf-8")
-                    
-                    # Parse the JSON output from the runner
-                    try:
-                        # Find JSON output in logs
-                        json_start = logs.find("__RESULTS_JSON_START__")
-                        json_end = logs.find("__RESULTS_JSON_END__")
-                        
-                        if json_start >= 0 and json_end > json_start:
-                            json_data = logs[json_start + len("__RESULTS_JSON_START__"):json_end].strip()
-                            results = json.loads(json_data)
-                            results["logs"] = logs
-                            return results
-                        else:
-                            # No JSON results found, return error
-                            return {
-                                "status": "error",
-                                "message": "Failed to parse execution results",
-                                "logs": logs,
-                                "error": True
-                            }
-                    except json.JSONDecodeError:
+                    events = container.logs(stdout=True, stderr=False)
+                    logs = container.logs(stdout=False, stderr=True).decode("utf-8", errors="replace")
+                except:
+                    events = None
+                finally:
+                    if timed_out:
+                        # Force stop
+                        try:
+                            container.stop(timeout=1)
+                        except:
+                            pass
+                
+                if events is None:
+                    if timed_out:
                         return {
                             "status": "error",
-                            "message": "Failed to parse execution results JSON",
-                            "logs": logs,
+                            "message": "Execution timed out",
+                            "execution_time": timeout,
                             "error": True
                         }
-                except:
                     # If failed to get logs, return error
                     return {
                         "status": "error",
@@ -355,6 +426,11 @@ class DockerSandbox:
                         "error": True
                     }
                 
+                parser = RunnerEventParser(self._test_result_callback(on_test_result))
+                parser.feed(events)
+                parser.close()
+                return summarize_runner_events(parser.events, logs, timed_out=timed_out)
+                
             except ContainerError as e:
                 # Container run failed
                 return {
@@ -364,10 +440,9 @@ class DockerSandbox:
                     "error": True
                 }
             except ImageNotFound:
-                # Node.js image not found
                 return {
                     "status": "error",
-                    "message": "Node.js Docker image not found",
+                    "message": f"{runtime['display_name']} Docker image not found",
                     "error": True
                 }
             except Exception as e:
@@ -384,369 +459,52 @@ class DockerSandbox:
             shutil.rmtree(temp_dir, ignore_errors=True)
     
     @staticmethod
-    def _generate_python_test_runner(test_cases: List[Dict[str, Any]], function_name: Optional[str] = None) -> str:
+    def _test_result_callback(
+        on_test_result: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> Optional[Callable[[Dict[str, Any]], None]]:
         """
-        Generate a Python test runner script for the Docker container.
+        Adapt a per-test callback to receive runner events.
         
         Args:
-            test_cases: List of test cases to run
-            function_name: Name of the function to test (extracted from code if None)
+            on_test_result: Callback for finished tests, or None
             
         Returns:
-            Python script code for the test runner
+            Runner event callback, or None
         """
-        return """
-import sys
-import io
-import time
-import json
-import ast
-from contextlib import redirect_stdout, redirect_stderr
-
-# Load the candidate's code
-with open("code.py", "r") as f:
-    code = f.read()
-
-# Load the test cases
-with open("test_cases.json", "r") as f:
-    test_cases = json.load(f)
-
-# Function to extract the function name from the code
-def extract_function_name(code):
-    try:
-        tree = ast.parse(code)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                return node.name
-        raise ValueError("No function definition found in code")
-    except Exception as e:
-        raise ValueError(f"Error parsing code: {e}")
-
-# Determine the function name
-function_name = "{}"
-if not function_name:
-    try:
-        function_name = extract_function_name(code)
-    except Exception as e:
-        print(f"Error extracting function name: {{e}}")
-        results = {{
-            "status": "error",
-            "error_message": f"Could not identify a function to test: {{e}}"
-        }}
-        print("__RESULTS_JSON_START__")
-        print(json.dumps(results))
-        print("__RESULTS_JSON_END__")
-        sys.exit(1)
-
-# Prepare results
-results = {{
-    "status": "success",
-    "passed": 0,
-    "failed": 0,
-    "error": False,
-    "execution_time": 0,
-    "test_results": []
-}}
-
-# Execute the code to define the function
-try:
-    namespace = {{}};
-    exec(code, namespace)
-
-    # Check if function exists
-    if function_name not in namespace:
-        results["status"] = "error"
-        results["error_message"] = f"Function '{{function_name}}' not found in code"
-        print("__RESULTS_JSON_START__")
-        print(json.dumps(results))
-        print("__RESULTS_JSON_END__")
-        sys.exit(1)
-
-    # Get the function
-    function = namespace[function_name]
-
-    # Execute test cases
-    total_time = 0
-
-    for i, test_case in enumerate(test_cases):
-        test_input = test_case["input"]
-        expected_output = test_case["expected_output"]
-
-        # Prepare test result
-        test_result = {{
-            "test_case_id": i + 1,
-            "input": test_input,
-            "expected_output": expected_output,
-            "is_hidden": test_case.get("is_hidden", False),
-            "explanation": test_case.get("explanation", ""),
-            "passed": False,
-            "execution_time": 0,
-            "output": None,
-            "error": None
-        }}
-
-        # Capture stdout and stderr
-        stdout_buffer = io.StringIO()
-        stderr_buffer = io.StringIO()
-
-        try:
-            # Measure execution time
-            start_time = time.time()
-
-            # Execute with stdout/stderr redirection
-            with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-                if isinstance(test_input, (list, tuple)) and not isinstance(test_input, str):
-                    actual_output = function(*test_input)
-                elif isinstance(test_input, dict):
-                    actual_output = function(**test_input)
-                else:
-                    actual_output = function(test_input)
-
-            # Calculate execution time
-            execution_time = time.time() - start_time
-            total_time += execution_time
-
-            # Get stdout and stderr content
-            stdout_content = stdout_buffer.getvalue()
-            stderr_content = stderr_buffer.getvalue()
-
-            # Check if output matches expected output
-            output_matches = False
-            if actual_output == expected_output:
-                output_matches = True
-            elif (isinstance(actual_output, (list, tuple)) and 
-                  isinstance(expected_output, (list, tuple)) and
-                  len(actual_output) == len(expected_output) and
-                  all(a == e for a, e in zip(actual_output, expected_output))):
-                output_matches = True
-            elif (isinstance(actual_output, dict) and 
-                  isinstance(expected_output, dict) and
-                  len(actual_output) == len(expected_output) and
-                  all(actual_output.get(k) == v for k, v in expected_output.items())):
-                output_matches = True
-
-            if output_matches:
-                test_result["passed"] = True
-                results["passed"] += 1
-            else:
-                test_result["passed"] = False
-                results["failed"] += 1
-
-            # Add actual output and execution information
-            test_result["output"] = actual_output
-            test_result["execution_time"] = execution_time
-
-            # Add stdout/stderr if any
-            if stdout_content:
-                test_result["stdout"] = stdout_content
-            if stderr_content:
-                test_result["stderr"] = stderr_content
-
-        except Exception as e:
-            # Handle exceptions
-            import traceback
-            test_result["passed"] = False
-            test_result["error"] = str(e)
-            test_result["traceback"] = traceback.format_exc()
-            test_result["stderr"] = stderr_buffer.getvalue()
-            results["failed"] += 1
-
-        # Add test result
-        results["test_results"].append(test_result)
-
-    # Calculate overall metrics
-    results["execution_time"] = total_time
-    results["all_passed"] = results["failed"] == 0
-    results["detailed_metrics"] = {{
-        "avg_execution_time": total_time / len(test_cases) if test_cases else 0,
-        "max_execution_time": max((t["execution_time"] for t in results["test_results"]), default=0),
-        "success_rate": results["passed"] / len(test_cases) if test_cases else 0
-    }}
-
-except Exception as e:
-    import traceback
-    results["status"] = "error"
-    results["error_message"] = str(e)
-    results["traceback"] = traceback.format_exc()
-
-# Output the results as JSON
-print("__RESULTS_JSON_START__")
-print(json.dumps(results))
-print("__RESULTS_JSON_END__")
-""".format(function_name or "")
+        if on_test_result is None:
+            return None
+        
+        def on_event(event: Dict[str, Any]) -> None:
+            if event["event"] == "test":
+                on_test_result({key: value for key, value in event.items() if key != "event"})
+        
+        return on_event
     
     @staticmethod
-    def _generate_javascript_test_runner(test_cases: List[Dict[str, Any]], function_name: Optional[str] = None) -> str:
+    def _generate_python_test_runner() -> str:
         """
-        Generate a JavaScript test runner script for the Docker container.
+        Generate a Python test runner script for the Docker container.
+        
+        The runner reads its options from runner_config.json and reports results
+        with the structured protocol in runner_protocol.
         
-        Args:
-            test_cases: List of test cases to run
-            function_name: Name of the function to test
-            
         Returns:
-            JavaScript script code for the test runner
+            Python script code for the test runner
         """
-        return """
-const fs = require('fs');
-
-// Load the candidate's code
-const code = fs.readFileSync('code.js', 'utf8');
-
-// Load the test cases
-const testCases = JSON.parse(fs.readFileSync('test_cases.json', 'utf8'));
-
-// Function to extract the function name from the code (basic implementation)
-function extractFunctionName(code) {
-    const functionRegex = /function\\s+([a-zA-Z0-9_]+)\\s*\\(/;
-    const arrowFunctionRegex = /const\\s+([a-zA-Z0-9_]+)\\s*=\\s*\\(?.*\\)?\\s*=>/;
-    
-    const functionMatch = code.match(functionRegex);
-    if (functionMatch) return functionMatch[1];
-    
-    const arrowMatch = code.match(arrowFunctionRegex);
-    if (arrowMatch) return arrowMatch[1];
-    
-    throw new Error("No function definition found in code");
-}
-
-// Determine the function name
-let functionName = "{functionName}";
-if (!functionName) {
-    try {
-        functionName = extractFunctionName(code);
-    } catch (e) {
-        console.error(`Error extracting function name: ${e.message}`);
-        const results = {
-            status: "error",
-            error_message: `Could not identify a function to test: ${e.message}`
-        };
-        console.log("__RESULTS_JSON_START__");
-        console.log(JSON.stringify(results));
-        console.log("__RESULTS_JSON_END__");
-        process.exit(1);
-    }
-}
-
-// Prepare results
-const results = {
-    status: "success",
-    passed: 0,
-    failed: 0,
-    error: false,
-    execution_time: 0,
-    test_results: []
-};
-
-// Execute the code to define the function
-try {
-    // Create a new context and evaluate the code
-    eval(code);
-    
-    // Check if function exists
-    if (typeof global[functionName] !== 'function') {
-        results.status = "error";
-        results.error_message = `Function '${functionName}' not found in code`;
-        console.log("__RESULTS_JSON_START__");
-        console.log(JSON.stringify(results));
-        console.log("__RESULTS_JSON_END__");
-        process.exit(1);
-    }
-    
-    // Get the function
-    const fn = global[functionName];
+        return PYTHON_TEST_RUNNER
     
-    // Execute test cases
-    let totalTime = 0;
-    
-    testCases.forEach((testCase, i) => {
-        const testInput = testCase.input;
-        const expectedOutput = testCase.expected_output;
+    @staticmethod
+    def _generate_javascript_test_runner() -> str:
+        """
+        Generate a JavaScript test runner script for the Docker container.
         
-        // Prepare test result
-        const testResult = {
-            test_case_id: i + 1,
-            input: testInput,
-            expected_output: expectedOutput,
-            is_hidden: testCase.is_hidden || false,
-            explanation: testCase.explanation || "",
-            passed: false,
-            execution_time: 0,
-            output: null,
-            error: null
-        };
+        The runner reads its options from runner_config.json and reports results
+        with the structured protocol in runner_protocol.
         
-        try {
-            // Measure execution time
-            const startTime = Date.now();
-            
-            // Execute function
-            let actualOutput;
-            if (Array.isArray(testInput)) {
-                actualOutput = fn(...testInput);
-            } else if (typeof testInput === 'object' && testInput !== null && !Array.isArray(testInput)) {
-                actualOutput = fn(testInput);
-            } else {
-                actualOutput = fn(testInput);
-            }
-            
-            // Calculate execution time
-            const executionTime = (Date.now() - startTime) / 1000;
-            totalTime += executionTime;
-            
-            // Check if output matches expected output
-            let outputMatches = false;
-            
-            // Handle various output types
-            if (JSON.stringify(actualOutput) === JSON.stringify(expectedOutput)) {
-                outputMatches = true;
-            }
-            
-            if (outputMatches) {
-                testResult.passed = true;
-                results.passed++;
-            } else {
-                testResult.passed = false;
-                results.failed++;
-            }
-            
-            // Add actual output and execution information
-            testResult.output = actualOutput;
-            testResult.execution_time = executionTime;
-            
-        } catch (e) {
-            // Handle exceptions
-            testResult.passed = false;
-            testResult.error = e.message;
-            testResult.stack = e.stack;
-            results.failed++;
-        }
-        
-        // Add test result
-        results.test_results.push(testResult);
-    });
-    
-    // Calculate overall metrics
-    results.execution_time = totalTime;
-    results.all_passed = results.failed === 0;
-    results.detailed_metrics = {
-        avg_execution_time: testCases.length ? totalTime / testCases.length : 0,
-        max_execution_time: Math.max(...results.test_results.map(t => t.execution_time)),
-        success_rate: testCases.length ? results.passed / testCases.length : 0
-    };
-    
-} catch (e) {
-    // Handle exceptions during code execution setup
-    results.status = "error";
-    results.error_message = e.message;
-    results.stack = e.stack;
-}
-
-// Output the results as JSON
-console.log("__RESULTS_JSON_START__");
-console.log(JSON.stringify(results));
-console.log("__RESULTS_JSON_END__");
-""".replace("{functionName}", function_name or "")
+        Returns:
+            JavaScript script code for the test runner
+        """
+        return JAVASCRIPT_TEST_RUNNER
 
     def check_docker_requirements(self) -> Dict[str, Any]:
         """
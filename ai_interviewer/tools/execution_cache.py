@@ -0,0 +1,284 @@
+"""
+Result cache for code submission evaluations.
+
+Candidates often re-submit unchanged code, and the frontend submits before
+completing a challenge, so the same evaluation is requested repeatedly. An
+evaluation is fully determined by the code, the challenge and its test cases,
+the language, the feedback skill level and the test runner version, so it is
+keyed by a hash of those and kept in a TTL-bounded in-memory LRU, optionally
+backed by a MongoDB collection shared between workers.
+"""
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from ai_interviewer.tools.runner_protocol import RUNNER_VERSION
+from ai_interviewer.utils.config import get_db_config, get_sandbox_config
+from ai_interviewer.utils.response_cache import normalize_code
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def is_cacheable(execution_results: Dict[str, Any]) -> bool:
+    """
+    Check whether execution results are deterministic enough to cache.
+
+    Infrastructure errors and timed out tests depend on load rather than on
+    the code, so they are always re-run.
+
+    Args:
+        execution_results: Results from execute_candidate_code
+
+    Returns:
+        True if the results may be cached
+    """
+    if execution_results.get("status") != "success":
+        return False
+    detailed = execution_results.get("detailed_results") or {}
+    if detailed.get("detailed_metrics", {}).get("timed_out_tests"):
+        return False
+    return not any(t.get("timed_out") for t in detailed.get("test_results", []))
+
+
+class ExecutionResultCache:
+    """
+    TTL and LRU bounded cache of submission evaluations with an optional MongoDB tier.
+    """
+
+    def __init__(self,
+                 max_entries: Optional[int] = None,
+                 ttl: Optional[int] = None,
+                 collection: Optional[Any] = None):
+        """
+        Initialize the cache.
+
+        Settings default to the values from get_sandbox_config().
+
+        Args:
+            max_entries: Maximum number of evaluations kept in memory
+            ttl: Seconds an evaluation stays valid
+            collection: Optional pymongo collection used as a shared second tier
+        """
+        config = get_sandbox_config()
+
+        self.max_entries = max_entries if max_entries is not None else config["cache_max_entries"]
+        self.ttl = ttl if ttl is not None else config["cache_ttl"]
+        self.collection = collection
+
+        # key -> (expiry on the monotonic clock, value)
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.stats = {"memory_hits": 0, "mongodb_hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    @staticmethod
+    def make_key(code: str,
+                 challenge_id: str,
+                 test_cases: List[Dict[str, Any]],
+                 language: str,
+                 skill_level: str = "") -> str:
+        """
+        Build the cache key for an evaluation.
+
+        Args:
+            code: Candidate source code
+            challenge_id: ID of the challenge
+            test_cases: Test cases the code is evaluated against, including hidden ones
+            language: Programming language
+            skill_level: Skill level the feedback is written for
+
+        Returns:
+            Hex digest identifying the evaluation
+        """
+        payload = json.dumps({
+            "code": normalize_code(code),
+            "challenge_id": challenge_id,
+            "test_cases": test_cases,
+            "language": language.lower(),
+            "skill_level": skill_level,
+            "runner_version": RUNNER_VERSION
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached evaluation.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            A copy of the cached evaluation, or None on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > now:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return copy.deepcopy(value)
+                del self._memory[key]
+                self.stats["expired"] += 1
+
+        value, remaining = self._get_shared(key)
+        with self._lock:
+            if value is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["mongodb_hits"] += 1
+            self._remember(key, value, remaining)
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Add an evaluation to the cache.
+
+        Args:
+            key: Cache key
+            value: Evaluation result
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value, self.ttl)
+
+        if self.collection is None:
+            return
+        try:
+            self.collection.replace_one(
+                {"_id": key},
+                {
+                    "_id": key,
+                    "value": json.dumps(value, default=str),
+                    "expires_at": datetime.utcnow() + timedelta(seconds=self.ttl)
+                },
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store evaluation {key} in MongoDB: {e}")
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        with self._lock:
+            self._memory.clear()
+
+    def _get_shared(self, key: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Look up an evaluation in the MongoDB tier.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of the evaluation (or None) and its remaining lifetime in seconds
+        """
+        if self.collection is None:
+            return None, 0
+        try:
+            document = self.collection.find_one({"_id": key})
+        except Exception as e:
+            logger.warning(f"Failed to read evaluation {key} from MongoDB: {e}")
+            return None, 0
+        if not document:
+            return None, 0
+
+        # The TTL index only sweeps periodically, so check expiry here too
+        remaining = (document["expires_at"] - datetime.utcnow()).total_seconds()
+        if remaining <= 0:
+            return None, 0
+        try:
+            return json.loads(document["value"]), remaining
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Discarding malformed cached evaluation {key}: {e}")
+            return None, 0
+
+    def _remember(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        """
+        Store an evaluation in the memory LRU. Must be called with the lock held.
+
+        Args:
+            key: Cache key
+            value: Evaluation result
+            ttl: Seconds the entry stays valid
+        """
+        self._memory.pop(key, None)
+        self._memory[key] = (time.monotonic() + ttl, value)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hit/miss counters and the current size
+        """
+        with self._lock:
+            return {
+                **self.stats,
+                "entries": len(self._memory),
+                "mongodb": self.collection is not None
+            }
+
+
+# Lazily created process-wide cache
+_execution_cache: Optional[ExecutionResultCache] = None
+_execution_cache_lock = threading.Lock()
+
+
+def get_execution_cache() -> Optional[ExecutionResultCache]:
+    """
+    Get the process-wide evaluation cache.
+
+    Returns:
+        ExecutionResultCache instance, or None if caching is disabled
+    """
+    global _execution_cache
+
+    config = get_sandbox_config()
+    if not config["cache_enabled"]:
+        return None
+
+    with _execution_cache_lock:
+        if _execution_cache is None:
+            _execution_cache = ExecutionResultCache(collection=_get_mongodb_collection() if config["cache_mongodb"] else None)
+        return _execution_cache
+
+
+def _get_mongodb_collection() -> Optional[Any]:
+    """
+    Connect to the MongoDB collection backing the shared cache tier.
+
+    Returns:
+        pymongo collection, or None if MongoDB is unavailable
+    """
+    try:
+        import pymongo
+        from pymongo.mongo_client import MongoClient
+
+        db_config = get_db_config()
+        client = MongoClient(
+            db_config["uri"],
+            maxPoolSize=db_config["max_pool_size"],
+            minPoolSize=db_config["min_pool_size"],
+            maxIdleTimeMS=db_config["max_idle_time_ms"],
+            waitQueueTimeoutMS=db_config["wait_queue_timeout_ms"],
+            serverSelectionTimeoutMS=2000
+        )
+        collection = client[db_config["database"]][db_config["execution_cache_collection"]]
+        # Let MongoDB drop entries once they expire
+        collection.create_index([("expires_at", pymongo.ASCENDING)], expireAfterSeconds=0)
+        logger.info(f"Execution cache MongoDB tier using collection {db_config['execution_cache_collection']}")
+        return collection
+    except Exception as e:
+        logger.warning(f"Execution cache MongoDB tier unavailable, using memory only: {e}")
+        return None
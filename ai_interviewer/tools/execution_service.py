@@ -0,0 +1,306 @@
+"""
+Concurrency-limited code execution service for the AI Interviewer.
+
+Evaluating a submission blocks on the sandbox for as long as the candidate's
+tests take to run. This module runs those evaluations on a dedicated thread
+pool so they never block the event loop, caps how many run at once across the
+whole process, and starts waiting jobs from the least recently served user so one
+candidate submitting repeatedly cannot starve the others.
+
+Jobs can be awaited directly (`run`) or submitted and later polled by job id
+(`submit` / `get_job` / `wait`), so long test suites do not need to hold an HTTP
+request open.
+"""
+import asyncio
+import functools
+import itertools
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from ai_interviewer.utils.config import get_sandbox_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class CodeExecutionService:
+    """
+    Fair, bounded executor for blocking code evaluation calls.
+
+    Scheduling state is only touched from the event loop; the blocking work runs
+    on the service's own thread pool. Jobs are plain dicts; `get_job` returns a
+    copy without the internal (underscore-prefixed) fields.
+    """
+
+    def __init__(self,
+                 max_concurrency: Optional[int] = None,
+                 max_concurrent_per_user: Optional[int] = None,
+                 max_queued_per_user: Optional[int] = None,
+                 job_ttl: Optional[float] = None,
+                 max_jobs: int = 10000):
+        """
+        Initialize the service.
+
+        Settings default to the values from get_sandbox_config().
+
+        Args:
+            max_concurrency: Maximum number of jobs running at once
+            max_concurrent_per_user: Maximum number of running jobs per user
+            max_queued_per_user: Maximum number of waiting jobs per user
+            job_ttl: Seconds a finished job stays available for polling
+            max_jobs: Maximum number of finished jobs to keep
+        """
+        config = get_sandbox_config()
+
+        self.max_concurrency = max(1, max_concurrency if max_concurrency is not None else config["max_concurrency"])
+        self.max_concurrent_per_user = max(1, max_concurrent_per_user if max_concurrent_per_user is not None else config["max_concurrent_per_user"])
+        self.max_queued_per_user = max(1, max_queued_per_user if max_queued_per_user is not None else config["max_queued_per_user"])
+        self.job_ttl = job_ttl if job_ttl is not None else config["job_ttl"]
+        self.max_jobs = max_jobs
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="code-execution")
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Waiting job ids per user
+        self._pending: "OrderedDict[str, deque]" = OrderedDict()
+        self._running_per_user: Dict[str, int] = {}
+        # Sequence number of the last job started per active user; lowest goes next
+        self._last_served: Dict[str, int] = {}
+        self._serve_sequence = itertools.count()
+        self._running = 0
+        self._tasks = set()
+
+        self.stats = {"submitted": 0, "rejected": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+    def submit(self, user_id: str, func: Callable[..., Any], *args, **kwargs) -> Optional[str]:
+        """
+        Queue a blocking call for execution.
+
+        Must be called from within the running event loop.
+
+        Args:
+            user_id: Key used for per-user limits and fair scheduling
+            func: Blocking callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Job id, or None if the user already has too many jobs waiting
+        """
+        self._expire_jobs()
+
+        if len(self._pending.get(user_id, ())) >= self.max_queued_per_user:
+            self.stats["rejected"] += 1
+            logger.warning(f"Rejected code execution for {user_id}: {self.max_queued_per_user} jobs already queued")
+            return None
+
+        job_id = uuid.uuid4().hex
+        self._jobs[job_id] = {
+            "job_id": job_id,
+            "user_id": user_id,
+            "status": "queued",
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+            "_call": functools.partial(func, *args, **kwargs),
+            "_done": asyncio.get_running_loop().create_future(),
+            "_exception": None
+        }
+        self._pending.setdefault(user_id, deque()).append(job_id)
+        self.stats["submitted"] += 1
+
+        self._dispatch()
+        return job_id
+
+    async def run(self, user_id: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call through the service and wait for its result.
+
+        Args:
+            user_id: Key used for per-user limits and fair scheduling
+            func: Blocking callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of func
+
+        Raises:
+            RuntimeError: If the user already has too many jobs waiting
+        """
+        job_id = self.submit(user_id, func, *args, **kwargs)
+        if job_id is None:
+            raise RuntimeError("Too many code executions are already queued for this user")
+
+        try:
+            await self.wait(job_id)
+        except asyncio.CancelledError:
+            # Nobody is waiting for the result any more
+            self.cancel(job_id)
+            raise
+
+        job = self._jobs[job_id]
+        if job["_exception"] is not None:
+            raise job["_exception"]
+        return job["result"]
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a job to finish.
+
+        Args:
+            job_id: Job id from submit
+            timeout: Maximum seconds to wait; None waits until the job finishes
+
+        Returns:
+            Job status as returned by get_job (possibly still queued or running
+            if the timeout expired), or None for an unknown job
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+
+        try:
+            await asyncio.wait_for(asyncio.shield(job["_done"]), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a job.
+
+        Args:
+            job_id: Job id from submit
+
+        Returns:
+            Job status dictionary, or None for an unknown or expired job
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+
+        status = {key: value for key, value in job.items() if not key.startswith("_")}
+        if job["status"] == "queued":
+            status["queue_position"] = list(self._pending.get(job["user_id"], ())).index(job_id) + 1
+        return status
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job that has not started yet.
+
+        Args:
+            job_id: Job id from submit
+
+        Returns:
+            True if the job was removed from the queue
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job["status"] != "queued":
+            return False
+
+        queue = self._pending.get(job["user_id"])
+        queue.remove(job_id)
+        if not queue:
+            del self._pending[job["user_id"]]
+
+        job["status"] = "cancelled"
+        job["finished_at"] = time.time()
+        job["_done"].set_result(None)
+        self.stats["cancelled"] += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get service statistics.
+
+        Returns:
+            Counters plus current queue and concurrency figures
+        """
+        return {
+            **self.stats,
+            "running": self._running,
+            "queued": sum(len(queue) for queue in self._pending.values()),
+            "max_concurrency": self.max_concurrency
+        }
+
+    def shutdown(self) -> None:
+        """Stop the thread pool, abandoning jobs that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch(self) -> None:
+        """Start waiting jobs, least recently served user first, while capacity allows."""
+        while self._running < self.max_concurrency and self._pending:
+            eligible = [
+                user for user in self._pending
+                if self._running_per_user.get(user, 0) < self.max_concurrent_per_user
+            ]
+            if not eligible:
+                # Every waiting user is at their own limit
+                return
+
+            user_id = min(eligible, key=lambda user: self._last_served.get(user, -1))
+            queue = self._pending[user_id]
+            job_id = queue.popleft()
+            if not queue:
+                del self._pending[user_id]
+            self._last_served[user_id] = next(self._serve_sequence)
+
+            job = self._jobs[job_id]
+            job["status"] = "running"
+            job["started_at"] = time.time()
+            self._running += 1
+            self._running_per_user[user_id] = self._running_per_user.get(user_id, 0) + 1
+
+            task = asyncio.get_running_loop().create_task(self._run_job(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_job(self, job: Dict[str, Any]) -> None:
+        """
+        Run a job on the thread pool and record its outcome.
+
+        Args:
+            job: Job to run
+        """
+        try:
+            job["result"] = await asyncio.get_running_loop().run_in_executor(self._executor, job["_call"])
+            job["status"] = "completed"
+            self.stats["completed"] += 1
+        except Exception as e:
+            logger.error(f"Code execution job {job['job_id']} failed: {e}")
+            job["status"] = "failed"
+            job["error"] = str(e)
+            job["_exception"] = e
+            self.stats["failed"] += 1
+        finally:
+            job["finished_at"] = time.time()
+            job["_call"] = None
+            self._running -= 1
+            user_id = job["user_id"]
+            self._running_per_user[user_id] -= 1
+            if not self._running_per_user[user_id]:
+                del self._running_per_user[user_id]
+                if user_id not in self._pending:
+                    self._last_served.pop(user_id, None)
+            if not job["_done"].done():
+                job["_done"].set_result(None)
+            self._dispatch()
+
+    def _expire_jobs(self) -> None:
+        """Forget finished jobs past their TTL, or the oldest ones over max_jobs."""
+        now = time.time()
+        finished = [
+            job_id for job_id, job in self._jobs.items()
+            if job["finished_at"] is not None
+        ]
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in finished:
+            if now - self._jobs[job_id]["finished_at"] > self.job_ttl or excess > 0:
+                del self._jobs[job_id]
+                excess -= 1
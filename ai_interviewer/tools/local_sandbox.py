@@ -0,0 +1,472 @@
+"""
+Subprocess-based code execution sandbox for hosts without Docker.
+
+Candidate code never runs in the server process. Each submission is handed to
+a pre-started, single-use worker process that:
+
+- applies `resource.setrlimit` limits on CPU time, address space, open files,
+  file size and core dumps to itself,
+- drops to an unprivileged user (SANDBOX_LOCAL_RUN_AS_UID, nobody by
+  default) if the server runs as root,
+- moves itself into fresh user and network namespaces, which leaves it
+  without any network interface (no seccomp needed), and
+- runs the structured test runner from runner_protocol in a private temporary
+  directory, with only PATH and LANG in its environment.
+
+If the kernel does not allow the namespaces, the worker refuses to run the
+code unless SANDBOX_LOCAL_ALLOW_UNISOLATED is set, because the code would
+otherwise have network access.
+
+The parent enforces a hard wall-clock limit by killing the worker's whole
+process group. Workers are started ahead of time so interpreter start-up is
+off the request path, and are replaced after every job.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import selectors
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from ai_interviewer.tools.runner_protocol import (
+    JAVASCRIPT_TEST_RUNNER,
+    PYTHON_TEST_RUNNER,
+    RUNNER_CONFIG_FILE,
+    RunnerEventParser,
+    build_runner_config,
+    summarize_runner_events
+)
+from ai_interviewer.utils.config import get_sandbox_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Same defaults as the Docker sandbox
+DEFAULT_MEMORY_LIMIT = "128m"
+DEFAULT_CPU_LIMIT = 0.5
+DEFAULT_TIMEOUT = 10
+DEFAULT_TEST_TIMEOUT = 3
+
+# Limits that do not come from the caller
+MAX_OPEN_FILES = 64
+MAX_FILE_SIZE = 10 * 1024 * 1024
+MAX_OUTPUT_BYTES = 1024 * 1024
+
+# Runs inside each worker. Blocks until a job arrives on stdin, locks the
+# process down and then runs the test runner (Python) or execs it (Node.js).
+WORKER_BOOTSTRAP = r'''
+import ctypes, json, os, resource, runpy, shutil, sys
+
+job = json.loads(sys.stdin.readline())
+os.chdir(job["workdir"])
+
+
+def limit(kind, value):
+    soft, hard = resource.getrlimit(kind)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    try:
+        resource.setrlimit(kind, (value, value))
+    except (ValueError, OSError):
+        pass
+
+
+limits = job["limits"]
+limit(resource.RLIMIT_CPU, limits["cpu_seconds"])
+limit(resource.RLIMIT_NOFILE, limits["max_open_files"])
+limit(resource.RLIMIT_FSIZE, limits["max_file_size"])
+limit(resource.RLIMIT_CORE, 0)
+if job["language"] == "python":
+    # V8 reserves far more address space than it uses, so Node.js gets a heap limit instead
+    limit(resource.RLIMIT_AS, limits["memory_bytes"])
+
+if job["run_as"] is not None:
+    os.setgroups([])
+    os.setgid(job["run_as"])
+    os.setuid(job["run_as"])
+
+network = "enabled"
+if job["disable_network"]:
+    flags = 0x10000000 | 0x40000000  # CLONE_NEWUSER | CLONE_NEWNET
+    try:
+        if hasattr(os, "unshare"):
+            os.unshare(flags)
+        elif ctypes.CDLL(None, use_errno=True).unshare(flags) != 0:
+            raise OSError(ctypes.get_errno(), "unshare failed")
+        network = "isolated"
+    except (OSError, AttributeError):
+        network = "unavailable"
+
+refused = network == "unavailable" and not job["allow_unisolated"]
+sys.stdout.write(json.dumps({"event": "sandbox", "backend": "local", "network": network, "refused": refused}) + "\n")
+sys.stdout.flush()
+if refused:
+    sys.exit(3)
+
+if job["language"] == "python":
+    sys.argv = ["runner.py"]
+    runpy.run_path("runner.py", run_name="__main__")
+else:
+    node = shutil.which("node") or "node"
+    os.execv(node, [node, "--max-old-space-size=%d" % max(16, limits["memory_bytes"] // (1024 * 1024)), "runner.js"])
+'''
+
+LANGUAGE_FILES = {
+    "python": {"code": "code.py", "runner": "runner.py", "source": PYTHON_TEST_RUNNER},
+    "javascript": {"code": "code.js", "runner": "runner.js", "source": JAVASCRIPT_TEST_RUNNER},
+}
+
+
+def parse_memory_limit(memory_limit: str) -> int:
+    """
+    Convert a Docker-style memory limit to bytes.
+
+    Args:
+        memory_limit: Limit such as "128m", "1g" or a byte count
+
+    Returns:
+        Limit in bytes
+    """
+    units = {"k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+    value = str(memory_limit).strip().lower().rstrip("b")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+class LocalSandbox:
+    """
+    Local process sandbox with the same execute_code interface as DockerSandbox.
+    """
+
+    def __init__(self, pool_size: Optional[int] = None, python_executable: Optional[str] = None):
+        """
+        Initialize the sandbox and start warm workers in the background.
+
+        Args:
+            pool_size: Number of idle workers to keep ready (defaults to get_sandbox_config())
+            python_executable: Interpreter for the workers (defaults to the server's)
+        """
+        if os.name != "posix":
+            raise RuntimeError("The local sandbox requires a POSIX system")
+
+        config = get_sandbox_config()
+        self.pool_size = max(0, pool_size if pool_size is not None else config["local_pool_size"])
+        self.python_executable = python_executable or sys.executable
+        self.allow_unisolated = config["local_allow_unisolated"]
+        # Never run candidate code as root
+        run_as = config["local_run_as_uid"]
+        self.run_as = run_as if os.geteuid() == 0 and run_as >= 0 else None
+
+        self._idle: "queue.Queue[subprocess.Popen]" = queue.Queue()
+        self._closed = False
+        self.stats = {"runs": 0, "timeouts": 0, "killed": 0}
+
+        threading.Thread(target=self._fill_pool, daemon=True).start()
+        atexit.register(self.shutdown)
+        logger.info(f"Local process sandbox initialized ({self.pool_size} warm workers)")
+
+    def execute_code(
+        self,
+        language: str,
+        code: str,
+        test_cases: List[Dict[str, Any]],
+        function_name: Optional[str] = None,
+        memory_limit: str = DEFAULT_MEMORY_LIMIT,
+        cpu_limit: float = DEFAULT_CPU_LIMIT,
+        timeout: int = DEFAULT_TIMEOUT,
+        network_disabled: bool = True,
+        per_test_timeout: Optional[float] = DEFAULT_TEST_TIMEOUT,
+        stop_on_hidden_failure: bool = False,
+        on_test_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute code in a resource-limited worker process.
+
+        Args:
+            language: Programming language (python, javascript)
+            code: Source code to execute
+            test_cases: List of test cases to run against the code
+            function_name: Name of the function to test (optional, will be extracted if not provided)
+            memory_limit: Memory limit (e.g., "128m"); address space for Python, heap size for Node.js
+            cpu_limit: Accepted for interface compatibility; processes cannot be throttled
+                without cgroups, so only total CPU time is limited
+            timeout: Wall-clock limit in seconds; the worker is killed when it expires
+            network_disabled: Whether to cut the worker off from the network
+            per_test_timeout: Time limit per test case in seconds (None for no limit)
+            stop_on_hidden_failure: Skip the remaining tests after the first failing hidden test
+            on_test_result: Called with each test result as soon as that test finishes
+
+        Returns:
+            Dictionary with execution results
+        """
+        language = language.lower()
+        if language == "js":
+            language = "javascript"
+        if language not in LANGUAGE_FILES:
+            return {
+                "status": "error",
+                "message": f"Unsupported language: {language}",
+                "error": True
+            }
+        if language == "javascript" and shutil.which("node") is None:
+            return {
+                "status": "error",
+                "message": "Node.js is not installed",
+                "error": True
+            }
+
+        files = LANGUAGE_FILES[language]
+        workdir = tempfile.mkdtemp(prefix="ai_interviewer_")
+        try:
+            for name, content in {
+                files["code"]: code,
+                files["runner"]: files["source"],
+                "test_cases.json": json.dumps(test_cases),
+                RUNNER_CONFIG_FILE: build_runner_config(function_name, per_test_timeout, stop_on_hidden_failure)
+            }.items():
+                with open(os.path.join(workdir, name), "w") as f:
+                    f.write(content)
+            if self.run_as is not None:
+                # The only directory the unprivileged worker can write to
+                os.chown(workdir, self.run_as, self.run_as)
+
+            job = {
+                "workdir": workdir,
+                "language": language,
+                "disable_network": network_disabled,
+                "allow_unisolated": self.allow_unisolated,
+                "run_as": self.run_as,
+                "limits": {
+                    # The wall-clock kill normally fires first; this catches CPU spinning in children
+                    "cpu_seconds": int(timeout) + 1,
+                    "memory_bytes": parse_memory_limit(memory_limit),
+                    "max_open_files": MAX_OPEN_FILES,
+                    "max_file_size": MAX_FILE_SIZE
+                }
+            }
+
+            def report_test(event: Dict[str, Any]) -> None:
+                if event["event"] == "test":
+                    on_test_result({key: value for key, value in event.items() if key != "event"})
+            parser = RunnerEventParser(report_test if on_test_result is not None else None)
+
+            output = self._run_job(job, timeout, parser.feed)
+            parser.close()
+
+            if output["truncated"]:
+                return {
+                    "status": "error",
+                    "message": "Execution produced too much output",
+                    "logs": output["stderr"][:10000],
+                    "error": True
+                }
+
+            sandbox_event = next((e for e in parser.events if e["event"] == "sandbox"), None)
+            if sandbox_event and sandbox_event.get("refused"):
+                logger.error("Local sandbox refused to run code: network isolation is unavailable on this host")
+                return {
+                    "status": "error",
+                    "message": "Code execution is unavailable: the sandbox cannot isolate the network on this host",
+                    "sandbox": {key: value for key, value in sandbox_event.items() if key != "event"},
+                    "error": True
+                }
+
+            results = summarize_runner_events(parser.events, output["stderr"], timed_out=output["timed_out"])
+            if sandbox_event:
+                results["sandbox"] = {key: value for key, value in sandbox_event.items() if key != "event"}
+            if output["exit_code"] and output["exit_code"] < 0 and results["status"] == "success":
+                # Killed by a signal, e.g. SIGXCPU from the CPU limit
+                results.update({
+                    "status": "error",
+                    "message": f"Execution was killed by signal {-output['exit_code']}",
+                    "error": True
+                })
+            return results
+        except Exception as e:
+            logger.error(f"Local sandbox execution error: {e}")
+            return {
+                "status": "error",
+                "message": f"Execution error: {str(e)}",
+                "error": True
+            }
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def check_docker_requirements(self) -> Dict[str, Any]:
+        """
+        Report availability, mirroring DockerSandbox.check_docker_requirements.
+
+        Returns:
+            Dictionary with check results
+        """
+        return {
+            "status": "success",
+            "docker_available": False,
+            "backend": "local",
+            "node_available": shutil.which("node") is not None
+        }
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get warm worker statistics, mirroring DockerSandbox.get_pool_stats.
+
+        Returns:
+            Statistics for the single pool shared by all languages
+        """
+        return {
+            "local": {
+                **self.stats,
+                "size": self.pool_size,
+                "idle": self._idle.qsize()
+            }
+        }
+
+    def shutdown(self) -> None:
+        """Kill all idle workers."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._kill(worker)
+
+    def _run_job(self, job: Dict[str, Any], timeout: float, on_stdout: Callable[[bytes], None]) -> Dict[str, Any]:
+        """
+        Hand a job to a worker and collect its output until exit or the deadline.
+
+        Args:
+            job: Job description for the worker bootstrap
+            timeout: Wall-clock limit in seconds
+            on_stdout: Called with each chunk of stdout as it arrives
+
+        Returns:
+            Dictionary with exit_code, stderr, timed_out and truncated
+        """
+        worker = self._acquire()
+        # Each worker runs exactly one job
+        threading.Thread(target=self._fill_pool, daemon=True).start()
+
+        deadline = time.monotonic() + timeout
+        stderr = bytearray()
+        received = 0
+        timed_out = False
+        truncated = False
+
+        try:
+            worker.stdin.write((json.dumps(job) + "\n").encode("utf-8"))
+            worker.stdin.close()
+
+            selector = selectors.DefaultSelector()
+            selector.register(worker.stdout, selectors.EVENT_READ, "stdout")
+            selector.register(worker.stderr, selectors.EVENT_READ, "stderr")
+            try:
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+                    for key, _ in selector.select(remaining):
+                        data = os.read(key.fileobj.fileno(), 65536)
+                        if not data:
+                            selector.unregister(key.fileobj)
+                            continue
+                        received += len(data)
+                        if key.data == "stdout":
+                            on_stdout(data)
+                        else:
+                            stderr.extend(data)
+                    if received > MAX_OUTPUT_BYTES:
+                        truncated = True
+                        break
+            finally:
+                selector.close()
+        finally:
+            if timed_out or truncated:
+                self._kill(worker)
+            try:
+                exit_code = worker.wait(timeout=max(0.1, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                # Output closed but the process lingers (e.g. a detached child)
+                timed_out = True
+                self._kill(worker)
+                exit_code = worker.wait()
+            # Anything the worker left running in its process group goes too
+            self._kill(worker)
+            for stream in (worker.stdout, worker.stderr):
+                stream.close()
+
+        self.stats["runs"] += 1
+        if timed_out:
+            self.stats["timeouts"] += 1
+
+        return {
+            "exit_code": exit_code,
+            "stderr": stderr.decode("utf-8", errors="replace"),
+            "timed_out": timed_out,
+            "truncated": truncated
+        }
+
+    def _acquire(self) -> subprocess.Popen:
+        """
+        Take a warm worker, or start one if none is ready.
+
+        Returns:
+            Worker process waiting for a job on stdin
+        """
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return self._start_worker()
+            if worker.poll() is None:
+                return worker
+
+    def _fill_pool(self) -> None:
+        """Start workers until pool_size are idle."""
+        while not self._closed and self._idle.qsize() < self.pool_size:
+            try:
+                self._idle.put(self._start_worker())
+            except Exception as e:
+                logger.error(f"Failed to start local sandbox worker: {e}")
+                return
+
+    def _start_worker(self) -> subprocess.Popen:
+        """
+        Start a worker process in its own session, with a minimal environment.
+
+        Returns:
+            Worker process
+        """
+        return subprocess.Popen(
+            [self.python_executable, "-I", "-c", WORKER_BOOTSTRAP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=tempfile.gettempdir(),
+            env={"PATH": os.environ.get("PATH", "/usr/bin:/bin"), "LANG": "C.UTF-8"},
+            start_new_session=True,
+            close_fds=True
+        )
+
+    def _kill(self, worker: subprocess.Popen) -> None:
+        """
+        Kill a worker and everything in its process group.
+
+        Args:
+            worker: Worker process
+        """
+        try:
+            os.killpg(worker.pid, signal.SIGKILL)
+            self.stats["killed"] += 1
+        except (ProcessLookupError, PermissionError):
+            pass
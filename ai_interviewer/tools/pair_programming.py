@@ -13,10 +13,11 @@ import ast
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
 import re
 
 from ai_interviewer.tools.code_quality import CodeQualityMetrics
+from ai_interviewer.utils.llm_gateway import get_llm_gateway
+from ai_interviewer.utils.response_cache import get_response_cache, normalize_code, normalize_text
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -243,6 +244,21 @@ class HintGenerator:
     def _generate_llm_based_hints(code: str, challenge_info: Dict, error_message: Optional[str] = None) -> List[str]:
         """Generate hints using an LLM when other hints aren't sufficient."""
         try:
+            # The same challenge, code and error get the same hints across candidates
+            cache = get_response_cache()
+            cache_key = None
+            if cache and cache.is_enabled("hints"):
+                challenge = challenge_info.get("id") or challenge_info.get("description", "")
+                cache_key = cache.make_key(
+                    "hints",
+                    challenge=challenge,
+                    code=normalize_code(code),
+                    error=normalize_text(error_message)
+                )
+                cached = cache.get("hints", cache_key)
+                if cached is not None:
+                    return cached
+            
             # Create a prompt for the LLM
             prompt_template = """
             You are an expert programming mentor. Based on the code and challenge below, provide 2-3 helpful hints
@@ -274,11 +290,8 @@ class HintGenerator:
                 ))
             ]
             
-            # Get model from config (in production, this should use the configured model)
-            llm = ChatGoogleGenerativeAI(model="gemini-1.5-pro", temperature=0.2)
-            
-            # Generate response
-            response = llm.invoke(messages)
+            # Generate response through the shared gateway
+            response = get_llm_gateway().invoke(messages, model="gemini-1.5-pro", temperature=0.2)
             
             # Parse response into hints
             hint_text = response.content
@@ -291,6 +304,9 @@ class HintGenerator:
             # Take up to 3 hints
             hints = hints[:3]
             
+            if cache_key and hints:
+                cache.put("hints", cache_key, hints)
+            
             return hints
             
         except Exception as e:
@@ -740,9 +756,8 @@ def _generate_context_aware_suggestions(code: str, context: Dict) -> List[str]:
             HumanMessage(content=prompt_template.format(code=code, context=context_str))
         ]
         
-        # Get model response
-        llm = ChatGoogleGenerativeAI(model="gemini-1.5-pro", temperature=0.2)
-        response = llm.invoke(messages)
+        # Get model response through the shared gateway
+        response = get_llm_gateway().invoke(messages, model="gemini-1.5-pro", temperature=0.2)
         
         # Parse response into suggestions
         suggestion_text = response.content
@@ -789,9 +804,8 @@ def _generate_llm_completion(code: str, context: Optional[str], language: str) -
             ))
         ]
         
-        # Get model response
-        llm = ChatGoogleGenerativeAI(model="gemini-1.5-pro", temperature=0.2)
-        response = llm.invoke(messages)
+        # Get model response through the shared gateway
+        response = get_llm_gateway().invoke(messages, model="gemini-1.5-pro", temperature=0.2)
         
         # Extract code from response
         completion_text = response.content
@@ -815,6 +829,20 @@ def _generate_llm_completion(code: str, context: Optional[str], language: str) -
 def _generate_llm_code_review(code: str, section: Optional[str], language: str) -> List[str]:
     """Generate code review using an LLM."""
     try:
+        # Reviews depend only on the code, the focus section and the language
+        cache = get_response_cache()
+        cache_key = None
+        if cache and cache.is_enabled("code_review"):
+            cache_key = cache.make_key(
+                "code_review",
+                code=normalize_code(code),
+                section=normalize_text(section),
+                language=language
+            )
+            cached = cache.get("code_review", cache_key)
+            if cached is not None:
+                return cached
+        
         # Create a prompt
         prompt_template = """
         You are an expert code reviewer. Review the following code and provide specific, 
@@ -845,9 +873,8 @@ def _generate_llm_code_review(code: str, section: Optional[str], language: str)
             ))
         ]
         
-        # Get model response
-        llm = ChatGoogleGenerativeAI(model="gemini-1.5-pro", temperature=0.2)
-        response = llm.invoke(messages)
+        # Get model response through the shared gateway
+        response = get_llm_gateway().invoke(messages, model="gemini-1.5-pro", temperature=0.2)
         
         # Parse response into review comments
         review_text = response.content
@@ -856,7 +883,12 @@ def _generate_llm_code_review(code: str, section: Optional[str], language: str)
         # Filter out non-comments
         comments = [c for c in comments if len(c) > 10 and len(c) < 200]
         # Take up to 5 comments
-        return comments[:5]
+        comments = comments[:5]
+        
+        if cache_key and comments:
+            cache.put("code_review", cache_key, comments)
+        
+        return comments
     except Exception as e:
         logger.error(f"Error generating LLM review: {e}")
         return []
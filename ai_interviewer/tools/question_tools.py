@@ -10,8 +10,9 @@ from typing import Dict, List, Optional, Any, Union
 import re
 
 from langchain_core.tools import tool
-from langchain_google_genai import ChatGoogleGenerativeAI
 from ai_interviewer.utils.config import get_llm_config
+from ai_interviewer.utils.llm_gateway import get_llm_gateway
+from ai_interviewer.utils.response_cache import get_response_cache, normalize_text
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -47,12 +48,26 @@ def generate_interview_question(
     logger.info(f"Skill areas: {skill_areas}")
     
     try:
-        # Initialize LLM with appropriate temperature for creative but controlled question generation
         llm_config = get_llm_config()
-        model = ChatGoogleGenerativeAI(
-            model=llm_config["model"],
-            temperature=0.4  # Using a slightly higher temperature for question variety
-        )
+        
+        # Without conversation history the question depends only on role, skills and difficulty
+        cache = get_response_cache()
+        cache_key = None
+        if (cache and cache.is_enabled("question") and not previous_questions and not previous_responses
+                and not current_topic and not follow_up_to):
+            cache_key = cache.make_key(
+                "question",
+                job_role=normalize_text(job_role),
+                skill_areas=sorted({normalize_text(skill) for skill in skill_areas or []}),
+                difficulty=normalize_text(difficulty_level)
+            )
+            cached = cache.get("question", cache_key)
+            if cached is not None:
+                # Keep the metadata as this caller spelled it
+                cached["requested_difficulty"] = difficulty_level
+                cached["requested_skill_areas"] = skill_areas
+                cached["job_role"] = job_role
+                return cached
         
         # Format previous Q&A for context
         conversation_context = ""
@@ -119,8 +134,8 @@ Return your response as a valid JSON object containing:
 - "follow_up_questions": 2-3 potential follow-up questions for deeper exploration
 """
         
-        # Call the LLM
-        response = model.invoke(prompt)
+        # Call the LLM with a slightly higher temperature for question variety
+        response = get_llm_gateway().invoke(prompt, model=llm_config["model"], temperature=0.4)
         
         # Process response
         response_content = response.content
@@ -152,6 +167,9 @@ Return your response as a valid JSON object containing:
             result["requested_skill_areas"] = skill_areas
             result["job_role"] = job_role
             
+            if cache_key:
+                cache.put("question", cache_key, result)
+            
             return result
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing LLM response as JSON: {e}")
@@ -221,12 +239,7 @@ def analyze_candidate_response(
     logger.info(f"Analyzing candidate response for job role: {job_role}")
     
     try:
-        # Initialize LLM
         llm_config = get_llm_config()
-        model = ChatGoogleGenerativeAI(
-            model=llm_config["model"],
-            temperature=0.1  # Low temperature for objective analysis
-        )
         
         # Build the prompt
         prompt = f"""
@@ -284,8 +297,8 @@ Return your analysis as a valid JSON object with the following fields:
 - "depth_analysis": A paragraph explaining the candidate's depth of understanding
 """
         
-        # Call the LLM
-        response_obj = model.invoke(prompt)
+        # Call the LLM with a low temperature for objective analysis
+        response_obj = get_llm_gateway().invoke(prompt, model=llm_config["model"], temperature=0.1)
         response_content = response_obj.content
         
         # Extract the JSON part
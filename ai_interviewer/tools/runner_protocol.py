@@ -0,0 +1,466 @@
+"""
+Structured test runner protocol for sandboxed code execution.
+
+The test runners in this module execute every test case in a single sandbox
+run and report back over stdout as newline-delimited JSON events, one line per
+event, flushed as soon as each test finishes:
+
+    {"event": "start", "runner_version", "total"}
+    {"event": "test", "test_case_id", "passed", "output", "execution_time",
+     "cpu_time", "peak_memory_kb", "memory_delta_kb", "timed_out", ...}
+    {"event": "error", "error_message", "traceback"}     - setup failed
+    {"event": "end", "stopped_early"}
+
+The runners reserve stdout for these events and send anything the candidate's
+code prints to stderr, so no marker scraping is needed. Each test has its own
+timeout, and the run can optionally stop at the first failing hidden test.
+"""
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Bump when the runners or the event format change
+RUNNER_VERSION = 2
+
+# Runner options file written next to code and test_cases.json
+RUNNER_CONFIG_FILE = "runner_config.json"
+
+PYTHON_TEST_RUNNER = r'''
+import ast
+import io
+import json
+import os
+import resource
+import signal
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+
+# Keep the real stdout for protocol events; anything else written to fd 1
+# (including by the candidate's code) goes to stderr
+_events = os.fdopen(os.dup(1), "w", buffering=1)
+os.dup2(2, 1)
+
+
+def emit(event):
+    _events.write(json.dumps(event, default=repr) + "\n")
+    _events.flush()
+
+
+def fail(message, tb=None):
+    emit({"event": "error", "error_message": message, "traceback": tb})
+    emit({"event": "end", "stopped_early": True})
+    sys.exit(1)
+
+
+class TestTimeout(BaseException):
+    """Raised in the test when its time limit expires; not caught by `except Exception`."""
+
+
+def _on_alarm(signum, frame):
+    raise TestTimeout()
+
+
+signal.signal(signal.SIGALRM, _on_alarm)
+
+with open("code.py", "r") as f:
+    code = f.read()
+with open("test_cases.json", "r") as f:
+    test_cases = json.load(f)
+with open("runner_config.json", "r") as f:
+    config = json.load(f)
+
+emit({"event": "start", "runner_version": config.get("runner_version"), "total": len(test_cases)})
+
+function_name = config.get("function_name") or ""
+if not function_name:
+    try:
+        tree = ast.parse(code)
+        function_name = next(node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef))
+    except StopIteration:
+        fail("Could not identify a function to test: No function definition found in code")
+    except Exception as e:
+        fail(f"Could not identify a function to test: Error parsing code: {e}")
+
+per_test_timeout = config.get("per_test_timeout") or 0
+stop_on_hidden_failure = config.get("stop_on_hidden_failure", False)
+
+namespace = {}
+try:
+    if per_test_timeout:
+        signal.setitimer(signal.ITIMER_REAL, per_test_timeout)
+    try:
+        exec(code, namespace)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+except TestTimeout:
+    fail(f"Loading the code timed out after {per_test_timeout}s")
+except BaseException as e:
+    fail(f"Error executing code: {e}", traceback.format_exc())
+
+if function_name not in namespace:
+    fail(f"Function '{function_name}' not found in code")
+function = namespace[function_name]
+
+
+def outputs_match(actual, expected):
+    if actual == expected:
+        return True
+    if (isinstance(actual, (list, tuple)) and isinstance(expected, (list, tuple))
+            and len(actual) == len(expected)
+            and all(a == e for a, e in zip(actual, expected))):
+        return True
+    if (isinstance(actual, dict) and isinstance(expected, dict)
+            and len(actual) == len(expected)
+            and all(actual.get(k) == v for k, v in expected.items())):
+        return True
+    return False
+
+
+def peak_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+stopped_early = False
+
+for i, test_case in enumerate(test_cases):
+    test_input = test_case["input"]
+    expected_output = test_case["expected_output"]
+    timeout = test_case.get("timeout") or per_test_timeout
+
+    test_result = {
+        "event": "test",
+        "test_case_id": i + 1,
+        "input": test_input,
+        "expected_output": expected_output,
+        "is_hidden": test_case.get("is_hidden", False),
+        "explanation": test_case.get("explanation", ""),
+        "passed": False,
+        "timed_out": False,
+        "output": None,
+        "error": None
+    }
+
+    stdout_buffer = io.StringIO()
+    stderr_buffer = io.StringIO()
+    rss_before = peak_rss_kb()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    try:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
+                if isinstance(test_input, (list, tuple)):
+                    actual_output = function(*test_input)
+                elif isinstance(test_input, dict):
+                    actual_output = function(**test_input)
+                else:
+                    actual_output = function(test_input)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        test_result["output"] = actual_output
+        test_result["passed"] = outputs_match(actual_output, expected_output)
+    except TestTimeout:
+        test_result["timed_out"] = True
+        test_result["error"] = f"Test timed out after {timeout}s"
+    except (Exception, SystemExit) as e:
+        test_result["error"] = str(e) or type(e).__name__
+        test_result["traceback"] = traceback.format_exc()
+
+    test_result["execution_time"] = time.perf_counter() - wall_start
+    test_result["cpu_time"] = time.process_time() - cpu_start
+    peak = peak_rss_kb()
+    test_result["peak_memory_kb"] = peak
+    test_result["memory_delta_kb"] = peak - rss_before
+    if stdout_buffer.getvalue():
+        test_result["stdout"] = stdout_buffer.getvalue()
+    if stderr_buffer.getvalue():
+        test_result["stderr"] = stderr_buffer.getvalue()
+
+    emit(test_result)
+
+    if stop_on_hidden_failure and test_result["is_hidden"] and not test_result["passed"]:
+        stopped_early = i + 1 < len(test_cases)
+        break
+
+emit({"event": "end", "stopped_early": stopped_early})
+'''
+
+JAVASCRIPT_TEST_RUNNER = r'''
+const fs = require('fs');
+const vm = require('vm');
+
+// Keep the real stdout for protocol events; anything else written to stdout
+// goes to stderr
+const writeEvent = process.stdout.write.bind(process.stdout);
+process.stdout.write = process.stderr.write.bind(process.stderr);
+
+function emit(event) {
+    writeEvent(JSON.stringify(event) + "\n");
+}
+
+function main() {
+    const code = fs.readFileSync('code.js', 'utf8');
+    const testCases = JSON.parse(fs.readFileSync('test_cases.json', 'utf8'));
+    const config = JSON.parse(fs.readFileSync('runner_config.json', 'utf8'));
+
+    emit({event: "start", runner_version: config.runner_version, total: testCases.length});
+
+    const fail = (message, stack) => {
+        emit({event: "error", error_message: message, stack: stack});
+        emit({event: "end", stopped_early: true});
+        process.exitCode = 1;
+    };
+
+    let functionName = config.function_name || "";
+    if (!functionName) {
+        const functionMatch = code.match(/function\s+([a-zA-Z0-9_$]+)\s*\(/);
+        const arrowMatch = code.match(/(?:const|let|var)\s+([a-zA-Z0-9_$]+)\s*=\s*(?:async\s*)?(?:function\b|\(?[^)=]*\)?\s*=>)/);
+        functionName = functionMatch ? functionMatch[1] : (arrowMatch ? arrowMatch[1] : "");
+        if (!functionName) {
+            return fail("Could not identify a function to test: No function definition found in code");
+        }
+    }
+    if (!/^[A-Za-z_$][\w$]*$/.test(functionName)) {
+        return fail(`Invalid function name '${functionName}'`);
+    }
+
+    // Console output from the candidate's code is captured per test
+    let captured = [];
+    const capture = (...args) => captured.push(args.map(String).join(' '));
+    const context = vm.createContext({console: {log: capture, info: capture, warn: capture, error: capture, debug: capture}});
+
+    const perTestTimeout = config.per_test_timeout || 0;
+    const timeoutMs = (seconds) => seconds ? Math.max(1, Math.round(seconds * 1000)) : undefined;
+
+    try {
+        vm.runInContext(code, context, {filename: 'code.js', timeout: timeoutMs(perTestTimeout)});
+    } catch (e) {
+        return fail(`Error executing code: ${e.message}`, e.stack);
+    }
+    if (vm.runInContext(`typeof ${functionName}`, context) !== 'function') {
+        return fail(`Function '${functionName}' not found in code`);
+    }
+
+    let stoppedEarly = false;
+    for (let i = 0; i < testCases.length; i++) {
+        const testCase = testCases[i];
+        const testInput = testCase.input;
+        const expectedOutput = testCase.expected_output;
+        const timeout = testCase.timeout || perTestTimeout;
+
+        const testResult = {
+            event: "test",
+            test_case_id: i + 1,
+            input: testInput,
+            expected_output: expectedOutput,
+            is_hidden: testCase.is_hidden || false,
+            explanation: testCase.explanation || "",
+            passed: false,
+            timed_out: false,
+            output: null,
+            error: null
+        };
+
+        captured = [];
+        context.__args = Array.isArray(testInput) ? testInput : [testInput];
+        const rssBefore = process.resourceUsage().maxRSS;
+        const cpuStart = process.cpuUsage();
+        const wallStart = process.hrtime.bigint();
+
+        try {
+            const actualOutput = vm.runInContext(`${functionName}(...__args)`, context, {timeout: timeoutMs(timeout)});
+            testResult.output = actualOutput === undefined ? null : actualOutput;
+            testResult.passed = JSON.stringify(actualOutput) === JSON.stringify(expectedOutput);
+        } catch (e) {
+            if (e && e.code === 'ERR_SCRIPT_EXECUTION_TIMEOUT') {
+                testResult.timed_out = true;
+                testResult.error = `Test timed out after ${timeout}s`;
+            } else {
+                testResult.error = e && e.message !== undefined ? e.message : String(e);
+                testResult.stack = e && e.stack;
+            }
+        }
+
+        const cpu = process.cpuUsage(cpuStart);
+        testResult.execution_time = Number(process.hrtime.bigint() - wallStart) / 1e9;
+        testResult.cpu_time = (cpu.user + cpu.system) / 1e6;
+        const peak = process.resourceUsage().maxRSS;
+        testResult.peak_memory_kb = peak;
+        testResult.memory_delta_kb = peak - rssBefore;
+        if (captured.length) {
+            testResult.stdout = captured.join('\n') + '\n';
+        }
+
+        emit(testResult);
+
+        if (config.stop_on_hidden_failure && testResult.is_hidden && !testResult.passed) {
+            stoppedEarly = i + 1 < testCases.length;
+            break;
+        }
+    }
+
+    emit({event: "end", stopped_early: stoppedEarly});
+}
+
+main();
+'''
+
+
+def build_runner_config(function_name: Optional[str] = None,
+                        per_test_timeout: Optional[float] = None,
+                        stop_on_hidden_failure: bool = False) -> str:
+    """
+    Build the contents of the runner options file.
+
+    Args:
+        function_name: Name of the function to test (extracted from code if None)
+        per_test_timeout: Default time limit per test in seconds (None for no limit);
+            a test case's own "timeout" field takes precedence
+        stop_on_hidden_failure: Stop after the first failing hidden test
+
+    Returns:
+        JSON document for RUNNER_CONFIG_FILE
+    """
+    return json.dumps({
+        "runner_version": RUNNER_VERSION,
+        "function_name": function_name or "",
+        "per_test_timeout": per_test_timeout or 0,
+        "stop_on_hidden_failure": stop_on_hidden_failure
+    })
+
+
+class RunnerEventParser:
+    """
+    Incremental parser for the runner's event stream.
+
+    Output may arrive in arbitrary chunks; complete lines are decoded as they
+    become available and handed to an optional callback.
+    """
+
+    def __init__(self, on_event: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize the parser.
+
+        Args:
+            on_event: Called with each event as soon as it is parsed
+        """
+        self.on_event = on_event
+        self.events: List[Dict[str, Any]] = []
+        self.invalid_lines: List[str] = []
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> None:
+        """
+        Add runner output.
+
+        Args:
+            data: Next chunk of the runner's stdout
+        """
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b"\n")
+        for line in lines:
+            self._parse_line(line)
+
+    def close(self) -> None:
+        """Parse any trailing line that was not newline-terminated."""
+        if self._buffer.strip():
+            self._parse_line(self._buffer)
+        self._buffer = b""
+
+    def _parse_line(self, line: bytes) -> None:
+        """
+        Decode a single event line.
+
+        Args:
+            line: Raw line without the newline
+        """
+        text = line.decode("utf-8", errors="replace").strip()
+        if not text:
+            return
+        try:
+            event = json.loads(text)
+        except json.JSONDecodeError:
+            self.invalid_lines.append(text)
+            return
+        if not isinstance(event, dict) or "event" not in event:
+            self.invalid_lines.append(text)
+            return
+
+        self.events.append(event)
+        if self.on_event:
+            try:
+                self.on_event(event)
+            except Exception as e:
+                logger.warning(f"Runner event callback failed: {e}")
+
+
+def summarize_runner_events(events: List[Dict[str, Any]], logs: str = "", timed_out: bool = False) -> Dict[str, Any]:
+    """
+    Build the execution results dictionary from runner events.
+
+    The result has the same shape the sandbox has always returned (status,
+    passed, failed, test_results, detailed_metrics, ...), so tests that finished
+    before a crash or overall timeout are still reported.
+
+    Args:
+        events: Parsed runner events
+        logs: Candidate output and runner diagnostics (stderr)
+        timed_out: Whether the run hit the overall wall-clock limit
+
+    Returns:
+        Dictionary with execution results
+    """
+    start = next((e for e in events if e["event"] == "start"), None)
+    end = next((e for e in events if e["event"] == "end"), None)
+    error = next((e for e in events if e["event"] == "error"), None)
+    test_results = [
+        {key: value for key, value in e.items() if key != "event"}
+        for e in events if e["event"] == "test"
+    ]
+
+    total = start["total"] if start else len(test_results)
+    passed = sum(1 for t in test_results if t.get("passed"))
+    execution_time = sum(t.get("execution_time", 0) for t in test_results)
+
+    results = {
+        "status": "success",
+        "passed": passed,
+        "failed": len(test_results) - passed,
+        "skipped": max(0, total - len(test_results)),
+        "stopped_early": bool(end and end.get("stopped_early")),
+        "error": False,
+        "execution_time": execution_time,
+        "test_results": test_results,
+        "runner_version": start.get("runner_version") if start else None,
+        "logs": logs
+    }
+
+    if error:
+        results["status"] = "error"
+        results["error_message"] = error.get("error_message", "")
+        if error.get("traceback") or error.get("stack"):
+            results["traceback"] = error.get("traceback") or error.get("stack")
+    elif timed_out:
+        results.update({"status": "error", "message": "Execution timed out", "error": True})
+    elif start is None:
+        results.update({"status": "error", "message": "Failed to parse execution results", "error": True})
+    elif end is None:
+        results.update({"status": "error", "message": "Test runner exited before finishing", "error": True})
+
+    results["all_passed"] = results["status"] == "success" and results["failed"] == 0 and results["skipped"] == 0
+    results["detailed_metrics"] = {
+        "avg_execution_time": execution_time / len(test_results) if test_results else 0,
+        "max_execution_time": max((t.get("execution_time", 0) for t in test_results), default=0),
+        "total_cpu_time": sum(t.get("cpu_time", 0) for t in test_results),
+        "peak_memory_kb": max((t.get("peak_memory_kb", 0) for t in test_results), default=0),
+        "timed_out_tests": sum(1 for t in test_results if t.get("timed_out")),
+        "success_rate": passed / total if total else 0
+    }
+    return results
@@ -0,0 +1,460 @@
+"""
+Warm container pool for the Docker code execution sandbox.
+
+Starting a container for every submission costs far more than running the
+candidate's tests. This module keeps a small pool of pre-started, locked-down
+worker containers per language. Each job is sent to an idle worker over the
+stdin of a `docker exec` process: a bootstrap script reads the job's files from
+stdin, writes them to a private directory under the worker's tmpfs and runs the
+test runner there.
+
+Workers are recycled (removed and replaced) after a configurable number of runs
+or as soon as a run faults (timeout, oversized output, exec failure or a failed
+cleanup), so state left behind by one submission cannot accumulate.
+"""
+import json
+import logging
+import queue
+import socket
+import struct
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Label applied to every pooled worker so they can be identified in `docker ps`
+POOL_LABEL = "ai-interviewer.sandbox-pool"
+
+# Unprivileged user ("nobody") that runs candidate code inside workers
+WORKER_USER = "65534:65534"
+
+# Reads {"files": {name: content}} from stdin, writes the files to a fresh
+# directory and runs the test runner from it
+PYTHON_BOOTSTRAP = """
+import json, os, runpy, sys, tempfile
+job = json.load(sys.stdin)
+job_dir = tempfile.mkdtemp(dir="/tmp")
+for name, content in job["files"].items():
+    with open(os.path.join(job_dir, name), "w") as f:
+        f.write(content)
+os.chdir(job_dir)
+sys.argv = ["runner.py"]
+runpy.run_path("runner.py", run_name="__main__")
+"""
+
+JAVASCRIPT_BOOTSTRAP = """
+const fs = require('fs');
+const path = require('path');
+let input = '';
+process.stdin.setEncoding('utf8');
+process.stdin.on('data', chunk => { input += chunk; });
+process.stdin.on('end', () => {
+    const job = JSON.parse(input);
+    const jobDir = fs.mkdtempSync('/tmp/job-');
+    for (const [name, content] of Object.entries(job.files)) {
+        fs.writeFileSync(path.join(jobDir, name), content);
+    }
+    process.chdir(jobDir);
+    require(path.join(jobDir, 'runner.js'));
+});
+"""
+
+BOOTSTRAP_COMMANDS = {
+    "python": ["python", "-c", PYTHON_BOOTSTRAP],
+    "javascript": ["node", "-e", JAVASCRIPT_BOOTSTRAP],
+}
+
+# Kills everything left running by the previous job and wipes the tmpfs.
+# kill -1 never signals PID 1, which keeps the worker itself alive.
+CLEANUP_COMMAND = ["sh", "-c", "kill -9 -1 2>/dev/null; rm -rf /tmp/* /tmp/.[!.]* 2>/dev/null; exit 0"]
+
+
+class ContainerPool:
+    """
+    Pool of pre-started worker containers for a single language.
+
+    Workers are plain dicts holding the container and the number of runs it has
+    served. The pool is thread-safe; `run` can be called from several threads.
+    """
+
+    def __init__(self,
+                 client: Any,
+                 language: str,
+                 image: str,
+                 size: int = 2,
+                 max_runs: int = 25,
+                 memory_limit: str = "128m",
+                 cpu_limit: float = 0.5,
+                 network_disabled: bool = True,
+                 acquire_timeout: float = 15.0,
+                 max_output_bytes: int = 1024 * 1024):
+        """
+        Initialize the pool. No containers are started until `start` or the first run.
+
+        Args:
+            client: docker.DockerClient
+            language: Language key in BOOTSTRAP_COMMANDS
+            image: Docker image for the workers
+            size: Maximum number of workers
+            max_runs: Runs after which a worker is recycled
+            memory_limit: Worker memory limit (e.g., "128m")
+            cpu_limit: Worker CPU limit in cores
+            network_disabled: Whether workers have no network access
+            acquire_timeout: Seconds to wait for an idle worker
+            max_output_bytes: Output size beyond which a run is treated as a fault
+        """
+        if language not in BOOTSTRAP_COMMANDS:
+            raise ValueError(f"No pool bootstrap for language: {language}")
+
+        self.client = client
+        self.language = language
+        self.image = image
+        self.size = max(1, size)
+        self.max_runs = max(1, max_runs)
+        self.memory_limit = memory_limit
+        self.cpu_limit = cpu_limit
+        self.network_disabled = network_disabled
+        self.acquire_timeout = acquire_timeout
+        self.max_output_bytes = max_output_bytes
+        self.command = BOOTSTRAP_COMMANDS[language]
+
+        self._idle: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._lock = threading.Lock()
+        # Workers that exist or are being started
+        self._total = 0
+        self._closed = False
+
+        self.stats = {"runs": 0, "started": 0, "recycled": 0, "faults": 0, "unavailable": 0}
+
+    def start(self) -> int:
+        """
+        Start workers until the pool is full.
+
+        Returns:
+            Number of workers started
+        """
+        started = 0
+        while True:
+            with self._lock:
+                if self._closed or self._total >= self.size:
+                    break
+                self._total += 1
+            worker = self._start_worker()
+            if worker is None:
+                with self._lock:
+                    self._total -= 1
+                break
+            self._idle.put(worker)
+            started += 1
+        return started
+
+    def run(self,
+            files: Dict[str, str],
+            timeout: float,
+            on_stdout: Optional[Callable[[bytes], None]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Run a job on a pooled worker.
+
+        Args:
+            files: File name to content mapping; must include the test runner
+            timeout: Wall-clock limit for the job in seconds
+            on_stdout: Called with each chunk of stdout as it arrives
+
+        Returns:
+            Dictionary with exit_code, stdout, stderr, timed_out and truncated,
+            or None if no worker could be obtained (the caller should fall back
+            to a one-off container)
+        """
+        worker = self.acquire()
+        if worker is None:
+            return None
+
+        faulted = True
+        try:
+            result = self._exec_job(worker, files, timeout, on_stdout)
+            faulted = result["timed_out"] or result["truncated"]
+            return result
+        except Exception as e:
+            logger.error(f"Pooled {self.language} worker failed: {e}")
+            return None
+        finally:
+            self.release(worker, faulted=faulted)
+
+    def acquire(self) -> Optional[Dict[str, Any]]:
+        """
+        Take an idle worker, starting one if the pool is not yet full.
+
+        Returns:
+            Worker dict, or None if none became available within acquire_timeout
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_start = not self._closed and self._total < self.size
+            if can_start:
+                self._total += 1
+        if can_start:
+            worker = self._start_worker()
+            if worker is not None:
+                return worker
+            with self._lock:
+                self._total -= 1
+
+        try:
+            return self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            with self._lock:
+                self.stats["unavailable"] += 1
+            logger.warning(f"No {self.language} sandbox worker available after {self.acquire_timeout}s")
+            return None
+
+    def release(self, worker: Dict[str, Any], faulted: bool = False) -> None:
+        """
+        Return a worker to the pool, recycling it if needed.
+
+        Args:
+            worker: Worker dict from acquire
+            faulted: Whether the run on this worker faulted
+        """
+        worker["runs"] += 1
+        with self._lock:
+            self.stats["runs"] += 1
+            if faulted:
+                self.stats["faults"] += 1
+
+        if self._closed:
+            self._discard(worker)
+            return
+
+        if not faulted and worker["runs"] < self.max_runs and self._reset_worker(worker):
+            self._idle.put(worker)
+            return
+
+        # Replace the worker off the request path
+        with self._lock:
+            self.stats["recycled"] += 1
+        threading.Thread(target=self._replace_worker, args=(worker,), daemon=True).start()
+
+    def shutdown(self) -> None:
+        """Stop accepting work and remove all idle workers."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(worker)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Counters plus current worker counts
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            total = self._total
+        return {
+            **stats,
+            "language": self.language,
+            "size": self.size,
+            "workers": total,
+            "idle": self._idle.qsize()
+        }
+
+    def _start_worker(self) -> Optional[Dict[str, Any]]:
+        """
+        Start a locked-down worker container that idles until jobs are exec'd into it.
+
+        Returns:
+            Worker dict, or None if the container could not be started
+        """
+        try:
+            container = self.client.containers.run(
+                self.image,
+                command=["sleep", "infinity"],
+                name=f"ai-interviewer-{self.language}-pool-{uuid.uuid4().hex[:8]}",
+                labels={POOL_LABEL: self.language},
+                detach=True,
+                auto_remove=True,
+                read_only=True,
+                # The only writable location; wiped between jobs
+                tmpfs={"/tmp": "rw,nosuid,nodev,size=64m,mode=1777"},
+                working_dir="/tmp",
+                environment={"HOME": "/tmp"},
+                user=WORKER_USER,
+                mem_limit=self.memory_limit,
+                cpu_quota=int(self.cpu_limit * 100000),  # Docker CPU quota in microseconds
+                pids_limit=64,
+                network_disabled=self.network_disabled,
+                cap_drop=["ALL"],
+                security_opt=["no-new-privileges"],
+            )
+            with self._lock:
+                self.stats["started"] += 1
+            logger.info(f"Started {self.language} sandbox worker {container.name}")
+            return {"container": container, "runs": 0}
+        except Exception as e:
+            logger.error(f"Failed to start {self.language} sandbox worker: {e}")
+            return None
+
+    def _replace_worker(self, worker: Dict[str, Any]) -> None:
+        """
+        Remove a worker and start a fresh one in its place.
+
+        Args:
+            worker: Worker to replace
+        """
+        self._discard(worker)
+        replacement = None if self._closed else self._start_worker()
+        if replacement is None:
+            with self._lock:
+                self._total -= 1
+            return
+        if self._closed:
+            self._discard(replacement)
+            return
+        self._idle.put(replacement)
+
+    def _discard(self, worker: Dict[str, Any]) -> None:
+        """
+        Remove a worker's container.
+
+        Args:
+            worker: Worker to remove
+        """
+        try:
+            worker["container"].remove(force=True)
+        except Exception as e:
+            logger.debug(f"Failed to remove sandbox worker: {e}")
+
+    def _reset_worker(self, worker: Dict[str, Any]) -> bool:
+        """
+        Kill leftover processes and clear the worker's tmpfs.
+
+        Args:
+            worker: Worker to reset
+
+        Returns:
+            True if the worker is clean and can be reused
+        """
+        try:
+            exit_code, _ = worker["container"].exec_run(CLEANUP_COMMAND, user=WORKER_USER)
+            return exit_code == 0
+        except Exception as e:
+            logger.warning(f"Failed to reset sandbox worker: {e}")
+            return False
+
+    def _exec_job(self,
+                  worker: Dict[str, Any],
+                  files: Dict[str, str],
+                  timeout: float,
+                  on_stdout: Optional[Callable[[bytes], None]] = None) -> Dict[str, Any]:
+        """
+        Exec the bootstrap in a worker and stream the job in over stdin.
+
+        Args:
+            worker: Worker to run on
+            files: Files for the job
+            timeout: Wall-clock limit in seconds
+            on_stdout: Called with each chunk of stdout as it arrives
+
+        Returns:
+            Dictionary with exit_code, stdout, stderr, timed_out and truncated
+        """
+        api = self.client.api
+        exec_id = api.exec_create(
+            worker["container"].id,
+            self.command,
+            stdin=True,
+            stdout=True,
+            stderr=True,
+            user=WORKER_USER,
+            workdir="/tmp"
+        )["Id"]
+        response_socket = api.exec_start(exec_id, socket=True)
+        # exec_start returns the socket wrapped in a SocketIO on most transports
+        raw = getattr(response_socket, "_sock", response_socket)
+
+        try:
+            raw.sendall(json.dumps({"files": files}).encode("utf-8"))
+            raw.shutdown(socket.SHUT_WR)
+            output = self._read_output(raw, time.monotonic() + timeout, on_stdout)
+        finally:
+            try:
+                response_socket.close()
+            except Exception:
+                pass
+
+        exit_code = None
+        if not output["timed_out"]:
+            exit_code = api.exec_inspect(exec_id).get("ExitCode")
+
+        return {"exit_code": exit_code, **output}
+
+    def _read_output(self,
+                     raw: Any,
+                     deadline: float,
+                     on_stdout: Optional[Callable[[bytes], None]] = None) -> Dict[str, Any]:
+        """
+        Read multiplexed exec output until EOF, the deadline or the output cap.
+
+        Args:
+            raw: Socket attached to the exec process
+            deadline: time.monotonic() value at which the job is abandoned
+            on_stdout: Called with each chunk of stdout as it arrives
+
+        Returns:
+            Dictionary with stdout, stderr, timed_out and truncated
+        """
+        streams: Dict[int, bytearray] = {1: bytearray(), 2: bytearray()}
+        buffer = b""
+        received = 0
+        timed_out = False
+        truncated = False
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            raw.settimeout(remaining)
+            try:
+                chunk = raw.recv(65536)
+            except socket.timeout:
+                timed_out = True
+                break
+            if not chunk:
+                break
+
+            received += len(chunk)
+            buffer += chunk
+            # Each frame is an 8 byte header (stream id, size) followed by the payload
+            while len(buffer) >= 8:
+                stream, size = struct.unpack(">BxxxL", buffer[:8])
+                if len(buffer) < 8 + size:
+                    break
+                payload = buffer[8:8 + size]
+                streams.get(stream, streams[2]).extend(payload)
+                if stream == 1 and on_stdout:
+                    on_stdout(payload)
+                buffer = buffer[8 + size:]
+
+            if received > self.max_output_bytes:
+                truncated = True
+                break
+
+        return {
+            "stdout": streams[1].decode("utf-8", errors="replace"),
+            "stderr": streams[2].decode("utf-8", errors="replace"),
+            "timed_out": timed_out,
+            "truncated": truncated
+        }
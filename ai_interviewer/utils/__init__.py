@@ -7,7 +7,12 @@ from ai_interviewer.utils.config import (
     get_db_config,
     get_llm_config,
     get_speech_config,
+    get_insights_config,
+    get_memory_config,
+    get_sandbox_config,
+    get_code_quality_config,
     log_config
 )
 from ai_interviewer.utils.memory_manager import InterviewMemoryManager
 from ai_interviewer.utils.session_manager import SessionManager
+from ai_interviewer.utils.async_session_manager import AsyncSessionManager
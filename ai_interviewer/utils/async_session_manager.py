@@ -0,0 +1,562 @@
+"""
+Async session manager for AI Interviewer sessions.
+
+This module provides a motor-based counterpart of SessionManager for use from
+async code paths (FastAPI handlers, async LangGraph nodes) so that session
+reads and writes do not block the event loop.
+"""
+import uuid
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+import pymongo
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from ai_interviewer.utils.config import get_db_config
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def _serialize_messages(messages: List[Any]) -> List[Any]:
+    """
+    Convert message objects to a format that can be stored in MongoDB.
+
+    Args:
+        messages: List of message objects
+
+    Returns:
+        List of serializable messages
+    """
+    serializable_messages = []
+    for msg in messages:
+        if hasattr(msg, 'dict') and callable(getattr(msg, 'dict')):
+            # Handle Pydantic models or objects with dict method
+            serializable_messages.append(msg.dict())
+        elif hasattr(msg, '__dict__'):
+            # Handle custom objects with __dict__
+            serializable_messages.append(msg.__dict__)
+        else:
+            # Try direct serialization
+            serializable_messages.append(msg)
+    return serializable_messages
+
+
+class AsyncSessionManager:
+    """
+    Manages interview sessions with async MongoDB persistence.
+
+    Exposes the same methods as SessionManager as coroutines. Metadata updates
+    are applied as partial ``$set`` operations on individual ``metadata.<key>``
+    fields and messages are appended with ``$push``, so concurrent writers do
+    not overwrite each other's changes with a stale copy of the document.
+    """
+
+    def __init__(
+        self,
+        connection_uri: str,
+        database_name: str = "ai_interviewer",
+        collection_name: str = "interview_metadata",
+        max_pool_size: Optional[int] = None,
+        min_pool_size: Optional[int] = None,
+        max_idle_time_ms: Optional[int] = None,
+        wait_queue_timeout_ms: Optional[int] = None
+    ):
+        """
+        Initialize the async session manager.
+
+        Pool settings default to the values from get_db_config().
+
+        Args:
+            connection_uri: MongoDB connection URI
+            database_name: Name of the database
+            collection_name: Name of the collection for session metadata
+            max_pool_size: Maximum number of pooled connections
+            min_pool_size: Minimum number of pooled connections kept open
+            max_idle_time_ms: How long a pooled connection may stay idle
+            wait_queue_timeout_ms: How long to wait for a free pooled connection
+        """
+        db_config = get_db_config()
+
+        self.connection_uri = connection_uri
+        self.database_name = database_name
+        self.collection_name = collection_name
+
+        # Initialize MongoDB connection pool
+        self.client = AsyncIOMotorClient(
+            connection_uri,
+            maxPoolSize=max_pool_size if max_pool_size is not None else db_config["max_pool_size"],
+            minPoolSize=min_pool_size if min_pool_size is not None else db_config["min_pool_size"],
+            maxIdleTimeMS=max_idle_time_ms if max_idle_time_ms is not None else db_config["max_idle_time_ms"],
+            waitQueueTimeoutMS=wait_queue_timeout_ms if wait_queue_timeout_ms is not None else db_config["wait_queue_timeout_ms"],
+        )
+        self.db = self.client[database_name]
+        self.collection = self.db[collection_name]
+
+        # Indexes are created lazily on first use, inside the running event loop
+        self._indexes_created = False
+
+        logger.info(f"Async session manager initialized with {connection_uri}")
+
+    async def setup(self) -> None:
+        """Create the indexes used by session queries."""
+        if self._indexes_created:
+            return
+
+        await self.collection.create_index([("session_id", pymongo.ASCENDING)], unique=True)
+        await self.collection.create_index([("user_id", pymongo.ASCENDING)])
+        await self.collection.create_index([("last_active", pymongo.DESCENDING)])
+        self._indexes_created = True
+
+    async def _ensure_setup(self) -> None:
+        """Create indexes on first use, logging rather than raising on failure."""
+        if self._indexes_created:
+            return
+        try:
+            await self.setup()
+        except Exception as e:
+            logger.error(f"Error creating session indexes: {e}")
+
+    async def _update_fields(self, session_id: str, fields: Dict[str, Any], action: str,
+                             push: Optional[Dict[str, Any]] = None, inc: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Apply an atomic partial update to a session document.
+
+        Args:
+            session_id: Session identifier
+            fields: Fields to $set (last_active is always refreshed)
+            action: Description of the update for logging
+            push: Optional $push specification
+            inc: Optional $inc specification
+
+        Returns:
+            True if the session was found, False otherwise
+        """
+        await self._ensure_setup()
+        try:
+            update: Dict[str, Any] = {"$set": {**fields, "last_active": datetime.now()}}
+            if push:
+                update["$push"] = push
+            if inc:
+                update["$inc"] = inc
+
+            result = await self.collection.update_one({"session_id": session_id}, update)
+
+            if result.modified_count > 0 or result.matched_count > 0:
+                logger.info(f"Updated {action} for session {session_id}")
+                return True
+            else:
+                logger.warning(f"Session {session_id} not found for {action} update")
+                return False
+        except Exception as e:
+            logger.error(f"Error updating session {action}: {e}")
+            return False
+
+    async def create_session(self, user_id: str, metadata: Optional[Dict[str, Any]] = None,
+                             session_id: Optional[str] = None) -> str:
+        """
+        Create a new interview session.
+
+        Args:
+            user_id: User identifier
+            metadata: Optional additional metadata
+            session_id: Optional session ID to use instead of a generated one
+
+        Returns:
+            Session ID
+        """
+        await self._ensure_setup()
+        session_id = session_id or str(uuid.uuid4())
+        timestamp = datetime.now()
+
+        # Prepare document
+        document = {
+            "session_id": session_id,
+            "user_id": user_id,
+            "created_at": timestamp,
+            "last_active": timestamp,
+            "status": "active",
+            "metadata": metadata or {},
+        }
+
+        # Insert into MongoDB
+        try:
+            await self.collection.insert_one(document)
+            logger.info(f"Created new session {session_id} for user {user_id}")
+            return session_id
+        except Exception as e:
+            logger.error(f"Error creating session: {e}")
+            raise
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get session details by ID.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session details or None if not found
+        """
+        await self._ensure_setup()
+        try:
+            return await self.collection.find_one({"session_id": session_id})
+        except Exception as e:
+            logger.error(f"Error retrieving session {session_id}: {e}")
+            return None
+
+    async def get_session_metadata(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get only the metadata of a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session metadata, or an empty dict if the session was not found
+        """
+        await self._ensure_setup()
+        try:
+            session = await self.collection.find_one(
+                {"session_id": session_id},
+                projection={"metadata": 1, "_id": 0}
+            )
+            return (session or {}).get("metadata", {}) or {}
+        except Exception as e:
+            logger.error(f"Error retrieving metadata for session {session_id}: {e}")
+            return {}
+
+    async def get_user_sessions(self, user_id: str, include_completed: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get all sessions for a user.
+
+        Args:
+            user_id: User identifier
+            include_completed: Whether to include completed sessions
+
+        Returns:
+            List of session details
+        """
+        await self._ensure_setup()
+        try:
+            query = {"user_id": user_id}
+
+            if not include_completed:
+                query["status"] = "active"
+
+            cursor = self.collection.find(query, sort=[("last_active", pymongo.DESCENDING)])
+            sessions = await cursor.to_list(length=None)
+
+            logger.info(f"Found {len(sessions)} sessions for user {user_id}")
+            return sessions
+        except Exception as e:
+            logger.error(f"Error retrieving sessions for user {user_id}: {e}")
+            return []
+
+    async def update_session_activity(self, session_id: str) -> bool:
+        """
+        Update the last activity timestamp for a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._update_fields(session_id, {}, "activity")
+
+    async def update_session_metadata(self, session_id: str, metadata: Dict[str, Any]) -> bool:
+        """
+        Update metadata for a session.
+
+        Each top-level key is written with its own ``metadata.<key>`` $set, so keys
+        that are not part of ``metadata`` are left untouched.
+
+        Args:
+            session_id: Session identifier
+            metadata: Metadata fields to update
+
+        Returns:
+            True if successful, False otherwise
+        """
+        fields = {f"metadata.{key}": value for key, value in metadata.items()}
+        return await self._update_fields(session_id, fields, "metadata")
+
+    async def push_session_metadata(self, session_id: str, entries: Dict[str, Any]) -> bool:
+        """
+        Append entries to list fields of the session metadata with a single $push.
+
+        Unlike rewriting the metadata, concurrent appends to the same session
+        do not overwrite each other.
+
+        Args:
+            session_id: Session identifier
+            entries: Metadata list fields mapped to the entry to append to each
+
+        Returns:
+            True if successful, False otherwise
+        """
+        push = {f"metadata.{key}": value for key, value in entries.items()}
+        return await self._update_fields(session_id, {}, "metadata", push=push)
+
+    async def complete_session(self, session_id: str) -> bool:
+        """
+        Mark a session as completed.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if successful, False otherwise
+        """
+        await self._ensure_setup()
+        try:
+            result = await self.collection.update_one(
+                {"session_id": session_id},
+                {"$set": {"status": "completed", "completed_at": datetime.now()}}
+            )
+
+            if result.modified_count > 0:
+                logger.info(f"Marked session {session_id} as completed")
+                return True
+            else:
+                logger.warning(f"Session {session_id} not found for completion")
+                return False
+        except Exception as e:
+            logger.error(f"Error completing session: {e}")
+            return False
+
+    async def delete_session(self, session_id: str) -> bool:
+        """
+        Delete a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if successful, False otherwise
+        """
+        await self._ensure_setup()
+        try:
+            result = await self.collection.delete_one({"session_id": session_id})
+
+            if result.deleted_count > 0:
+                logger.info(f"Deleted session {session_id}")
+                return True
+            else:
+                logger.warning(f"Session {session_id} not found for deletion")
+                return False
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+            return False
+
+    async def list_active_sessions(self, max_inactive_minutes: int = 60) -> List[Dict[str, Any]]:
+        """
+        List all active sessions.
+
+        Args:
+            max_inactive_minutes: Maximum inactive time in minutes
+
+        Returns:
+            List of active session details
+        """
+        await self._ensure_setup()
+        cutoff_datetime = datetime.fromtimestamp(datetime.now().timestamp() - (max_inactive_minutes * 60))
+
+        try:
+            cursor = self.collection.find(
+                {
+                    "status": "active",
+                    "last_active": {"$gte": cutoff_datetime}
+                },
+                sort=[("last_active", pymongo.DESCENDING)]
+            )
+            sessions = await cursor.to_list(length=None)
+
+            logger.info(f"Found {len(sessions)} active sessions")
+            return sessions
+        except Exception as e:
+            logger.error(f"Error listing active sessions: {e}")
+            return []
+
+    async def get_most_recent_session(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent session for a user.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Most recent session or None if not found
+        """
+        await self._ensure_setup()
+        try:
+            session = await self.collection.find_one(
+                {"user_id": user_id, "status": "active"},
+                sort=[("last_active", pymongo.DESCENDING)]
+            )
+
+            if session:
+                logger.info(f"Found most recent session {session['session_id']} for user {user_id}")
+            else:
+                logger.info(f"No active sessions found for user {user_id}")
+            return session
+        except Exception as e:
+            logger.error(f"Error retrieving most recent session: {e}")
+            return None
+
+    async def clean_inactive_sessions(self, max_inactive_minutes: int = 1440) -> int:
+        """
+        Clean up inactive sessions by marking them as completed.
+
+        Args:
+            max_inactive_minutes: Maximum inactive time in minutes (default: 24 hours)
+
+        Returns:
+            Number of sessions cleaned up
+        """
+        await self._ensure_setup()
+        cutoff_datetime = datetime.fromtimestamp(datetime.now().timestamp() - (max_inactive_minutes * 60))
+
+        try:
+            result = await self.collection.update_many(
+                {
+                    "status": "active",
+                    "last_active": {"$lt": cutoff_datetime}
+                },
+                {
+                    "$set": {
+                        "status": "completed",
+                        "completed_at": datetime.now(),
+                        "completion_reason": "inactivity"
+                    }
+                }
+            )
+
+            count = result.modified_count
+            if count > 0:
+                logger.info(f"Cleaned up {count} inactive sessions")
+            return count
+        except Exception as e:
+            logger.error(f"Error cleaning up inactive sessions: {e}")
+            return 0
+
+    async def update_session_messages(self, session_id: str, messages: List[Any]) -> bool:
+        """
+        Replace the messages for a session.
+
+        Args:
+            session_id: Session identifier
+            messages: List of message objects to save
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._update_fields(
+            session_id, {"messages": _serialize_messages(messages)}, "messages"
+        )
+
+    async def append_session_messages(self, session_id: str, messages: List[Any]) -> bool:
+        """
+        Append messages to a session with a single $push.
+
+        Args:
+            session_id: Session identifier
+            messages: List of message objects to append
+
+        Returns:
+            True if successful, False otherwise
+        """
+        serializable_messages = _serialize_messages(messages)
+        return await self._update_fields(
+            session_id,
+            {},
+            "messages",
+            push={"messages": {"$each": serializable_messages}},
+            inc={"metadata.message_count": len(serializable_messages)}
+        )
+
+    async def update_conversation_summary(self, session_id: str, summary: str) -> bool:
+        """
+        Update the conversation summary for a session.
+
+        Args:
+            session_id: Session identifier
+            summary: New conversation summary
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._update_fields(
+            session_id, {"metadata.conversation_summary": summary}, "conversation summary"
+        )
+
+    async def get_conversation_summary(self, session_id: str) -> Optional[str]:
+        """
+        Get the current conversation summary for a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Conversation summary or None if not found
+        """
+        await self._ensure_setup()
+        try:
+            session = await self.collection.find_one(
+                {"session_id": session_id},
+                projection={"metadata.conversation_summary": 1, "_id": 0}
+            )
+            if not session:
+                return None
+            return session.get("metadata", {}).get("conversation_summary", "")
+        except Exception as e:
+            logger.error(f"Error retrieving conversation summary: {e}")
+            return None
+
+    async def reduce_message_history(self, session_id: str, messages_to_keep: List[Any]) -> bool:
+        """
+        Update the session with a reduced set of messages, typically after summarization.
+
+        Args:
+            session_id: Session identifier
+            messages_to_keep: List of message objects to retain
+
+        Returns:
+            True if successful, False otherwise
+        """
+        serializable_messages = _serialize_messages(messages_to_keep)
+        return await self._update_fields(
+            session_id,
+            {
+                "messages": serializable_messages,
+                "metadata.message_count": len(serializable_messages)
+            },
+            "reduced message history"
+        )
+
+    async def configure_context_management(self, session_id: str, max_messages: int = 20) -> bool:
+        """
+        Configure context management settings for a session.
+
+        Args:
+            session_id: Session identifier
+            max_messages: Maximum number of messages to keep before summarization
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._update_fields(
+            session_id, {"metadata.max_messages_before_summary": max_messages}, "context management settings"
+        )
+
+    def close(self):
+        """Close the MongoDB connection pool."""
+        if self.client:
+            self.client.close()
+            logger.info("Async MongoDB connection closed")
@@ -24,16 +24,83 @@ MONGODB_URI = os.environ.get("MONGODB_URI", "mongodb://localhost:27017")
 MONGODB_DATABASE = os.environ.get("MONGODB_DATABASE", "ai_interviewer")
 MONGODB_SESSIONS_COLLECTION = os.environ.get("MONGODB_SESSIONS_COLLECTION", "interview_sessions")
 MONGODB_METADATA_COLLECTION = os.environ.get("MONGODB_METADATA_COLLECTION", "interview_metadata")
+MONGODB_EXECUTION_CACHE_COLLECTION = os.environ.get("MONGODB_EXECUTION_CACHE_COLLECTION", "execution_cache")
+MONGODB_LLM_CACHE_COLLECTION = os.environ.get("MONGODB_LLM_CACHE_COLLECTION", "llm_response_cache")
+MONGODB_MAX_POOL_SIZE = int(os.environ.get("MONGODB_MAX_POOL_SIZE", "100"))
+MONGODB_MIN_POOL_SIZE = int(os.environ.get("MONGODB_MIN_POOL_SIZE", "0"))
+MONGODB_MAX_IDLE_TIME_MS = int(os.environ.get("MONGODB_MAX_IDLE_TIME_MS", "300000"))  # Close idle pooled connections after 5 minutes
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "10000"))  # Max wait for a free pooled connection
 
 # LLM configuration
 LLM_MODEL = os.environ.get("LLM_MODEL", "gemini-1.5-pro-latest")
 LLM_TEMPERATURE = float(os.environ.get("LLM_TEMPERATURE", "0.2"))
 SYSTEM_NAME = os.environ.get("SYSTEM_NAME", "Dhruv")
+LLM_REQUESTS_PER_MINUTE = int(os.environ.get("LLM_REQUESTS_PER_MINUTE", "60"))  # Global budget for tool LLM calls; excess calls queue (0 for unlimited)
+LLM_TOKENS_PER_MINUTE = int(os.environ.get("LLM_TOKENS_PER_MINUTE", "250000"))  # Estimated tokens per minute before calls queue (0 for unlimited)
+LLM_EXPECTED_OUTPUT_TOKENS = int(os.environ.get("LLM_EXPECTED_OUTPUT_TOKENS", "1024"))  # Output tokens reserved per call until actual usage is known
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "true").lower() in ["1", "true", "yes"]  # Reuse tool LLM responses for identical inputs
+LLM_CACHE_MAX_ENTRIES = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "1024"))  # In-memory LRU size
+LLM_CACHE_BACKEND = os.environ.get("LLM_CACHE_BACKEND", "memory").lower()  # memory, disk or mongodb (second tier shared between workers)
+LLM_CACHE_DIR = os.environ.get("LLM_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "llm_cache"))
+LLM_CACHE_TTL_HINTS = int(os.environ.get("LLM_CACHE_TTL_HINTS", "604800"))  # Seconds cached hints stay valid (0 disables)
+LLM_CACHE_TTL_CODE_REVIEW = int(os.environ.get("LLM_CACHE_TTL_CODE_REVIEW", "604800"))  # Seconds cached code reviews stay valid (0 disables)
+LLM_CACHE_TTL_QUESTION = int(os.environ.get("LLM_CACHE_TTL_QUESTION", "3600"))  # Seconds a generated opening question is reused (0 disables)
+LLM_CONTEXT_CACHE_BACKEND = os.environ.get("LLM_CONTEXT_CACHE_BACKEND", "local").lower()  # local or gemini (register long system prompt prefixes with Gemini context caching)
+LLM_CONTEXT_CACHE_MODEL = os.environ.get("LLM_CONTEXT_CACHE_MODEL", LLM_MODEL)  # Context caching needs a versioned model name, e.g. models/gemini-1.5-pro-002
+LLM_CONTEXT_CACHE_MIN_TOKENS = int(os.environ.get("LLM_CONTEXT_CACHE_MIN_TOKENS", "32768"))  # Smaller prefixes are sent inline
+LLM_CONTEXT_CACHE_TTL = int(os.environ.get("LLM_CONTEXT_CACHE_TTL", "3600"))  # Seconds a rendered prefix and its remote cache stay valid
+LLM_CONTEXT_CACHE_MAX_PREFIXES = int(os.environ.get("LLM_CONTEXT_CACHE_MAX_PREFIXES", "256"))  # Distinct session settings kept
 
 # Session configuration
 SESSION_TIMEOUT_MINUTES = int(os.environ.get("SESSION_TIMEOUT_MINUTES", "60"))
 MAX_SESSION_HISTORY = int(os.environ.get("MAX_SESSION_HISTORY", "50"))
 
+# Background insight extraction configuration
+INSIGHTS_QUEUE_SIZE = int(os.environ.get("INSIGHTS_QUEUE_SIZE", "100"))  # Max queued extraction jobs
+INSIGHTS_NUM_WORKERS = int(os.environ.get("INSIGHTS_NUM_WORKERS", "2"))  # Concurrent extraction workers
+INSIGHTS_EVERY_N_TURNS = int(os.environ.get("INSIGHTS_EVERY_N_TURNS", "3"))  # Extract at most once every N turns per session
+
+# Long-term memory configuration
+MEMORY_STORE_BACKEND = os.environ.get("MEMORY_STORE_BACKEND", "mongodb").lower()  # mongodb or memory (cross-thread store in async mode; memory is lost on restart)
+MEMORY_PROFILE_CACHE_ENABLED = os.environ.get("MEMORY_PROFILE_CACHE_ENABLED", "true").lower() in ["1", "true", "yes"]  # Keep candidate profiles in a per-process cache
+MEMORY_PROFILE_CACHE_TTL = float(os.environ.get("MEMORY_PROFILE_CACHE_TTL", "300"))  # Seconds a cached profile is used without re-reading the store
+MEMORY_PROFILE_CACHE_MAX_ENTRIES = int(os.environ.get("MEMORY_PROFILE_CACHE_MAX_ENTRIES", "10000"))
+MEMORY_PROFILE_INVALIDATION = os.environ.get("MEMORY_PROFILE_INVALIDATION", "local").lower()  # local or mongodb (share profile invalidations between workers)
+MEMORY_PROFILE_INVALIDATION_POLL_INTERVAL = float(os.environ.get("MEMORY_PROFILE_INVALIDATION_POLL_INTERVAL", "2.0"))  # Seconds between checks for changes made by other workers
+MONGODB_PROFILE_INVALIDATION_COLLECTION = os.environ.get("MONGODB_PROFILE_INVALIDATION_COLLECTION", "profile_invalidations")
+MEMORY_VECTOR_INDEX_ENABLED = os.environ.get("MEMORY_VECTOR_INDEX_ENABLED", "true").lower() in ["1", "true", "yes"]  # In-process vector index for semantic memory search
+MEMORY_VECTOR_DIM = int(os.environ.get("MEMORY_VECTOR_DIM", "512"))  # Dimensions of the hashed n-gram vectors
+MEMORY_VECTOR_ANN_THRESHOLD = int(os.environ.get("MEMORY_VECTOR_ANN_THRESHOLD", "20000"))  # Items from which unscoped searches are approximate (0 = always exact)
+MEMORY_VECTOR_NPROBE = int(os.environ.get("MEMORY_VECTOR_NPROBE", "16"))  # Clusters scored by an approximate search
+MEMORY_VECTOR_REFRESH_INTERVAL = float(os.environ.get("MEMORY_VECTOR_REFRESH_INTERVAL", "30"))  # Seconds between searches that index memories saved by other workers (0 = every search)
+
+# Code sandbox configuration
+SANDBOX_BACKEND = os.environ.get("SANDBOX_BACKEND", "auto").lower()  # auto (Docker, else local processes), docker or local
+SANDBOX_LOCAL_POOL_SIZE = int(os.environ.get("SANDBOX_LOCAL_POOL_SIZE", "2"))  # Warm worker processes for the local sandbox
+SANDBOX_LOCAL_RUN_AS_UID = int(os.environ.get("SANDBOX_LOCAL_RUN_AS_UID", "65534"))  # User (and group) local sandbox workers run as when the server runs as root; -1 keeps root
+SANDBOX_LOCAL_ALLOW_UNISOLATED = os.environ.get("SANDBOX_LOCAL_ALLOW_UNISOLATED", "false").lower() in ["1", "true", "yes"]  # Run code in the local sandbox even where network namespaces are unavailable (code gets network access)
+SANDBOX_POOL_ENABLED = os.environ.get("SANDBOX_POOL_ENABLED", "true").lower() in ["1", "true", "yes"]  # Keep pre-started worker containers per language
+SANDBOX_POOL_SIZE = int(os.environ.get("SANDBOX_POOL_SIZE", "2"))  # Warm workers per language
+SANDBOX_POOL_MAX_RUNS = int(os.environ.get("SANDBOX_POOL_MAX_RUNS", "25"))  # Recycle a worker after this many runs
+SANDBOX_POOL_ACQUIRE_TIMEOUT = float(os.environ.get("SANDBOX_POOL_ACQUIRE_TIMEOUT", "15.0"))  # Seconds to wait for a free worker before using a one-off container
+SANDBOX_MAX_OUTPUT_BYTES = int(os.environ.get("SANDBOX_MAX_OUTPUT_BYTES", str(1024 * 1024)))  # Output beyond this marks the run as faulted
+SANDBOX_PREPARE_ON_STARTUP = os.environ.get("SANDBOX_PREPARE_ON_STARTUP", "true").lower() in ["1", "true", "yes"]  # Pull images, fill pools and run a canary when the server starts
+EXECUTION_MAX_CONCURRENCY = int(os.environ.get("EXECUTION_MAX_CONCURRENCY", "4"))  # Code evaluations running at once across all users
+EXECUTION_MAX_CONCURRENT_PER_USER = int(os.environ.get("EXECUTION_MAX_CONCURRENT_PER_USER", "1"))  # Running evaluations per user
+EXECUTION_MAX_QUEUED_PER_USER = int(os.environ.get("EXECUTION_MAX_QUEUED_PER_USER", "5"))  # Waiting evaluations per user before new ones are rejected
+EXECUTION_JOB_TTL = int(os.environ.get("EXECUTION_JOB_TTL", "900"))  # Seconds finished jobs stay available for polling
+EXECUTION_CACHE_ENABLED = os.environ.get("EXECUTION_CACHE_ENABLED", "true").lower() in ["1", "true", "yes"]  # Reuse evaluations of identical submissions
+EXECUTION_CACHE_MAX_ENTRIES = int(os.environ.get("EXECUTION_CACHE_MAX_ENTRIES", "512"))  # In-memory LRU size
+EXECUTION_CACHE_TTL = int(os.environ.get("EXECUTION_CACHE_TTL", "86400"))  # Seconds a cached evaluation stays valid
+EXECUTION_CACHE_MONGODB = os.environ.get("EXECUTION_CACHE_MONGODB", "false").lower() in ["1", "true", "yes"]  # Share cached evaluations across workers via MongoDB
+
+# Code quality analysis configuration
+CODE_QUALITY_DEEP_ANALYSIS = os.environ.get("CODE_QUALITY_DEEP_ANALYSIS", "false").lower() in ["1", "true", "yes"]  # Lint with a long-lived pylint worker instead of the built-in AST checks
+CODE_QUALITY_PYLINT_TIMEOUT = float(os.environ.get("CODE_QUALITY_PYLINT_TIMEOUT", "20.0"))  # Seconds to wait for the pylint worker before using the AST checks
+CODE_QUALITY_EMPIRICAL_COMPLEXITY = os.environ.get("CODE_QUALITY_EMPIRICAL_COMPLEXITY", "false").lower() in ["1", "true", "yes"]  # Also time submissions in the sandbox on growing inputs
+CODE_QUALITY_EMPIRICAL_MAX_SIZE = int(os.environ.get("CODE_QUALITY_EMPIRICAL_MAX_SIZE", "16384"))  # Largest input size tried
+CODE_QUALITY_EMPIRICAL_TIME_BUDGET = float(os.environ.get("CODE_QUALITY_EMPIRICAL_TIME_BUDGET", "0.5"))  # Stop growing inputs once one call takes this many seconds
+
 # Speech configuration
 DEEPGRAM_API_KEY = os.environ.get("DEEPGRAM_API_KEY", "")
 SPEECH_RECORDING_DURATION = float(os.environ.get("SPEECH_RECORDING_DURATION", "30.0"))  # Max recording duration
@@ -41,19 +108,43 @@ SPEECH_SAMPLE_RATE = int(os.environ.get("SPEECH_SAMPLE_RATE", "16000"))
 SPEECH_TTS_VOICE = os.environ.get("SPEECH_TTS_VOICE", "nova")
 SPEECH_SILENCE_THRESHOLD = float(os.environ.get("SPEECH_SILENCE_THRESHOLD", "0.03"))  # Volume threshold to detect silence
 SPEECH_SILENCE_DURATION = float(os.environ.get("SPEECH_SILENCE_DURATION", "2.0"))  # Seconds of silence to stop recording
+DEEPGRAM_API_URL = os.environ.get("DEEPGRAM_API_URL", "https://api.deepgram.com/v1")  # Override to point at a local stand-in
+SPEECH_HTTP_POOL_LIMIT = int(os.environ.get("SPEECH_HTTP_POOL_LIMIT", "100"))  # Max pooled connections to the speech API
+SPEECH_HTTP_POOL_LIMIT_PER_HOST = int(os.environ.get("SPEECH_HTTP_POOL_LIMIT_PER_HOST", "20"))
+SPEECH_HTTP_KEEPALIVE_TIMEOUT = float(os.environ.get("SPEECH_HTTP_KEEPALIVE_TIMEOUT", "60.0"))  # Seconds to keep idle connections open
+SPEECH_HTTP_CONNECT_TIMEOUT = float(os.environ.get("SPEECH_HTTP_CONNECT_TIMEOUT", "10.0"))
+SPEECH_HTTP_TOTAL_TIMEOUT = float(os.environ.get("SPEECH_HTTP_TOTAL_TIMEOUT", "60.0"))  # Max seconds per STT/TTS request
+SPEECH_ENDPOINTING_MS = int(os.environ.get("SPEECH_ENDPOINTING_MS", "300"))  # Silence that ends a spoken phrase in streaming STT
+SPEECH_UTTERANCE_END_MS = int(os.environ.get("SPEECH_UTTERANCE_END_MS", "1000"))  # Gap between words that ends an utterance
+SPEECH_STREAM_SAMPLE_RATE = int(os.environ.get("SPEECH_STREAM_SAMPLE_RATE", "24000"))  # Sample rate of raw PCM audio sent over the voice WebSocket
+SPEECH_TTS_CHUNKED = os.environ.get("SPEECH_TTS_CHUNKED", "true").lower() in ["1", "true", "yes"]  # Synthesize long responses sentence by sentence
+SPEECH_TTS_MAX_CONCURRENCY = int(os.environ.get("SPEECH_TTS_MAX_CONCURRENCY", "4"))  # Max concurrent TTS chunk requests
+SPEECH_TTS_MIN_CHUNK_LENGTH = int(os.environ.get("SPEECH_TTS_MIN_CHUNK_LENGTH", "40"))  # Short sentences are merged up to this many characters
+SPEECH_TTS_CACHE_ENABLED = os.environ.get("SPEECH_TTS_CACHE_ENABLED", "true").lower() in ["1", "true", "yes"]  # Reuse audio for repeated phrases
+SPEECH_TTS_CACHE_DIR = os.environ.get("SPEECH_TTS_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tts_cache"))
+SPEECH_TTS_CACHE_MAX_DISK_MB = int(os.environ.get("SPEECH_TTS_CACHE_MAX_DISK_MB", "512"))
+SPEECH_TTS_CACHE_MAX_MEMORY_MB = int(os.environ.get("SPEECH_TTS_CACHE_MAX_MEMORY_MB", "64"))
+SPEECH_DEBUG_AUDIO_DUMP = os.environ.get("SPEECH_DEBUG_AUDIO_DUMP", "false").lower() in ["1", "true", "yes"]  # Save a sample of each upload for debugging
+SPEECH_DEBUG_AUDIO_PATH = os.environ.get("SPEECH_DEBUG_AUDIO_PATH", "/tmp/audio_debug_sample.raw")
 
-def get_db_config() -> Dict[str, str]:
+def get_db_config() -> Dict[str, Any]:
     """
     Get MongoDB configuration.
     
     Returns:
-        Dictionary with MongoDB configuration
+        Dictionary with MongoDB configuration, including connection pool sizing
     """
     return {
         "uri": MONGODB_URI,
         "database": MONGODB_DATABASE,
         "sessions_collection": MONGODB_SESSIONS_COLLECTION,
         "metadata_collection": MONGODB_METADATA_COLLECTION,
+        "execution_cache_collection": MONGODB_EXECUTION_CACHE_COLLECTION,
+        "llm_cache_collection": MONGODB_LLM_CACHE_COLLECTION,
+        "max_pool_size": MONGODB_MAX_POOL_SIZE,
+        "min_pool_size": MONGODB_MIN_POOL_SIZE,
+        "max_idle_time_ms": MONGODB_MAX_IDLE_TIME_MS,
+        "wait_queue_timeout_ms": MONGODB_WAIT_QUEUE_TIMEOUT_MS,
     }
 
 def get_llm_config() -> Dict[str, Any]:
@@ -67,6 +158,21 @@ def get_llm_config() -> Dict[str, Any]:
         "model": LLM_MODEL,
         "temperature": LLM_TEMPERATURE,
         "system_name": SYSTEM_NAME,
+        "requests_per_minute": LLM_REQUESTS_PER_MINUTE,
+        "tokens_per_minute": LLM_TOKENS_PER_MINUTE,
+        "expected_output_tokens": LLM_EXPECTED_OUTPUT_TOKENS,
+        "cache_enabled": LLM_CACHE_ENABLED,
+        "cache_max_entries": LLM_CACHE_MAX_ENTRIES,
+        "cache_backend": LLM_CACHE_BACKEND,
+        "cache_dir": LLM_CACHE_DIR,
+        "cache_ttl_hints": LLM_CACHE_TTL_HINTS,
+        "cache_ttl_code_review": LLM_CACHE_TTL_CODE_REVIEW,
+        "cache_ttl_question": LLM_CACHE_TTL_QUESTION,
+        "context_cache_backend": LLM_CONTEXT_CACHE_BACKEND,
+        "context_cache_model": LLM_CONTEXT_CACHE_MODEL,
+        "context_cache_min_tokens": LLM_CONTEXT_CACHE_MIN_TOKENS,
+        "context_cache_ttl": LLM_CONTEXT_CACHE_TTL,
+        "context_cache_max_prefixes": LLM_CONTEXT_CACHE_MAX_PREFIXES,
     }
 
 def get_session_config() -> Dict[str, Any]:
@@ -81,6 +187,84 @@ def get_session_config() -> Dict[str, Any]:
         "max_history": MAX_SESSION_HISTORY,
     }
 
+def get_insights_config() -> Dict[str, Any]:
+    """
+    Get background insight extraction configuration.
+    
+    Returns:
+        Dictionary with insight extraction configuration
+    """
+    return {
+        "queue_size": INSIGHTS_QUEUE_SIZE,
+        "num_workers": INSIGHTS_NUM_WORKERS,
+        "every_n_turns": INSIGHTS_EVERY_N_TURNS,
+    }
+
+def get_memory_config() -> Dict[str, Any]:
+    """
+    Get long-term memory configuration.
+    
+    Returns:
+        Dictionary with memory store, profile cache and vector index configuration
+    """
+    return {
+        "store_backend": MEMORY_STORE_BACKEND,
+        "profile_cache_enabled": MEMORY_PROFILE_CACHE_ENABLED,
+        "profile_cache_ttl": MEMORY_PROFILE_CACHE_TTL,
+        "profile_cache_max_entries": MEMORY_PROFILE_CACHE_MAX_ENTRIES,
+        "profile_invalidation": MEMORY_PROFILE_INVALIDATION,
+        "profile_invalidation_poll_interval": MEMORY_PROFILE_INVALIDATION_POLL_INTERVAL,
+        "profile_invalidation_collection": MONGODB_PROFILE_INVALIDATION_COLLECTION,
+        "vector_index_enabled": MEMORY_VECTOR_INDEX_ENABLED,
+        "vector_dim": MEMORY_VECTOR_DIM,
+        "vector_ann_threshold": MEMORY_VECTOR_ANN_THRESHOLD,
+        "vector_nprobe": MEMORY_VECTOR_NPROBE,
+        "vector_refresh_interval": MEMORY_VECTOR_REFRESH_INTERVAL,
+    }
+
+def get_sandbox_config() -> Dict[str, Any]:
+    """
+    Get code sandbox configuration.
+    
+    Returns:
+        Dictionary with sandbox pool configuration
+    """
+    return {
+        "backend": SANDBOX_BACKEND,
+        "local_pool_size": SANDBOX_LOCAL_POOL_SIZE,
+        "local_run_as_uid": SANDBOX_LOCAL_RUN_AS_UID,
+        "local_allow_unisolated": SANDBOX_LOCAL_ALLOW_UNISOLATED,
+        "pool_enabled": SANDBOX_POOL_ENABLED,
+        "pool_size": SANDBOX_POOL_SIZE,
+        "pool_max_runs": SANDBOX_POOL_MAX_RUNS,
+        "pool_acquire_timeout": SANDBOX_POOL_ACQUIRE_TIMEOUT,
+        "max_output_bytes": SANDBOX_MAX_OUTPUT_BYTES,
+        "prepare_on_startup": SANDBOX_PREPARE_ON_STARTUP,
+        "max_concurrency": EXECUTION_MAX_CONCURRENCY,
+        "max_concurrent_per_user": EXECUTION_MAX_CONCURRENT_PER_USER,
+        "max_queued_per_user": EXECUTION_MAX_QUEUED_PER_USER,
+        "job_ttl": EXECUTION_JOB_TTL,
+        "cache_enabled": EXECUTION_CACHE_ENABLED,
+        "cache_max_entries": EXECUTION_CACHE_MAX_ENTRIES,
+        "cache_ttl": EXECUTION_CACHE_TTL,
+        "cache_mongodb": EXECUTION_CACHE_MONGODB,
+    }
+
+def get_code_quality_config() -> Dict[str, Any]:
+    """
+    Get code quality analysis configuration.
+    
+    Returns:
+        Dictionary with code quality analysis configuration
+    """
+    return {
+        "deep_analysis": CODE_QUALITY_DEEP_ANALYSIS,
+        "pylint_timeout": CODE_QUALITY_PYLINT_TIMEOUT,
+        "empirical_complexity": CODE_QUALITY_EMPIRICAL_COMPLEXITY,
+        "empirical_max_size": CODE_QUALITY_EMPIRICAL_MAX_SIZE,
+        "empirical_time_budget": CODE_QUALITY_EMPIRICAL_TIME_BUDGET,
+    }
+
 def get_config_value(key: str, default: Optional[Any] = None) -> Any:
     """
     Get a configuration value from environment variables.
@@ -108,6 +292,24 @@ def get_speech_config() -> Dict[str, Any]:
         "tts_voice": SPEECH_TTS_VOICE,
         "silence_threshold": SPEECH_SILENCE_THRESHOLD,
         "silence_duration": SPEECH_SILENCE_DURATION,
+        "api_url": DEEPGRAM_API_URL,
+        "http_pool_limit": SPEECH_HTTP_POOL_LIMIT,
+        "http_pool_limit_per_host": SPEECH_HTTP_POOL_LIMIT_PER_HOST,
+        "http_keepalive_timeout": SPEECH_HTTP_KEEPALIVE_TIMEOUT,
+        "http_connect_timeout": SPEECH_HTTP_CONNECT_TIMEOUT,
+        "http_total_timeout": SPEECH_HTTP_TOTAL_TIMEOUT,
+        "endpointing_ms": SPEECH_ENDPOINTING_MS,
+        "utterance_end_ms": SPEECH_UTTERANCE_END_MS,
+        "stream_sample_rate": SPEECH_STREAM_SAMPLE_RATE,
+        "tts_chunked": SPEECH_TTS_CHUNKED,
+        "tts_max_concurrency": SPEECH_TTS_MAX_CONCURRENCY,
+        "tts_min_chunk_length": SPEECH_TTS_MIN_CHUNK_LENGTH,
+        "tts_cache_enabled": SPEECH_TTS_CACHE_ENABLED,
+        "tts_cache_dir": SPEECH_TTS_CACHE_DIR,
+        "tts_cache_max_disk_mb": SPEECH_TTS_CACHE_MAX_DISK_MB,
+        "tts_cache_max_memory_mb": SPEECH_TTS_CACHE_MAX_MEMORY_MB,
+        "debug_audio_dump": SPEECH_DEBUG_AUDIO_DUMP,
+        "debug_audio_path": SPEECH_DEBUG_AUDIO_PATH,
     }
 
 def log_config():
@@ -116,14 +318,35 @@ def log_config():
     logger.info(f"- MongoDB Database: {MONGODB_DATABASE}")
     logger.info(f"- Sessions Collection: {MONGODB_SESSIONS_COLLECTION}")
     logger.info(f"- Metadata Collection: {MONGODB_METADATA_COLLECTION}")
+    logger.info(f"- MongoDB Pool Size: {MONGODB_MIN_POOL_SIZE}-{MONGODB_MAX_POOL_SIZE} connections")
     logger.info(f"- LLM Model: {LLM_MODEL}")
     logger.info(f"- LLM Temperature: {LLM_TEMPERATURE}")
+    logger.info(f"- LLM Budget: {LLM_REQUESTS_PER_MINUTE or 'unlimited'} requests/min, {LLM_TOKENS_PER_MINUTE or 'unlimited'} tokens/min")
+    logger.info(f"- LLM Response Cache: {'Enabled (' + f'{LLM_CACHE_MAX_ENTRIES} entries, {LLM_CACHE_BACKEND} tier, TTL hints {LLM_CACHE_TTL_HINTS}s / reviews {LLM_CACHE_TTL_CODE_REVIEW}s / questions {LLM_CACHE_TTL_QUESTION}s' + ')' if LLM_CACHE_ENABLED else 'Disabled'}")
+    logger.info(f"- System Prompt Prefix Cache: {LLM_CONTEXT_CACHE_BACKEND} (TTL {LLM_CONTEXT_CACHE_TTL}s" + (f", prefixes over {LLM_CONTEXT_CACHE_MIN_TOKENS} tokens cached by Gemini" if LLM_CONTEXT_CACHE_BACKEND == "gemini" else "") + ")")
     logger.info(f"- System Name: {SYSTEM_NAME}")
     logger.info(f"- Session Timeout: {SESSION_TIMEOUT_MINUTES} minutes")
     logger.info(f"- Max Session History: {MAX_SESSION_HISTORY} messages")
+    logger.info(f"- Insight Extraction: every {INSIGHTS_EVERY_N_TURNS} turns, {INSIGHTS_NUM_WORKERS} workers, queue size {INSIGHTS_QUEUE_SIZE}")
+    logger.info(f"- Memory Store: {MEMORY_STORE_BACKEND}")
+    logger.info(f"- Profile Cache: {'Enabled (TTL ' + f'{MEMORY_PROFILE_CACHE_TTL:g}s, {MEMORY_PROFILE_INVALIDATION} invalidation)' if MEMORY_PROFILE_CACHE_ENABLED else 'Disabled'}")
+    logger.info(f"- Vector Index: {'Enabled (approximate from ' + str(MEMORY_VECTOR_ANN_THRESHOLD) + f' items, refreshed every {MEMORY_VECTOR_REFRESH_INTERVAL:g}s)' if MEMORY_VECTOR_INDEX_ENABLED else 'Disabled'}")
+    logger.info(f"- Sandbox Backend: {SANDBOX_BACKEND} ({'prepared' if SANDBOX_PREPARE_ON_STARTUP else 'lazy'} on startup)")
+    if SANDBOX_LOCAL_ALLOW_UNISOLATED:
+        logger.warning("- Local sandbox may run code without network isolation (SANDBOX_LOCAL_ALLOW_UNISOLATED)")
+    logger.info(f"- Sandbox Pool: {'Enabled' if SANDBOX_POOL_ENABLED else 'Disabled'} ({SANDBOX_POOL_SIZE} workers per language, recycled after {SANDBOX_POOL_MAX_RUNS} runs)")
+    logger.info(f"- Code Execution: {EXECUTION_MAX_CONCURRENCY} concurrent, {EXECUTION_MAX_CONCURRENT_PER_USER} per user")
+    logger.info(f"- Execution Cache: {'Enabled (' + f'{EXECUTION_CACHE_MAX_ENTRIES} entries, TTL {EXECUTION_CACHE_TTL}s' + (', MongoDB tier' if EXECUTION_CACHE_MONGODB else '') + ')' if EXECUTION_CACHE_ENABLED else 'Disabled'}")
+    logger.info(f"- Code Quality Analysis: {'pylint worker' if CODE_QUALITY_DEEP_ANALYSIS else 'AST checks'}")
+    logger.info(f"- Complexity Estimation: {'static + empirical (max size ' + str(CODE_QUALITY_EMPIRICAL_MAX_SIZE) + ')' if CODE_QUALITY_EMPIRICAL_COMPLEXITY else 'static'}")
     logger.info(f"- Speech TTS Voice: {SPEECH_TTS_VOICE}")
     logger.info(f"- Speech Recording Max Duration: {SPEECH_RECORDING_DURATION} seconds")
     logger.info(f"- Speech Sample Rate: {SPEECH_SAMPLE_RATE} Hz")
     logger.info(f"- Speech Silence Threshold: {SPEECH_SILENCE_THRESHOLD}")
     logger.info(f"- Speech Silence Duration: {SPEECH_SILENCE_DURATION} seconds")
+    logger.info(f"- Speech HTTP Pool: {SPEECH_HTTP_POOL_LIMIT} connections ({SPEECH_HTTP_POOL_LIMIT_PER_HOST} per host), keep-alive {SPEECH_HTTP_KEEPALIVE_TIMEOUT}s, timeout {SPEECH_HTTP_TOTAL_TIMEOUT}s")
+    logger.info(f"- Speech Streaming: endpointing {SPEECH_ENDPOINTING_MS}ms, utterance end {SPEECH_UTTERANCE_END_MS}ms, output {SPEECH_STREAM_SAMPLE_RATE} Hz")
+    logger.info(f"- Speech Chunked TTS: {'Enabled' if SPEECH_TTS_CHUNKED else 'Disabled'} (max {SPEECH_TTS_MAX_CONCURRENCY} concurrent requests)")
+    logger.info(f"- Speech TTS Cache: {'Enabled (' + SPEECH_TTS_CACHE_DIR + f', {SPEECH_TTS_CACHE_MAX_DISK_MB} MB disk, {SPEECH_TTS_CACHE_MAX_MEMORY_MB} MB memory)' if SPEECH_TTS_CACHE_ENABLED else 'Disabled'}")
+    logger.info(f"- Speech Debug Audio Dump: {'Enabled (' + SPEECH_DEBUG_AUDIO_PATH + ')' if SPEECH_DEBUG_AUDIO_DUMP else 'Disabled'}")
     logger.info(f"- Deepgram API Key: {'Configured' if DEEPGRAM_API_KEY else 'Not configured'}") 
\ No newline at end of file
@@ -0,0 +1,206 @@
+"""
+Background insight extraction for the AI Interviewer.
+
+This module provides a bounded worker queue that runs candidate insight
+extraction and memory updates off the response critical path. Jobs are
+debounced per session and a newer job for a session supersedes (and cancels)
+any older one that is still queued or running.
+"""
+import asyncio
+import itertools
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ai_interviewer.utils.config import get_insights_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class InsightExtractionWorker:
+    """
+    Bounded async worker pool for per-session insight extraction jobs.
+
+    A job is a dictionary with at least a ``session_id`` key; it is passed as-is
+    to the handler coroutine. Worker tasks are started lazily on the first
+    submit, so the worker can be created outside a running event loop.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], Awaitable[None]],
+        max_queue_size: Optional[int] = None,
+        num_workers: Optional[int] = None,
+        every_n_turns: Optional[int] = None,
+        max_tracked_sessions: int = 10000
+    ):
+        """
+        Initialize the worker.
+
+        Settings default to the values from get_insights_config().
+
+        Args:
+            handler: Coroutine function that processes a job
+            max_queue_size: Maximum number of queued jobs before new ones are dropped
+            num_workers: Number of concurrent worker tasks
+            every_n_turns: Run extraction at most once every N turns per session,
+                unless the interview stage changes
+            max_tracked_sessions: Number of sessions to keep debounce state for
+        """
+        config = get_insights_config()
+
+        self.handler = handler
+        self.max_queue_size = max_queue_size if max_queue_size is not None else config["queue_size"]
+        self.num_workers = num_workers if num_workers is not None else config["num_workers"]
+        self.every_n_turns = max(1, every_n_turns if every_n_turns is not None else config["every_n_turns"])
+        self.max_tracked_sessions = max_tracked_sessions
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers = []
+        self._job_ids = itertools.count(1)
+
+        # Per-session debounce state: {"turns": int, "stage": str}
+        self._session_state: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Latest job id submitted for each session; older jobs are stale
+        self._latest_job: Dict[str, int] = {}
+        # Currently running task for each session
+        self._running: Dict[str, asyncio.Task] = {}
+
+        self.stats = {"submitted": 0, "debounced": 0, "superseded": 0, "dropped": 0, "completed": 0, "failed": 0}
+
+    def _ensure_started(self) -> None:
+        """Start worker tasks on the running event loop if needed."""
+        if self._queue is not None and self._workers:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker_loop(i), name=f"insight-worker-{i}")
+            for i in range(self.num_workers)
+        ]
+        logger.info(f"Started {self.num_workers} insight extraction workers (queue size {self.max_queue_size})")
+
+    def should_run(self, session_id: str, interview_stage: Optional[str] = None) -> bool:
+        """
+        Record a turn for a session and decide whether extraction is due.
+
+        Args:
+            session_id: Session identifier
+            interview_stage: Current interview stage
+
+        Returns:
+            True if a job should be submitted for this turn
+        """
+        state = self._session_state.pop(session_id, None) or {"turns": 0, "stage": interview_stage}
+        self._session_state[session_id] = state
+        while len(self._session_state) > self.max_tracked_sessions:
+            self._session_state.popitem(last=False)
+
+        state["turns"] += 1
+        stage_changed = interview_stage is not None and state["stage"] is not None and interview_stage != state["stage"]
+        if interview_stage is not None:
+            state["stage"] = interview_stage
+
+        if state["turns"] >= self.every_n_turns or stage_changed:
+            state["turns"] = 0
+            return True
+        return False
+
+    def submit(self, job: Dict[str, Any], interview_stage: Optional[str] = None, force: bool = False) -> bool:
+        """
+        Submit a job, subject to per-session debouncing.
+
+        Must be called from within the running event loop.
+
+        Args:
+            job: Job dictionary containing at least "session_id"
+            interview_stage: Current interview stage, used for debouncing
+            force: Skip debouncing
+
+        Returns:
+            True if the job was queued, False if it was debounced or dropped
+        """
+        session_id = job["session_id"]
+
+        if not force and not self.should_run(session_id, interview_stage):
+            self.stats["debounced"] += 1
+            return False
+
+        self._ensure_started()
+
+        job_id = next(self._job_ids)
+        if session_id in self._latest_job:
+            self.stats["superseded"] += 1
+
+        # Cancel an older job that is already running for this session
+        running = self._running.get(session_id)
+        if running and not running.done():
+            running.cancel()
+            logger.debug(f"Cancelled superseded insight job for session {session_id}")
+
+        try:
+            self._queue.put_nowait({**job, "_job_id": job_id})
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            logger.warning(f"Insight queue full, dropping job for session {session_id}")
+            return False
+
+        self._latest_job[session_id] = job_id
+        self.stats["submitted"] += 1
+        return True
+
+    async def _worker_loop(self, worker_index: int) -> None:
+        """
+        Process jobs from the queue until cancelled.
+
+        Args:
+            worker_index: Index of this worker, for logging
+        """
+        while True:
+            job = await self._queue.get()
+            session_id = job["session_id"]
+            try:
+                # Skip jobs that were superseded while waiting in the queue
+                if self._latest_job.get(session_id) != job["_job_id"]:
+                    continue
+
+                task = asyncio.create_task(self.handler(job))
+                self._running[session_id] = task
+                try:
+                    await task
+                    self.stats["completed"] += 1
+                except asyncio.CancelledError:
+                    if not task.cancelled():
+                        # The worker itself is being cancelled
+                        raise
+                    logger.debug(f"Insight job for session {session_id} was superseded")
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    logger.error(f"Insight worker {worker_index} failed for session {session_id}: {e}")
+                finally:
+                    if self._running.get(session_id) is task:
+                        del self._running[session_id]
+                    if self._latest_job.get(session_id) == job["_job_id"]:
+                        del self._latest_job[session_id]
+            finally:
+                self._queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until all queued jobs have been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Cancel worker tasks and any running jobs."""
+        for task in list(self._running.values()):
+            task.cancel()
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._running.clear()
+        self._latest_job.clear()
+        logger.info("Insight extraction workers stopped")
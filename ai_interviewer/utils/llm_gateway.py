@@ -0,0 +1,341 @@
+"""
+Shared gateway for LLM calls made by the interview tools.
+
+Every tool call used to build its own ChatGoogleGenerativeAI client and send
+its own request, even when a double-click or a retry sent the same prompt at
+the same moment. The gateway:
+
+- reuses one client per model and set of generation settings,
+- coalesces identical in-flight requests (single-flight): the first caller
+  makes the request and every concurrent caller with the same prompt and
+  settings waits for that result or error,
+- spends a global requests-per-minute and tokens-per-minute budget, queueing
+  calls until budget is available instead of failing them.
+
+Both sync (invoke) and async (ainvoke) callers share the in-flight table and
+the budget; async callers never block the event loop while they wait.
+"""
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from langchain_core.messages import BaseMessage
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from ai_interviewer.utils.config import get_llm_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Rough characters per token, used to estimate prompt size before sending
+CHARS_PER_TOKEN = 4
+
+Prompt = Union[str, Sequence[BaseMessage]]
+
+
+class RateBudget:
+    """
+    Token buckets for requests and tokens per minute.
+
+    A reservation either succeeds immediately or reports how long to wait, so
+    sync callers can sleep and async callers can await without holding a lock.
+    A limit of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize the budget with full buckets.
+
+        Args:
+            requests_per_minute: Requests allowed per minute (0 for unlimited)
+            tokens_per_minute: Tokens allowed per minute (0 for unlimited)
+        """
+        self.requests_per_minute = max(0, requests_per_minute)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self._requests = float(self.requests_per_minute)
+        self._tokens = float(self.tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> float:
+        """
+        Take one request and ``tokens`` tokens from the budget if available.
+
+        Args:
+            tokens: Estimated tokens for the request; requests larger than the
+                per-minute limit are allowed once the bucket is full
+
+        Returns:
+            0 if the budget was taken, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            self._refill()
+            tokens = min(tokens, self.tokens_per_minute)
+            wait = 0.0
+            if self.requests_per_minute and self._requests < 1:
+                wait = max(wait, (1 - self._requests) * 60.0 / self.requests_per_minute)
+            if self.tokens_per_minute and self._tokens < tokens:
+                wait = max(wait, (tokens - self._tokens) * 60.0 / self.tokens_per_minute)
+            if wait > 0:
+                return wait
+            if self.requests_per_minute:
+                self._requests -= 1
+            if self.tokens_per_minute:
+                self._tokens -= tokens
+            return 0.0
+
+    def adjust(self, tokens: int) -> None:
+        """
+        Correct the token bucket once the actual usage of a request is known.
+
+        Args:
+            tokens: Actual minus reserved tokens (negative returns budget)
+        """
+        if not self.tokens_per_minute:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens = min(float(self.tokens_per_minute), self._tokens - tokens)
+
+    def acquire(self, tokens: int) -> float:
+        """
+        Block until the budget is available, then take it.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.reserve(tokens)
+            if wait == 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def aacquire(self, tokens: int) -> float:
+        """
+        Async variant of acquire that waits without blocking the event loop.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.reserve(tokens)
+            if wait == 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(float(self.requests_per_minute), self._requests + elapsed * self.requests_per_minute / 60.0)
+        if self.tokens_per_minute:
+            self._tokens = min(float(self.tokens_per_minute), self._tokens + elapsed * self.tokens_per_minute / 60.0)
+
+
+class LLMGateway:
+    """
+    Client reuse, single-flight coalescing and a global rate budget for LLM calls.
+    """
+
+    def __init__(self,
+                 requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None,
+                 expected_output_tokens: Optional[int] = None,
+                 model_factory: Optional[Callable[..., Any]] = None):
+        """
+        Initialize the gateway.
+
+        Settings default to the values from get_llm_config().
+
+        Args:
+            requests_per_minute: Global request budget (0 for unlimited)
+            tokens_per_minute: Global token budget (0 for unlimited)
+            expected_output_tokens: Output tokens reserved per request until usage is known
+            model_factory: Builds a chat model from keyword settings (ChatGoogleGenerativeAI)
+        """
+        config = get_llm_config()
+        self.budget = RateBudget(
+            requests_per_minute if requests_per_minute is not None else config["requests_per_minute"],
+            tokens_per_minute if tokens_per_minute is not None else config["tokens_per_minute"]
+        )
+        self.expected_output_tokens = expected_output_tokens if expected_output_tokens is not None else config["expected_output_tokens"]
+        self.model_factory = model_factory or ChatGoogleGenerativeAI
+
+        self._models: Dict[str, Any] = {}
+        self._in_flight: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {"requests": 0, "coalesced": 0, "errors": 0, "queued": 0, "queued_seconds": 0.0, "clients": 0}
+
+    def get_model(self, model: Optional[str] = None, temperature: float = 0.2, **kwargs) -> Any:
+        """
+        Get the shared client for a model and generation settings.
+
+        Args:
+            model: Model name (the configured model if None)
+            temperature: Sampling temperature
+            **kwargs: Further client settings
+
+        Returns:
+            Chat model instance, created on first use
+        """
+        settings = {"model": model or get_llm_config()["model"], "temperature": temperature, **kwargs}
+        key = json.dumps(settings, sort_keys=True, default=str)
+        with self._lock:
+            client = self._models.get(key)
+            if client is None:
+                client = self.model_factory(**settings)
+                self._models[key] = client
+                self.stats["clients"] += 1
+            return client
+
+    def invoke(self, prompt: Prompt, model: Optional[str] = None, temperature: float = 0.2, **kwargs) -> Any:
+        """
+        Send a prompt, sharing the result with identical concurrent calls.
+
+        Args:
+            prompt: Prompt string or list of messages
+            model: Model name (the configured model if None)
+            temperature: Sampling temperature
+            **kwargs: Further client settings
+
+        Returns:
+            Model response message
+        """
+        key, tokens = self._request_key(prompt, model, temperature, kwargs)
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+
+        try:
+            self._record_wait(self.budget.acquire(tokens))
+            response = self.get_model(model, temperature, **kwargs).invoke(prompt)
+            self._settle_usage(response, tokens)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            self.stats["errors"] += 1
+            future.set_exception(e)
+            raise
+        finally:
+            self._leave(key)
+
+    async def ainvoke(self, prompt: Prompt, model: Optional[str] = None, temperature: float = 0.2, **kwargs) -> Any:
+        """
+        Async variant of invoke.
+
+        Args:
+            prompt: Prompt string or list of messages
+            model: Model name (the configured model if None)
+            temperature: Sampling temperature
+            **kwargs: Further client settings
+
+        Returns:
+            Model response message
+        """
+        key, tokens = self._request_key(prompt, model, temperature, kwargs)
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            self._record_wait(await self.budget.aacquire(tokens))
+            response = await self.get_model(model, temperature, **kwargs).ainvoke(prompt)
+            self._settle_usage(response, tokens)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            self.stats["errors"] += 1
+            future.set_exception(e)
+            raise
+        finally:
+            self._leave(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get gateway statistics.
+
+        Returns:
+            Counters plus the number of requests in flight
+        """
+        with self._lock:
+            in_flight = len(self._in_flight)
+        return {**self.stats, "in_flight": in_flight}
+
+    def _request_key(self, prompt: Prompt, model: Optional[str], temperature: float,
+                     kwargs: Dict[str, Any]) -> Tuple[str, int]:
+        """Hash the prompt and settings, and estimate the tokens the request will use."""
+        if isinstance(prompt, str):
+            payload: Any = prompt
+            length = len(prompt)
+        else:
+            payload = [(message.type, message.content) for message in prompt]
+            length = sum(len(str(message.content)) for message in prompt)
+        document = json.dumps(
+            {"prompt": payload, "model": model or get_llm_config()["model"], "temperature": temperature, "settings": kwargs},
+            sort_keys=True, default=str
+        )
+        key = hashlib.sha256(document.encode("utf-8")).hexdigest()
+        return key, length // CHARS_PER_TOKEN + self.expected_output_tokens
+
+    def _join(self, key: str) -> Tuple[concurrent.futures.Future, bool]:
+        """Return the in-flight future for a key and whether this caller must make the request."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                return future, False
+            future = concurrent.futures.Future()
+            self._in_flight[key] = future
+            self.stats["requests"] += 1
+            return future, True
+
+    def _leave(self, key: str) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def _record_wait(self, waited: float) -> None:
+        if waited > 0:
+            self.stats["queued"] += 1
+            self.stats["queued_seconds"] += waited
+
+    def _settle_usage(self, response: Any, reserved: int) -> None:
+        """Return or charge the difference between reserved and reported tokens."""
+        usage = getattr(response, "usage_metadata", None) or {}
+        total = usage.get("total_tokens") if isinstance(usage, dict) else None
+        if total:
+            self.budget.adjust(total - reserved)
+
+
+# Process-wide gateway (lazily created)
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """
+    Get or create the shared LLM gateway.
+
+    Returns:
+        LLMGateway instance
+    """
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway()
+            budget = _gateway.budget
+            logger.info(
+                f"LLM gateway initialized ({budget.requests_per_minute or 'unlimited'} requests/min, "
+                f"{budget.tokens_per_minute or 'unlimited'} tokens/min)"
+            )
+        return _gateway
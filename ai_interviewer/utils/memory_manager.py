@@ -5,9 +5,11 @@ This module extends the memory capabilities of the AI Interviewer by implementin
 both short-term (thread-level) and long-term (cross-thread) memory persistence.
 """
 import logging
+import threading
+import time
 import uuid
 from typing import Dict, List, Optional, Any, Tuple, Union
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from pymongo import MongoClient
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -16,9 +18,13 @@ from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langgraph.checkpoint.mongodb import MongoDBSaver
 from langgraph.checkpoint.mongodb.aio import AsyncMongoDBSaver
 from langgraph.store.mongodb.base import MongoDBStore
+from langgraph.store.base import GetOp
 from langgraph.store.memory import InMemoryStore
 
-from ai_interviewer.utils.config import get_db_config
+from ai_interviewer.utils.config import get_db_config, get_memory_config
+from ai_interviewer.utils.mongo_store import AsyncMongoStore, value_text
+from ai_interviewer.utils.profile_cache import create_profile_cache
+from ai_interviewer.utils.vector_index import create_vector_index
 
 # Set up logging
 logging.basicConfig(
@@ -28,14 +34,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Namespaces covered by semantic search
+VECTOR_NAMESPACES = [("candidate_profiles",), ("interview_memories", "insights"), ("interview_memories", "feedback")]
+
+# Items read per store search while building the vector index
+VECTOR_BUILD_PAGE_SIZE = 500
+
+# Refreshes re-read items updated this long before the newest indexed item, so
+# items from workers whose clocks are slightly behind are not missed
+VECTOR_REFRESH_OVERLAP = timedelta(seconds=5)
+
 class InterviewMemoryManager:
     """
     Manages both short-term (thread-level) and long-term (cross-thread) memory for the AI Interviewer.
     
     This class provides:
     1. Thread-level memory persistence via MongoDBSaver checkpointer (sync) or AsyncMongoDBSaver (async)
-    2. Cross-thread memory persistence via MongoDBStore (sync) or InMemoryStore (async)
+    2. Cross-thread memory persistence via MongoDBStore (sync) or AsyncMongoStore (async)
     3. Helper methods for common memory operations
+    4. Semantic search over profiles, insights and feedback via an in-process vector index
     """
     
     def __init__(
@@ -64,6 +81,19 @@ class InterviewMemoryManager:
         self.store_collection = store_collection or "interview_memory_store"
         self.use_async = use_async
         self.async_setup_completed = False
+        self.store_client = None
+        
+        # Read-through cache for candidate profiles, read on every model call
+        self.profile_cache = create_profile_cache()
+        
+        # Vector index for semantic search, built from the store on first use
+        self.vector_index = create_vector_index()
+        self.vector_index_built = False
+        self._vector_index_lock = threading.Lock()
+        # Newest updated_at read from the store, and when it was last read
+        self._vector_indexed_until = None
+        self._vector_refreshed_at = 0.0
+        self._vector_refresh_interval = get_memory_config()["vector_refresh_interval"]
         
         try:
             if self.use_async:
@@ -78,10 +108,8 @@ class InterviewMemoryManager:
                     "collection_name": self.checkpoint_collection
                 }
                 
-                # Initialize async store for cross-thread memory
-                # Use InMemoryStore for async operations as there is no AsyncMongoDBStore
-                self.async_store = InMemoryStore()
-                logger.info(f"Initialized InMemoryStore for async operations")
+                # Initialize async store for cross-thread memory, shared by all workers
+                self.async_store = self._create_async_store()
                 
                 # Initialize sync clients as None since we're in async mode
                 self.client = None
@@ -158,6 +186,7 @@ class InterviewMemoryManager:
             
             # Mark setup as completed
             self.async_setup_completed = True
+            self.start_vector_index_build()
             
             logger.info("Async memory manager setup complete")
         except Exception as e:
@@ -179,11 +208,23 @@ class InterviewMemoryManager:
             if hasattr(self.store, 'setup') and callable(getattr(self.store, 'setup')):
                 self.store.setup()
             
+            self.start_vector_index_build()
             logger.info("Memory manager setup complete")
         except Exception as e:
             logger.error(f"Error setting up memory manager: {e}")
             raise
     
+    def start_vector_index_build(self) -> None:
+        """
+        Build the vector index from the store in a background thread.
+        
+        Building reads and embeds every indexed memory, so it is done at startup
+        rather than by the first semantic search.
+        """
+        if self.vector_index is None or self.vector_index_built:
+            return
+        threading.Thread(target=self._build_vector_index, name="vector-index-build", daemon=True).start()
+    
     def get_checkpointer(self):
         """
         Get the appropriate checkpointer for thread-level memory persistence.
@@ -202,7 +243,8 @@ class InterviewMemoryManager:
         Get the appropriate store for cross-thread memory persistence.
         
         Returns:
-            MongoDBStore or InMemoryStore instance based on use_async setting
+            MongoDBStore or AsyncMongoStore instance based on use_async setting
+            (InMemoryStore if the async store is configured to be in memory)
         """
         if self.use_async:
             return self.async_store
@@ -271,18 +313,29 @@ class InterviewMemoryManager:
                 profile_id = str(uuid.uuid4())
                 profile_data["user_id"] = user_id
                 profile_data["created_at"] = datetime.now().isoformat()
+                merged_data = profile_data
                 store.put(namespace, profile_id, profile_data)
                 logger.info(f"Created new candidate profile for user {user_id}")
             
+            # Write through so the next read is served from the cache
+            if self.profile_cache:
+                self.profile_cache.put(user_id, merged_data)
+            self._index_memory(namespace, profile_id, merged_data)
+            
             return True
         except Exception as e:
             logger.error(f"Error saving candidate profile: {e}")
+            # The write may have partly happened, so make the next read go to the store
+            self.invalidate_candidate_profile(user_id)
             return False
     
     def get_candidate_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a candidate's profile data.
         
+        Profiles are served from the profile cache when enabled and only read
+        from the store on a miss.
+        
         Args:
             user_id: User identifier
             
@@ -290,23 +343,31 @@ class InterviewMemoryManager:
             Profile data dictionary or None if not found
         """
         try:
-            namespace = ("candidate_profiles",)
-            store = self.get_store()
-            if store is None:
+            if self.get_store() is None:
                 logger.error("Store not initialized")
                 return None
             
-            profiles = list(store.search(namespace, filter={"user_id": user_id}))
-            
-            if profiles:
-                return profiles[0].value
-            else:
-                return None
+            if self.profile_cache:
+                return self.profile_cache.get_or_load(user_id, self._load_candidate_profile)
+            return self._load_candidate_profile(user_id)
         except Exception as e:
             logger.error(f"Error retrieving candidate profile: {e}")
             return None
     
-    def save_interview_memory(self, session_id: str, memory_type: str, memory_data: Dict[str, Any]) -> bool:
+    def invalidate_candidate_profile(self, user_id: str) -> None:
+        """
+        Drop a cached candidate profile in this and (if configured) every other worker.
+        
+        Call this after changing a profile in the store without save_candidate_profile.
+        
+        Args:
+            user_id: User identifier
+        """
+        if self.profile_cache:
+            self.profile_cache.invalidate(user_id)
+    
+    def save_interview_memory(self, session_id: str, memory_type: str, memory_data: Dict[str, Any],
+                              user_id: Optional[str] = None) -> bool:
         """
         Save interview-specific memory that persists across sessions.
         
@@ -314,6 +375,7 @@ class InterviewMemoryManager:
             session_id: Session identifier
             memory_type: Type of memory (e.g., "insights", "evaluations", "feedback")
             memory_data: Memory data to store
+            user_id: Optional ID of the candidate, so the memory can be searched per user
             
         Returns:
             Success status
@@ -331,8 +393,11 @@ class InterviewMemoryManager:
             memory_data["session_id"] = session_id
             memory_data["created_at"] = datetime.now().isoformat()
             memory_data["memory_type"] = memory_type
+            if user_id:
+                memory_data["user_id"] = user_id
             
             store.put(namespace, memory_id, memory_data)
+            self._index_memory(namespace, memory_id, memory_data)
             logger.info(f"Saved {memory_type} memory for session {session_id}")
             return True
         except Exception as e:
@@ -376,18 +441,25 @@ class InterviewMemoryManager:
             logger.error(f"Error retrieving interview memories: {e}")
             return []
     
-    def search_memories(self, query: str, user_id: Optional[str] = None, max_results: int = 5) -> List[Dict[str, Any]]:
+    def search_memories(self, query: str, user_id: Optional[str] = None, max_results: int = 5,
+                        offset: int = 0, mode: str = "text") -> List[Dict[str, Any]]:
         """
-        Search for memories across all namespaces based on content.
-        This is a simple implementation that will be enhanced with vector search.
+        Search candidate profiles and interview memories based on content.
+        
+        In text mode with AsyncMongoStore the search runs on the store's text index,
+        so results are ranked, paginated and scoped to the user by the database.
+        Other stores are scanned for the query as a substring. Semantic mode ranks
+        profiles, insights and feedback by vector similarity to the query.
         
         Args:
             query: Search query
             user_id: Optional user ID to restrict search
             max_results: Maximum number of results to return
+            offset: Number of results to skip, for pagination
+            mode: "text" for keyword search or "semantic" for similarity search
             
         Returns:
-            List of matching memory items
+            List of matching memory items, most relevant first when ranked
         """
         try:
             store = self.get_store()
@@ -395,58 +467,54 @@ class InterviewMemoryManager:
                 logger.error("Store not initialized")
                 return []
             
-            all_results = []
+            if mode == "semantic":
+                return self._semantic_search(store, query, user_id, max_results, offset)
             
-            # Search in candidate profiles
-            namespace = ("candidate_profiles",)
-            if user_id:
-                profiles = list(store.search(namespace, filter={"user_id": user_id}))
-            else:
-                profiles = list(store.search(namespace))
-            
-            # Add matching profiles
-            for profile in profiles:
-                profile_str = str(profile.value)
-                if query.lower() in profile_str.lower():
-                    all_results.append({
-                        "type": "candidate_profile",
-                        "key": profile.key,
-                        "value": profile.value
-                    })
-            
-            # Search in interview memories
-            memory_types = ["insights", "evaluations", "feedback", "coding"]
-            for mem_type in memory_types:
-                namespace = ("interview_memories", mem_type)
-                if user_id:
-                    memories = list(store.search(namespace, filter={"user_id": user_id}))
+            search_filter = {"user_id": user_id} if user_id else None
+            
+            if isinstance(store, AsyncMongoStore):
+                items = store.search_text(
+                    [("candidate_profiles",), ("interview_memories",)],
+                    query,
+                    filter=search_filter,
+                    limit=max_results,
+                    offset=offset
+                )
+                return [self._memory_search_result(item) for item in items]
+            
+            all_results = []
+            namespaces = [("candidate_profiles",)] + [
+                ("interview_memories", mem_type) for mem_type in ["insights", "evaluations", "feedback", "coding"]
+            ]
+            for namespace in namespaces:
+                if search_filter:
+                    items = list(store.search(namespace, filter=search_filter))
                 else:
-                    memories = list(store.search(namespace))
+                    items = list(store.search(namespace))
                 
-                # Add matching memories
-                for memory in memories:
-                    memory_str = str(memory.value)
-                    if query.lower() in memory_str.lower():
-                        all_results.append({
-                            "type": f"interview_{mem_type}",
-                            "key": memory.key,
-                            "value": memory.value
-                        })
-            
-            # Return limited results
-            return all_results[:max_results]
+                # Add matching items
+                for item in items:
+                    if query.lower() in str(item.value).lower():
+                        all_results.append(self._memory_search_result(item))
+            
+            # Return the requested page
+            return all_results[offset:offset + max_results]
         except Exception as e:
             logger.error(f"Error searching memories: {e}")
             return []
     
     def close(self):
         """Close database connections and release resources."""
+        if self.profile_cache:
+            self.profile_cache.close()
         try:
             if self.use_async:
                 # Close async client if it exists
                 if self.async_client:
                     self.async_client.close()
                     logger.info("Closed async MongoDB client")
+                if self.store_client:
+                    self.store_client.close()
             else:
                 # Close sync client if it exists
                 if self.client:
@@ -457,12 +525,16 @@ class InterviewMemoryManager:
 
     async def aclose(self):
         """Asynchronously close database connections and release resources."""
+        if self.profile_cache:
+            self.profile_cache.close()
         try:
             if self.use_async:
                 # Close async client if it exists
                 if self.async_client:
                     await self.async_client.close()
                     logger.info("Closed async MongoDB client")
+                if self.store_client:
+                    self.store_client.close()
             else:
                 # Close sync client if it exists
                 if self.client:
@@ -479,7 +551,203 @@ class InterviewMemoryManager:
     
     # Private helper methods
     
-    def _merge_profile_data(self, current_data: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _index_memory(self, namespace: Tuple[str, ...], key: str, value: Dict[str, Any]) -> None:
+        """
+        Add a stored item to the vector index if its namespace is searched semantically.
+        
+        Args:
+            namespace: Store namespace of the item
+            key: Store key of the item
+            value: Stored value
+        """
+        if self.vector_index is None or tuple(namespace) not in VECTOR_NAMESPACES:
+            return
+        try:
+            self.vector_index.add(
+                f"{'.'.join(namespace)}/{key}",
+                value_text(value),
+                {"namespace": tuple(namespace), "key": key, "user_id": value.get("user_id")}
+            )
+        except Exception as e:
+            logger.warning(f"Failed to add {key} to the vector index: {e}")
+    
+    def _build_vector_index(self) -> None:
+        """Background thread target for start_vector_index_build."""
+        try:
+            self._ensure_vector_index(self.get_store())
+        except Exception as e:
+            logger.error(f"Error building vector index: {e}")
+    
+    def _ensure_vector_index(self, store) -> None:
+        """
+        Build the vector index from the store unless it has been built already.
+        
+        Waits for a build that is in progress in another thread.
+        
+        Args:
+            store: Cross-thread store to read the indexed namespaces from
+        """
+        if self.vector_index_built:
+            return
+        with self._vector_index_lock:
+            if self.vector_index_built:
+                return
+            # Items written before any item that can be read back from the store
+            indexed_until = datetime(1970, 1, 1)
+            for namespace in VECTOR_NAMESPACES:
+                offset = 0
+                while True:
+                    items = list(store.search(namespace, limit=VECTOR_BUILD_PAGE_SIZE, offset=offset))
+                    for item in items:
+                        self._index_memory(item.namespace, item.key, item.value)
+                        indexed_until = max(indexed_until, item.updated_at.replace(tzinfo=None))
+                    if len(items) < VECTOR_BUILD_PAGE_SIZE:
+                        break
+                    offset += VECTOR_BUILD_PAGE_SIZE
+            self._vector_indexed_until = indexed_until
+            self._vector_refreshed_at = time.monotonic()
+            self.vector_index_built = True
+            logger.info(f"Built vector index with {len(self.vector_index)} memories")
+    
+    def _refresh_vector_index(self, store) -> None:
+        """
+        Index memories saved to the store since the vector index was built or refreshed.
+        
+        This process indexes its own saves as it makes them, but server workers
+        sharing the MongoDB store only see each other's memories through this
+        refresh. It runs at most once per refresh interval and only for stores
+        that can be read by update time (AsyncMongoStore); the in-memory store
+        and the sync MongoDBStore are not refreshed, so their semantic search
+        only covers the memories of the process that built the index.
+        
+        Args:
+            store: Cross-thread store to read the indexed namespaces from
+        """
+        if not hasattr(store, "search_updated_since") or self._vector_indexed_until is None:
+            return
+        if time.monotonic() - self._vector_refreshed_at < self._vector_refresh_interval:
+            return
+        # Searches during a build or another refresh use the index as it is
+        if not self._vector_index_lock.acquire(blocking=False):
+            return
+        try:
+            self._vector_refreshed_at = time.monotonic()
+            since = self._vector_indexed_until - VECTOR_REFRESH_OVERLAP
+            newest = self._vector_indexed_until
+            while True:
+                items = store.search_updated_since(VECTOR_NAMESPACES, since, limit=VECTOR_BUILD_PAGE_SIZE)
+                for item in items:
+                    self._index_memory(item.namespace, item.key, item.value)
+                    newest = max(newest, item.updated_at.replace(tzinfo=None))
+                # Pages overlap by the items written at the same time as the last one
+                if len(items) < VECTOR_BUILD_PAGE_SIZE or items[-1].updated_at.replace(tzinfo=None) == since:
+                    break
+                since = items[-1].updated_at.replace(tzinfo=None)
+            self._vector_indexed_until = newest
+        except Exception as e:
+            logger.warning(f"Failed to refresh the vector index: {e}")
+        finally:
+            self._vector_index_lock.release()
+    
+    def _semantic_search(self, store, query: str, user_id: Optional[str], max_results: int,
+                         offset: int) -> List[Dict[str, Any]]:
+        """
+        Search profiles, insights and feedback by similarity to the query.
+        
+        Args:
+            store: Cross-thread store holding the memories
+            query: Search query
+            user_id: Optional user ID to restrict search
+            max_results: Maximum number of results to return
+            offset: Number of results to skip, for pagination
+            
+        Returns:
+            List of memory items with their cosine similarity, most similar first
+        """
+        if self.vector_index is None:
+            logger.warning("Semantic memory search requested but the vector index is disabled")
+            return []
+        self._ensure_vector_index(store)
+        self._refresh_vector_index(store)
+        
+        hits = self.vector_index.search(query, k=max_results, user_id=user_id, offset=offset)
+        # Read the current values of all hits in one batch
+        items = store.batch([GetOp(metadata["namespace"], metadata["key"]) for _, _, metadata in hits])
+        
+        results = []
+        for (_, score, _), item in zip(hits, items):
+            # Skip items deleted from the store since they were indexed
+            if item is None:
+                continue
+            result = self._memory_search_result(item)
+            result["score"] = score
+            results.append(result)
+        return results
+    
+    @staticmethod
+    def _memory_search_result(item) -> Dict[str, Any]:
+        """
+        Convert a store item to a memory search result.
+        
+        Args:
+            item: Item from a candidate profile or interview memory namespace
+            
+        Returns:
+            Dictionary with the memory type, key, value and relevance score if ranked
+        """
+        if item.namespace[0] == "candidate_profiles":
+            memory_type = "candidate_profile"
+        else:
+            memory_type = f"interview_{item.namespace[-1]}"
+        result = {
+            "type": memory_type,
+            "key": item.key,
+            "value": item.value
+        }
+        if getattr(item, "score", None) is not None:
+            result["score"] = item.score
+        return result
+    
+    def _create_async_store(self):
+        """
+        Create the cross-thread store used in async mode.
+        
+        Returns:
+            AsyncMongoStore on the store collection, or InMemoryStore if configured
+            or if the MongoDB store cannot be created
+        """
+        if get_memory_config()["store_backend"] != "mongodb":
+            logger.info("Initialized InMemoryStore for async operations; long-term memory is not persisted")
+            return InMemoryStore()
+        try:
+            # Sync helpers run in worker threads and need a pymongo client on the same data
+            self.store_client = MongoClient(self.connection_uri)
+            store = AsyncMongoStore(
+                self.async_client[self.db_name][self.store_collection],
+                sync_collection=self.store_client[self.db_name][self.store_collection]
+            )
+            logger.info(f"Initialized AsyncMongoStore with collection: {self.store_collection}")
+            return store
+        except Exception as e:
+            logger.error(f"Error initializing AsyncMongoStore, falling back to InMemoryStore: {e}")
+            return InMemoryStore()
+    
+    def _load_candidate_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a candidate's profile from the store.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            Profile data dictionary or None if not found
+        """
+        namespace = ("candidate_profiles",)
+        profiles = list(self.get_store().search(namespace, filter={"user_id": user_id}))
+        return profiles[0].value if profiles else None
+    
+    @staticmethod
+    def _merge_profile_data(current_data: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Intelligently merge profile data, preserving history where appropriate.
         
@@ -493,21 +761,23 @@ class InterviewMemoryManager:
         result = dict(current_data)
         
         # Always update timestamp
-        result["updated_at"] = new_data["updated_at"]
+        if "updated_at" in new_data:
+            result["updated_at"] = new_data["updated_at"]
         
         # Fields that should be appended rather than overwritten
         list_fields = ["key_skills", "notable_experiences", "strengths", "areas_for_improvement"]
         
         for key, value in new_data.items():
             if key in list_fields and key in current_data and isinstance(current_data[key], list):
-                # Append new items to list, avoiding duplicates
+                # Append new items to a copy of the list, avoiding duplicates
+                result[key] = list(current_data[key])
                 existing_items = set(str(item).lower() for item in current_data[key])
                 for item in value:
-                    if str(item).lower() not in existing_items:
+                    if item and str(item).lower() not in existing_items:
                         result[key].append(item)
                         existing_items.add(str(item).lower())
             else:
                 # For other fields, simply overwrite
                 result[key] = value
         
-        return result 
\ No newline at end of file
+        return result
@@ -0,0 +1,471 @@
+"""
+MongoDB-backed LangGraph store with native async support.
+
+Candidate profiles and interview memories live in the cross-thread store. In
+async mode the memory manager used an InMemoryStore, so they were lost on
+restart and never shared between server workers. AsyncMongoStore implements
+LangGraph's BaseStore on a MongoDB collection:
+
+- async operations (aget, aput, asearch, ...) use Motor, and concurrent calls
+  made in the same event loop iteration are coalesced into one abatch,
+- each batch reads all its GetOps with a single query and applies all its
+  PutOps with a single bulk write,
+- sync operations use a pymongo collection on the same database, so the memory
+  manager's sync helpers keep working from worker threads.
+
+Each item is one document keyed by namespace and key. The namespace is stored
+as a dotted path (LangGraph labels cannot contain dots) for prefix searches.
+The user_id and session_id of the value are copied to top-level fields, so
+filters on them are served by indexes. The text of the value is copied to a
+search_text field with a MongoDB text index, so searches with a query are
+ranked and paginated by the database.
+"""
+import asyncio
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ASCENDING, TEXT, DeleteOne, UpdateOne
+from langgraph.store.base import (
+    BaseStore,
+    GetOp,
+    Item,
+    ListNamespacesOp,
+    MatchCondition,
+    PutOp,
+    SearchItem,
+    SearchOp,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Value fields copied to indexed top-level fields
+INDEXED_FIELDS = ("user_id", "session_id")
+
+# Projection and sort on the relevance of a text search
+TEXT_SCORE = {"$meta": "textScore"}
+
+# Updates sent per bulk write when adding existing items to the text index
+BACKFILL_BATCH_SIZE = 500
+
+
+def _namespace_path(namespace: Tuple[str, ...]) -> str:
+    return ".".join(namespace)
+
+
+def _document_id(namespace: Tuple[str, ...], key: str) -> str:
+    # Namespace labels cannot contain dots, so "." separates them from each other and "/" from the key
+    return f"{_namespace_path(namespace)}/{key}"
+
+
+def _backfill_write(document: Dict[str, Any]) -> UpdateOne:
+    return UpdateOne({"_id": document["_id"]}, {"$set": {"search_text": value_text(document["value"])}})
+
+
+def _prefix_query(prefix: Tuple[str, ...]) -> Dict[str, Any]:
+    """Match namespaces equal to or below a prefix, using the namespace index."""
+    if not prefix:
+        return {}
+    path = re.escape(_namespace_path(prefix))
+    return {"namespace": {"$regex": f"^{path}(\\.|$)"}}
+
+
+def _filter_query(filter: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Translate a LangGraph value filter to a MongoDB query."""
+    query = {}
+    for field, condition in (filter or {}).items():
+        path = field if field in INDEXED_FIELDS else f"value.{field}"
+        query[path] = condition
+    return query
+
+
+def value_text(value: Any) -> str:
+    """Collect the strings in a stored value, for text and vector indexing."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        parts = value.values()
+    elif isinstance(value, (list, tuple)):
+        parts = value
+    else:
+        return ""
+    return " ".join(text for text in map(value_text, parts) if text)
+
+
+def _find(collection: Any, query: Dict[str, Any], text: Optional[str], limit: int, offset: int) -> Any:
+    """Find a page of documents, by relevance for a text query and newest first otherwise."""
+    if text:
+        cursor = collection.find({**query, "$text": {"$search": text}}, {"score": TEXT_SCORE})
+        cursor = cursor.sort([("score", TEXT_SCORE)])
+    else:
+        cursor = collection.find(query).sort("updated_at", -1)
+    return cursor.skip(offset).limit(limit)
+
+
+def _to_item(document: Dict[str, Any], search: bool = False) -> Item:
+    namespace = tuple(document["namespace_labels"])
+    if search:
+        return SearchItem(
+            namespace=namespace,
+            key=document["key"],
+            value=document["value"],
+            created_at=document["created_at"],
+            updated_at=document["updated_at"],
+            score=document.get("score")
+        )
+    return Item(
+        value=document["value"],
+        key=document["key"],
+        namespace=namespace,
+        created_at=document["created_at"],
+        updated_at=document["updated_at"]
+    )
+
+
+def _matches(namespace: Tuple[str, ...], condition: MatchCondition) -> bool:
+    """Check a namespace against a prefix or suffix condition with "*" wildcards."""
+    path = tuple(condition.path)
+    if len(path) > len(namespace):
+        return False
+    part = namespace[:len(path)] if condition.match_type == "prefix" else namespace[len(namespace) - len(path):]
+    return all(expected == "*" or expected == actual for expected, actual in zip(path, part))
+
+
+class AsyncMongoStore(BaseStore):
+    """
+    LangGraph store on a MongoDB collection with batched async and sync access.
+    """
+
+    def __init__(self, async_collection: Any, sync_collection: Optional[Any] = None):
+        """
+        Initialize the store.
+
+        Args:
+            async_collection: Motor collection used by the async operations
+            sync_collection: pymongo collection on the same data used by the sync
+                operations (sync calls fail if None)
+        """
+        self.async_collection = async_collection
+        self.sync_collection = sync_collection
+        # Operations waiting to be sent in the next batch, per event loop
+        self._pending: Dict[asyncio.AbstractEventLoop, List[Tuple[Any, asyncio.Future]]] = {}
+        self.stats = {"batches": 0, "operations": 0, "coalesced_calls": 0}
+
+    async def setup(self) -> None:
+        """Create the indexes used by gets, puts, searches and filters."""
+        for keys, options in self._index_specs():
+            await self.async_collection.create_index(keys, **options)
+        # Items written before the text index existed
+        backfilled = 0
+        writes = []
+        async for document in self.async_collection.find({"search_text": {"$exists": False}}, {"value": 1}):
+            writes.append(_backfill_write(document))
+            if len(writes) == BACKFILL_BATCH_SIZE:
+                await self.async_collection.bulk_write(writes, ordered=False)
+                backfilled += len(writes)
+                writes = []
+        if writes:
+            await self.async_collection.bulk_write(writes, ordered=False)
+            backfilled += len(writes)
+        logger.info(f"AsyncMongoStore indexes ready ({backfilled} items added to the text index)")
+
+    def setup_sync(self) -> None:
+        """Create the indexes with the sync collection."""
+        collection = self._require_sync()
+        for keys, options in self._index_specs():
+            collection.create_index(keys, **options)
+        backfilled = 0
+        writes = []
+        for document in collection.find({"search_text": {"$exists": False}}, {"value": 1}):
+            writes.append(_backfill_write(document))
+            if len(writes) == BACKFILL_BATCH_SIZE:
+                collection.bulk_write(writes, ordered=False)
+                backfilled += len(writes)
+                writes = []
+        if writes:
+            collection.bulk_write(writes, ordered=False)
+            backfilled += len(writes)
+        logger.info(f"AsyncMongoStore indexes ready ({backfilled} items added to the text index)")
+
+    # Batched single operations
+
+    async def aget(self, namespace: Tuple[str, ...], key: str, **kwargs) -> Optional[Item]:
+        """Get an item, batched with other operations from the same loop iteration."""
+        return await self._enqueue(GetOp(tuple(namespace), key))
+
+    async def aput(self, namespace: Tuple[str, ...], key: str, value: Dict[str, Any], index: Any = None, **kwargs) -> None:
+        """Store an item, batched with other operations from the same loop iteration."""
+        await self._enqueue(PutOp(tuple(namespace), key, value))
+
+    async def adelete(self, namespace: Tuple[str, ...], key: str) -> None:
+        """Delete an item, batched with other operations from the same loop iteration."""
+        await self._enqueue(PutOp(tuple(namespace), key, None))
+
+    async def _enqueue(self, op: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(loop, [])
+        pending.append((op, future))
+        if len(pending) == 1:
+            # Flush once the callers that are ready in this iteration have queued their operations
+            loop.call_soon(lambda: loop.create_task(self._flush(loop)))
+        return await future
+
+    async def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        queued = self._pending.pop(loop, [])
+        if not queued:
+            return
+        self.stats["coalesced_calls"] += len(queued) - 1
+        try:
+            results = await self.abatch([op for op, _ in queued])
+        except Exception as e:
+            for _, future in queued:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(queued, results):
+            if not future.done():
+                future.set_result(result)
+
+    # Full-text search
+
+    def search_text(self,
+                    namespace_prefixes: List[Tuple[str, ...]],
+                    query: str,
+                    filter: Optional[Dict[str, Any]] = None,
+                    limit: int = 10,
+                    offset: int = 0) -> List[SearchItem]:
+        """
+        Search items under several namespace prefixes by relevance to a query.
+
+        Args:
+            namespace_prefixes: Namespaces to search, including their sub-namespaces
+            query: Words to search for (MongoDB text search syntax)
+            filter: Value filter, e.g. {"user_id": ...}
+            limit: Maximum number of items returned
+            offset: Number of top-ranked items to skip
+
+        Returns:
+            Matching items, most relevant first, with their text score
+        """
+        cursor = _find(self._require_sync(), self._text_query(namespace_prefixes, filter), query, limit, offset)
+        return [_to_item(doc, search=True) for doc in cursor]
+
+    async def asearch_text(self,
+                           namespace_prefixes: List[Tuple[str, ...]],
+                           query: str,
+                           filter: Optional[Dict[str, Any]] = None,
+                           limit: int = 10,
+                           offset: int = 0) -> List[SearchItem]:
+        """
+        Search items under several namespace prefixes with the async collection.
+
+        Args:
+            namespace_prefixes: Namespaces to search, including their sub-namespaces
+            query: Words to search for (MongoDB text search syntax)
+            filter: Value filter, e.g. {"user_id": ...}
+            limit: Maximum number of items returned
+            offset: Number of top-ranked items to skip
+
+        Returns:
+            Matching items, most relevant first, with their text score
+        """
+        cursor = _find(self.async_collection, self._text_query(namespace_prefixes, filter), query, limit, offset)
+        return [_to_item(doc, search=True) async for doc in cursor]
+
+    # Incremental reads
+
+    def search_updated_since(self,
+                             namespace_prefixes: List[Tuple[str, ...]],
+                             since: datetime,
+                             limit: int = 500) -> List[Item]:
+        """
+        Find items written at or after a time, e.g. by other server workers.
+
+        Args:
+            namespace_prefixes: Namespaces to search, including their sub-namespaces
+            since: Earliest updated_at returned
+            limit: Maximum number of items returned
+
+        Returns:
+            Matching items, oldest update first, so the last item's updated_at
+            can be passed as since to read the next page
+        """
+        query = {**self._text_query(namespace_prefixes, None), "updated_at": {"$gte": since}}
+        cursor = self._require_sync().find(query).sort("updated_at", ASCENDING).limit(limit)
+        return [_to_item(doc) for doc in cursor]
+
+    # BaseStore batch interface
+
+    def batch(self, ops: Iterable[Any]) -> List[Any]:
+        """
+        Execute operations with the sync collection.
+
+        Args:
+            ops: GetOp, PutOp, SearchOp and ListNamespacesOp operations
+
+        Returns:
+            Results in the order of the operations
+        """
+        collection = self._require_sync()
+        ops = list(ops)
+        results: List[Any] = [None] * len(ops)
+
+        # Reads see the state before this batch's writes, as in InMemoryStore
+        gets = self._gets(ops)
+        if gets:
+            found = {doc["_id"]: doc for doc in collection.find({"_id": {"$in": list(gets)}})}
+            self._fill_gets(ops, gets, found, results)
+
+        for i, op in enumerate(ops):
+            if isinstance(op, SearchOp):
+                cursor = _find(collection, self._search_query(op), op.query, op.limit, op.offset)
+                results[i] = [_to_item(doc, search=True) for doc in cursor]
+            elif isinstance(op, ListNamespacesOp):
+                results[i] = self._list_namespaces(op, collection.distinct("namespace"))
+
+        writes = self._writes(ops)
+        if writes:
+            collection.bulk_write(writes, ordered=True)
+        self._count(ops)
+        return results
+
+    async def abatch(self, ops: Iterable[Any]) -> List[Any]:
+        """
+        Execute operations with the async collection.
+
+        Args:
+            ops: GetOp, PutOp, SearchOp and ListNamespacesOp operations
+
+        Returns:
+            Results in the order of the operations
+        """
+        collection = self.async_collection
+        ops = list(ops)
+        results: List[Any] = [None] * len(ops)
+
+        gets = self._gets(ops)
+        if gets:
+            found = {doc["_id"]: doc async for doc in collection.find({"_id": {"$in": list(gets)}})}
+            self._fill_gets(ops, gets, found, results)
+
+        for i, op in enumerate(ops):
+            if isinstance(op, SearchOp):
+                cursor = _find(collection, self._search_query(op), op.query, op.limit, op.offset)
+                results[i] = [_to_item(doc, search=True) async for doc in cursor]
+            elif isinstance(op, ListNamespacesOp):
+                results[i] = self._list_namespaces(op, await collection.distinct("namespace"))
+
+        writes = self._writes(ops)
+        if writes:
+            await collection.bulk_write(writes, ordered=True)
+        self._count(ops)
+        return results
+
+    # Helpers
+
+    @staticmethod
+    def _index_specs() -> List[Tuple[List[Tuple[str, int]], Dict[str, Any]]]:
+        return [
+            ([("namespace", ASCENDING), ("key", ASCENDING)], {"unique": True}),
+            ([("namespace", ASCENDING), ("user_id", ASCENDING), ("updated_at", ASCENDING)], {}),
+            ([("namespace", ASCENDING), ("session_id", ASCENDING)], {}),
+            ([("namespace", ASCENDING), ("updated_at", ASCENDING)], {}),
+            # Values may contain a "language" field, which must not select the text language
+            ([("search_text", TEXT)], {"language_override": "text_language"}),
+        ]
+
+    def _require_sync(self) -> Any:
+        if self.sync_collection is None:
+            raise RuntimeError("AsyncMongoStore was created without a sync collection; use the async methods")
+        return self.sync_collection
+
+    @staticmethod
+    def _writes(ops: List[Any]) -> List[Any]:
+        """Build one bulk write for all PutOps; later puts to the same item win."""
+        writes = []
+        now = datetime.now(timezone.utc)
+        for op in ops:
+            if not isinstance(op, PutOp):
+                continue
+            _id = _document_id(op.namespace, op.key)
+            if op.value is None:
+                writes.append(DeleteOne({"_id": _id}))
+                continue
+            fields = {
+                "value": op.value,
+                "search_text": value_text(op.value),
+                "updated_at": now,
+                **{field: op.value.get(field) for field in INDEXED_FIELDS}
+            }
+            writes.append(UpdateOne(
+                {"_id": _id},
+                {
+                    "$set": fields,
+                    "$setOnInsert": {
+                        "namespace": _namespace_path(op.namespace),
+                        "namespace_labels": list(op.namespace),
+                        "key": op.key,
+                        "created_at": now
+                    }
+                },
+                upsert=True
+            ))
+        return writes
+
+    @staticmethod
+    def _gets(ops: List[Any]) -> Dict[str, List[int]]:
+        """Map the document ID of every GetOp to the positions that requested it."""
+        gets: Dict[str, List[int]] = {}
+        for i, op in enumerate(ops):
+            if isinstance(op, GetOp):
+                gets.setdefault(_document_id(op.namespace, op.key), []).append(i)
+        return gets
+
+    @staticmethod
+    def _fill_gets(ops: List[Any], gets: Dict[str, List[int]], found: Dict[str, Any], results: List[Any]) -> None:
+        for _id, positions in gets.items():
+            document = found.get(_id)
+            for i in positions:
+                results[i] = _to_item(document) if document else None
+
+    @staticmethod
+    def _search_query(op: SearchOp) -> Dict[str, Any]:
+        return {**_prefix_query(op.namespace_prefix), **_filter_query(op.filter)}
+
+    @staticmethod
+    def _text_query(namespace_prefixes: List[Tuple[str, ...]], filter: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        prefixes = [_prefix_query(prefix) for prefix in namespace_prefixes]
+        query = _filter_query(filter)
+        if len(prefixes) == 1:
+            query.update(prefixes[0])
+        elif prefixes:
+            query["$or"] = prefixes
+        return query
+
+    @staticmethod
+    def _list_namespaces(op: ListNamespacesOp, paths: List[str]) -> List[Tuple[str, ...]]:
+        namespaces = set()
+        for path in paths:
+            namespace = tuple(path.split("."))
+            if op.match_conditions and not all(_matches(namespace, c) for c in op.match_conditions):
+                continue
+            if op.max_depth is not None:
+                namespace = namespace[:op.max_depth]
+            namespaces.add(namespace)
+        return sorted(namespaces)[op.offset:op.offset + op.limit]
+
+    def _count(self, ops: List[Any]) -> None:
+        self.stats["batches"] += 1
+        self.stats["operations"] += len(ops)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Number of batches, operations and calls coalesced into shared batches
+        """
+        return dict(self.stats)
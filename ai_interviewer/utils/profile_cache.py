@@ -0,0 +1,311 @@
+"""
+Per-process cache of candidate profiles.
+
+The interviewer reads the candidate profile on every model call once the
+candidate's name is known, including tool-loop re-entries within one turn.
+ProfileCache sits in front of the memory store: reads go through it (misses
+are loaded from the store and cached, including "no profile yet"), saves
+write through it, and entries expire after a TTL.
+
+Other workers may update the same profile. Invalidations are published on a
+pluggable bus so every worker drops its copy:
+
+- LocalInvalidationBus only reaches caches in this process.
+- MongoInvalidationBus records invalidations in a MongoDB collection that
+  every worker polls.
+
+The TTL bounds staleness if an invalidation is missed.
+"""
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ai_interviewer.utils.config import get_db_config, get_memory_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Seconds invalidation events are kept in MongoDB
+INVALIDATION_RETENTION = 3600
+
+
+class LocalInvalidationBus:
+    """
+    Invalidation bus that only reaches subscribers in this process.
+    """
+
+    def __init__(self):
+        """Initialize the bus without subscribers."""
+        self._subscribers: List[Callable[[str], None]] = []
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback for invalidated user IDs.
+
+        Args:
+            callback: Called with the user ID of each invalidated profile
+        """
+        self._subscribers.append(callback)
+
+    def publish(self, user_id: str) -> None:
+        """
+        Announce that a user's profile changed.
+
+        Args:
+            user_id: User identifier
+        """
+        for callback in list(self._subscribers):
+            callback(user_id)
+
+    def close(self) -> None:
+        """Stop delivering invalidations."""
+        self._subscribers.clear()
+
+
+class MongoInvalidationBus(LocalInvalidationBus):
+    """
+    Invalidation bus shared between workers through a MongoDB collection.
+
+    Each published invalidation is inserted as a document. A background thread
+    polls for documents from other workers and passes them to the subscribers.
+    """
+
+    def __init__(self, collection: Any, poll_interval: float = 2.0):
+        """
+        Initialize the bus and start polling.
+
+        Args:
+            collection: pymongo collection for invalidation events
+            poll_interval: Seconds between polls
+        """
+        super().__init__()
+        self.collection = collection
+        self.poll_interval = poll_interval
+        self.origin = uuid.uuid4().hex
+        self._since = datetime.utcnow()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll_loop, name="profile-invalidation", daemon=True)
+        self._thread.start()
+
+    def publish(self, user_id: str) -> None:
+        """
+        Invalidate a profile in this process and announce it to other workers.
+
+        Args:
+            user_id: User identifier
+        """
+        super().publish(user_id)
+        try:
+            self.collection.insert_one({
+                "user_id": user_id,
+                "origin": self.origin,
+                "at": datetime.utcnow(),
+                "expires_at": datetime.utcnow() + timedelta(seconds=INVALIDATION_RETENTION)
+            })
+        except Exception as e:
+            logger.warning(f"Failed to publish profile invalidation for {user_id}: {e}")
+
+    def poll(self) -> int:
+        """
+        Deliver invalidations published by other workers since the last poll.
+
+        Returns:
+            Number of invalidations delivered
+        """
+        # Events written just before the previous poll may become visible late, so overlap slightly
+        since = self._since - timedelta(seconds=self.poll_interval)
+        now = datetime.utcnow()
+        delivered = 0
+        for event in self.collection.find({"at": {"$gt": since}, "origin": {"$ne": self.origin}}):
+            super().publish(event["user_id"])
+            delivered += 1
+        self._since = now
+        return delivered
+
+    def close(self) -> None:
+        """Stop polling."""
+        self._stop.set()
+        super().close()
+
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Failed to poll profile invalidations: {e}")
+
+
+class ProfileCache:
+    """
+    TTL and LRU bounded read-through cache of candidate profiles.
+    """
+
+    def __init__(self,
+                 ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None,
+                 bus: Optional[LocalInvalidationBus] = None):
+        """
+        Initialize the cache.
+
+        Settings default to the values from get_memory_config().
+
+        Args:
+            ttl: Seconds a cached profile is used without re-reading the store
+            max_entries: Maximum number of profiles kept
+            bus: Invalidation bus shared with other caches (LocalInvalidationBus if None)
+        """
+        config = get_memory_config()
+
+        self.ttl = ttl if ttl is not None else config["profile_cache_ttl"]
+        self.max_entries = max_entries if max_entries is not None else config["profile_cache_max_entries"]
+        self.bus = bus or LocalInvalidationBus()
+        self.bus.subscribe(self._drop)
+
+        # user id -> (expiry on the monotonic clock, profile or None)
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        # user id -> generation, bumped on every write or invalidation so
+        # loads that started earlier do not overwrite newer data
+        self._generations: Dict[str, int] = {}
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "invalidations": 0, "evictions": 0}
+
+    def get_or_load(self, user_id: str, loader: Callable[[str], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        Get a profile, loading it from the store on a miss.
+
+        Args:
+            user_id: User identifier
+            loader: Reads the profile from the store, returning None if there is none
+
+        Returns:
+            A copy of the profile, or None if the user has no profile
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(user_id)
+                self.stats["hits"] += 1
+                return _copy(entry[1])
+            self.stats["misses"] += 1
+            generation = self._generations.setdefault(user_id, 0)
+
+        profile = loader(user_id)
+
+        with self._lock:
+            # Only cache the result if nothing changed the profile meanwhile
+            if self._generations.get(user_id, 0) == generation:
+                self._store(user_id, profile)
+        return _copy(profile)
+
+    def put(self, user_id: str, profile: Dict[str, Any]) -> None:
+        """
+        Write a saved profile through to the cache and invalidate other copies.
+
+        Args:
+            user_id: User identifier
+            profile: Profile as saved in the store
+        """
+        self.bus.publish(user_id)
+        with self._lock:
+            self._store(user_id, _copy(profile))
+            self.stats["writes"] += 1
+
+    def invalidate(self, user_id: str) -> None:
+        """
+        Drop a profile here and in every cache on the bus.
+
+        Args:
+            user_id: User identifier
+        """
+        self.bus.publish(user_id)
+
+    def clear(self) -> None:
+        """Drop all cached profiles in this process."""
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+    def close(self) -> None:
+        """Stop receiving invalidations."""
+        self.bus.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Counters plus the number of cached profiles
+        """
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries)}
+
+    def _drop(self, user_id: str) -> None:
+        """Invalidation bus callback."""
+        with self._lock:
+            # Only users cached or being loaded here are tracked
+            if user_id in self._generations:
+                self._generations[user_id] = next(self._counter)
+            if self._entries.pop(user_id, None) is not None:
+                self.stats["invalidations"] += 1
+
+    def _store(self, user_id: str, profile: Optional[Dict[str, Any]]) -> None:
+        """Add an entry. Must be called with the lock held."""
+        self._entries.pop(user_id, None)
+        self._entries[user_id] = (time.monotonic() + self.ttl, profile)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._generations.pop(evicted, None)
+            self.stats["evictions"] += 1
+
+
+def _copy(profile: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Copy a profile so callers cannot change the cached one."""
+    if profile is None:
+        return None
+    return {key: list(value) if isinstance(value, list) else dict(value) if isinstance(value, dict) else value
+            for key, value in profile.items()}
+
+
+def create_profile_cache() -> Optional[ProfileCache]:
+    """
+    Create a profile cache with the configured invalidation bus.
+
+    Returns:
+        ProfileCache instance, or None if profile caching is disabled
+    """
+    config = get_memory_config()
+    if not config["profile_cache_enabled"]:
+        return None
+
+    bus = None
+    if config["profile_invalidation"] == "mongodb":
+        try:
+            import pymongo
+            from pymongo.mongo_client import MongoClient
+
+            db_config = get_db_config()
+            client = MongoClient(
+                db_config["uri"],
+                maxPoolSize=db_config["max_pool_size"],
+                minPoolSize=db_config["min_pool_size"],
+                maxIdleTimeMS=db_config["max_idle_time_ms"],
+                waitQueueTimeoutMS=db_config["wait_queue_timeout_ms"],
+                serverSelectionTimeoutMS=2000
+            )
+            collection = client[db_config["database"]][config["profile_invalidation_collection"]]
+            collection.create_index([("at", pymongo.ASCENDING)])
+            # Let MongoDB drop old events
+            collection.create_index([("expires_at", pymongo.ASCENDING)], expireAfterSeconds=0)
+            bus = MongoInvalidationBus(collection, config["profile_invalidation_poll_interval"])
+            logger.info(f"Profile cache invalidations shared through {config['profile_invalidation_collection']}")
+        except Exception as e:
+            logger.warning(f"Profile invalidation bus unavailable, invalidating in this process only: {e}")
+
+    return ProfileCache(bus=bus)
@@ -0,0 +1,344 @@
+"""
+Prefix caching for the interviewer system prompt.
+
+The interviewer system prompt is mostly static for a session: persona, role,
+seniority, skills, job description and the interview guidelines only change
+when the session metadata does. Only the stage, candidate name, conversation
+summary and candidate history change from turn to turn. SystemPromptCache
+renders the static prefix once per distinct set of session settings, binds
+sessions to it, and formats only the volatile suffix on each turn.
+
+A prefix can also be registered with a backend:
+
+- LocalPrefixBackend keeps prefixes in process only; the prefix is still sent
+  inline with each request, but it is no longer re-rendered every turn.
+- GeminiContextCacheBackend registers long prefixes (and the interviewer
+  tools) with Gemini context caching, so they are billed at the cached rate
+  and not re-tokenised. Gemini only caches content above a minimum size;
+  shorter prefixes fall back to being sent inline.
+
+When a session's settings change, it is bound to a new prefix, and remote
+caches no longer used by any session are released.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from ai_interviewer.utils.config import get_llm_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Rough characters per token, used to decide whether a prefix is worth caching remotely
+CHARS_PER_TOKEN = 4
+
+# Local entries expire slightly before the remote cache so expired handles are never used
+EXPIRY_MARGIN = 0.9
+
+
+class SystemPrompt(NamedTuple):
+    """A rendered system prompt split into its cached prefix and per-turn suffix."""
+    prefix: str
+    suffix: str
+    prefix_key: str
+    cache_handle: Optional[str] = None
+
+    @property
+    def content(self) -> str:
+        """Full system prompt text."""
+        return self.prefix + self.suffix
+
+
+class LocalPrefixBackend:
+    """
+    Backend that keeps prefixes in process only.
+    """
+
+    def register(self, key: str, prefix: str, ttl: float) -> Optional[str]:
+        """
+        Register a prefix.
+
+        Args:
+            key: Prefix key
+            prefix: Rendered prefix text
+            ttl: Seconds the prefix should stay cached
+
+        Returns:
+            None, as the prefix is sent inline
+        """
+        return None
+
+    def release(self, handle: str) -> None:
+        """Release a registered prefix (nothing to do locally)."""
+
+
+class GeminiContextCacheBackend:
+    """
+    Backend that registers prefixes with Gemini context caching.
+    """
+
+    def __init__(self, model: str, min_tokens: int, tools: Optional[List[Any]] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            model: Versioned Gemini model name the cache is created for
+            min_tokens: Smallest prefix, in estimated tokens, worth caching remotely
+            tools: LangChain tools bound to the interviewer; cached requests cannot
+                send tools, so they are stored in the cache with the prefix
+        """
+        self.model = model
+        self.min_tokens = min_tokens
+        self.tools = tools or []
+        try:
+            from google.generativeai import caching
+            self.caching = caching
+        except ImportError:
+            logger.error("Gemini context caching needs google-generativeai>=0.7.0; system prompt prefixes will be sent inline")
+            self.caching = None
+
+    def register(self, key: str, prefix: str, ttl: float) -> Optional[str]:
+        """
+        Create a Gemini cached content entry for a prefix.
+
+        Args:
+            key: Prefix key
+            prefix: Rendered prefix text, used as the system instruction
+            ttl: Seconds the cached content lives
+
+        Returns:
+            Name of the cached content, or None if the prefix is sent inline
+        """
+        if self.caching is None or len(prefix) // CHARS_PER_TOKEN < self.min_tokens:
+            return None
+        try:
+            from langchain_google_genai._function_utils import convert_to_genai_function_declarations
+
+            cached = self.caching.CachedContent.create(
+                model=self.model,
+                display_name=f"interview-prefix-{key[:16]}",
+                system_instruction=prefix,
+                tools=[convert_to_genai_function_declarations(self.tools)] if self.tools else None,
+                ttl=timedelta(seconds=ttl)
+            )
+            logger.info(f"Registered system prompt prefix {key[:16]} as {cached.name}")
+            return cached.name
+        except Exception as e:
+            logger.warning(f"Gemini context caching unavailable, sending prefix inline: {e}")
+            return None
+
+    def release(self, handle: str) -> None:
+        """
+        Delete a Gemini cached content entry.
+
+        Args:
+            handle: Name of the cached content
+        """
+        if self.caching is None:
+            return
+        try:
+            self.caching.CachedContent.get(handle).delete()
+        except Exception as e:
+            logger.warning(f"Failed to delete cached content {handle}: {e}")
+
+
+class _Prefix(NamedTuple):
+    text: str
+    handle: Optional[str]
+    expires: float
+
+
+class SystemPromptCache:
+    """
+    Renders system prompts from a cached static prefix and a per-turn suffix.
+    """
+
+    def __init__(self,
+                 prefix_template: str,
+                 suffix_template: str,
+                 backend: Optional[Any] = None,
+                 ttl: Optional[int] = None,
+                 max_prefixes: Optional[int] = None,
+                 max_sessions: int = 10000):
+        """
+        Initialize the cache.
+
+        Settings default to the values from get_llm_config().
+
+        Args:
+            prefix_template: Template formatted with the static session settings
+            suffix_template: Template formatted with the per-turn values
+            backend: Prefix backend with register/release (LocalPrefixBackend if None)
+            ttl: Seconds a rendered prefix (and its remote cache) stays valid
+            max_prefixes: Maximum number of distinct prefixes kept
+            max_sessions: Maximum number of session bindings tracked
+        """
+        config = get_llm_config()
+
+        self.prefix_template = prefix_template
+        self.suffix_template = suffix_template
+        self.backend = backend or LocalPrefixBackend()
+        self.ttl = ttl if ttl is not None else config["context_cache_ttl"]
+        self.max_prefixes = max_prefixes if max_prefixes is not None else config["context_cache_max_prefixes"]
+        self.max_sessions = max_sessions
+
+        self._prefixes: "OrderedDict[str, _Prefix]" = OrderedDict()
+        # session id -> prefix key, in LRU order
+        self._sessions: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.stats = {"hits": 0, "renders": 0, "registered": 0, "invalidations": 0, "released": 0}
+
+    @staticmethod
+    def make_key(static: Dict[str, Any]) -> str:
+        """
+        Build the key identifying a prefix.
+
+        Args:
+            static: Values the prefix template is formatted with
+
+        Returns:
+            Hex digest of the values
+        """
+        payload = json.dumps(static, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def render(self, session_id: str, static: Dict[str, Any], volatile: Dict[str, Any],
+               extra: str = "") -> SystemPrompt:
+        """
+        Render the system prompt for a turn.
+
+        Args:
+            session_id: Session the prompt is for
+            static: Values for the prefix template (session settings)
+            volatile: Values for the suffix template (per-turn state)
+            extra: Text appended after the suffix, such as the candidate history
+
+        Returns:
+            SystemPrompt with the cached prefix and the freshly formatted suffix
+        """
+        key = self.make_key(static)
+        prefix = self._get_prefix(key, static)
+        released = self._bind(session_id, key)
+        for handle in released:
+            self._release(handle)
+
+        suffix = self.suffix_template.format(**volatile) + extra
+        return SystemPrompt(prefix.text, suffix, key, prefix.handle)
+
+    def active_handles(self) -> List[str]:
+        """
+        Get the remote cache handles currently in use.
+
+        Returns:
+            Handles of prefixes registered with the backend
+        """
+        with self._lock:
+            return [prefix.handle for prefix in self._prefixes.values() if prefix.handle]
+
+    def clear(self) -> None:
+        """Drop all prefixes and session bindings, releasing remote caches."""
+        with self._lock:
+            handles = [prefix.handle for prefix in self._prefixes.values() if prefix.handle]
+            self._prefixes.clear()
+            self._sessions.clear()
+        for handle in handles:
+            self._release(handle)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Counters plus the number of prefixes and sessions tracked
+        """
+        with self._lock:
+            return {
+                **self.stats,
+                "prefixes": len(self._prefixes),
+                "sessions": len(self._sessions),
+                "remote": sum(1 for prefix in self._prefixes.values() if prefix.handle)
+            }
+
+    def _get_prefix(self, key: str, static: Dict[str, Any]) -> _Prefix:
+        """Return the cached prefix for a key, rendering and registering it on a miss."""
+        expired = None
+        with self._lock:
+            prefix = self._prefixes.get(key)
+            if prefix is not None and prefix.expires > time.monotonic():
+                self._prefixes.move_to_end(key)
+                self.stats["hits"] += 1
+                return prefix
+            if prefix is not None:
+                expired = self._prefixes.pop(key).handle
+
+        if expired:
+            self._release(expired)
+
+        # Registration may be a network call, so it runs outside the lock
+        text = self.prefix_template.format(**static)
+        handle = self.backend.register(key, text, self.ttl)
+        prefix = _Prefix(text, handle, time.monotonic() + self.ttl * EXPIRY_MARGIN)
+
+        evicted = []
+        with self._lock:
+            self.stats["renders"] += 1
+            if handle:
+                self.stats["registered"] += 1
+            self._prefixes[key] = prefix
+            while len(self._prefixes) > self.max_prefixes:
+                _, old = self._prefixes.popitem(last=False)
+                if old.handle:
+                    evicted.append(old.handle)
+        for old_handle in evicted:
+            self._release(old_handle)
+        return prefix
+
+    def _bind(self, session_id: str, key: str) -> List[str]:
+        """Bind a session to a prefix and return handles of prefixes it no longer uses."""
+        with self._lock:
+            previous = self._sessions.pop(session_id, None)
+            self._sessions[session_id] = key
+            released = []
+            if previous and previous != key:
+                # The session's settings changed
+                self.stats["invalidations"] += 1
+                released = self._drop_if_unused(previous)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            return released
+
+    def _drop_if_unused(self, key: str) -> List[str]:
+        """Drop a remotely cached prefix no session uses any more. Must be called with the lock held."""
+        prefix = self._prefixes.get(key)
+        if prefix is None or not prefix.handle or key in self._sessions.values():
+            return []
+        del self._prefixes[key]
+        return [prefix.handle]
+
+    def _release(self, handle: str) -> None:
+        self.backend.release(handle)
+        with self._lock:
+            self.stats["released"] += 1
+
+
+def create_prefix_backend(tools: Optional[List[Any]] = None) -> Any:
+    """
+    Create the configured prefix backend.
+
+    Args:
+        tools: LangChain tools bound to the interviewer model
+
+    Returns:
+        GeminiContextCacheBackend or LocalPrefixBackend
+    """
+    config = get_llm_config()
+    if config["context_cache_backend"] == "gemini":
+        logger.info(f"System prompt prefixes over {config['context_cache_min_tokens']} tokens use Gemini context caching")
+        return GeminiContextCacheBackend(config["context_cache_model"], config["context_cache_min_tokens"], tools)
+    return LocalPrefixBackend()
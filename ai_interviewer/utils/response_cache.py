@@ -0,0 +1,442 @@
+"""
+Response cache for deterministic tool LLM calls.
+
+LLM hints for the same challenge, code and error, reviews of the same code
+section, and opening questions for the same role, skills and difficulty are
+requested over and over across candidates. Their responses are keyed by a hash
+of the normalized inputs that determine them (a semantic key), namespaced per
+tool with a per-tool TTL, and kept in an in-memory LRU optionally backed by a
+shared second tier:
+
+- DiskResponseStore keeps one JSON file per entry in a directory,
+- MongoResponseStore keeps entries in a MongoDB collection with a TTL index.
+
+Any object with the same get/put methods can be plugged in as the second tier.
+Only successful responses should be stored; callers keep their fallbacks out.
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from ai_interviewer.utils.config import get_db_config, get_llm_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Tools whose responses are cached, mapped to their TTL setting in get_llm_config()
+TOOL_TTL_SETTINGS = {
+    "hints": "cache_ttl_hints",
+    "code_review": "cache_ttl_code_review",
+    "question": "cache_ttl_question",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Normalize free text (roles, skills, error messages) for cache keys.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Lower-cased text with runs of whitespace collapsed
+    """
+    return _WHITESPACE.sub(" ", text or "").strip().lower()
+
+
+def normalize_code(code: Optional[str]) -> str:
+    """
+    Normalize source code for cache keys.
+
+    Line endings, trailing whitespace and surrounding blank lines do not
+    change what the code does, so they are ignored. Indentation is kept.
+    Shared by the LLM response cache and the code execution cache.
+
+    Args:
+        code: Source code
+
+    Returns:
+        Normalized source code
+    """
+    lines = [line.rstrip() for line in (code or "").replace("\r\n", "\n").replace("\r", "\n").split("\n")]
+    return "\n".join(lines).strip("\n")
+
+
+class DiskResponseStore:
+    """
+    Second cache tier keeping one JSON file per entry in a directory.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the store.
+
+        Args:
+            cache_dir: Directory for cached responses, created if missing
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Read an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of the value and its remaining lifetime in seconds, or None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cached response {key}: {e}")
+            self._remove(path)
+            return None
+
+        remaining = document.get("expires_at", 0) - time.time()
+        if remaining <= 0:
+            self._remove(path)
+            return None
+        return document.get("value"), remaining
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Write an entry atomically.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response
+            ttl: Seconds the entry stays valid
+        """
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"value": value, "expires_at": time.time() + ttl}, f, default=str)
+        os.replace(temp_path, path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key.replace(":", "_") + ".json")
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class MongoResponseStore:
+    """
+    Second cache tier keeping entries in a MongoDB collection shared between workers.
+    """
+
+    def __init__(self, collection: Any):
+        """
+        Initialize the store.
+
+        Args:
+            collection: pymongo collection with a TTL index on expires_at
+        """
+        self.collection = collection
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Read an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of the value and its remaining lifetime in seconds, or None
+        """
+        document = self.collection.find_one({"_id": key})
+        if not document:
+            return None
+
+        # The TTL index only sweeps periodically, so check expiry here too
+        remaining = (document["expires_at"] - datetime.utcnow()).total_seconds()
+        if remaining <= 0:
+            return None
+        return json.loads(document["value"]), remaining
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Write an entry.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response
+            ttl: Seconds the entry stays valid
+        """
+        self.collection.replace_one(
+            {"_id": key},
+            {
+                "_id": key,
+                "value": json.dumps(value, default=str),
+                "expires_at": datetime.utcnow() + timedelta(seconds=ttl)
+            },
+            upsert=True
+        )
+
+
+class ResponseCache:
+    """
+    TTL and LRU bounded cache of tool LLM responses with an optional second tier.
+    """
+
+    def __init__(self,
+                 max_entries: Optional[int] = None,
+                 ttls: Optional[Dict[str, float]] = None,
+                 store: Optional[Any] = None):
+        """
+        Initialize the cache.
+
+        Settings default to the values from get_llm_config().
+
+        Args:
+            max_entries: Maximum number of responses kept in memory
+            ttls: Seconds a response stays valid, per tool (0 disables caching for the tool)
+            store: Optional second tier with get(key) and put(key, value, ttl)
+        """
+        config = get_llm_config()
+
+        self.max_entries = max_entries if max_entries is not None else config["cache_max_entries"]
+        self.ttls = ttls if ttls is not None else {tool: config[setting] for tool, setting in TOOL_TTL_SETTINGS.items()}
+        self.store = store
+
+        # key -> (expiry on the monotonic clock, value)
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # tool -> counters
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def make_key(tool: str, **fields: Any) -> str:
+        """
+        Build the cache key for a tool call.
+
+        Callers pass the inputs that determine the response, already
+        normalized with normalize_text or normalize_code.
+
+        Args:
+            tool: Tool name, used as the key namespace
+            **fields: Inputs that determine the response
+
+        Returns:
+            Key of the form "<tool>:<hex digest>"
+        """
+        payload = json.dumps(fields, sort_keys=True, default=str)
+        return f"{tool}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def is_enabled(self, tool: str) -> bool:
+        """
+        Check whether responses of a tool are cached.
+
+        Args:
+            tool: Tool name
+
+        Returns:
+            True if the tool has a positive TTL
+        """
+        return self.ttls.get(tool, 0) > 0
+
+    def get(self, tool: str, key: str) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        Args:
+            tool: Tool name
+            key: Cache key from make_key
+
+        Returns:
+            A copy of the cached response, or None on a miss
+        """
+        if not self.is_enabled(tool):
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > now:
+                    self._memory.move_to_end(key)
+                    self._count(tool, "memory_hits")
+                    return copy.deepcopy(value)
+                del self._memory[key]
+                self._count(tool, "expired")
+
+        found = self._get_shared(key)
+        with self._lock:
+            if found is None:
+                self._count(tool, "misses")
+                return None
+            value, remaining = found
+            self._count(tool, "store_hits")
+            self._remember(key, value, min(remaining, self.ttls[tool]))
+        return copy.deepcopy(value)
+
+    def put(self, tool: str, key: str, value: Any) -> None:
+        """
+        Add a response to the cache.
+
+        Args:
+            tool: Tool name
+            key: Cache key from make_key
+            value: JSON-serializable response
+        """
+        if not self.is_enabled(tool):
+            return
+
+        ttl = self.ttls[tool]
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value, ttl)
+            self._count(tool, "stores")
+
+        if self.store is None:
+            return
+        try:
+            self.store.put(key, value, ttl)
+        except Exception as e:
+            logger.warning(f"Failed to store cached response {key}: {e}")
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Per-tool counters with hit rates, plus the current size
+        """
+        with self._lock:
+            tools = {}
+            for tool, counters in self.stats.items():
+                hits = counters.get("memory_hits", 0) + counters.get("store_hits", 0)
+                lookups = hits + counters.get("misses", 0) + counters.get("expired", 0)
+                tools[tool] = {**counters, "hit_rate": round(hits / lookups, 3) if lookups else 0.0}
+            return {
+                "tools": tools,
+                "entries": len(self._memory),
+                "store": type(self.store).__name__ if self.store is not None else None
+            }
+
+    def _get_shared(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Look up a response in the second tier, treating errors as misses."""
+        if self.store is None:
+            return None
+        try:
+            return self.store.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read cached response {key}: {e}")
+            return None
+
+    def _remember(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a response in the memory LRU. Must be called with the lock held.
+
+        Args:
+            key: Cache key
+            value: Response
+            ttl: Seconds the entry stays valid
+        """
+        self._memory.pop(key, None)
+        self._memory[key] = (time.monotonic() + ttl, value)
+        while len(self._memory) > self.max_entries:
+            evicted, _ = self._memory.popitem(last=False)
+            self._count(evicted.split(":", 1)[0], "evictions")
+
+    def _count(self, tool: str, counter: str) -> None:
+        """Increment a per-tool counter. Must be called with the lock held."""
+        counters = self.stats.setdefault(tool, {
+            "memory_hits": 0, "store_hits": 0, "misses": 0, "expired": 0, "stores": 0, "evictions": 0
+        })
+        counters[counter] += 1
+
+
+# Lazily created process-wide cache
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide tool response cache.
+
+    Returns:
+        ResponseCache instance, or None if caching is disabled
+    """
+    global _response_cache
+
+    config = get_llm_config()
+    if not config["cache_enabled"]:
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(store=_create_store(config))
+        return _response_cache
+
+
+def _create_store(config: Dict[str, Any]) -> Optional[Any]:
+    """
+    Create the configured second tier.
+
+    Args:
+        config: LLM configuration
+
+    Returns:
+        DiskResponseStore, MongoResponseStore or None for memory only
+    """
+    backend = config["cache_backend"]
+    if backend == "disk":
+        try:
+            store = DiskResponseStore(config["cache_dir"])
+            logger.info(f"Tool response cache disk tier using {config['cache_dir']}")
+            return store
+        except OSError as e:
+            logger.warning(f"Tool response cache disk tier unavailable, using memory only: {e}")
+            return None
+    if backend == "mongodb":
+        try:
+            import pymongo
+            from pymongo.mongo_client import MongoClient
+
+            db_config = get_db_config()
+            client = MongoClient(
+                db_config["uri"],
+                maxPoolSize=db_config["max_pool_size"],
+                minPoolSize=db_config["min_pool_size"],
+                maxIdleTimeMS=db_config["max_idle_time_ms"],
+                waitQueueTimeoutMS=db_config["wait_queue_timeout_ms"],
+                serverSelectionTimeoutMS=2000
+            )
+            collection = client[db_config["database"]][db_config["llm_cache_collection"]]
+            # Let MongoDB drop entries once they expire
+            collection.create_index([("expires_at", pymongo.ASCENDING)], expireAfterSeconds=0)
+            logger.info(f"Tool response cache MongoDB tier using collection {db_config['llm_cache_collection']}")
+            return MongoResponseStore(collection)
+        except Exception as e:
+            logger.warning(f"Tool response cache MongoDB tier unavailable, using memory only: {e}")
+            return None
+    return None
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Any
 import pymongo
 from pymongo.mongo_client import MongoClient
 
+from ai_interviewer.utils.config import get_db_config
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -41,7 +43,14 @@ class SessionManager:
         self.collection_name = collection_name
         
         # Initialize MongoDB connection
-        self.client = MongoClient(connection_uri)
+        db_config = get_db_config()
+        self.client = MongoClient(
+            connection_uri,
+            maxPoolSize=db_config["max_pool_size"],
+            minPoolSize=db_config["min_pool_size"],
+            maxIdleTimeMS=db_config["max_idle_time_ms"],
+            waitQueueTimeoutMS=db_config["wait_queue_timeout_ms"],
+        )
         self.db = self.client[database_name]
         self.collection = self.db[collection_name]
         
@@ -52,18 +61,20 @@ class SessionManager:
         
         logger.info(f"Session manager initialized with {connection_uri}")
     
-    def create_session(self, user_id: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+    def create_session(self, user_id: str, metadata: Optional[Dict[str, Any]] = None,
+                       session_id: Optional[str] = None) -> str:
         """
         Create a new interview session.
         
         Args:
             user_id: User identifier
             metadata: Optional additional metadata
+            session_id: Optional session ID to use instead of a generated one
             
         Returns:
             Session ID
         """
-        session_id = str(uuid.uuid4())
+        session_id = session_id or str(uuid.uuid4())
         timestamp = datetime.now()
         
         # Prepare document
@@ -183,6 +194,39 @@ class SessionManager:
             logger.error(f"Error updating session metadata: {e}")
             return False
     
+    def push_session_metadata(self, session_id: str, entries: Dict[str, Any]) -> bool:
+        """
+        Append entries to list fields of the session metadata with a single $push.
+        
+        Unlike rewriting the metadata, concurrent appends to the same session
+        do not overwrite each other.
+        
+        Args:
+            session_id: Session identifier
+            entries: Metadata list fields mapped to the entry to append to each
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            result = self.collection.update_one(
+                {"session_id": session_id},
+                {
+                    "$push": {f"metadata.{key}": value for key, value in entries.items()},
+                    "$set": {"last_active": datetime.now()}
+                }
+            )
+            
+            if result.modified_count > 0 or result.matched_count > 0:
+                logger.info(f"Appended to metadata of session {session_id}")
+                return True
+            else:
+                logger.warning(f"Session {session_id} not found for metadata append")
+                return False
+        except Exception as e:
+            logger.error(f"Error appending to session metadata: {e}")
+            return False
+    
     def complete_session(self, session_id: str) -> bool:
         """
         Mark a session as completed.
@@ -394,21 +438,10 @@ class SessionManager:
             True if successful, False otherwise
         """
         try:
-            # Get the current metadata
-            session = self.get_session(session_id)
-            if not session:
-                logger.warning(f"Session {session_id} not found for summary update")
-                return False
-                
-            metadata = session.get("metadata", {})
-            
-            # Update the summary in metadata
-            metadata["conversation_summary"] = summary
-            
-            # Save the updated metadata
+            # Update only the summary field so concurrent metadata writes are not overwritten
             result = self.collection.update_one(
                 {"session_id": session_id},
-                {"$set": {"metadata": metadata, "last_active": datetime.now()}}
+                {"$set": {"metadata.conversation_summary": summary, "last_active": datetime.now()}}
             )
             
             if result.modified_count > 0 or result.matched_count > 0:
@@ -473,6 +506,7 @@ class SessionManager:
                 {
                     "$set": {
                         "messages": serializable_messages,
+                        "metadata.message_count": len(serializable_messages),
                         "last_active": datetime.now()
                     }
                 }
@@ -481,13 +515,6 @@ class SessionManager:
             if result.modified_count > 0 or result.matched_count > 0:
                 logger.info(f"Updated session {session_id} with reduced message history, count: {len(serializable_messages)}")
                 
-                # Also update the message count in metadata
-                session = self.get_session(session_id)
-                if session:
-                    metadata = session.get("metadata", {})
-                    metadata["message_count"] = len(serializable_messages)
-                    self.update_session_metadata(session_id, metadata)
-                
                 return True
             else:
                 logger.warning(f"Session {session_id} not found for reducing message history")
@@ -508,20 +535,10 @@ class SessionManager:
             True if successful, False otherwise
         """
         try:
-            session = self.get_session(session_id)
-            if not session:
-                logger.warning(f"Session {session_id} not found for context management configuration")
-                return False
-                
-            metadata = session.get("metadata", {})
-            
-            # Update context management settings
-            metadata["max_messages_before_summary"] = max_messages
-            
-            # Save the updated metadata
+            # Update only the context management setting
             result = self.collection.update_one(
                 {"session_id": session_id},
-                {"$set": {"metadata": metadata, "last_active": datetime.now()}}
+                {"$set": {"metadata.max_messages_before_summary": max_messages, "last_active": datetime.now()}}
             )
             
             if result.modified_count > 0 or result.matched_count > 0:
@@ -4,23 +4,171 @@ Speech utilities for AI Interviewer platform.
 This module provides speech-to-text (STT) and text-to-speech (TTS) 
 functionality using Deepgram's API.
 """
+import io
 import os
+import re
 import asyncio
 import logging
 import tempfile
 import wave
 import pyaudio
 import numpy as np
-from typing import Optional, Tuple, Dict, Any, Union, List, BinaryIO
+from typing import Optional, Tuple, Dict, Any, Union, List, BinaryIO, AsyncIterator
 import aiohttp
 import base64
 from pathlib import Path
 import json
 import time
 
+from ai_interviewer.utils.config import get_speech_config
+from ai_interviewer.utils.tts_cache import TTSCache
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sentence boundary: terminal punctuation (optionally followed by quotes/brackets) and whitespace
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])["\')\]]*\s+')
+
+def split_complete_sentences(text: str, min_length: int = 20) -> Tuple[List[str], str]:
+    """
+    Split complete sentences off the front of a (possibly still growing) text buffer.
+    
+    Short sentences are merged with the following one so each chunk is worth a
+    separate TTS request.
+    
+    Args:
+        text: Text buffer, e.g. LLM tokens received so far
+        min_length: Minimum length of a returned sentence chunk
+        
+    Returns:
+        Tuple of (complete sentence chunks, remaining incomplete text)
+    """
+    sentences = []
+    start = 0
+    chunk_start = 0
+    for match in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+        start = match.end()
+        if len(text[chunk_start:start].strip()) >= min_length:
+            sentences.append(text[chunk_start:start].strip())
+            chunk_start = start
+    return sentences, text[chunk_start:]
+
+def stitch_wav_chunks(chunks: List[bytes]) -> bytes:
+    """
+    Concatenate WAV audio chunks with identical formats into a single WAV file.
+    
+    Args:
+        chunks: WAV audio data for each chunk, in playback order
+        
+    Returns:
+        WAV audio data containing all chunks
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+    
+    output = io.BytesIO()
+    writer = None
+    try:
+        for chunk in chunks:
+            with wave.open(io.BytesIO(chunk), 'rb') as wf:
+                if writer is None:
+                    writer = wave.open(output, 'wb')
+                    writer.setnchannels(wf.getnchannels())
+                    writer.setsampwidth(wf.getsampwidth())
+                    writer.setframerate(wf.getframerate())
+                writer.writeframes(wf.readframes(wf.getnframes()))
+    finally:
+        if writer is not None:
+            writer.close()
+    return output.getvalue()
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    Write audio data to a file.
+    
+    Args:
+        path: File path
+        data: Audio data
+    """
+    with open(path, 'wb') as f:
+        f.write(data)
+
+class DeepgramHTTPClient:
+    """
+    Long-lived, connection-pooled HTTP session for Deepgram API requests.
+    
+    The underlying aiohttp session is created lazily on first use, so the client can be
+    constructed outside a running event loop. Connections are kept alive between
+    requests to avoid repeated DNS, TCP and TLS handshakes.
+    """
+    
+    def __init__(self,
+                 base_url: Optional[str] = None,
+                 pool_limit: Optional[int] = None,
+                 pool_limit_per_host: Optional[int] = None,
+                 keepalive_timeout: Optional[float] = None,
+                 connect_timeout: Optional[float] = None,
+                 total_timeout: Optional[float] = None):
+        """
+        Initialize the DeepgramHTTPClient.
+        
+        Settings default to the values from get_speech_config().
+        
+        Args:
+            base_url: Base URL of the Deepgram API (e.g. a local stand-in for tests)
+            pool_limit: Maximum number of pooled connections
+            pool_limit_per_host: Maximum number of pooled connections per host
+            keepalive_timeout: Seconds to keep idle connections open
+            connect_timeout: Seconds to wait for a connection
+            total_timeout: Maximum seconds for a whole request
+        """
+        config = get_speech_config()
+        
+        self.base_url = (base_url or config["api_url"]).rstrip("/")
+        self.pool_limit = pool_limit if pool_limit is not None else config["http_pool_limit"]
+        self.pool_limit_per_host = pool_limit_per_host if pool_limit_per_host is not None else config["http_pool_limit_per_host"]
+        self.keepalive_timeout = keepalive_timeout if keepalive_timeout is not None else config["http_keepalive_timeout"]
+        self.connect_timeout = connect_timeout if connect_timeout is not None else config["http_connect_timeout"]
+        self.total_timeout = total_timeout if total_timeout is not None else config["http_total_timeout"]
+        
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled session, creating it if needed.
+        
+        Returns:
+            Shared aiohttp ClientSession
+        """
+        if self._session is not None and not self._session.closed:
+            return self._session
+        
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.pool_limit,
+                    limit_per_host=self.pool_limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300
+                )
+                timeout = aiohttp.ClientTimeout(total=self.total_timeout, connect=self.connect_timeout)
+                self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+                logger.info(f"Opened pooled HTTP session for {self.base_url} (limit {self.pool_limit})")
+        
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the pooled session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed pooled HTTP session")
+        self._session = None
+
+
 class DeepgramSTT:
     """
     Speech-to-Text functionality using Deepgram's API.
@@ -28,19 +176,22 @@ class DeepgramSTT:
     This class provides methods for transcribing audio from a file or microphone.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[DeepgramHTTPClient] = None):
         """
         Initialize the DeepgramSTT class.
         
         Args:
             api_key: Deepgram API key (if None, uses environment variable)
+            http_client: Shared pooled HTTP client (a private one is created if None)
         """
         self.api_key = api_key or os.environ.get("DEEPGRAM_API_KEY")
         if not self.api_key:
             raise ValueError("Deepgram API key is required. Set DEEPGRAM_API_KEY environment variable or pass as parameter.")
         
+        self.http_client = http_client or DeepgramHTTPClient()
+        
         # API endpoint for Deepgram Nova ASR
-        self.base_url = "https://api.deepgram.com/v1/listen"
+        self.base_url = f"{self.http_client.base_url}/listen"
         
         # Default parameters for transcription
         self.default_params = {
@@ -51,15 +202,30 @@ class DeepgramSTT:
             "utterances": "true"     # Include utterance boundaries
         }
         
+        # Live transcription endpoint and parameters (interim results with endpointing)
+        speech_config = get_speech_config()
+        self.streaming_url = re.sub(r"^http", "ws", self.base_url)
+        self.streaming_params = {
+            "model": "nova-2",
+            "language": "en",
+            "smart_format": "true",
+            "punctuate": "true",
+            "interim_results": "true",
+            "endpointing": str(speech_config["endpointing_ms"]),
+            "utterance_end_ms": str(speech_config["utterance_end_ms"]),
+            "vad_events": "true"
+        }
+        
         logger.info("Initialized Deepgram STT client")
     
-    async def transcribe_file(self, audio_file: Union[str, Path, BinaryIO], 
+    async def transcribe_file(self, audio_file: Union[str, Path, BinaryIO, bytes, bytearray, memoryview], 
                              params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Transcribe audio from a file using Deepgram's API.
         
         Args:
-            audio_file: Path to audio file or file-like object
+            audio_file: Path to audio file, file-like object, or in-memory audio bytes
+                (bytes/memoryview are posted as-is without copying)
             params: Additional parameters to pass to Deepgram API
             
         Returns:
@@ -88,8 +254,10 @@ class DeepgramSTT:
         logger.debug(f"STT API params: {request_params}")
         
         try:
-            # Handle string/Path or file-like object
-            if isinstance(audio_file, (str, Path)):
+            # Handle in-memory bytes, string/Path or file-like object
+            if isinstance(audio_file, (bytes, bytearray, memoryview)):
+                audio_data = audio_file
+            elif isinstance(audio_file, (str, Path)):
                 with open(audio_file, 'rb') as f:
                     audio_data = f.read()
             else:
@@ -99,36 +267,36 @@ class DeepgramSTT:
             
             logger.debug(f"Audio data size: {len(audio_data)} bytes")
             
-            # Make API request
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.post(url, headers=headers, data=audio_data) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            logger.error(f"Deepgram STT API error: {response.status} - {error_text}")
-                            logger.error(f"Request URL was: {url}")
-                            return {
-                                "success": False,
-                                "error": f"API error: {response.status}",
-                                "details": error_text
-                            }
-                        
-                        result = await response.json()
-                        
-                        # Extract transcript text
-                        transcript = result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("transcript", "")
-                        
+            # Make API request on the pooled session
+            session = await self.http_client.get_session()
+            try:
+                async with session.post(url, headers=headers, data=audio_data) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.error(f"Deepgram STT API error: {response.status} - {error_text}")
+                        logger.error(f"Request URL was: {url}")
                         return {
-                            "success": True,
-                            "transcript": transcript,
-                            "raw_response": result
+                            "success": False,
+                            "error": f"API error: {response.status}",
+                            "details": error_text
                         }
-                except aiohttp.ClientError as e:
-                    logger.error(f"STT API request failed: {e}")
+                    
+                    result = await response.json()
+                    
+                    # Extract transcript text
+                    transcript = result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("transcript", "")
+                    
                     return {
-                        "success": False,
-                        "error": f"API request failed: {str(e)}"
+                        "success": True,
+                        "transcript": transcript,
+                        "raw_response": result
                     }
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"STT API request failed: {e}")
+                return {
+                    "success": False,
+                    "error": f"API request failed: {str(e)}"
+                }
         
         except Exception as e:
             logger.error(f"Error transcribing audio file: {e}")
@@ -137,6 +305,75 @@ class DeepgramSTT:
                 "error": f"Error transcribing audio: {str(e)}"
             }
     
+    async def stream_transcription(self,
+                                   audio_queue: "asyncio.Queue[Optional[bytes]]",
+                                   params: Optional[Dict[str, Any]] = None,
+                                   keepalive_interval: float = 5.0) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Transcribe audio incrementally using Deepgram's live streaming API.
+        
+        Audio chunks are read from the queue until a None sentinel is received. A
+        KeepAlive message is sent whenever no audio arrives for keepalive_interval
+        seconds so the connection is not closed between utterances.
+        
+        Args:
+            audio_queue: Queue of audio chunks; None ends the stream
+            params: Additional parameters to pass to Deepgram API (e.g. encoding and
+                sample_rate for raw PCM input)
+            keepalive_interval: Seconds of silence before sending a KeepAlive
+            
+        Yields:
+            {"type": "transcript", "transcript", "is_final", "speech_final"} for each
+            result, and {"type": "utterance_end"} when Deepgram detects the end of an
+            utterance
+        """
+        request_params = {**self.streaming_params, **(params or {})}
+        for key, value in request_params.items():
+            if isinstance(value, bool):
+                request_params[key] = "true" if value else "false"
+        
+        query_params = "&".join([f"{k}={v}" for k, v in request_params.items()])
+        url = f"{self.streaming_url}?{query_params}"
+        headers = {"Authorization": f"Token {self.api_key}"}
+        
+        session = await self.http_client.get_session()
+        async with session.ws_connect(url, headers=headers) as ws:
+            async def send_audio():
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(audio_queue.get(), timeout=keepalive_interval)
+                    except asyncio.TimeoutError:
+                        await ws.send_str(json.dumps({"type": "KeepAlive"}))
+                        continue
+                    if chunk is None:
+                        break
+                    await ws.send_bytes(chunk)
+                # Ask Deepgram to flush remaining results and close the stream
+                await ws.send_str(json.dumps({"type": "CloseStream"}))
+            
+            sender = asyncio.create_task(send_audio())
+            try:
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        data = json.loads(msg.data)
+                        if data.get("type") == "Results":
+                            alternatives = data.get("channel", {}).get("alternatives", [{}])
+                            yield {
+                                "type": "transcript",
+                                "transcript": alternatives[0].get("transcript", "") if alternatives else "",
+                                "is_final": bool(data.get("is_final")),
+                                "speech_final": bool(data.get("speech_final"))
+                            }
+                        elif data.get("type") == "UtteranceEnd":
+                            yield {"type": "utterance_end"}
+                    elif msg.type == aiohttp.WSMsgType.ERROR:
+                        logger.error(f"Deepgram streaming STT error: {ws.exception()}")
+                        break
+            finally:
+                if not sender.done():
+                    sender.cancel()
+                await asyncio.gather(sender, return_exceptions=True)
+    
     async def transcribe_microphone(self, 
                                   duration_seconds: float = 30.0,
                                   sample_rate: int = 16000,
@@ -337,19 +574,22 @@ class DeepgramTTS:
     This class provides methods for converting text to speech.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[DeepgramHTTPClient] = None):
         """
         Initialize the DeepgramTTS class.
         
         Args:
             api_key: Deepgram API key (if None, uses environment variable)
+            http_client: Shared pooled HTTP client (a private one is created if None)
         """
         self.api_key = api_key or os.environ.get("DEEPGRAM_API_KEY")
         if not self.api_key:
             raise ValueError("Deepgram API key is required. Set DEEPGRAM_API_KEY environment variable or pass as parameter.")
         
+        self.http_client = http_client or DeepgramHTTPClient()
+        
         # API endpoint for Deepgram Aura TTS
-        self.base_url = "https://api.deepgram.com/v1/speak"
+        self.base_url = f"{self.http_client.base_url}/speak"
         
         # Default parameters for TTS
         self.default_params = {
@@ -416,45 +656,45 @@ class DeepgramTTS:
             logger.debug(f"TTS API headers: {headers}")
             logger.debug(f"TTS API payload: {json.dumps(payload, indent=2)}")
             
-            # Make API request
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.post(url, headers=headers, json=payload) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            logger.error(f"Deepgram TTS API error: {response.status} - {error_text}")
-                            logger.error(f"Request URL was: {url}")
-                            logger.error(f"Request payload was: {json.dumps(payload)}")
-                            return {
-                                "success": False,
-                                "error": f"API error: {response.status}",
-                                "details": error_text
-                            }
-                        
-                        # Get binary audio data
-                        audio_data = await response.read()
-                        
-                        # Save to file if requested
-                        if output_file:
-                            with open(output_file, 'wb') as f:
-                                f.write(audio_data)
-                            logger.info(f"Saved audio to {output_file}")
-                        
-                        # Play audio if requested
-                        if play_audio:
-                            await self._play_audio(audio_data)
-                        
+            # Make API request on the pooled session
+            session = await self.http_client.get_session()
+            try:
+                async with session.post(url, headers=headers, json=payload) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.error(f"Deepgram TTS API error: {response.status} - {error_text}")
+                        logger.error(f"Request URL was: {url}")
+                        logger.error(f"Request payload was: {json.dumps(payload)}")
                         return {
-                            "success": True,
-                            "audio_data": audio_data,
-                            "output_file": str(output_file) if output_file else None
+                            "success": False,
+                            "error": f"API error: {response.status}",
+                            "details": error_text
                         }
-                except aiohttp.ClientError as e:
-                    logger.error(f"TTS API request failed: {e}")
+                    
+                    # Get binary audio data
+                    audio_data = await response.read()
+                    
+                    # Save to file if requested
+                    if output_file:
+                        with open(output_file, 'wb') as f:
+                            f.write(audio_data)
+                        logger.info(f"Saved audio to {output_file}")
+                    
+                    # Play audio if requested
+                    if play_audio:
+                        await self._play_audio(audio_data)
+                    
                     return {
-                        "success": False,
-                        "error": f"API request failed: {str(e)}"
+                        "success": True,
+                        "audio_data": audio_data,
+                        "output_file": str(output_file) if output_file else None
                     }
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"TTS API request failed: {e}")
+                return {
+                    "success": False,
+                    "error": f"API request failed: {str(e)}"
+                }
         
         except Exception as e:
             logger.error(f"Error synthesizing speech: {e}")
@@ -463,66 +703,100 @@ class DeepgramTTS:
                 "error": f"Error synthesizing speech: {str(e)}"
             }
     
+    async def stream_speech(self,
+                            text: str,
+                            params: Optional[Dict[str, Any]] = None,
+                            chunk_size: int = 4096) -> AsyncIterator[bytes]:
+        """
+        Convert text to speech, yielding audio chunks as they are received.
+        
+        Args:
+            text: Text to convert to speech
+            params: Additional parameters to pass to Deepgram API
+            chunk_size: Maximum size of each yielded chunk in bytes
+            
+        Yields:
+            Audio data chunks (nothing is yielded if the request fails)
+        """
+        request_params = {**self.default_params, **(params or {})}
+        query_params = "&".join([f"{k}={v}" for k, v in request_params.items() if k != "text"])
+        url = f"{self.base_url}?{query_params}"
+        headers = {
+            "Authorization": f"Token {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        session = await self.http_client.get_session()
+        try:
+            async with session.post(url, headers=headers, json={"text": text}) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Deepgram TTS API error: {response.status} - {error_text}")
+                    return
+                
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    yield chunk
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"TTS streaming request failed: {e}")
+    
     async def _play_audio(self, audio_data: bytes) -> None:
         """
         Play audio data through speakers.
         
+        Playback runs in a worker thread so the event loop (and any in-flight
+        synthesis requests) keeps running while audio plays.
+        
         Args:
             audio_data: WAV audio data to play
         """
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-                temp_file.write(audio_data)
-            
-            try:
-                # Initialize PyAudio
-                p = pyaudio.PyAudio()
+            await asyncio.to_thread(self._play_wav_bytes, audio_data)
+        except Exception as e:
+            logger.error(f"Error playing audio: {e}")
+    
+    @staticmethod
+    def _play_wav_bytes(audio_data: bytes) -> None:
+        """
+        Play WAV audio data through speakers, blocking until playback completes.
+        
+        Args:
+            audio_data: WAV audio data to play
+        """
+        # Initialize PyAudio
+        p = pyaudio.PyAudio()
+        
+        try:
+            # Open WAV data from memory
+            with wave.open(io.BytesIO(audio_data), 'rb') as wf:
+                # Get audio parameters
+                channels = wf.getnchannels()
+                sample_width = wf.getsampwidth()
+                sample_rate = wf.getframerate()
                 
-                # Open WAV file
-                with wave.open(temp_path, 'rb') as wf:
-                    # Get audio parameters
-                    channels = wf.getnchannels()
-                    sample_width = wf.getsampwidth()
-                    sample_rate = wf.getframerate()
-                    
-                    # Open stream
-                    stream = p.open(
-                        format=p.get_format_from_width(sample_width),
-                        channels=channels,
-                        rate=sample_rate,
-                        output=True
-                    )
-                    
-                    # Read data in chunks and play
-                    chunk_size = 1024
+                # Open stream
+                stream = p.open(
+                    format=p.get_format_from_width(sample_width),
+                    channels=channels,
+                    rate=sample_rate,
+                    output=True
+                )
+                
+                # Read data in chunks and play
+                chunk_size = 1024
+                data = wf.readframes(chunk_size)
+                
+                print("Playing audio...")
+                while len(data) > 0:
+                    stream.write(data)
                     data = wf.readframes(chunk_size)
-                    
-                    print("Playing audio...")
-                    while len(data) > 0:
-                        stream.write(data)
-                        data = wf.readframes(chunk_size)
-                    
-                    # Clean up
-                    stream.stop_stream()
-                    stream.close()
-                    p.terminate()
-                    
-                    print("Audio playback complete.")
-            
-            except Exception as e:
-                logger.error(f"Error playing audio: {e}")
-            
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temporary file {temp_path}: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error preparing audio for playback: {e}")
+                
+                # Clean up
+                stream.stop_stream()
+                stream.close()
+                
+                print("Audio playback complete.")
+        finally:
+            p.terminate()
 
 
 class VoiceHandler:
@@ -532,29 +806,70 @@ class VoiceHandler:
     This class provides a unified interface for voice interactions.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[DeepgramHTTPClient] = None,
+                 tts_cache: Optional[TTSCache] = None):
         """
         Initialize the VoiceHandler class.
         
         Args:
             api_key: Deepgram API key (if None, uses environment variable)
+            http_client: Pooled HTTP client shared by STT and TTS (created from
+                get_speech_config() if None)
+            tts_cache: Cache for synthesized audio (created from get_speech_config()
+                if None and caching is enabled)
         """
         self.api_key = api_key or os.environ.get("DEEPGRAM_API_KEY")
         if not self.api_key:
             raise ValueError("Deepgram API key is required. Set DEEPGRAM_API_KEY environment variable or pass as parameter.")
         
+        # STT and TTS share one long-lived connection pool owned by this handler
+        self.http_client = http_client or DeepgramHTTPClient()
+        
         # Initialize STT and TTS components
-        self.stt = DeepgramSTT(api_key=self.api_key)
-        self.tts = DeepgramTTS(api_key=self.api_key)
+        self.stt = DeepgramSTT(api_key=self.api_key, http_client=self.http_client)
+        self.tts = DeepgramTTS(api_key=self.api_key, http_client=self.http_client)
+        
+        # Sentence-chunked synthesis settings
+        speech_config = get_speech_config()
+        self.chunked_tts = speech_config["tts_chunked"]
+        self.tts_max_concurrency = speech_config["tts_max_concurrency"]
+        self.tts_min_chunk_length = speech_config["tts_min_chunk_length"]
+        
+        # Content-addressed cache so repeated phrases need no TTS request
+        self.tts_cache = tts_cache
+        if self.tts_cache is None and speech_config["tts_cache_enabled"]:
+            try:
+                self.tts_cache = TTSCache()
+            except Exception as e:
+                logger.warning(f"TTS cache disabled: {e}")
         
         logger.info("Initialized VoiceHandler")
     
-    async def transcribe_audio_bytes(self, audio_bytes: bytes, sample_rate: int = 16000, channels: int = 1) -> Dict[str, Any]:
+    def tts_cache_key(self, text: str, voice: str) -> str:
+        """
+        Get the TTS cache key for text spoken with a voice and the current TTS settings.
+        
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use for synthesis
+            
+        Returns:
+            Cache key
+        """
+        return TTSCache.make_key(text, voice, self.tts.default_params.get("model"), self.tts.default_params.get("encoding"))
+    
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        await self.http_client.close()
+    
+    async def transcribe_audio_bytes(self, audio_bytes: Union[bytes, bytearray, memoryview], sample_rate: int = 16000, channels: int = 1) -> Dict[str, Any]:
         """
         Transcribe audio from bytes using Deepgram's API.
         
+        The audio is posted straight from memory; nothing is written to disk.
+        
         Args:
-            audio_bytes: Audio data as bytes
+            audio_bytes: Audio data as bytes or a memoryview over them
             sample_rate: Audio sample rate in Hz
             channels: Number of audio channels
             
@@ -562,32 +877,19 @@ class VoiceHandler:
             Dictionary with transcription results or the transcription text
         """
         try:
-            # Create a temporary file to store the audio bytes
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-                temp_file.write(audio_bytes)
+            # Add sample rate and channels to params for the transcription
+            params = {
+                "sample_rate": str(sample_rate),  # Convert to string for API
+                "channels": str(channels)
+            }
             
-            try:
-                # Add sample rate and channels to params for the transcription
-                params = {
-                    "sample_rate": str(sample_rate),  # Convert to string for API
-                    "channels": str(channels)
-                }
-                
-                # Transcribe the temporary file
-                result = await self.stt.transcribe_file(temp_path, params=params)
-                
-                # If the result contains a 'transcript' field, return it
-                if isinstance(result, dict) and result.get('success', False) and 'transcript' in result:
-                    return result['transcript']
-                
-                return result
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temporary file {temp_path}: {e}")
+            result = await self.stt.transcribe_file(audio_bytes, params=params)
+            
+            # If the result contains a 'transcript' field, return it
+            if isinstance(result, dict) and result.get('success', False) and 'transcript' in result:
+                return result['transcript']
+            
+            return result
         
         except Exception as e:
             logger.error(f"Error transcribing audio bytes: {e}")
@@ -629,30 +931,151 @@ class VoiceHandler:
             logger.error(f"STT error: {result.get('error', 'Unknown error')}")
             return ""
     
+    async def synthesize_chunks(self,
+                                text: str,
+                                voice: str = "nova",
+                                max_concurrency: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Synthesize text sentence by sentence, yielding each chunk's audio in order.
+        
+        Chunks are requested concurrently (at most max_concurrency at a time), so the
+        first chunk is yielded as soon as it is ready while later ones are still in flight.
+        
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use for synthesis
+            max_concurrency: Maximum concurrent TTS requests (from config if None)
+            
+        Yields:
+            WAV audio data for each chunk
+            
+        Raises:
+            RuntimeError: If synthesis of a chunk fails
+        """
+        sentences, remainder = split_complete_sentences(text, min_length=self.tts_min_chunk_length)
+        if remainder.strip():
+            sentences.append(remainder.strip())
+        
+        semaphore = asyncio.Semaphore(max_concurrency or self.tts_max_concurrency)
+        params = {"voice": voice}
+        
+        async def synthesize(sentence: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.tts.synthesize_speech(text=sentence, params=params)
+        
+        tasks = [asyncio.create_task(synthesize(sentence)) for sentence in sentences]
+        try:
+            for index, task in enumerate(tasks):
+                result = await task
+                if not result.get("success", False):
+                    raise RuntimeError(f"TTS failed for chunk {index}: {result.get('error', 'Unknown error')}")
+                yield result["audio_data"]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
     async def speak(self, 
                  text: str, 
                  voice: str = "nova",
                  play_audio: bool = True,
-                 output_file: Optional[str] = None) -> bool:
+                 output_file: Optional[str] = None,
+                 chunked: Optional[bool] = None) -> bool:
         """
         Convert text to speech and play/save.
         
+        Audio for text that was spoken before is taken from the TTS cache. In
+        chunked mode the text is synthesized sentence by sentence with concurrent
+        requests; playback starts with the first chunk and the saved file is the
+        chunks stitched into a single WAV.
+        
         Args:
             text: Text to convert to speech
             voice: Voice to use for synthesis
             play_audio: Whether to play the audio immediately
             output_file: Optional path to save audio file
+            chunked: Whether to use sentence-chunked synthesis (from config if None)
             
         Returns:
             True if successful, False otherwise
         """
-        params = {"voice": voice}
+        if chunked is None:
+            chunked = self.chunked_tts
         
-        result = await self.tts.synthesize_speech(
-            text=text,
-            output_file=output_file,
-            play_audio=play_audio,
-            params=params
-        )
+        cache_key = self.tts_cache_key(text, voice) if self.tts_cache else None
+        # Cache reads and writes may hit the disk, so they run off the event loop
+        audio_data = await asyncio.to_thread(self.tts_cache.get, cache_key) if cache_key else None
+        
+        if audio_data is not None:
+            logger.info("Serving speech from TTS cache")
+            if play_audio:
+                await self.tts._play_audio(audio_data)
+        else:
+            if chunked:
+                audio_data = await self._speak_chunked(text, voice, play_audio)
+            else:
+                result = await self.tts.synthesize_speech(
+                    text=text,
+                    play_audio=play_audio,
+                    params={"voice": voice}
+                )
+                audio_data = result.get("audio_data") if result.get("success", False) else None
+            
+            if audio_data is None:
+                return False
+            
+            if cache_key:
+                await asyncio.to_thread(self.tts_cache.put, cache_key, audio_data)
+        
+        if output_file:
+            await asyncio.to_thread(_write_file, output_file, audio_data)
+            logger.info(f"Saved audio to {output_file}")
+        
+        return True
+    
+    async def synthesize_to_cache(self, text: str, voice: str = "nova") -> Optional[str]:
+        """
+        Make sure speech for the text is in the TTS cache.
+        
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use for synthesis
+            
+        Returns:
+            Cache key of the audio, or None if caching is disabled or synthesis failed
+        """
+        if not self.tts_cache:
+            return None
         
-        return result.get("success", False) 
\ No newline at end of file
+        cache_key = self.tts_cache_key(text, voice)
+        if self.tts_cache.contains(cache_key):
+            return cache_key
+        
+        if await self.speak(text, voice=voice, play_audio=False):
+            return cache_key
+        return None
+    
+    async def _speak_chunked(self, text: str, voice: str, play_audio: bool) -> Optional[bytes]:
+        """
+        Sentence-chunked synthesis used by speak.
+        
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use for synthesis
+            play_audio: Whether to play the audio as chunks arrive
+            
+        Returns:
+            WAV audio data for the whole text, or None on failure
+        """
+        audio_chunks = []
+        try:
+            async for audio_data in self.synthesize_chunks(text, voice=voice):
+                audio_chunks.append(audio_data)
+                if play_audio:
+                    await self.tts._play_audio(audio_data)
+            
+            return stitch_wav_chunks(audio_chunks) if audio_chunks else None
+        except Exception as e:
+            logger.error(f"Error in chunked speech synthesis: {e}")
+            return None
@@ -0,0 +1,275 @@
+"""
+Content-addressed cache for synthesized speech.
+
+Audio is keyed by a hash of the normalized text and the synthesis settings
+(voice, model, encoding), so repeated interviewer phrases are served without
+another TTS request. Entries are kept in a size-bounded in-memory LRU backed by
+a size-bounded LRU directory on disk.
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from ai_interviewer.utils.config import get_speech_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Cache keys are SHA-256 hex digests
+CACHE_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class TTSCache:
+    """
+    Two-tier (memory and disk) LRU cache of synthesized audio keyed by content hash.
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None,
+                 max_memory_bytes: Optional[int] = None,
+                 extension: str = ".wav"):
+        """
+        Initialize the cache.
+
+        Settings default to the values from get_speech_config().
+
+        Args:
+            cache_dir: Directory for cached audio files
+            max_disk_bytes: Maximum total size of cached files on disk
+            max_memory_bytes: Maximum total size of audio kept in memory
+            extension: File extension for cached audio
+        """
+        config = get_speech_config()
+
+        self.cache_dir = cache_dir or config["tts_cache_dir"]
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else config["tts_cache_max_disk_mb"] * 1024 * 1024
+        self.max_memory_bytes = max_memory_bytes if max_memory_bytes is not None else config["tts_cache_max_memory_mb"] * 1024 * 1024
+        self.extension = extension
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        # Disk index in LRU order: key -> file size
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_disk_index()
+
+    @staticmethod
+    def make_key(text: str, voice: str, model: str, encoding: str) -> str:
+        """
+        Build the cache key for a synthesis request.
+
+        Whitespace is normalized so trivially different renderings of the same
+        phrase share an entry.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice used for synthesis
+            model: TTS model
+            encoding: Audio encoding
+
+        Returns:
+            Hex digest identifying the audio
+        """
+        normalized = " ".join(text.split())
+        payload = "\x1f".join([normalized, voice or "", model or "", encoding or ""])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_valid_key(key: str) -> bool:
+        """
+        Check whether a string is a well-formed cache key.
+
+        Args:
+            key: Candidate key (e.g. taken from a request path)
+
+        Returns:
+            True if the key is a SHA-256 hex digest
+        """
+        return bool(CACHE_KEY_PATTERN.match(key or ""))
+
+    def path_for(self, key: str) -> str:
+        """
+        Get the file path for a cache key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path of the cached audio file
+        """
+        return os.path.join(self.cache_dir, f"{key}{self.extension}")
+
+    def contains(self, key: str) -> bool:
+        """
+        Check whether audio is cached without loading it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key is cached in memory or on disk
+        """
+        with self._lock:
+            return key in self._memory or key in self._disk
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get cached audio, promoting it to the front of both LRUs.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Audio data, or None on a miss
+        """
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                if key in self._disk:
+                    self._disk.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return audio
+
+            if key not in self._disk:
+                self.stats["misses"] += 1
+                return None
+
+        try:
+            with open(self.path_for(key), "rb") as f:
+                audio = f.read()
+            # Record the access so LRU order survives restarts
+            os.utime(self.path_for(key))
+        except OSError as e:
+            logger.warning(f"Cached audio {key} could not be read: {e}")
+            with self._lock:
+                self._disk_bytes -= self._disk.pop(key, 0)
+                self.stats["misses"] += 1
+            return None
+
+        with self._lock:
+            if key in self._disk:
+                self._disk.move_to_end(key)
+            self._remember(key, audio)
+            self.stats["disk_hits"] += 1
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """
+        Add audio to the cache.
+
+        Args:
+            key: Cache key
+            audio: Audio data
+        """
+        path = self.path_for(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            # Write atomically so readers never see a partial file
+            with open(temp_path, "wb") as f:
+                f.write(audio)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cached audio {key}: {e}")
+            return
+
+        with self._lock:
+            self._disk_bytes -= self._disk.pop(key, 0)
+            self._disk[key] = len(audio)
+            self._disk_bytes += len(audio)
+            self._remember(key, audio)
+            evicted = self._evict_disk()
+
+        for evicted_key in evicted:
+            try:
+                os.unlink(self.path_for(evicted_key))
+            except OSError as e:
+                logger.warning(f"Failed to delete evicted audio {evicted_key}: {e}")
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        """
+        Store audio in the memory LRU. Must be called with the lock held.
+
+        Args:
+            key: Cache key
+            audio: Audio data
+        """
+        if len(audio) > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_bytes -= len(dropped)
+
+    def _evict_disk(self) -> List[str]:
+        """
+        Drop least recently used disk entries over the size limit. Must be called with the lock held.
+
+        Returns:
+            Keys whose files should be deleted
+        """
+        evicted = []
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            dropped = self._memory.pop(key, None)
+            if dropped is not None:
+                self._memory_bytes -= len(dropped)
+            evicted.append(key)
+            self.stats["evictions"] += 1
+        return evicted
+
+    def _load_disk_index(self) -> None:
+        """Index existing cache files, oldest access first."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            key, ext = os.path.splitext(name)
+            if ext != self.extension or not self.is_valid_key(key):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, key, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+
+        for key in self._evict_disk():
+            try:
+                os.unlink(self.path_for(key))
+            except OSError as e:
+                logger.warning(f"Failed to delete evicted audio {key}: {e}")
+
+        logger.info(f"TTS cache at {self.cache_dir}: {len(self._disk)} entries, {self._disk_bytes} bytes")
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hit/miss counters and current sizes
+        """
+        with self._lock:
+            return {
+                **self.stats,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes
+            }
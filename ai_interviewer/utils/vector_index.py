@@ -0,0 +1,324 @@
+"""
+Offline vector index for semantic memory search.
+
+Keyword search only matches memories containing the query's words (or their
+stems). The vector index also ranks near matches, such as "microservice" for
+"micro-services" or "postgres" for "PostgreSQL", and never calls an external
+embedding service:
+
+- HashedNgramEmbedder turns text into a fixed-size vector by hashing its words
+  and character n-grams (the hashing trick), so texts sharing words or word
+  pieces get similar vectors. No model has to be downloaded.
+- MemoryVectorIndex keeps the vectors of candidate profiles, insights and
+  feedback in a NumPy matrix and returns the top k by cosine similarity. Items
+  are added or replaced one at a time as memories are saved.
+
+Each server worker keeps its own index. The memory manager periodically adds
+the memories other workers saved to the shared MongoDB store, so they become
+searchable here within MEMORY_VECTOR_REFRESH_INTERVAL seconds.
+
+Small indexes are searched exhaustively. Once an index reaches ann_threshold
+items, it is partitioned into clusters (spherical k-means, retrained each time
+the index doubles), and searches only score the nprobe clusters closest to the
+query. Searches scoped to one user only score that user's items, so they are
+always exact. scripts/benchmark_vector_index.py measures where approximate
+search starts to pay off.
+"""
+import logging
+import re
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ai_interviewer.utils.config import get_memory_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Whole words count more than each of their n-grams
+WORD_WEIGHT = 2.0
+
+# Similarity below which a match comes from hash collisions rather than shared text
+MIN_SCORE = 0.05
+
+# Rows allocated up front; the matrix doubles when full
+INITIAL_CAPACITY = 1024
+
+# k-means settings used to train the clusters
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_CLUSTER = 64
+
+# Rows assigned to clusters at a time, bounding the size of the score matrix
+ASSIGN_CHUNK = 8192
+
+
+class HashedNgramEmbedder:
+    """
+    Embeds text by hashing words and character n-grams into a fixed number of dimensions.
+    """
+
+    def __init__(self, dim: int = 512, ngram_sizes: Sequence[int] = (3, 4)):
+        """
+        Initialize the embedder.
+
+        Args:
+            dim: Number of dimensions of the vectors
+            ngram_sizes: Lengths of the character n-grams taken from each word
+        """
+        self.dim = dim
+        self.ngram_sizes = tuple(ngram_sizes)
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length float32 vector, or a zero vector if the text has no words
+        """
+        indices: List[int] = []
+        weights: List[float] = []
+        for word in WORD_PATTERN.findall(text.lower()):
+            self._add_feature(indices, weights, f"w:{word}", WORD_WEIGHT)
+            padded = f"<{word}>"
+            for size in self.ngram_sizes:
+                for start in range(len(padded) - size + 1):
+                    self._add_feature(indices, weights, padded[start:start + size], 1.0)
+
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if indices:
+            np.add.at(vector, indices, weights)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+        return vector
+
+    def _add_feature(self, indices: List[int], weights: List[float], feature: str, weight: float) -> None:
+        hashed = zlib.crc32(feature.encode("utf-8"))
+        indices.append(hashed % self.dim)
+        # A hash bit picks the sign, so colliding features cancel out on average instead of piling up
+        weights.append(weight if hashed & 0x80000000 else -weight)
+
+
+class MemoryVectorIndex:
+    """
+    In-process cosine similarity index with incremental updates.
+    """
+
+    def __init__(self,
+                 embedder: Optional[HashedNgramEmbedder] = None,
+                 ann_threshold: Optional[int] = None,
+                 nprobe: Optional[int] = None):
+        """
+        Initialize an empty index.
+
+        Settings default to the values from get_memory_config().
+
+        Args:
+            embedder: Text embedder (HashedNgramEmbedder if None)
+            ann_threshold: Number of items from which unscoped searches are
+                approximate (0 keeps every search exhaustive)
+            nprobe: Number of clusters scored by an approximate search
+        """
+        config = get_memory_config()
+
+        self.embedder = embedder or HashedNgramEmbedder(config["vector_dim"])
+        self.ann_threshold = ann_threshold if ann_threshold is not None else config["vector_ann_threshold"]
+        self.nprobe = nprobe if nprobe is not None else config["vector_nprobe"]
+
+        self._vectors = np.zeros((INITIAL_CAPACITY, self.embedder.dim), dtype=np.float32)
+        self._ids: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        # user id -> positions of the user's items
+        self._user_positions: Dict[Optional[str], List[int]] = {}
+
+        # Clusters for approximate search
+        self._centroids: Optional[np.ndarray] = None
+        self._clusters = np.zeros(INITIAL_CAPACITY, dtype=np.int32)
+        self._trained_size = 0
+        self._lock = threading.Lock()
+
+        self.stats = {"adds": 0, "exact_searches": 0, "approximate_searches": 0, "trainings": 0}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, item_id: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add an item, or replace it if the ID is already indexed.
+
+        Args:
+            item_id: Unique item identifier
+            text: Text the item is found by
+            metadata: Data returned with search results; its "user_id" scopes searches
+        """
+        vector = self.embedder.embed(text)
+        metadata = dict(metadata or {})
+        user_id = metadata.get("user_id")
+
+        with self._lock:
+            position = self._positions.get(item_id)
+            if position is None:
+                position = len(self._ids)
+                self._reserve(position + 1)
+                self._ids.append(item_id)
+                self._metadata.append(metadata)
+                self._positions[item_id] = position
+                self._user_positions.setdefault(user_id, []).append(position)
+            else:
+                previous_user = self._metadata[position].get("user_id")
+                if previous_user != user_id:
+                    self._user_positions[previous_user].remove(position)
+                    self._user_positions.setdefault(user_id, []).append(position)
+                self._metadata[position] = metadata
+
+            self._vectors[position] = vector
+            if self._centroids is not None:
+                self._clusters[position] = int(np.argmax(self._centroids @ vector))
+            self.stats["adds"] += 1
+
+            # Retrain each time the index doubles, so clusters keep up with the data
+            size = len(self._ids)
+            if self.ann_threshold and size >= self.ann_threshold and size >= 2 * self._trained_size:
+                self._train()
+
+    def search(self,
+               query: str,
+               k: int = 5,
+               user_id: Optional[str] = None,
+               offset: int = 0,
+               exact: bool = False) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Find the items most similar to a query.
+
+        Args:
+            query: Query text
+            k: Maximum number of results
+            user_id: Only search this user's items
+            offset: Number of top results to skip, for pagination
+            exact: Score every item even if the index is clustered
+
+        Returns:
+            (item ID, cosine similarity, metadata) tuples, most similar first;
+            items sharing (almost) nothing with the query are left out
+        """
+        vector = self.embedder.embed(query)
+        wanted = offset + k
+
+        with self._lock:
+            size = len(self._ids)
+            approximate = False
+            if user_id is not None:
+                candidates = np.asarray(self._user_positions.get(user_id, []), dtype=np.int64)
+                scores = self._vectors[candidates] @ vector
+            elif self._centroids is not None and not exact:
+                candidates = self._probe(vector, size)
+                scores = self._vectors[candidates] @ vector
+                approximate = True
+            else:
+                # Score the matrix in place rather than copying the selected rows
+                candidates = np.arange(size)
+                scores = self._vectors[:size] @ vector
+            top = _top_k(scores, wanted)
+            results = [
+                (self._ids[candidates[i]], float(scores[i]), dict(self._metadata[candidates[i]]))
+                for i in top if scores[i] > MIN_SCORE
+            ]
+            self.stats["approximate_searches" if approximate else "exact_searches"] += 1
+
+        return results[offset:]
+
+    def train(self) -> None:
+        """Partition the current items into clusters for approximate search."""
+        with self._lock:
+            self._train()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Counters plus the number of items and clusters
+        """
+        with self._lock:
+            return {
+                **self.stats,
+                "items": len(self._ids),
+                "clusters": 0 if self._centroids is None else len(self._centroids)
+            }
+
+    def _reserve(self, size: int) -> None:
+        """Grow the vector matrix to hold at least size rows. Must be called with the lock held."""
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        vectors = np.zeros((capacity, self.embedder.dim), dtype=np.float32)
+        vectors[:len(self._ids)] = self._vectors[:len(self._ids)]
+        clusters = np.zeros(capacity, dtype=np.int32)
+        clusters[:len(self._ids)] = self._clusters[:len(self._ids)]
+        self._vectors, self._clusters = vectors, clusters
+
+    def _train(self) -> None:
+        """Run spherical k-means on a sample and assign every item. Must be called with the lock held."""
+        size = len(self._ids)
+        if size == 0:
+            return
+        vectors = self._vectors[:size]
+        n_clusters = max(1, int(np.sqrt(size)))
+        rng = np.random.default_rng(0)
+        sample = vectors[rng.choice(size, min(size, n_clusters * KMEANS_SAMPLE_PER_CLUSTER), replace=False)]
+        centroids = sample[rng.choice(len(sample), n_clusters, replace=False)].copy()
+
+        for _ in range(KMEANS_ITERATIONS):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Clusters that lost all their points keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+
+        self._centroids = centroids.astype(np.float32)
+        for start in range(0, size, ASSIGN_CHUNK):
+            chunk = vectors[start:start + ASSIGN_CHUNK]
+            self._clusters[start:start + len(chunk)] = np.argmax(chunk @ self._centroids.T, axis=1)
+        self._trained_size = size
+        self.stats["trainings"] += 1
+        logger.info(f"Clustered vector index of {size} items into {n_clusters} clusters")
+
+    def _probe(self, vector: np.ndarray, size: int) -> np.ndarray:
+        """Positions of the items in the clusters closest to a vector. Must be called with the lock held."""
+        nprobe = min(self.nprobe, len(self._centroids))
+        nearest = _top_k(self._centroids @ vector, nprobe)
+        return np.flatnonzero(np.isin(self._clusters[:size], nearest))
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, highest first."""
+    if k <= 0 or len(scores) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def create_vector_index() -> Optional[MemoryVectorIndex]:
+    """
+    Create the memory vector index.
+
+    Returns:
+        MemoryVectorIndex instance, or None if semantic search is disabled
+    """
+    if not get_memory_config()["vector_index_enabled"]:
+        return None
+    return MemoryVectorIndex()
@@ -0,0 +1,242 @@
+"""
+Real-time voice pipeline for the AI Interviewer.
+
+This module connects a client WebSocket to streaming speech-to-text, the
+interviewer's token stream and sentence-level text-to-speech. Audio frames from
+the client are transcribed as they arrive; when Deepgram detects the end of an
+utterance the transcript is sent to the interviewer, and speech for the first
+complete sentence of the response is synthesized and pushed back over the
+socket while the rest of the response is still being generated.
+
+Messages sent to the client:
+    {"type": "ready", "session_id", "audio_format"}      - pipeline is listening
+    {"type": "transcript", "transcript", "is_final"}     - interim/final STT results
+    {"type": "user_utterance", "text"}                   - an utterance was submitted
+    {"type": "token", "content"}                         - AI response tokens
+    {"type": "audio_start", "index", "text"}             - audio for a sentence follows
+    binary frames                                        - raw audio for that sentence
+    {"type": "audio_end", "index"}                       - sentence audio complete
+    {"type": "done", "response", "session_id", "interview_stage"}
+    {"type": "error", "detail"}
+
+Messages accepted from the client:
+    binary frames                                        - audio to transcribe
+    {"type": "stop"}                                     - finish the conversation
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from ai_interviewer.utils.speech_utils import VoiceHandler, split_complete_sentences
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class VoiceConversation:
+    """
+    A single real-time voice conversation over a WebSocket.
+
+    The websocket only needs the receive/send_json/send_bytes coroutines of a
+    Starlette/FastAPI WebSocket, so tests can drive the pipeline with a stand-in.
+    """
+
+    def __init__(self,
+                 websocket: Any,
+                 voice_handler: VoiceHandler,
+                 interviewer: Any,
+                 user_id: str,
+                 session_id: Optional[str] = None,
+                 voice: str = "nova",
+                 stt_params: Optional[Dict[str, Any]] = None,
+                 tts_params: Optional[Dict[str, Any]] = None,
+                 max_audio_queue: int = 200):
+        """
+        Initialize the conversation.
+
+        Args:
+            websocket: Accepted WebSocket connection
+            voice_handler: VoiceHandler providing streaming STT and TTS
+            interviewer: AIInterviewer instance
+            user_id: User identifier
+            session_id: Optional session ID for continuing a session
+            voice: Voice to use for synthesis
+            stt_params: Extra Deepgram streaming STT parameters (e.g. encoding, sample_rate)
+            tts_params: Extra Deepgram TTS parameters for the returned audio
+            max_audio_queue: Maximum number of buffered incoming audio frames
+        """
+        self.websocket = websocket
+        self.voice_handler = voice_handler
+        self.interviewer = interviewer
+        self.user_id = user_id
+        self.session_id = session_id
+        self.voice = voice
+        self.stt_params = stt_params or {}
+        self.tts_params = tts_params or {}
+
+        self._audio_queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=max_audio_queue)
+        self._utterances: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        self._disconnected = False
+
+    async def run(self) -> None:
+        """Run the conversation until the client stops or disconnects."""
+        await self.websocket.send_json({
+            "type": "ready",
+            "session_id": self.session_id,
+            "audio_format": {
+                "encoding": self.tts_params.get("encoding", "linear16"),
+                "sample_rate": self.tts_params.get("sample_rate"),
+                "container": self.tts_params.get("container", "none")
+            }
+        })
+
+        receiver = asyncio.create_task(self._receive_audio())
+        transcriber = asyncio.create_task(self._transcribe())
+        responder = asyncio.create_task(self._respond())
+        try:
+            await receiver
+            if not self._disconnected:
+                # After a stop message the transcriber flushes and the responder
+                # answers what is left; on disconnect everything is cancelled
+                await transcriber
+                await responder
+        finally:
+            for task in (receiver, transcriber, responder):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(receiver, transcriber, responder, return_exceptions=True)
+
+    async def _receive_audio(self) -> None:
+        """Forward audio frames from the client to the STT queue."""
+        try:
+            while True:
+                message = await self.websocket.receive()
+                if message.get("type") == "websocket.disconnect":
+                    self._disconnected = True
+                    break
+                if message.get("bytes"):
+                    await self._audio_queue.put(message["bytes"])
+                elif message.get("text"):
+                    try:
+                        control = json.loads(message["text"])
+                    except json.JSONDecodeError:
+                        continue
+                    if control.get("type") == "stop":
+                        break
+        finally:
+            await self._audio_queue.put(None)
+
+    async def _transcribe(self) -> None:
+        """Run streaming STT and submit each completed utterance."""
+        final_parts = []
+        try:
+            async for event in self.voice_handler.stt.stream_transcription(self._audio_queue, params=self.stt_params):
+                if event["type"] == "transcript":
+                    if event["transcript"]:
+                        await self._send_json({
+                            "type": "transcript",
+                            "transcript": event["transcript"],
+                            "is_final": event["is_final"]
+                        })
+                    if event["is_final"] and event["transcript"]:
+                        final_parts.append(event["transcript"])
+                    if not event["speech_final"]:
+                        continue
+
+                # speech_final or UtteranceEnd: the candidate stopped speaking
+                if final_parts:
+                    await self._utterances.put(" ".join(final_parts))
+                    final_parts = []
+
+            # Submit anything left when the stream closes
+            if final_parts:
+                await self._utterances.put(" ".join(final_parts))
+        except Exception as e:
+            logger.error(f"Error in streaming transcription: {e}")
+            await self._send_json({"type": "error", "detail": f"Transcription failed: {str(e)}"})
+        finally:
+            await self._utterances.put(None)
+
+    async def _respond(self) -> None:
+        """Answer utterances one at a time, in order."""
+        while True:
+            utterance = await self._utterances.get()
+            if utterance is None:
+                break
+            try:
+                await self._run_turn(utterance)
+            except Exception as e:
+                logger.error(f"Error in voice turn: {e}")
+                await self._send_json({"type": "error", "detail": str(e)})
+
+    async def _run_turn(self, utterance: str) -> None:
+        """
+        Send an utterance to the interviewer and speak the response as it streams.
+
+        Args:
+            utterance: Transcribed candidate utterance
+        """
+        await self._send_json({"type": "user_utterance", "text": utterance})
+
+        sentences: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        speaker = asyncio.create_task(self._speak_sentences(sentences))
+        buffer = ""
+        try:
+            async for event in self.interviewer.stream_interview(self.user_id, utterance, self.session_id):
+                if event["type"] == "token":
+                    await self._send_json({"type": "token", "content": event["content"]})
+                    buffer += event["content"]
+                    complete, buffer = split_complete_sentences(buffer)
+                    for sentence in complete:
+                        await sentences.put(sentence)
+                elif event["type"] == "done":
+                    self.session_id = event["session_id"]
+                    if buffer.strip():
+                        await sentences.put(buffer.strip())
+                    buffer = ""
+                    await sentences.put(None)
+                    await speaker
+                    await self._send_json({
+                        "type": "done",
+                        "response": event["response"],
+                        "session_id": event["session_id"],
+                        "interview_stage": event.get("interview_stage")
+                    })
+                else:
+                    await self._send_json({"type": "error", "detail": event.get("message", "Unknown error")})
+        finally:
+            if not speaker.done():
+                speaker.cancel()
+                await asyncio.gather(speaker, return_exceptions=True)
+
+    async def _speak_sentences(self, sentences: "asyncio.Queue[Optional[str]]") -> None:
+        """
+        Synthesize queued sentences in order and push their audio to the client.
+
+        Args:
+            sentences: Queue of sentences to speak; None ends the response
+        """
+        params = {"voice": self.voice, **self.tts_params}
+        index = 0
+        while True:
+            sentence = await sentences.get()
+            if sentence is None:
+                break
+            await self._send_json({"type": "audio_start", "index": index, "text": sentence})
+            async for chunk in self.voice_handler.tts.stream_speech(sentence, params=params):
+                await self.websocket.send_bytes(chunk)
+            await self._send_json({"type": "audio_end", "index": index})
+            index += 1
+
+    async def _send_json(self, data: Dict[str, Any]) -> None:
+        """
+        Send a JSON message, ignoring errors from a client that has gone away.
+
+        Args:
+            data: Message to send
+        """
+        try:
+            await self.websocket.send_json(data)
+        except Exception as e:
+            logger.debug(f"Failed to send voice pipeline message: {e}")
@@ -186,6 +186,7 @@ class VoiceInterviewCLI:
         try:
             if hasattr(self.interviewer, 'cleanup'):
                 self.interviewer.cleanup()
+            await self.voice_handler.aclose()
             logger.info("Resources cleaned up")
         except Exception as e:
             logger.error(f"Error cleaning up resources: {e}")
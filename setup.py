@@ -34,6 +34,7 @@ setup(
         "langchain>=0.1.0",
         "langgraph>=0.0.27",
         "langchain-google-genai>=0.0.5",
+        "google-generativeai>=0.7.0",
         "reportlab>=4.1.0"
     ],
     entry_points={